@@ -0,0 +1,46 @@
+"""add analytics jobs
+
+Revision ID: 20261019_analytics_jobs
+Revises: 20261019_assignment_reviewer_ix
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261019_analytics_jobs'
+down_revision = '20261019_assignment_reviewer_ix'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Create analytics_jobs table (background analytics runs with progress and persisted results)
+    op.create_table(
+        'analytics_jobs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('kind', sa.String(50), nullable=False),
+        sa.Column('subject_id', sa.String(64), nullable=False),
+        sa.Column('input_key', sa.String(64), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False, server_default='pending'),
+        sa.Column('progress', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('message', sa.String(255)),
+        sa.Column('result', sa.JSON()),
+        sa.Column('error', sa.Text()),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('started_at', sa.DateTime(timezone=True)),
+        sa.Column('finished_at', sa.DateTime(timezone=True)),
+        sa.Column('requested_by', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=True),
+        sa.CheckConstraint("status IN ('pending', 'running', 'completed', 'failed')", name='valid_analytics_job_status'),
+        sa.CheckConstraint('progress >= 0 AND progress <= 100', name='valid_analytics_job_progress'),
+    )
+    op.create_index('ix_analytics_jobs_id', 'analytics_jobs', ['id'])
+    op.create_index('ix_analytics_jobs_input_key', 'analytics_jobs', ['input_key'])
+
+
+def downgrade():
+    op.drop_index('ix_analytics_jobs_input_key', table_name='analytics_jobs')
+    op.drop_index('ix_analytics_jobs_id', table_name='analytics_jobs')
+    op.drop_table('analytics_jobs')
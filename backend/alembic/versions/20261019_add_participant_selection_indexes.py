@@ -0,0 +1,27 @@
+"""index users and organizations for participant selection
+
+Revision ID: 20261019_participant_ix
+Revises: 20261019_analytics_jobs
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261019_participant_ix'
+down_revision = '20261019_analytics_jobs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Cycle participant criteria filter users by status and organization subtree
+    op.create_index('ix_users_status', 'users', ['status'])
+    op.create_index('ix_users_organization_id', 'users', ['organization_id'])
+    op.create_index('ix_organizations_parent_id', 'organizations', ['parent_id'])
+
+
+def downgrade():
+    op.drop_index('ix_organizations_parent_id', table_name='organizations')
+    op.drop_index('ix_users_organization_id', table_name='users')
+    op.drop_index('ix_users_status', table_name='users')
@@ -0,0 +1,45 @@
+"""rank units and indexes on performance scores
+
+Revision ID: 20261019_performance_ranks
+Revises: 20261019_participant_ix
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261019_performance_ranks'
+down_revision = '20261019_participant_ix'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Units the directorate / department ranks were computed within, so top-N per unit is an index range
+    op.add_column('performance_scores', sa.Column('directorate_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column('performance_scores', sa.Column('department_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key(
+        'performance_scores_directorate_id_fkey', 'performance_scores', 'organizations', ['directorate_id'], ['id']
+    )
+    op.create_foreign_key(
+        'performance_scores_department_id_fkey', 'performance_scores', 'organizations', ['department_id'], ['id']
+    )
+    op.create_index('ix_performance_scores_organization_rank', 'performance_scores', ['cycle_id', 'organization_rank'])
+    op.create_index(
+        'ix_performance_scores_directorate_rank', 'performance_scores', ['cycle_id', 'directorate_id', 'directorate_rank']
+    )
+    op.create_index(
+        'ix_performance_scores_department_rank', 'performance_scores', ['cycle_id', 'department_id', 'department_rank']
+    )
+
+
+def downgrade():
+    op.drop_index('ix_performance_scores_department_rank', table_name='performance_scores')
+    op.drop_index('ix_performance_scores_directorate_rank', table_name='performance_scores')
+    op.drop_index('ix_performance_scores_organization_rank', table_name='performance_scores')
+    op.drop_constraint('performance_scores_department_id_fkey', 'performance_scores', type_='foreignkey')
+    op.drop_constraint('performance_scores_directorate_id_fkey', 'performance_scores', type_='foreignkey')
+    op.drop_column('performance_scores', 'department_id')
+    op.drop_column('performance_scores', 'directorate_id')
@@ -0,0 +1,48 @@
+"""add review analytics cube
+
+Revision ID: 20261019_review_cube
+Revises: 20261019_user_cycle_summaries
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261019_review_cube'
+down_revision = '20261019_user_cycle_summaries'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Ratings pre-aggregated per (cycle, organization subtree, trait, review type)
+    # (completed cycles are built by the scheduled tasks run)
+    op.create_table(
+        'review_analytics_cube',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('review_type', sa.String(20), nullable=False),
+        sa.Column('rating_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rating_sum', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rating_sum_squares', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rating_1', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rating_2', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rating_3', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rating_4', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rating_5', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('built_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('cycle_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('review_cycles.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('organizations.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('trait_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('review_traits.id'), nullable=False),
+        sa.UniqueConstraint('cycle_id', 'organization_id', 'trait_id', 'review_type', name='unique_cube_cell'),
+        sa.CheckConstraint("review_type IN ('self', 'peer', 'supervisor')", name='valid_cube_review_type')
+    )
+    op.create_index('ix_review_analytics_cube_id', 'review_analytics_cube', ['id'])
+    op.create_index('ix_review_analytics_cube_organization_trait', 'review_analytics_cube', ['organization_id', 'trait_id'])
+
+
+def downgrade():
+    op.drop_index('ix_review_analytics_cube_organization_trait', table_name='review_analytics_cube')
+    op.drop_index('ix_review_analytics_cube_id', table_name='review_analytics_cube')
+    op.drop_table('review_analytics_cube')
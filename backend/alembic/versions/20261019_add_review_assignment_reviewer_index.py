@@ -0,0 +1,23 @@
+"""index review assignments by reviewer
+
+Revision ID: 20261019_assignment_reviewer_ix
+Revises: 20261019_cycle_progress
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '20261019_assignment_reviewer_ix'
+down_revision = '20261019_cycle_progress'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # "My assignments" lookups filter by reviewer; unique_assignment leads with cycle_id
+    op.create_index('ix_review_assignments_reviewer_id', 'review_assignments', ['reviewer_id'])
+
+
+def downgrade():
+    op.drop_index('ix_review_assignments_reviewer_id', table_name='review_assignments')
@@ -0,0 +1,30 @@
+"""add review cycle cube_built_at
+
+Revision ID: 20261019_cycle_cube_built_at
+Revises: 20261019_cycle_summarized_at
+Create Date: 2026-10-19 22:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261019_cycle_cube_built_at'
+down_revision = '20261019_cycle_summarized_at'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # When review_analytics_cube cells were last built for the cycle (NULL = never)
+    op.add_column('review_cycles', sa.Column('cube_built_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Cycles built before the marker existed
+    op.execute("""
+        UPDATE review_cycles SET cube_built_at = now()
+        WHERE EXISTS (SELECT 1 FROM review_analytics_cube WHERE review_analytics_cube.cycle_id = review_cycles.id)
+    """)
+
+
+def downgrade():
+    op.drop_column('review_cycles', 'cube_built_at')
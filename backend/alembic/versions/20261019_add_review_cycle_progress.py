@@ -0,0 +1,72 @@
+"""add review cycle progress counters
+
+Revision ID: 20261019_cycle_progress
+Revises: 20261019_score_aggregates
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261019_cycle_progress'
+down_revision = '20261019_score_aggregates'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Create review_cycle_progress table (completion counters per cycle, organization and review type)
+    op.create_table(
+        'review_cycle_progress',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('review_type', sa.String(20), nullable=False),
+        sa.Column('total_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completed_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('started_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('cycle_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('review_cycles.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('organizations.id'), nullable=False),
+        sa.UniqueConstraint('cycle_id', 'organization_id', 'review_type', name='unique_cycle_progress'),
+        sa.CheckConstraint("review_type IN ('self', 'peer', 'supervisor', 'participants')", name='valid_progress_review_type'),
+        sa.CheckConstraint('completed_count >= 0 AND completed_count <= total_count', name='valid_progress_counts'),
+    )
+    op.create_index('ix_review_cycle_progress_id', 'review_cycle_progress', ['id'])
+    op.create_index('ix_review_cycle_progress_cycle_id', 'review_cycle_progress', ['cycle_id'])
+
+    # Backfill assignment counters per review type
+    op.execute("""
+        INSERT INTO review_cycle_progress (id, cycle_id, organization_id, review_type, total_count, completed_count, started_count)
+        SELECT gen_random_uuid(), ra.cycle_id, u.organization_id, ra.review_type,
+               COUNT(*),
+               COUNT(*) FILTER (WHERE ra.status = 'completed'),
+               COUNT(*) FILTER (WHERE ra.status = 'completed')
+        FROM review_assignments ra
+        JOIN users u ON u.id = ra.reviewee_id
+        GROUP BY ra.cycle_id, u.organization_id, ra.review_type
+    """)
+
+    # Backfill participant counters from per-reviewee totals
+    op.execute("""
+        INSERT INTO review_cycle_progress (id, cycle_id, organization_id, review_type, total_count, completed_count, started_count)
+        SELECT gen_random_uuid(), reviewee.cycle_id, reviewee.organization_id, 'participants',
+               COUNT(*),
+               COUNT(*) FILTER (WHERE reviewee.completed = reviewee.total),
+               COUNT(*) FILTER (WHERE reviewee.completed > 0)
+        FROM (
+            SELECT ra.cycle_id, u.organization_id, ra.reviewee_id,
+                   COUNT(*) AS total,
+                   COUNT(*) FILTER (WHERE ra.status = 'completed') AS completed
+            FROM review_assignments ra
+            JOIN users u ON u.id = ra.reviewee_id
+            GROUP BY ra.cycle_id, u.organization_id, ra.reviewee_id
+        ) reviewee
+        GROUP BY reviewee.cycle_id, reviewee.organization_id
+    """)
+
+
+def downgrade():
+    op.drop_index('ix_review_cycle_progress_cycle_id', table_name='review_cycle_progress')
+    op.drop_index('ix_review_cycle_progress_id', table_name='review_cycle_progress')
+    op.drop_table('review_cycle_progress')
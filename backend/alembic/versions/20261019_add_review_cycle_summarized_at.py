@@ -0,0 +1,30 @@
+"""add review cycle summarized_at
+
+Revision ID: 20261019_cycle_summarized_at
+Revises: 20261019_review_cube
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '20261019_cycle_summarized_at'
+down_revision = '20261019_review_cube'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # When user_cycle_summaries were last built for the cycle (NULL = never)
+    op.add_column('review_cycles', sa.Column('summarized_at', sa.DateTime(timezone=True), nullable=True))
+
+    # Cycles summarized before the marker existed
+    op.execute("""
+        UPDATE review_cycles SET summarized_at = now()
+        WHERE EXISTS (SELECT 1 FROM user_cycle_summaries WHERE user_cycle_summaries.cycle_id = review_cycles.id)
+    """)
+
+
+def downgrade():
+    op.drop_column('review_cycles', 'summarized_at')
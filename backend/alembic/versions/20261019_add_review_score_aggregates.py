@@ -0,0 +1,58 @@
+"""add running review score aggregates
+
+Revision ID: 20261019_score_aggregates
+Revises: 20261019_upload_blobs
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261019_score_aggregates'
+down_revision = '20261019_upload_blobs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Create review_score_aggregates table (rating sum/count per cycle, reviewee, trait and review type)
+    op.create_table(
+        'review_score_aggregates',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('review_type', sa.String(20), nullable=False),
+        sa.Column('rating_sum', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rating_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('cycle_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('review_cycles.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('trait_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('review_traits.id'), nullable=False),
+        sa.UniqueConstraint('cycle_id', 'user_id', 'trait_id', 'review_type', name='unique_score_aggregate'),
+        sa.CheckConstraint("review_type IN ('self', 'peer', 'supervisor')", name='valid_aggregate_review_type'),
+        sa.CheckConstraint('rating_count >= 0', name='valid_aggregate_count'),
+    )
+    op.create_index('ix_review_score_aggregates_id', 'review_score_aggregates', ['id'])
+
+    # Backfill from completed assignments so in-flight cycles keep scoring correctly
+    op.execute("""
+        INSERT INTO review_score_aggregates (id, cycle_id, user_id, trait_id, review_type, rating_sum, rating_count)
+        SELECT gen_random_uuid(), ra.cycle_id, ra.reviewee_id, rq.trait_id, ra.review_type,
+               SUM(rr.rating), COUNT(rr.rating)
+        FROM review_responses rr
+        JOIN review_assignments ra ON ra.id = rr.assignment_id
+        JOIN review_questions rq ON rq.id = rr.question_id
+        JOIN review_cycle_traits rct
+          ON rct.cycle_id = ra.cycle_id AND rct.trait_id = rq.trait_id AND rct.is_active = true
+        WHERE ra.status = 'completed'
+          AND rq.is_active = true
+          AND ((ra.review_type = 'self' AND rq.applies_to_self = true)
+            OR (ra.review_type = 'peer' AND rq.applies_to_peer = true)
+            OR (ra.review_type = 'supervisor' AND rq.applies_to_supervisor = true))
+        GROUP BY ra.cycle_id, ra.reviewee_id, rq.trait_id, ra.review_type
+    """)
+
+
+def downgrade():
+    op.drop_index('ix_review_score_aggregates_id', table_name='review_score_aggregates')
+    op.drop_table('review_score_aggregates')
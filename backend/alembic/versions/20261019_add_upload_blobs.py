@@ -0,0 +1,53 @@
+"""add content-addressed upload blobs
+
+Revision ID: 20261019_upload_blobs
+Revises: 20260118_scope_type
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261019_upload_blobs'
+down_revision = '20260118_scope_type'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Create upload_blobs table (one row per distinct file content)
+    op.create_table(
+        'upload_blobs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('content_hash', sa.String(64), nullable=False),
+        sa.Column('file_path', sa.String(500), nullable=False),
+        sa.Column('size_bytes', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('content_type', sa.String(255), nullable=True),
+        sa.Column('ref_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('released_at', sa.DateTime(timezone=True), nullable=True),
+        sa.CheckConstraint('ref_count >= 0', name='valid_blob_ref_count'),
+    )
+    op.create_index('ix_upload_blobs_id', 'upload_blobs', ['id'])
+    op.create_index('ix_upload_blobs_content_hash', 'upload_blobs', ['content_hash'], unique=True)
+
+    # Link documents to blobs (existing documents keep their own file and a NULL blob_id)
+    op.add_column('initiative_documents', sa.Column('blob_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key(
+        'fk_initiative_documents_blob_id', 'initiative_documents', 'upload_blobs', ['blob_id'], ['id']
+    )
+    op.create_index('ix_initiative_documents_blob_id', 'initiative_documents', ['blob_id'])
+    op.create_index('ix_initiative_documents_initiative_id', 'initiative_documents', ['initiative_id'])
+
+
+def downgrade():
+    op.drop_index('ix_initiative_documents_initiative_id', table_name='initiative_documents')
+    op.drop_index('ix_initiative_documents_blob_id', table_name='initiative_documents')
+    op.drop_constraint('fk_initiative_documents_blob_id', 'initiative_documents', type_='foreignkey')
+    op.drop_column('initiative_documents', 'blob_id')
+
+    op.drop_index('ix_upload_blobs_content_hash', table_name='upload_blobs')
+    op.drop_index('ix_upload_blobs_id', table_name='upload_blobs')
+    op.drop_table('upload_blobs')
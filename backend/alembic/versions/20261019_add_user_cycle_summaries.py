@@ -0,0 +1,51 @@
+"""add user cycle summaries
+
+Revision ID: 20261019_user_cycle_summaries
+Revises: 20261019_performance_ranks
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '20261019_user_cycle_summaries'
+down_revision = '20261019_performance_ranks'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Per-user, per-cycle performance snapshots for trend views
+    # (completed cycles are backfilled by the scheduled tasks run)
+    op.create_table(
+        'user_cycle_summaries',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('cycle_end_date', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('overall_performance_score', sa.Numeric(5, 2)),
+        sa.Column('task_performance_score', sa.Numeric(5, 2)),
+        sa.Column('review_performance_score', sa.Numeric(5, 2)),
+        sa.Column('performance_band', sa.String(30)),
+        sa.Column('organization_rank', sa.Integer()),
+        sa.Column('average_trait_score', sa.Numeric(3, 2)),
+        sa.Column('trait_scores', sa.JSON()),
+        sa.Column('task_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completed_task_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('average_task_score', sa.Numeric(4, 2)),
+        sa.Column('reviews_completed', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True)),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('cycle_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('review_cycles.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('organizations.id'), nullable=True),
+        sa.UniqueConstraint('user_id', 'cycle_id', name='unique_user_cycle_summary')
+    )
+    op.create_index('ix_user_cycle_summaries_id', 'user_cycle_summaries', ['id'])
+    op.create_index('ix_user_cycle_summaries_user_end_date', 'user_cycle_summaries', ['user_id', 'cycle_end_date'])
+
+
+def downgrade():
+    op.drop_index('ix_user_cycle_summaries_user_end_date', table_name='user_cycle_summaries')
+    op.drop_index('ix_user_cycle_summaries_id', table_name='user_cycle_summaries')
+    op.drop_table('user_cycle_summaries')
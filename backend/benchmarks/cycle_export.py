@@ -0,0 +1,48 @@
+"""
+Throughput of the streamed export encoders on 200k score rows, and their peak memory at
+10k and 50k rows (which should stay flat as the row count grows)
+Run from backend/: python -m benchmarks.cycle_export
+"""
+
+from datetime import datetime
+from decimal import Decimal
+import time
+import tracemalloc
+import uuid
+
+from utils import cycle_export
+from utils.cycle_export import SCORE_COLUMNS
+
+
+def generated_rows(count: int):
+    for index in range(count):
+        yield (uuid.uuid4(), f"Employee {index}", f"e{index}@example.org", "Finance & Accounts", "Analyst",
+               uuid.uuid4(), "Integrity", Decimal("4.25"), None, Decimal("3.50"), Decimal("3.90"), datetime(2026, 10, 1))
+
+
+def encoded_size(export_format: str, count: int) -> int:
+    size = 0
+    for chunk in cycle_export._ENCODERS[export_format](SCORE_COLUMNS, generated_rows(count), "scores"):
+        size += len(chunk)
+    return size
+
+
+def main():
+    for export_format in ("csv", "ndjson", "xlsx"):
+        started = time.perf_counter()
+        size = encoded_size(export_format, 200_000)
+        elapsed = time.perf_counter() - started
+
+        # Traced separately: tracemalloc slows encoding several times over
+        peaks = []
+        for count in (10_000, 50_000):
+            tracemalloc.start()
+            encoded_size(export_format, count)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        print(f"{export_format:>6} 200000 rows: {size / 2 ** 20:5.1f} MiB in {elapsed:5.2f} s; "
+              f"peak {peaks[0] / 2 ** 10:.0f} KiB at 10k rows, {peaks[1] / 2 ** 10:.0f} KiB at 50k rows")
+
+
+if __name__ == "__main__":
+    main()
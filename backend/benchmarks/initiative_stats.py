@@ -0,0 +1,138 @@
+"""
+Initiative statistics on 100k initiatives (1000 creators in 20 departments): loading every visible
+initiative and counting per enum value in Python against the single FILTERed aggregate, for a
+global admin, a directorate manager with initiative_view_all and an individual contributor
+Run from backend/ with TEST_DATABASE_URL set: python -m benchmarks.initiative_stats
+"""
+
+from datetime import datetime, timedelta
+import random
+import uuid
+
+from sqlalchemy import and_, insert, or_
+
+from models import (
+    Initiative, InitiativeAssignment, InitiativeStatus, InitiativeType, InitiativeUrgency, Organization,
+    OrganizationLevel, Role, ScopeOverride, User
+)
+from utils.initiative_workflows import InitiativeWorkflowService
+from benchmarks.postgres import analyze, measure, rolled_back_session
+
+DIRECTORATES = 4
+DEPARTMENTS_PER_DIRECTORATE = 5
+CREATORS = 1000
+INITIATIVES_PER_CREATOR = 100
+
+
+def seed(db) -> dict:
+    """Organization tree, creators and their initiatives; returns the users to measure as"""
+    rng = random.Random(0)
+    company = uuid.uuid4()
+    directorates = [uuid.uuid4() for _ in range(DIRECTORATES)]
+    departments = [uuid.uuid4() for _ in range(DIRECTORATES * DEPARTMENTS_PER_DIRECTORATE)]
+    db.execute(insert(Organization), [
+        {"id": company, "name": "Company", "level": OrganizationLevel.GLOBAL, "parent_id": None},
+        *[{"id": directorate_id, "name": f"Directorate {index}", "level": OrganizationLevel.DIRECTORATE,
+           "parent_id": company} for index, directorate_id in enumerate(directorates)],
+        *[{"id": department_id, "name": f"Department {index}", "level": OrganizationLevel.DEPARTMENT,
+           "parent_id": directorates[index // DEPARTMENTS_PER_DIRECTORATE]}
+          for index, department_id in enumerate(departments)]
+    ])
+
+    roles = {name: uuid.uuid4() for name in ("admin", "manager", "member")}
+    db.execute(insert(Role), [
+        {"id": roles["admin"], "name": f"bench-admin-{roles['admin'].hex[:8]}",
+         "permissions": ["initiative_view_all"], "scope_override": ScopeOverride.GLOBAL},
+        {"id": roles["manager"], "name": f"bench-manager-{roles['manager'].hex[:8]}",
+         "permissions": ["initiative_view_all"], "scope_override": ScopeOverride.NONE},
+        {"id": roles["member"], "name": f"bench-member-{roles['member'].hex[:8]}",
+         "permissions": [], "scope_override": ScopeOverride.NONE},
+    ])
+
+    creators = [uuid.uuid4() for _ in range(CREATORS)]
+    people = {"admin": (uuid.uuid4(), company), "manager": (uuid.uuid4(), directorates[0])}
+    db.execute(insert(User), [
+        {"id": user_id, "email": f"{user_id.hex}@example.com", "name": f"User {index}", "first_name": "User",
+         "last_name": str(index), "organization_id": departments[index % len(departments)],
+         "role_id": roles["member"]}
+        for index, user_id in enumerate(creators)
+    ] + [
+        {"id": user_id, "email": f"{user_id.hex}@example.com", "name": name.title(), "first_name": name.title(),
+         "last_name": "Bench", "organization_id": organization_id, "role_id": roles[name]}
+        for name, (user_id, organization_id) in people.items()
+    ])
+
+    statuses, types, urgencies = list(InitiativeStatus), list(InitiativeType), list(InitiativeUrgency)
+    initiatives, assignments = [], []
+    for creator in creators:
+        for _ in range(INITIATIVES_PER_CREATOR):
+            status = rng.choice(statuses)
+            initiative_id = uuid.uuid4()
+            initiatives.append({
+                "id": initiative_id, "title": "Initiative", "type": rng.choice(types), "status": status,
+                "urgency": rng.choice(urgencies), "due_date": datetime(2026, 12, 31) + timedelta(days=rng.randint(0, 90)),
+                "created_by": creator, "score": rng.randint(1, 10) if status == InitiativeStatus.COMPLETED else None
+            })
+            assignments.append({"initiative_id": initiative_id, "user_id": creator})
+    db.execute(insert(Initiative), initiatives)
+    db.execute(insert(InitiativeAssignment), assignments)
+    analyze(db, "organizations", "users", "initiatives", "initiative_assignments")
+
+    return {
+        "admin": db.get(User, people["admin"][0]),
+        "manager": db.get(User, people["manager"][0]),
+        "member": db.get(User, creators[0]),
+    }
+
+
+def loaded_stats(service: InitiativeWorkflowService, user: User) -> dict:
+    # What /initiatives/stats did: load the visible initiatives (a second query merged in Python
+    # for view-all users), then one pass over them per enum value
+    db = service.db
+    initiatives = db.query(Initiative).filter(or_(
+        Initiative.created_by == user.id,
+        Initiative.assignments.any(InitiativeAssignment.user_id == user.id),
+        and_(Initiative.type == InitiativeType.GROUP, Initiative.team_head_id == user.id)
+    )).all()
+    if service.permission_service.user_has_permission(user, "initiative_view_all"):
+        accessible_orgs = service.permission_service.get_accessible_organizations(user)
+        initiative_ids = {initiative.id for initiative in initiatives}
+        for initiative in db.query(Initiative).join(User, Initiative.created_by == User.id).filter(
+            User.organization_id.in_(accessible_orgs)
+        ).all():
+            if initiative.id not in initiative_ids:
+                initiatives.append(initiative)
+
+    total = len(initiatives)
+    by_status = {s.value: sum(1 for i in initiatives if i.status == s) for s in InitiativeStatus}
+    scored = [i.score for i in initiatives if i.score is not None]
+    completed = sum(1 for i in initiatives if i.status in [InitiativeStatus.UNDER_REVIEW, InitiativeStatus.COMPLETED])
+    return {
+        "total_initiatives": total,
+        "by_status": by_status,
+        "by_type": {t.value: sum(1 for i in initiatives if i.type == t) for t in InitiativeType},
+        "by_urgency": {u.value: sum(1 for i in initiatives if i.urgency == u) for u in InitiativeUrgency},
+        "overdue_initiatives": by_status[InitiativeStatus.OVERDUE.value],
+        "pending_approval": by_status[InitiativeStatus.PENDING_APPROVAL.value],
+        "average_score": sum(scored) / len(scored) if scored else None,
+        "completion_rate": (completed / total * 100) if total > 0 else 0
+    }
+
+
+def main():
+    with rolled_back_session() as db:
+        users = seed(db)
+        service = InitiativeWorkflowService(db)
+        print(f"{CREATORS * INITIATIVES_PER_CREATOR} initiatives:")
+        for name, user in users.items():
+            stats = service.get_initiative_stats(user)
+            assert stats["total_initiatives"] == loaded_stats(service, user)["total_initiatives"]
+            print(f"  {name} ({stats['total_initiatives']} visible)")
+            for label, function in [("load and count", lambda: loaded_stats(service, user)),
+                                    ("SQL aggregate", lambda: service.get_initiative_stats(user))]:
+                elapsed, statements = measure(db, function)
+                print(f"    {label:<16} {elapsed:8.1f} ms  {statements:3} statements")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+PostgreSQL session for the benchmarks that need a database
+Like the database tests they use TEST_DATABASE_URL and work inside one transaction that is
+rolled back, so seeded rows never persist.
+"""
+
+from contextlib import contextmanager
+import os
+import statistics
+import sys
+import time
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+from database import Base
+import models  # noqa: F401  (registers every table on Base.metadata)
+
+
+@contextmanager
+def rolled_back_session():
+    url = os.environ.get("TEST_DATABASE_URL")
+    if not url:
+        sys.exit("Set TEST_DATABASE_URL to a PostgreSQL database to run this benchmark")
+    engine = create_engine(url)
+    connection = engine.connect()
+    transaction = connection.begin()
+    try:
+        Base.metadata.create_all(connection)
+        session = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            yield session
+        finally:
+            session.close()
+    finally:
+        transaction.rollback()
+        connection.close()
+        engine.dispose()
+
+
+def analyze(session, *tables):
+    """Refresh planner statistics after seeding so plans match a populated database"""
+    for table in tables:
+        session.execute(text(f"ANALYZE {table}"))
+
+
+def measure(session, function, repeat: int = 5):
+    """
+    Median wall time of function() in milliseconds over repeat runs, and the number of
+    statements one run executes
+    """
+    engine = session.get_bind().engine
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    timings = []
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        for _ in range(repeat):
+            statements.clear()
+            started = time.perf_counter()
+            function()
+            timings.append((time.perf_counter() - started) * 1000)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return statistics.median(timings), len(statements)
@@ -0,0 +1,35 @@
+"""
+Review assignment planning on synthetic organizations of 1k-20k users
+Run from backend/: python -m benchmarks.review_assignments
+"""
+
+import random
+import time
+import uuid
+
+from utils.review_assignments import DEFAULT_PEER_COUNT, ReviewParticipant, plan_review_assignments
+
+
+def main():
+    for user_count in (1_000, 5_000, 20_000):
+        rng = random.Random(0)
+        org_ids = [uuid.uuid4() for _ in range(max(1, user_count // 150))]
+        users = []
+        for index in range(user_count):
+            supervisor_id = users[rng.randrange(index)].id if index and rng.random() < 0.95 else None
+            users.append(ReviewParticipant(uuid.uuid4(), rng.choice(org_ids), supervisor_id))
+
+        started = time.perf_counter()
+        planned = plan_review_assignments(users, DEFAULT_PEER_COUNT, seed=42)
+        elapsed = time.perf_counter() - started
+
+        loads = {}
+        for assignment in planned:
+            if assignment.review_type == 'peer':
+                loads[assignment.reviewer_id] = loads.get(assignment.reviewer_id, 0) + 1
+        print(f"{user_count:>6} users -> {len(planned):>7} assignments in {elapsed * 1000:.1f} ms "
+              f"(peer load max {max(loads.values())}, {sum(loads.values()) / user_count:.2f} peers per reviewee)")
+
+
+if __name__ == "__main__":
+    main()
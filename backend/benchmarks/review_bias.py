@@ -0,0 +1,93 @@
+"""
+Bias analytics on ~100k ratings: RatingMatrix against the per-detector list passes it replaced
+Run from backend/: python -m benchmarks.review_bias
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import random
+import time
+import uuid
+
+from utils.review_bias import RatingMatrix, is_rating, rating_distribution
+
+
+def synthetic_reviews(rating_count: int = 100_000):
+    rng = random.Random(0)
+    reviewers = [uuid.uuid4() for _ in range(800)]
+    reviewees = [uuid.uuid4() for _ in range(2000)]
+    question_keys = [f"q{index}" for index in range(12)]
+    started_at = datetime(2026, 1, 1)
+    return [
+        SimpleNamespace(
+            reviewer_id=rng.choice(reviewers),
+            reviewee_id=rng.choice(reviewees),
+            created_at=started_at + timedelta(minutes=rng.randrange(500_000)),
+            responses={
+                **{key: rng.choice((1, 2, 3, 3, 4, 4, 4, 5, 5)) for key in question_keys},
+                "comment": "Consistently delivers"
+            }
+        )
+        for _ in range(rating_count // len(question_keys))
+    ]
+
+
+def legacy_ratings(items):
+    ratings = []
+    for review in items:
+        if review.responses:
+            ratings.extend(v for v in review.responses.values() if is_rating(v))
+    return ratings
+
+
+def legacy_pass(reviews):
+    # One list walk per detector, as before; recency sorts twice
+    results = []
+    for _ in range(5):
+        results.append(legacy_ratings(reviews))
+    ordered = sorted(reviews, key=lambda r: r.created_at, reverse=True)
+    ordered = sorted(reviews, key=lambda r: r.created_at, reverse=True)
+    results.append(legacy_ratings(ordered[:len(reviews) // 2]))
+    results.append(legacy_ratings(ordered[len(reviews) // 2:]))
+    for review in reviews:
+        ratings = [v for v in review.responses.values() if is_rating(v)]
+        results.append(max(ratings) - min(ratings))
+    all_ratings = results[0]
+    mean = sum(all_ratings) / len(all_ratings)
+    return mean, sum((r - mean) ** 2 for r in all_ratings) / len(all_ratings), Counter(all_ratings)
+
+
+def matrix_pass(reviews):
+    matrix = RatingMatrix(reviews)
+    matrix.overall_bias_score()
+    matrix.recency_bias()
+    matrix.halo_effect()
+    matrix.leniency_bias()
+    matrix.central_tendency_bias()
+    matrix.reviewer_leniency()
+    rating_distribution(matrix)
+    return matrix
+
+
+def best_of(runs: int, run, reviews):
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = run(reviews)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    reviews = synthetic_reviews()
+    legacy_time, (mean, variance, histogram) = best_of(3, legacy_pass, reviews)
+    matrix_time, matrix = best_of(3, matrix_pass, reviews)
+
+    assert abs(matrix.mean - mean) < 1e-9 and abs(matrix.variance - variance) < 1e-9
+    assert matrix.histogram == histogram
+    print(f"{len(matrix)} ratings: legacy {legacy_time * 1000:.0f} ms, matrix {matrix_time * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Cycle dashboard and user-progress on 20k assignments (2000 reviewees in 20 departments): the
+per-participant and per-type COUNT queries they replaced against the grouped scan of
+review_assignments and the maintained progress counters
+Run from backend/ with TEST_DATABASE_URL set: python -m benchmarks.review_progress
+"""
+
+from datetime import datetime
+import random
+import uuid
+
+from sqlalchemy import case, func, insert
+
+from models import Organization, OrganizationLevel, ReviewAssignment, ReviewCycle, Role, User
+from routers.reviews import REVIEW_ASSIGNMENT_TYPES, _build_cycle_dashboard, _cycle_reviewee_progress
+from utils.review_progress import ReviewProgressService
+from benchmarks.postgres import analyze, measure, rolled_back_session
+
+DEPARTMENTS = 20
+REVIEWEES = 2000
+PEERS = 8
+
+
+def seed(db) -> ReviewCycle:
+    """Self, supervisor and PEERS peer assignments per reviewee, about 60% completed"""
+    rng = random.Random(0)
+    role_id, company_id = uuid.uuid4(), uuid.uuid4()
+    db.execute(insert(Role), [{"id": role_id, "name": f"bench-{role_id.hex[:8]}", "permissions": []}])
+    departments = [uuid.uuid4() for _ in range(DEPARTMENTS)]
+    db.execute(insert(Organization), [
+        {"id": company_id, "name": "Company", "level": OrganizationLevel.GLOBAL, "parent_id": None},
+        *[{"id": department_id, "name": f"Department {index}", "level": OrganizationLevel.DEPARTMENT,
+           "parent_id": company_id} for index, department_id in enumerate(departments)]
+    ])
+    users = [uuid.uuid4() for _ in range(REVIEWEES + 1)]
+    db.execute(insert(User), [
+        {"id": user_id, "email": f"{user_id.hex}@example.com", "name": f"User {index}", "first_name": "User",
+         "last_name": str(index), "job_title": "Analyst", "organization_id": departments[index % DEPARTMENTS],
+         "role_id": role_id}
+        for index, user_id in enumerate(users)
+    ])
+    cycle = ReviewCycle(name="Benchmark", type="annual", period="FY-2026", start_date=datetime(2026, 1, 1),
+                        end_date=datetime(2026, 12, 31), created_by=users[0])
+    db.add(cycle)
+    db.flush()
+
+    supervisor, reviewees = users[0], users[1:]
+    assignments = []
+    for index, reviewee in enumerate(reviewees):
+        peers = [reviewees[(index + offset) % REVIEWEES] for offset in range(1, PEERS + 1)]
+        for review_type, reviewer in [('self', reviewee), ('supervisor', supervisor)] + [('peer', peer) for peer in peers]:
+            assignments.append({
+                "cycle_id": cycle.id, "reviewer_id": reviewer, "reviewee_id": reviewee, "review_type": review_type,
+                "status": 'completed' if rng.random() < 0.6 else 'pending'
+            })
+    db.execute(insert(ReviewAssignment), assignments)
+    analyze(db, "users", "organizations", "review_assignments")
+    return cycle
+
+
+def per_participant_progress(db, cycle_id):
+    # What /user-progress did: one grouped query, then one query per reviewee and review type
+    rows = db.query(
+        User.id, User.first_name, User.last_name, User.job_title, Organization.name.label('department'),
+        func.count(ReviewAssignment.id), func.count(case((ReviewAssignment.status == 'completed', 1)))
+    ).join(ReviewAssignment, ReviewAssignment.reviewee_id == User.id)\
+     .join(Organization, Organization.id == User.organization_id)\
+     .filter(ReviewAssignment.cycle_id == cycle_id)\
+     .group_by(User.id, User.first_name, User.last_name, User.job_title, Organization.name).all()
+    for row in rows:
+        for review_type in REVIEW_ASSIGNMENT_TYPES:
+            db.query(ReviewAssignment).filter(
+                ReviewAssignment.cycle_id == cycle_id,
+                ReviewAssignment.reviewee_id == row.id,
+                ReviewAssignment.review_type == review_type
+            ).all()
+
+
+def separate_counts_dashboard(db, cycle_id):
+    # What /dashboard did: participant counts with a HAVING subquery, two counts per review type
+    # and a department breakdown
+    is_completed = ReviewAssignment.status == 'completed'
+    in_cycle = ReviewAssignment.cycle_id == cycle_id
+    db.query(func.count(func.distinct(ReviewAssignment.reviewee_id))).filter(in_cycle).scalar()
+    db.query(func.count(func.distinct(ReviewAssignment.reviewee_id))).filter(
+        in_cycle,
+        ReviewAssignment.reviewee_id.in_(
+            db.query(ReviewAssignment.reviewee_id).filter(in_cycle).group_by(ReviewAssignment.reviewee_id).having(
+                func.count(ReviewAssignment.id) == func.count(case((is_completed, 1)))
+            )
+        )
+    ).scalar()
+    for review_type in REVIEW_ASSIGNMENT_TYPES:
+        db.query(ReviewAssignment).filter(in_cycle, ReviewAssignment.review_type == review_type).count()
+        db.query(ReviewAssignment).filter(in_cycle, ReviewAssignment.review_type == review_type, is_completed).count()
+    db.query(
+        Organization.name,
+        func.count(func.distinct(ReviewAssignment.reviewee_id)),
+        func.count(func.distinct(case((is_completed, ReviewAssignment.reviewee_id))))
+    ).join(User, User.id == ReviewAssignment.reviewee_id)\
+     .join(Organization, Organization.id == User.organization_id)\
+     .filter(in_cycle).group_by(Organization.name).all()
+
+
+def main():
+    with rolled_back_session() as db:
+        cycle = seed(db)
+        progress = ReviewProgressService(db)
+        # (label, function, runs): the per-participant queries take seconds, so they run once
+        cases = [
+            ("user-progress, per participant", lambda: per_participant_progress(db, cycle.id), 1),
+            ("user-progress, grouped scan", lambda: _cycle_reviewee_progress(cycle.id, db), 5),
+            ("dashboard, separate counts", lambda: separate_counts_dashboard(db, cycle.id), 5),
+            ("dashboard, counter rebuild", lambda: progress.rebuild(cycle.id), 5),
+            ("dashboard, maintained counters", lambda: _build_cycle_dashboard(cycle, db), 5),
+        ]
+        print(f"{REVIEWEES * (PEERS + 2)} assignments, {REVIEWEES} reviewees:")
+        for label, function, runs in cases:
+            elapsed, statements = measure(db, function, runs)
+            print(f"  {label:<32} {elapsed:8.1f} ms  {statements:5} statements")
+
+
+if __name__ == "__main__":
+    main()
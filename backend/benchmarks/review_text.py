@@ -0,0 +1,60 @@
+"""
+Keyword scanning of 4000 comments: per-keyword lower() checks against the compiled, memoized scan
+Run from backend/: python -m benchmarks.review_text
+"""
+
+import random
+import time
+
+from utils.review_text import (
+    KEYWORD_GROUPS, TOPIC_KEYWORDS, keyword_hits, mention_count, scan_batch, topics_in
+)
+
+# Mostly ordinary words with the occasional keyword
+FILLER = ("the", "project", "delivered", "on", "time", "client", "report", "and", "was", "very",
+          "this", "quarter", "her", "his", "their", "work", "with", "results", "deadline", "support")
+
+
+def per_keyword_scan(value):
+    # What the insight helpers did for one comment: lower() per keyword per list
+    any(word in value.lower() for word in KEYWORD_GROUPS["highlight"])
+    any(word in value.lower() for word in KEYWORD_GROUPS["development"])
+    sum(1 for word in KEYWORD_GROUPS["positive"] if word in value.lower())
+    sum(1 for word in KEYWORD_GROUPS["negative"] if word in value.lower())
+    any(word in value.lower() for word in KEYWORD_GROUPS["strength"])
+    'improve' in value.lower()
+    any(word in value.lower() for word in KEYWORD_GROUPS["recognition"])
+    lowered = value.lower()
+    [topic for topic, keywords in TOPIC_KEYWORDS.items() if any(keyword in lowered for keyword in keywords)]
+
+
+def main():
+    rng = random.Random(0)
+    keywords = sorted({keyword for keywords in {**KEYWORD_GROUPS, **TOPIC_KEYWORDS}.values() for keyword in keywords})
+    comments = [
+        " ".join(rng.choice(keywords) if rng.random() < 0.05 else rng.choice(FILLER) for _ in range(60)).capitalize()
+        for _ in range(4000)
+    ]
+
+    started = time.perf_counter()
+    for comment in comments:
+        per_keyword_scan(comment)
+    legacy = time.perf_counter() - started
+
+    keyword_hits.cache_clear()
+    started = time.perf_counter()
+    for comment in scan_batch(comments):
+        for group in KEYWORD_GROUPS:
+            mention_count(comment, group)
+        topics_in([comment])
+    compiled = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scan_batch(comments)
+    cached = time.perf_counter() - started
+    print(f"{len(comments)} comments: per-keyword {legacy * 1000:.0f} ms, "
+          f"compiled {compiled * 1000:.0f} ms, memoized rescan {cached * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
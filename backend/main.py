@@ -1,6 +1,5 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 import os
 import logging
 from decouple import config
@@ -11,6 +10,8 @@ logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 from database import create_tables
+from utils.file_delivery import UploadStaticFiles
+from utils.analytics_jobs import shutdown_job_runner
 from routers import auth, users, roles, organization, initiatives, goals, goal_tags, reviews, performance, notifications
 
 # Read CORS origins from environment variable, with fallback to .env file
@@ -39,7 +40,7 @@ app.add_middleware(
 
 if not os.path.exists("uploads"):
     os.makedirs("uploads")
-app.mount("/api/uploads", StaticFiles(directory="uploads"), name="uploads")
+app.mount("/api/uploads", UploadStaticFiles(directory="uploads"), name="uploads")
 
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(users.router, prefix="/api/users", tags=["Users"])
@@ -57,6 +58,11 @@ async def startup_event():
     """Create database tables on startup"""
     create_tables()
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the analytics worker pool"""
+    shutdown_job_runner()
+
 @app.get("/")
 async def root():
     return {"message": "NIGCOMSAT PMS API v2.0 - Simplified & Efficient"}
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Enum, Date, Float, Numeric, UniqueConstraint, CheckConstraint, Table
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Enum, Date, Float, Numeric, UniqueConstraint, CheckConstraint, Index, Table
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -132,7 +132,7 @@ class Organization(Base):
     name = Column(String(255), nullable=False)
     description = Column(Text)
     level = Column(Enum(OrganizationLevel), nullable=False)
-    parent_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=True)
+    parent_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -178,7 +178,7 @@ class User(Base):
     skillset = Column(Text)
     level = Column(Integer)  # Changed to Integer for civil service grade levels (1-17)
     job_title = Column(String(255))
-    status = Column(Enum(UserStatus), default=UserStatus.ACTIVE)
+    status = Column(Enum(UserStatus), default=UserStatus.ACTIVE, index=True)
     password_hash = Column(String(255))
     email_verified_at = Column(DateTime(timezone=True))
     onboarding_token = Column(String(255))
@@ -188,7 +188,7 @@ class User(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Foreign Keys
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False, index=True)
     role_id = Column(UUID(as_uuid=True), ForeignKey("roles.id"), nullable=False)
     supervisor_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
     level_rank = Column(Integer, default=2)  # For level comparison
@@ -404,6 +404,28 @@ class InitiativeSubmission(Base):
     initiative = relationship("Initiative", back_populates="submissions")
     submitter = relationship("User")
 
+class UploadBlob(Base):
+    """
+    Content-addressed file storage shared by all uploads
+    One row per distinct file content (sha256), reference counted by the rows that point at it
+    """
+    __tablename__ = "upload_blobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    content_hash = Column(String(64), nullable=False, unique=True, index=True)  # sha256 hex digest
+    file_path = Column(String(500), nullable=False)
+    size_bytes = Column(Integer, nullable=False, default=0)
+    content_type = Column(String(255))
+    ref_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    released_at = Column(DateTime(timezone=True))  # When ref_count last dropped to zero
+
+    # Relationships
+    documents = relationship("InitiativeDocument", back_populates="blob")
+
+    # Constraints
+    __table_args__ = (CheckConstraint("ref_count >= 0", name='valid_blob_ref_count'),)
+
 class InitiativeDocument(Base):
     """
     File attachments for initiative submissions
@@ -413,16 +435,18 @@ class InitiativeDocument(Base):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     file_name = Column(String(255), nullable=False)
-    file_path = Column(String(500), nullable=False)
+    file_path = Column(String(500), nullable=False)  # Mirrors blob.file_path for blob-backed documents
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Foreign Keys
-    initiative_id = Column(UUID(as_uuid=True), ForeignKey("initiatives.id"), nullable=True)  # Nullable for pre-upload
+    initiative_id = Column(UUID(as_uuid=True), ForeignKey("initiatives.id"), nullable=True, index=True)  # Nullable for pre-upload
     uploaded_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    blob_id = Column(UUID(as_uuid=True), ForeignKey("upload_blobs.id"), nullable=True, index=True)  # Null for legacy uploads
 
     # Relationships
     initiative = relationship("Initiative", back_populates="documents")
     uploader = relationship("User")
+    blob = relationship("UploadBlob", back_populates="documents")
 
 class InitiativeExtension(Base):
     """
@@ -504,6 +528,8 @@ class ReviewCycle(Base):
     participants_count = Column(Integer, default=0)
     completion_rate = Column(Float, default=0.0)
     quality_score = Column(Float, default=0.0)
+    summarized_at = Column(DateTime(timezone=True))  # Last user_cycle_summaries build
+    cube_built_at = Column(DateTime(timezone=True))  # Last review_analytics_cube build
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -790,7 +816,7 @@ class ReviewAssignment(Base):
 
     # Foreign Keys
     cycle_id = Column(UUID(as_uuid=True), ForeignKey("review_cycles.id", ondelete="CASCADE"), nullable=False)
-    reviewer_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    reviewer_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
     reviewee_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
 
     # Relationships
@@ -860,6 +886,126 @@ class ReviewScore(Base):
     # Constraints
     __table_args__ = (UniqueConstraint('cycle_id', 'user_id', 'trait_id', name='unique_user_trait_score'),)
 
+class ReviewScoreAggregate(Base):
+    """
+    Running rating totals per reviewee, trait and review type for completed assignments
+    Updated by delta on submission so ReviewScore can be refreshed without rescanning responses
+    """
+    __tablename__ = "review_score_aggregates"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    review_type = Column(String(20), nullable=False)  # self, peer, supervisor
+    rating_sum = Column(Integer, nullable=False, default=0)
+    rating_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # Foreign Keys
+    cycle_id = Column(UUID(as_uuid=True), ForeignKey("review_cycles.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    trait_id = Column(UUID(as_uuid=True), ForeignKey("review_traits.id"), nullable=False)
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint('cycle_id', 'user_id', 'trait_id', 'review_type', name='unique_score_aggregate'),
+        CheckConstraint("review_type IN ('self', 'peer', 'supervisor')", name='valid_aggregate_review_type'),
+        CheckConstraint("rating_count >= 0", name='valid_aggregate_count')
+    )
+
+class ReviewAnalyticsCube(Base):
+    """
+    Pre-aggregated ratings per cycle, organization, trait and review type
+    Each organization's cell rolls up its whole subtree (built along the organization closure),
+    so a slice at any level is read directly instead of re-joining responses, users and
+    organizations per cycle. Sum and sum of squares give mean and spread; rating_1..rating_5
+    hold the histogram.
+    """
+    __tablename__ = "review_analytics_cube"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    review_type = Column(String(20), nullable=False)  # self, peer, supervisor
+    rating_count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(Integer, nullable=False, default=0)
+    rating_sum_squares = Column(Integer, nullable=False, default=0)
+    rating_1 = Column(Integer, nullable=False, default=0)
+    rating_2 = Column(Integer, nullable=False, default=0)
+    rating_3 = Column(Integer, nullable=False, default=0)
+    rating_4 = Column(Integer, nullable=False, default=0)
+    rating_5 = Column(Integer, nullable=False, default=0)
+    built_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Foreign Keys
+    cycle_id = Column(UUID(as_uuid=True), ForeignKey("review_cycles.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    trait_id = Column(UUID(as_uuid=True), ForeignKey("review_traits.id"), nullable=False)
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint('cycle_id', 'organization_id', 'trait_id', 'review_type', name='unique_cube_cell'),
+        Index('ix_review_analytics_cube_organization_trait', 'organization_id', 'trait_id'),
+        CheckConstraint("review_type IN ('self', 'peer', 'supervisor')", name='valid_cube_review_type')
+    )
+
+class ReviewCycleProgress(Base):
+    """
+    Maintained completion counters per cycle, reviewee organization and review type
+    Kept in step with ReviewAssignment.status so dashboards read O(departments) rows
+
+    review_type 'participants' rows count reviewees instead of assignments:
+    completed_count = reviewees with every assignment completed,
+    started_count = reviewees with at least one completed assignment
+    """
+    __tablename__ = "review_cycle_progress"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    review_type = Column(String(20), nullable=False)  # self, peer, supervisor, participants
+    total_count = Column(Integer, nullable=False, default=0)
+    completed_count = Column(Integer, nullable=False, default=0)
+    started_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    # Foreign Keys
+    cycle_id = Column(UUID(as_uuid=True), ForeignKey("review_cycles.id", ondelete="CASCADE"), nullable=False, index=True)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
+
+    # Relationships
+    organization = relationship("Organization")
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint('cycle_id', 'organization_id', 'review_type', name='unique_cycle_progress'),
+        CheckConstraint("review_type IN ('self', 'peer', 'supervisor', 'participants')", name='valid_progress_review_type'),
+        CheckConstraint("completed_count >= 0 AND completed_count <= total_count", name='valid_progress_counts')
+    )
+
+class AnalyticsJob(Base):
+    """
+    Background analytics computations (cycle analytics, review insights)
+    Run in a worker process; clients poll progress and read the persisted result
+    """
+    __tablename__ = "analytics_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    kind = Column(String(50), nullable=False)  # cycle_analytics, review_insights
+    subject_id = Column(String(64), nullable=False)  # Cycle or review the job analyses
+    input_key = Column(String(64), nullable=False, index=True)  # Hash of kind, subject and data version
+    status = Column(String(20), nullable=False, default='pending')  # pending, running, completed, failed
+    progress = Column(Integer, nullable=False, default=0)  # 0-100
+    message = Column(String(255))
+    result = Column(JSON)
+    error = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+
+    # Foreign Keys
+    requested_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+
+    # Constraints
+    __table_args__ = (
+        CheckConstraint("status IN ('pending', 'running', 'completed', 'failed')", name='valid_analytics_job_status'),
+        CheckConstraint("progress >= 0 AND progress <= 100", name='valid_analytics_job_progress')
+    )
+
 class PerformanceScore(Base):
     """
     Overall performance scores combining task and review performance
@@ -881,6 +1027,9 @@ class PerformanceScore(Base):
     # Foreign Keys
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     cycle_id = Column(UUID(as_uuid=True), ForeignKey("review_cycles.id", ondelete="CASCADE"), nullable=False)
+    # Units the ranks were computed within (the user's directorate / department at ranking time)
+    directorate_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=True)
+    department_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=True)
 
     # Relationships
     user = relationship("User")
@@ -889,9 +1038,50 @@ class PerformanceScore(Base):
     # Constraints
     __table_args__ = (
         UniqueConstraint('user_id', 'cycle_id', name='unique_user_cycle_performance'),
+        Index('ix_performance_scores_organization_rank', 'cycle_id', 'organization_rank'),
+        Index('ix_performance_scores_directorate_rank', 'cycle_id', 'directorate_id', 'directorate_rank'),
+        Index('ix_performance_scores_department_rank', 'cycle_id', 'department_id', 'department_rank'),
         CheckConstraint("performance_band IN ('outstanding', 'exceeds_expectations', 'meets_expectations', 'below_expectations', 'needs_improvement')", name='valid_performance_band')
     )
 
+class UserCycleSummary(Base):
+    """
+    Per-user, per-cycle performance snapshot written when a cycle completes
+    Trend views read one row per cycle instead of re-deriving history from raw responses
+    """
+    __tablename__ = "user_cycle_summaries"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    cycle_end_date = Column(DateTime(timezone=True), nullable=False)  # Copied from the cycle for range scans
+    overall_performance_score = Column(Numeric(5, 2))  # 0-100, as in performance_scores
+    task_performance_score = Column(Numeric(5, 2))
+    review_performance_score = Column(Numeric(5, 2))
+    performance_band = Column(String(30))
+    organization_rank = Column(Integer)
+    average_trait_score = Column(Numeric(3, 2))  # Mean weighted trait score, 1-5
+    trait_scores = Column(JSON)  # {trait_id: weighted_score}
+    task_count = Column(Integer, nullable=False, default=0)
+    completed_task_count = Column(Integer, nullable=False, default=0)
+    average_task_score = Column(Numeric(4, 2))  # Mean initiative score, 1-10
+    reviews_completed = Column(Integer, nullable=False, default=0)  # Completed assignments as reviewee
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # Foreign Keys
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    cycle_id = Column(UUID(as_uuid=True), ForeignKey("review_cycles.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=True)  # At cycle completion
+
+    # Relationships
+    user = relationship("User")
+    cycle = relationship("ReviewCycle")
+
+    # Constraints
+    __table_args__ = (
+        UniqueConstraint('user_id', 'cycle_id', name='unique_user_cycle_summary'),
+        Index('ix_user_cycle_summaries_user_end_date', 'user_id', 'cycle_end_date'),
+    )
+
 # Notification System Models
 
 class NotificationType(str, enum.Enum):
@@ -3,8 +3,7 @@ Initiative Management API Router
 Based on CLAUDE.md specification with comprehensive initiative workflows
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Request
 from sqlalchemy.orm import Session
 from sqlalchemy import or_, func
 from typing import List, Optional
@@ -20,12 +19,14 @@ from schemas.initiatives import (
     InitiativeExtensionRequest, InitiativeExtensionReview, Initiative as InitiativeSchema,
     InitiativeWithAssignees, InitiativeForReview, InitiativeSubmissionDetail, InitiativeDocument, InitiativeExtension,
     InitiativeList, InitiativeStats, InitiativeUrgency, InitiativeAssignee, InitiativeApproval,
-    SubTask, SubTaskCreate, SubTaskUpdate, SubTaskReorder
+    SubTask, SubTaskCreate, SubTaskUpdate, SubTaskReorder, InitiativeBulkCreate, InitiativeBulkCreateResponse
 )
 from schemas.auth import UserSession
 from utils.auth import get_current_user
 from utils.permissions import UserPermissions, SystemPermissions
 from utils.initiative_workflows import InitiativeWorkflowService
+from utils.blob_storage import BlobStorageService
+from utils.file_delivery import file_download_response, guess_media_type, blob_etag
 
 router = APIRouter(prefix="/initiatives", tags=["initiatives"])
 
@@ -209,9 +210,6 @@ async def upload_initiative_document(
     Returns document ID that can be used when creating initiatives or submissions
     """
     from models import InitiativeDocument as InitiativeDocumentModel
-    import os
-    import uuid as uuid_module
-    from datetime import datetime
 
     user = db.query(User).filter(User.id == current_user.user_id).first()
     if not user:
@@ -230,27 +228,23 @@ async def upload_initiative_document(
     if file.content_type not in allowed_types:
         raise HTTPException(status_code=400, detail="File type not allowed")
 
-    # Create uploads directory if it doesn't exist
-    upload_dir = "uploads/initiative_documents"
-    os.makedirs(upload_dir, exist_ok=True)
-
-    # Generate unique filename
-    file_extension = os.path.splitext(file.filename)[1] if file.filename else ""
-    unique_filename = f"{uuid_module.uuid4()}{file_extension}"
-    file_path = os.path.join(upload_dir, unique_filename)
+    content = await file.read()
+    if len(content) > 10 * 1024 * 1024:
+        raise HTTPException(status_code=413, detail="File too large (max 10MB)")
 
-    # Save file
+    # Save file to deduplicated blob storage (identical files share one blob)
     try:
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
-    except Exception as e:
+        blob = BlobStorageService(db).store(content, file.content_type)
+    except OSError:
+        db.rollback()
         raise HTTPException(status_code=500, detail="Failed to save file")
 
     # Create document record (without initiative_id initially)
+    # Unattached uploads are removed by the upload garbage collector after a grace period
     document = InitiativeDocumentModel(
-        file_name=file.filename or unique_filename,
-        file_path=file_path,
+        file_name=file.filename or blob.content_hash,
+        file_path=blob.file_path,
+        blob_id=blob.id,
         uploaded_by=user.id
         # initiative_id will be None initially and set when attached to an initiative
     )
@@ -301,6 +295,35 @@ async def create_initiative(
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.post("/bulk", response_model=InitiativeBulkCreateResponse)
+async def create_initiatives_bulk(
+    bulk_data: InitiativeBulkCreate,
+    current_user: UserSession = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    initiative_service: InitiativeWorkflowService = Depends(get_initiative_service)
+):
+    """
+    Create many initiatives in one transaction
+    Same scope and status rules as POST /initiatives; the whole batch fails if any item is invalid
+    """
+    user = db.query(User).filter(User.id == current_user.user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    try:
+        initiatives = initiative_service.create_initiatives_bulk(
+            creator=user,
+            initiatives_data=[initiative_data.dict() for initiative_data in bulk_data.initiatives]
+        )
+    except ValueError as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return InitiativeBulkCreateResponse(
+        initiatives=[InitiativeSchema.from_orm(initiative) for initiative in initiatives],
+        total=len(initiatives)
+    )
+
 @router.put("/{initiative_id}/approve", response_model=InitiativeSchema)
 async def approve_initiative(
     initiative_id: uuid.UUID,
@@ -464,47 +487,8 @@ async def get_initiative_stats(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    # Get user's visible initiatives
-    initiatives = initiative_service.get_user_initiatives(user)
-
-    # Calculate statistics
-    total_initiatives = len(initiatives)
-
-    by_status = {}
-    for initiative_status in InitiativeStatus:
-        by_status[initiative_status.value] = sum(1 for initiative in initiatives if initiative.status == initiative_status)
-
-    by_type = {}
-    for initiative_type in InitiativeType:
-        by_type[initiative_type.value] = sum(1 for initiative in initiatives if initiative.type == initiative_type)
-
-    # Calculate urgency statistics
-    by_urgency = {}
-    for initiative_urgency in InitiativeUrgency:
-        by_urgency[initiative_urgency.value] = sum(1 for initiative in initiatives if initiative.urgency == initiative_urgency)
-
-    # Count overdue and pending approval initiatives
-    overdue_initiatives = sum(1 for initiative in initiatives if initiative.status == InitiativeStatus.OVERDUE)
-    pending_approval = sum(1 for initiative in initiatives if initiative.status == InitiativeStatus.PENDING_APPROVAL)
-
-    # Calculate average score and completion rate
-    scored_initiatives = [initiative for initiative in initiatives if initiative.score is not None]
-    average_score = sum(initiative.score for initiative in scored_initiatives) / len(scored_initiatives) if scored_initiatives else None
-
-    completed_or_approved = sum(1 for initiative in initiatives
-                              if initiative.status in [InitiativeStatus.UNDER_REVIEW, InitiativeStatus.COMPLETED])
-    completion_rate = (completed_or_approved / total_initiatives * 100) if total_initiatives > 0 else 0
-
-    return InitiativeStats(
-        total_initiatives=total_initiatives,
-        by_status=by_status,
-        by_type=by_type,
-        by_urgency=by_urgency,
-        overdue_initiatives=overdue_initiatives,
-        pending_approval=pending_approval,
-        average_score=average_score,
-        completion_rate=completion_rate
-    )
+    # Aggregate in SQL over the user's visible initiatives
+    return InitiativeStats(**initiative_service.get_initiative_stats(user))
 
 @router.get("/assignable-users")
 async def get_assignable_users(
@@ -1162,26 +1146,17 @@ async def upload_initiative_document(
     if not initiative_service.get_initiative_visibility(user, initiative_id):
         raise HTTPException(status_code=403, detail="Cannot access this initiative")
 
-    # Create uploads directory if it doesn't exist
-    upload_dir = "uploads/initiatives"
-    os.makedirs(upload_dir, exist_ok=True)
-
-    # Generate unique filename
-    file_extension = file.filename.split('.')[-1] if '.' in file.filename else ''
-    unique_filename = f"{uuid.uuid4()}.{file_extension}"
-    file_path = os.path.join(upload_dir, unique_filename)
-
-    # Save file
-    with open(file_path, "wb") as buffer:
-        content = await file.read()
-        buffer.write(content)
+    # Save file to deduplicated blob storage
+    content = await file.read()
+    blob = BlobStorageService(db).store(content, file.content_type)
 
     # Create document record
     from models import InitiativeDocument as DocumentModel
     document = DocumentModel(
         initiative_id=initiative_id,
         file_name=file.filename,
-        file_path=file_path,
+        file_path=blob.file_path,
+        blob_id=blob.id,
         uploaded_by=user.id
     )
 
@@ -1194,11 +1169,15 @@ async def upload_initiative_document(
 @router.get("/documents/{document_id}/download")
 async def download_initiative_document(
     document_id: uuid.UUID,
+    request: Request,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
     initiative_service: InitiativeWorkflowService = Depends(get_initiative_service)
 ):
-    """Download an initiative document"""
+    """
+    Download an initiative document
+    Supports conditional (304) and byte-range (206) requests, and proxy offload via FILE_DELIVERY_MODE
+    """
     user = db.query(User).filter(User.id == current_user.user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
@@ -1218,11 +1197,14 @@ async def download_initiative_document(
     if not os.path.exists(document.file_path):
         raise HTTPException(status_code=404, detail="File not found on server")
 
-    # Return file
-    return FileResponse(
-        path=document.file_path,
-        filename=document.file_name,
-        media_type='application/octet-stream'
+    # Blob-backed documents use the content hash as a strong validator
+    blob = document.blob
+    return file_download_response(
+        request,
+        file_path=document.file_path,
+        file_name=document.file_name,
+        media_type=guess_media_type(document.file_name, blob.content_type if blob else None),
+        etag=blob_etag(blob.content_hash) if blob else None
     )
 
 @router.get("/user/{user_id}")
@@ -1562,15 +1544,12 @@ async def delete_initiative(
     # Delete submissions
     db.query(InitiativeSubmission).filter(InitiativeSubmission.initiative_id == initiative_id).delete()
 
-    # Delete documents (note: you may want to also delete physical files)
+    # Delete documents, releasing their blob references
+    # Shared blobs stay on disk until the upload garbage collector finds them unreferenced
+    blob_storage = BlobStorageService(db)
     documents = db.query(InitiativeDocument).filter(InitiativeDocument.initiative_id == initiative_id).all()
     for doc in documents:
-        # Optionally delete physical file
-        if os.path.exists(doc.file_path):
-            try:
-                os.remove(doc.file_path)
-            except Exception as e:
-                print(f"Error deleting file {doc.file_path}: {e}")
+        blob_storage.release_document(doc)
         db.delete(doc)
 
     # Delete extensions
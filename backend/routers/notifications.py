@@ -19,6 +19,7 @@ from schemas.notifications import (
 from schemas.auth import UserSession
 from utils.auth import get_current_user
 from utils.websocket_manager import manager
+from utils.permissions import UserPermissions
 import logging
 
 logger = logging.getLogger(__name__)
@@ -110,6 +111,26 @@ async def websocket_endpoint(
                 except Exception as e:
                     logger.error(f"Error marking notification as read: {e}")
 
+            # Handle review cycle progress subscriptions (admins on the review-management page)
+            elif data.startswith("subscribe_cycle:"):
+                try:
+                    cycle_id = UUID(data.split(":")[1])
+                    permissions = UserPermissions(db).get_user_effective_permissions(user)["permissions"]
+                    if "review_view_all" in permissions:
+                        manager.subscribe_cycle(user_id, str(cycle_id))
+                        await websocket.send_json({
+                            "type": "cycle_subscribed",
+                            "cycle_id": str(cycle_id)
+                        })
+                except Exception as e:
+                    logger.error(f"Error subscribing to cycle progress: {e}")
+
+            elif data.startswith("unsubscribe_cycle:"):
+                try:
+                    manager.unsubscribe_cycle(user_id, str(UUID(data.split(":")[1])))
+                except Exception as e:
+                    logger.error(f"Error unsubscribing from cycle progress: {e}")
+
     except WebSocketDisconnect:
         manager.disconnect(websocket, user_id)
         logger.info(f"User {user_id} disconnected from WebSocket")
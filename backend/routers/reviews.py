@@ -4,19 +4,39 @@ Handles review cycles, reviews, and evaluation workflows
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, and_, or_, desc, asc
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import func, and_, or_, desc, asc, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import List, Optional, Dict, Any
-from database import get_db
-from models import User, ReviewCycle, Review, PeerReview, Initiative, InitiativeAssignment, Goal, Organization, ReviewTrait, ReviewQuestion, ReviewCycleTrait, ReviewAssignment, ReviewResponse as ReviewResponseModel, ReviewScore, PerformanceScore, ReviewCycleStatus
+from database import get_db, SessionLocal
+from models import User, ReviewCycle, ReviewCycleProgress, AnalyticsJob, Review, PeerReview, Initiative, InitiativeAssignment, Goal, Organization, ReviewTrait, ReviewQuestion, ReviewCycleTrait, ReviewAssignment, ReviewResponse as ReviewResponseModel, ReviewScore, PerformanceScore, ReviewCycleStatus, OrganizationLevel
 from routers.auth import get_current_user
 from utils.permissions import UserPermissions
+from utils.review_scoring import ReviewScoringService, complete_assignment
+from utils.review_progress import ReviewProgressService, PARTICIPANTS, push_cycle_progress
+from utils.review_forms import get_form_catalog, invalidate_form_catalog
+from utils.trait_inheritance import TraitApplicability, resolve_trait_applicability
+from utils.participant_criteria import participant_filter, cycle_participant_filter, count_participants
+from utils.review_bias import RatingMatrix, rating_distribution
+from utils.review_text import scan_batch, response_texts, mentions, mention_count, topics_in
+from utils.analytics_cache import cycle_results, cycle_watermark
+from utils.analytics_jobs import submit_analytics_job, serialize_job
+from utils.performance_ranking import PerformanceRankingService, RANK_SCOPES
+from utils.performance_history import PerformanceHistoryService, RESOLUTIONS, downsample, trend_direction
+from utils.review_cube import ReviewCubeService, DIMENSIONS as CUBE_DIMENSIONS
+from utils.cycle_export import EXPORT_FORMATS, EXPORT_DATASETS, stream_cycle_export
+from utils.file_delivery import content_disposition
+from utils.review_assignments import ReviewParticipant, plan_review_assignments, assignment_seed, DEFAULT_PEER_COUNT
 from pydantic import BaseModel
 from datetime import datetime, timedelta
 import json
+import uuid
 
 router = APIRouter(tags=["reviews"])
 
+REVIEW_ASSIGNMENT_TYPES = ('self', 'peer', 'supervisor')
+
 # Pydantic models
 class ReviewCycleCreate(BaseModel):
     name: str
@@ -29,12 +49,19 @@ class ReviewCycleCreate(BaseModel):
     target_population: Optional[dict] = None
     inclusion_criteria: Optional[dict] = None
     exclusion_criteria: Optional[dict] = None
-    mandatory_participants: Optional[List[int]] = None
+    mandatory_participants: Optional[List[str]] = None
     components: Optional[dict] = None
     ai_assistance: Optional[dict] = None
     calibration_sessions: Optional[dict] = None
     approval_workflow: Optional[dict] = None
 
+class ParticipantCriteria(BaseModel):
+    target_population: Optional[dict] = None
+    inclusion_criteria: Optional[dict] = None
+    exclusion_criteria: Optional[dict] = None
+    mandatory_participants: Optional[List[str]] = None
+    start_date: Optional[datetime] = None  # tenure reference date; defaults to now
+
 class ReviewCycleUpdate(BaseModel):
     name: Optional[str] = None
     type: Optional[str] = None
@@ -175,6 +202,16 @@ async def create_review_cycle(
             detail="Insufficient permissions to create review cycles"
         )
 
+    try:
+        participant_filter(
+            cycle_data.target_population,
+            cycle_data.inclusion_criteria,
+            cycle_data.exclusion_criteria,
+            cycle_data.mandatory_participants
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     cycle = ReviewCycle(
         name=cycle_data.name,
         type=cycle_data.type,
@@ -227,6 +264,32 @@ async def create_review_cycle(
 
     return cycle
 
+@router.post("/cycles/participants/dry-run")
+async def preview_cycle_participants(
+    criteria: ParticipantCriteria,
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Count the users a set of participant criteria would select, without creating anything"""
+    if "review_create_cycle" not in current_user.permissions:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to preview cycle participants"
+        )
+
+    try:
+        predicate = participant_filter(
+            criteria.target_population,
+            criteria.inclusion_criteria,
+            criteria.exclusion_criteria,
+            criteria.mandatory_participants,
+            reference_date=criteria.start_date
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return {"participants_count": count_participants(db, predicate)}
+
 @router.get("/cycles/{cycle_id}", response_model=ReviewCycleResponse)
 async def get_review_cycle(
     cycle_id: str,
@@ -287,9 +350,8 @@ async def update_review_cycle(
         )
     
     # Check permissions
-    permission_engine = get_permission_engine(db)
-    if not (cycle.created_by == current_user.user_id or 
-            permission_engine.check_permission(current_user, "reviews:update:all")):
+    if not (cycle.created_by == current_user.user_id or
+            "review_manage_cycle" in current_user.permissions):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Insufficient permissions to update this review cycle"
@@ -297,12 +359,25 @@ async def update_review_cycle(
     
     # Update fields
     update_data = cycle_data.dict(exclude_unset=True)
+    was_completed = cycle.status == ReviewCycleStatus.COMPLETED
     for field, value in update_data.items():
         setattr(cycle, field, value)
     
     db.commit()
     db.refresh(cycle)
 
+    # Freeze scores, ranks, per-user summaries and the analytics cube when the cycle completes.
+    # Each build commits on its own; one that fails stays unrecorded and the scheduled tasks retry it
+    if not was_completed and cycle.status == ReviewCycleStatus.COMPLETED:
+        for build in (PerformanceHistoryService(db).summarize_cycle, ReviewCubeService(db).build_cycle):
+            try:
+                build(cycle.id)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                print(f"Error building analytics for completed cycle {cycle.id}: {e}")
+        db.refresh(cycle)
+
     return cycle
 
 @router.post("/cycles/{cycle_id}/sync-traits")
@@ -354,6 +429,7 @@ async def sync_cycle_traits(
             new_links_count += 1
 
     db.commit()
+    invalidate_form_catalog(cycle_id)
 
     return {
         "message": f"Successfully synced traits to cycle",
@@ -632,65 +708,67 @@ async def create_peer_review(
     return peer_review
 
 def _initialize_cycle_participants(cycle: ReviewCycle, db: Session) -> List[User]:
-    """Initialize participants for a review cycle based on target population"""
-    query = db.query(User).filter(User.is_active == True)
-    
-    # Apply inclusion criteria
-    if cycle.inclusion_criteria:
-        # This would contain logic for filtering users based on criteria
-        # For now, just get all active users
-        pass
-    
-    # Apply exclusion criteria
-    if cycle.exclusion_criteria:
-        # Apply exclusion logic
-        pass
-    
-    participants = query.all()
-    
-    # Add mandatory participants
-    if cycle.mandatory_participants:
-        mandatory_users = db.query(User).filter(User.id.in_(cycle.mandatory_participants)).all()
-        participant_ids = {p.id for p in participants}
-        for user in mandatory_users:
-            if user.id not in participant_ids:
-                participants.append(user)
-    
-    return participants
+    """Initialize participants for a review cycle from its criteria (one query)"""
+    try:
+        predicate = cycle_participant_filter(cycle)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return db.query(User).filter(predicate).all()
 
 # Advanced Review System Features
 
-@router.post("/cycles/{cycle_id}/analytics")
+@router.post("/cycles/{cycle_id}/analytics", status_code=status.HTTP_202_ACCEPTED)
 async def generate_cycle_analytics(
-    cycle_id: int,
+    cycle_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Generate comprehensive analytics for a review cycle"""
+    """
+    Queue comprehensive analytics for a review cycle
+    Returns the job; poll GET /analytics-jobs/{job_id} for progress and the result
+    """
     cycle = db.query(ReviewCycle).filter(ReviewCycle.id == cycle_id).first()
     
     if not cycle:
         raise HTTPException(status_code=404, detail="Review cycle not found")
     
-    permission_engine = get_permission_engine(db)
-    if not permission_engine.check_permission(current_user, "reviews:analytics:view"):
+    if "review_view_all" not in current_user.permissions:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
-    
+
+    job = submit_analytics_job(
+        db, "cycle_analytics", cycle.id,
+        version=(cycle.updated_at,) + cycle_watermark(db, cycle.id, Review, PeerReview),
+        handler=_cycle_analytics_job,
+        requested_by=current_user.user_id
+    )
+    return serialize_job(job)
+
+def _cycle_analytics_job(db: Session, cycle_id: str, progress) -> dict:
+    """Comprehensive cycle analytics (runs in an analytics worker process)"""
+    cycle = db.query(ReviewCycle).filter(ReviewCycle.id == cycle_id).first()
+    if not cycle:
+        raise ValueError("Review cycle not found")
+
     # Get all reviews for this cycle
+    progress(10, "Loading reviews")
     reviews = db.query(Review).filter(Review.cycle_id == cycle_id).all()
     peer_reviews = db.query(PeerReview).filter(PeerReview.cycle_id == cycle_id).all()
     
-    analytics = {
+    # Parse the review responses once for every bias metric and scan every comment once
+    progress(40, "Parsing responses")
+    ratings = RatingMatrix(reviews)
+    scan_batch(response_texts(review.responses for review in reviews + peer_reviews))
+
+    progress(70, "Computing analytics")
+    return {
         "cycle_overview": _generate_cycle_overview(cycle, reviews, peer_reviews),
         "participation_analysis": _analyze_participation(reviews, peer_reviews),
         "performance_insights": _analyze_performance_patterns(reviews),
-        "bias_analysis": _detect_and_analyze_bias(reviews, peer_reviews),
+        "bias_analysis": _detect_and_analyze_bias(reviews, peer_reviews, ratings),
         "consistency_metrics": _analyze_rating_consistency(reviews, peer_reviews),
         "quality_assessment": _assess_review_quality(reviews, peer_reviews),
-        "recommendations": _generate_cycle_recommendations(cycle, reviews, peer_reviews)
+        "recommendations": _generate_cycle_recommendations(cycle, reviews, peer_reviews, ratings)
     }
-    
-    return analytics
 
 @router.post("/cycles/{cycle_id}/calibration")
 async def schedule_calibration_session(
@@ -738,47 +816,80 @@ async def get_bias_detection_report(
     if not permission_engine.check_permission(current_user, "reviews:analytics:view"):
         raise HTTPException(status_code=403, detail="Insufficient permissions")
     
+    cycle = db.query(ReviewCycle).filter(ReviewCycle.id == cycle_id).first()
+    if not cycle:
+        raise HTTPException(status_code=404, detail="Review cycle not found")
+
+    return cycle_results.get_or_compute(
+        "bias-detection", cycle,
+        watermark=lambda: cycle_watermark(db, cycle.id, Review, PeerReview),
+        compute=lambda: _build_bias_detection_report(cycle.id, db)
+    )
+
+def _build_bias_detection_report(cycle_id, db: Session) -> dict:
+    """Bias detection report for a cycle from its Review and PeerReview rows"""
     reviews = db.query(Review).filter(Review.cycle_id == cycle_id).all()
     peer_reviews = db.query(PeerReview).filter(PeerReview.cycle_id == cycle_id).all()
     
+    # Parse the review responses once for every bias metric
+    ratings = RatingMatrix(reviews)
+    peer_ratings = RatingMatrix(peer_reviews)
+
     bias_report = {
-        "overall_bias_score": _calculate_overall_bias_score(reviews, peer_reviews),
+        "overall_bias_score": ratings.overall_bias_score(),
         "bias_types": {
-            "recency_bias": _detect_recency_bias(reviews),
-            "halo_effect": _detect_halo_effect(reviews),
+            "recency_bias": ratings.recency_bias(),
+            "halo_effect": ratings.halo_effect(),
             "similarity_bias": _detect_similarity_bias(peer_reviews),
-            "leniency_bias": _detect_leniency_bias(reviews),
-            "central_tendency": _detect_central_tendency_bias(reviews)
+            "leniency_bias": ratings.leniency_bias(),
+            "central_tendency": ratings.central_tendency_bias()
         },
         "affected_groups": _analyze_demographic_bias(reviews, db),
-        "reviewer_patterns": _analyze_reviewer_bias_patterns(peer_reviews),
-        "mitigation_recommendations": _generate_bias_mitigation_recommendations(reviews, peer_reviews)
+        "reviewer_patterns": _analyze_reviewer_bias_patterns(peer_ratings),
+        "mitigation_recommendations": _generate_bias_mitigation_recommendations(ratings)
     }
     
     return bias_report
 
-@router.post("/ai-insights/{review_id}")
+@router.post("/ai-insights/{review_id}", status_code=status.HTTP_202_ACCEPTED)
 async def generate_ai_insights(
-    review_id: int,
+    review_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Generate AI-powered insights for a specific review"""
+    """
+    Queue AI-powered insights for a specific review
+    Returns the job; poll GET /analytics-jobs/{job_id} for progress and the result
+    """
     review = db.query(Review).filter(Review.id == review_id).first()
     
     if not review:
         raise HTTPException(status_code=404, detail="Review not found")
     
     # Check permissions
-    if review.reviewee_id != current_user.user_id:
-        permission_engine = get_permission_engine(db)
-        if not permission_engine.check_permission(current_user, "reviews:read:all"):
-            raise HTTPException(status_code=403, detail="Insufficient permissions")
+    if review.reviewee_id != current_user.user_id and "review_view_all" not in current_user.permissions:
+        raise HTTPException(status_code=403, detail="Insufficient permissions")
     
     if not review.responses:
         raise HTTPException(status_code=400, detail="No review responses to analyze")
-    
+
+    # Versioned by the analyzed input only: the job stores ai_insights, which bumps updated_at
+    job = submit_analytics_job(
+        db, "review_insights", review.id,
+        version=review.responses,
+        handler=_review_insights_job,
+        requested_by=current_user.user_id
+    )
+    return serialize_job(job)
+
+def _review_insights_job(db: Session, review_id: str, progress) -> dict:
+    """Insights for one review, stored on the review (runs in an analytics worker process)"""
+    review = db.query(Review).filter(Review.id == review_id).first()
+    if not review or not review.responses:
+        raise ValueError("No review responses to analyze")
+
     # Generate AI insights
+    progress(30, "Analyzing responses")
     insights = {
         "performance_highlights": _extract_performance_highlights(review.responses),
         "development_areas": _identify_development_areas(review.responses),
@@ -791,64 +902,83 @@ async def generate_ai_insights(
     
     # Store insights
     review.ai_insights = insights
-    review.sentiment_analysis = insights["sentiment_analysis"]
-    review.topic_analysis = insights["topic_extraction"]
-    
-    db.commit()
     
     return insights
 
+@router.get("/analytics-jobs/{job_id}")
+async def get_analytics_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Progress of an analytics job, with its result once completed"""
+    job = db.query(AnalyticsJob).filter(AnalyticsJob.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Analytics job not found")
+
+    # Jobs are shared between users with the same input, so access follows the job's subject
+    # rather than whoever happened to submit it first
+    if not _can_view_job_subject(job, current_user, db):
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    return serialize_job(job)
+
+def _can_view_job_subject(job: AnalyticsJob, current_user, db: Session) -> bool:
+    """The access check of the endpoint that submits this kind of job"""
+    if "review_view_all" in current_user.permissions:
+        return True
+    if job.kind == "review_insights":
+        reviewee_id = db.query(Review.reviewee_id).filter(Review.id == job.subject_id).scalar()
+        return reviewee_id is not None and reviewee_id == current_user.user_id
+    if job.kind == "performance_ranking":
+        return "review_manage_cycle" in current_user.permissions
+    return False
+
 @router.get("/performance-dashboard/{user_id}")
 async def get_performance_dashboard(
-    user_id: int,
+    user_id: str,
     time_period: str = Query("current_year"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get comprehensive performance dashboard for a user"""
+    """
+    Performance dashboard for a user from the per-cycle summaries
+    Reads one row per completed cycle in the period plus the user's goals
+    """
     
     # Check permissions
-    if user_id != current_user.user_id:
-        permission_engine = get_permission_engine(db)
-        if not (current_user.is_superuser or permission_engine.check_permission(current_user, "performance:view:all")):
-            raise HTTPException(status_code=403, detail="Insufficient permissions")
+    if user_id != str(current_user.user_id) and "performance_view_all" not in current_user.permissions:
+        raise HTTPException(status_code=403, detail="Insufficient permissions")
     
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    # Get reviews for the user
-    reviews_query = db.query(Review).filter(Review.reviewee_id == user_id)
-    peer_reviews_query = db.query(PeerReview).filter(PeerReview.reviewee_id == user_id)
-    
-    # Apply time filter
+    start_date = None
     if time_period == "current_year":
         start_date = datetime.now().replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
-        reviews_query = reviews_query.filter(Review.created_at >= start_date)
-        peer_reviews_query = peer_reviews_query.filter(PeerReview.created_at >= start_date)
     elif time_period == "last_6_months":
         start_date = datetime.now() - timedelta(days=180)
-        reviews_query = reviews_query.filter(Review.created_at >= start_date)
-        peer_reviews_query = peer_reviews_query.filter(PeerReview.created_at >= start_date)
-    
-    reviews = reviews_query.all()
-    peer_reviews = peer_reviews_query.all()
-    
+
+    # Completed cycles, one summary row each, instead of every historical review
+    history = PerformanceHistoryService(db).user_history(user_id, start_date=start_date)
+    competencies = _track_competency_progression(history, db)
+
     dashboard = {
         "user_profile": {
             "id": user.id,
             "name": f"{user.first_name} {user.last_name}",
             "email": user.email,
             "job_title": user.job_title,
-            "department": user.department.name if user.department else None
+            "department": user.organization.name if user.organization else None
         },
-        "performance_summary": _generate_performance_summary(reviews, peer_reviews),
+        "performance_summary": _summarize_performance(history, competencies),
+        "cycle_history": history,
         "goal_achievement": _analyze_goal_achievement(user_id, db),
-        "competency_analysis": _analyze_competency_development(reviews),
-        "peer_feedback_trends": _analyze_peer_feedback_trends(peer_reviews),
-        "development_progress": _track_development_progress(reviews),
-        "recognition_highlights": _extract_recognition_highlights(reviews, peer_reviews),
-        "growth_recommendations": _generate_growth_recommendations(user_id, reviews, peer_reviews, db)
+        "competency_analysis": competencies,
+        "development_progress": _calculate_performance_trajectory(history),
+        "task_trends": _analyze_task_trends(history),
+        "growth_recommendations": _recommend_growth(competencies)
     }
     
     return dashboard
@@ -857,12 +987,20 @@ async def get_performance_dashboard(
 async def get_organization_performance(
     cycle_id: Optional[str] = Query(None, description="Review cycle ID"),
     department: Optional[str] = Query(None),
+    page: Optional[int] = Query(None, ge=1, description="Page number; omit to return all employees"),
+    per_page: int = Query(100, ge=1, le=500),
+    format: str = Query("json", pattern="^(json|ndjson)$", description="ndjson streams one employee per line"),
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Get organization-wide performance analytics based on review cycle
     Returns task performance, values/traits scores, and competency framework data
+
+    Employee data is loaded in batches with a fixed number of grouped queries per batch.
+    - page/per_page: return one page of employees plus pagination info
+    - format=ndjson: stream a "meta" line followed by one "employee" line per employee,
+      so clients can render progressively
     """
 
     # Check permissions
@@ -870,7 +1008,7 @@ async def get_organization_performance(
         raise HTTPException(status_code=403, detail="Insufficient permissions to view organization performance")
 
     # Get review cycle (use most recent active if not specified)
-    from models import UserStatus, ReviewCycleStatus, InitiativeStatus
+    from models import UserStatus, ReviewCycleStatus
     cycle = None
     if cycle_id:
         cycle = db.query(ReviewCycle).filter(ReviewCycle.id == cycle_id).first()
@@ -885,8 +1023,8 @@ async def get_organization_performance(
     if not cycle:
         raise HTTPException(status_code=404, detail="No active review cycle found")
 
-    # Build base query for employees
-    employees_query = db.query(User).filter(User.status == UserStatus.ACTIVE)
+    # Build base query for employees (stable order so pages do not overlap)
+    employees_query = db.query(User.id).filter(User.status == UserStatus.ACTIVE)
 
     # Apply department filter
     if department and department != "all":
@@ -898,7 +1036,10 @@ async def get_organization_performance(
             if dept:
                 employees_query = employees_query.filter(User.organization_id == dept.id)
 
-    employees = employees_query.all()
+    employee_ids = [row[0] for row in employees_query.order_by(User.last_name, User.first_name, User.id).all()]
+    total_employees = len(employee_ids)
+    if page is not None:
+        employee_ids = employee_ids[(page - 1) * per_page:page * per_page]
 
     # Get all traits for this cycle
     cycle_traits = db.query(ReviewTrait).join(
@@ -908,80 +1049,168 @@ async def get_organization_performance(
         ReviewTrait.is_active == True
     ).order_by(ReviewTrait.display_order).all()
 
-    # Prepare employee performance data
+    cycle_data = {
+        "id": str(cycle.id),
+        "name": cycle.name,
+        "type": cycle.type,
+        "period": cycle.period,
+        "start_date": cycle.start_date.isoformat(),
+        "end_date": cycle.end_date.isoformat(),
+        "status": cycle.status.value
+    }
+    traits_data = [{"id": str(t.id), "name": t.name, "description": t.description} for t in cycle_traits]
+    trait_rows = [(str(t.id), t.name, t.description, t.scope_type) for t in cycle_traits]
+    applicability = resolve_trait_applicability(db)
+
+    cycle_snapshot = {"id": cycle.id, "start_date": cycle.start_date, "end_date": cycle.end_date}
+
+    if format == "ndjson":
+        def stream_employees():
+            # The request session is closed once the endpoint returns, so stream with our own
+            stream_db = SessionLocal()
+            try:
+                yield json.dumps({
+                    "type": "meta",
+                    "cycle": cycle_data,
+                    "traits": traits_data,
+                    "total": total_employees,
+                    "page": page,
+                    "per_page": per_page
+                }) + "\n"
+                for start in range(0, len(employee_ids), per_page):
+                    batch = _load_employee_performance(
+                        stream_db, cycle_snapshot, trait_rows, applicability, employee_ids[start:start + per_page]
+                    )
+                    yield "".join(json.dumps({"type": "employee", **employee}) + "\n" for employee in batch)
+            finally:
+                stream_db.close()
+
+        return StreamingResponse(stream_employees(), media_type="application/x-ndjson")
+
     employee_performance = []
+    for start in range(0, len(employee_ids), per_page):
+        employee_performance.extend(
+            _load_employee_performance(db, cycle_snapshot, trait_rows, applicability, employee_ids[start:start + per_page])
+        )
 
-    for employee in employees:
-        # Get tasks within cycle date range
-        tasks = db.query(Initiative).join(
-            InitiativeAssignment, InitiativeAssignment.initiative_id == Initiative.id
-        ).filter(
-            InitiativeAssignment.user_id == employee.id,
-            Initiative.created_at >= cycle.start_date,
-            Initiative.created_at <= cycle.end_date
-        ).all()
+    result = {
+        "cycle": cycle_data,
+        "traits": traits_data,
+        "employees": employee_performance
+    }
+    if page is not None:
+        result["pagination"] = {
+            "page": page,
+            "per_page": per_page,
+            "total": total_employees,
+            "pages": (total_employees + per_page - 1) // per_page
+        }
+    return result
 
-        # Calculate task metrics
-        total_tasks = len(tasks)
-        completed_tasks = len([t for t in tasks if t.status == InitiativeStatus.COMPLETED])
-        task_scores = [t.score for t in tasks if t.score is not None]
-        avg_task_score = sum(task_scores) / len(task_scores) if task_scores else None
+def _load_employee_performance(
+    db: Session, cycle: dict, trait_rows: list, applicability: TraitApplicability, employee_ids: list
+) -> List[dict]:
+    """
+    Build organization-performance rows for a batch of employees with four grouped queries
+    (employees with their organization, initiatives, trait scores, review counts)
 
-        # Get task details with ratings
-        task_details = []
-        for task in tasks:
-            task_details.append({
-                "id": str(task.id),
-                "title": task.title,
-                "status": task.status.value,
-                "score": task.score,
-                "due_date": task.due_date.isoformat() if task.due_date else None,
-                "completed_at": task.reviewed_at.isoformat() if task.reviewed_at else None
-            })
+    Args:
+        cycle: {"id", "start_date", "end_date"}
+        trait_rows: (trait_id, name, description, scope_type) in display order
+        applicability: resolved trait applicability of every organization
+    """
+    from models import InitiativeStatus, TraitScopeType
 
-        # Get trait scores for this employee in this cycle
-        trait_scores = db.query(ReviewScore).filter(
-            ReviewScore.cycle_id == cycle.id,
-            ReviewScore.user_id == employee.id
-        ).all()
+    if not employee_ids:
+        return []
+
+    employees = db.query(
+        User.id, User.first_name, User.last_name, User.email, User.job_title,
+        User.organization_id, Organization.name.label("department_name")
+    ).outerjoin(
+        Organization, Organization.id == User.organization_id
+    ).filter(User.id.in_(employee_ids)).all()
+    employees_by_id = {employee.id: employee for employee in employees}
+
+    # Tasks within cycle date range, grouped by assignee
+    tasks_by_user = {}
+    for user_id, task_id, title, task_status, score, due_date, reviewed_at in db.query(
+        InitiativeAssignment.user_id, Initiative.id, Initiative.title, Initiative.status,
+        Initiative.score, Initiative.due_date, Initiative.reviewed_at
+    ).join(
+        Initiative, InitiativeAssignment.initiative_id == Initiative.id
+    ).filter(
+        InitiativeAssignment.user_id.in_(employee_ids),
+        Initiative.created_at >= cycle["start_date"],
+        Initiative.created_at <= cycle["end_date"]
+    ).all():
+        tasks_by_user.setdefault(user_id, []).append({
+            "id": str(task_id),
+            "title": title,
+            "status": task_status.value,
+            "score": score,
+            "due_date": due_date.isoformat() if due_date else None,
+            "completed_at": reviewed_at.isoformat() if reviewed_at else None
+        })
+
+    # Weighted trait scores for this cycle
+    scores_by_user = {}
+    for user_id, trait_id, weighted_score in db.query(
+        ReviewScore.user_id, ReviewScore.trait_id, ReviewScore.weighted_score
+    ).filter(
+        ReviewScore.cycle_id == cycle["id"],
+        ReviewScore.user_id.in_(employee_ids)
+    ).all():
+        scores_by_user.setdefault(user_id, {})[str(trait_id)] = weighted_score
 
-        trait_score_map = {str(score.trait_id): score for score in trait_scores}
+    review_counts = dict(db.query(Review.reviewee_id, func.count(Review.id)).filter(
+        Review.cycle_id == cycle["id"],
+        Review.reviewee_id.in_(employee_ids)
+    ).group_by(Review.reviewee_id).all())
+
+    # Applicable trait ids per organization, as strings like trait_rows
+    applicable_by_org = {}
+
+    employee_performance = []
+    for employee_id in employee_ids:
+        employee = employees_by_id.get(employee_id)
+        if not employee:
+            continue
+
+        # Calculate task metrics
+        task_details = tasks_by_user.get(employee_id, [])
+        total_tasks = len(task_details)
+        completed_tasks = len([t for t in task_details if t["status"] == InitiativeStatus.COMPLETED.value])
+        task_scores = [t["score"] for t in task_details if t["score"] is not None]
+        avg_task_score = sum(task_scores) / len(task_scores) if task_scores else None
 
         # Separate values (global) from competency (department/unit-specific)
+        trait_score_map = scores_by_user.get(employee_id, {})
+        applicable = applicable_by_org.get(employee.organization_id)
+        if applicable is None:
+            applicable = applicable_by_org[employee.organization_id] = {
+                str(trait_id) for trait_id in applicability.traits_for(employee.organization_id)
+            }
         values_data = []
         competency_data = []
 
-        from models import TraitScopeType
-
-        for trait in cycle_traits:
-            score_obj = trait_score_map.get(str(trait.id))
+        for trait_id, trait_name, trait_description, scope_type in trait_rows:
+            weighted_score = trait_score_map.get(trait_id)
+            trait_data = {
+                "trait_id": trait_id,
+                "trait_name": trait_name,
+                "trait_description": trait_description,
+                "weighted_score": float(weighted_score) if weighted_score else None
+            }
 
             # Values are global (organization-wide)
-            if trait.scope_type == TraitScopeType.GLOBAL:
-                trait_data = {
-                    "trait_id": str(trait.id),
-                    "trait_name": trait.name,
-                    "trait_description": trait.description,
-                    "weighted_score": float(score_obj.weighted_score) if score_obj and score_obj.weighted_score else None
-                }
+            if scope_type == TraitScopeType.GLOBAL:
                 values_data.append(trait_data)
             # Competency are tied to directorate/department/unit
-            # Only include if the trait's organization matches the employee's organization
-            elif trait.organization_id and str(trait.organization_id) == str(employee.organization_id):
-                trait_data = {
-                    "trait_id": str(trait.id),
-                    "trait_name": trait.name,
-                    "trait_description": trait.description,
-                    "weighted_score": float(score_obj.weighted_score) if score_obj and score_obj.weighted_score else None
-                }
+            # Include traits scoped to the employee's organization or any organization above it
+            elif trait_id in applicable:
                 competency_data.append(trait_data)
 
-        # Get overall review score for this cycle
-        reviews = db.query(Review).filter(
-            Review.cycle_id == cycle.id,
-            Review.reviewee_id == employee.id
-        ).all()
-
         # Calculate separate scores for values and competency
         values_scores = [v["weighted_score"] for v in values_data if v["weighted_score"] is not None]
         competency_scores = [c["weighted_score"] for c in competency_data if c["weighted_score"] is not None]
@@ -989,16 +1218,11 @@ async def get_organization_performance(
         avg_values_score = sum(values_scores) / len(values_scores) if values_scores else None
         avg_competency_score = sum(competency_scores) / len(competency_scores) if competency_scores else None
 
-        # Get department info
-        department_name = None
-        if employee.organization:
-            department_name = employee.organization.name
-
         employee_performance.append({
             "id": str(employee.id),
             "name": f"{employee.first_name} {employee.last_name}",
             "email": employee.email,
-            "department_name": department_name,
+            "department_name": employee.department_name,
             "role_name": employee.job_title,
 
             # Task Performance
@@ -1014,22 +1238,10 @@ async def get_organization_performance(
             "competency": competency_data,
             "competency_score": round(avg_competency_score, 2) if avg_competency_score else None,
 
-            "total_reviews": len(reviews)
+            "total_reviews": review_counts.get(employee_id, 0)
         })
 
-    return {
-        "cycle": {
-            "id": str(cycle.id),
-            "name": cycle.name,
-            "type": cycle.type,
-            "period": cycle.period,
-            "start_date": cycle.start_date.isoformat(),
-            "end_date": cycle.end_date.isoformat(),
-            "status": cycle.status.value
-        },
-        "traits": [{"id": str(t.id), "name": t.name, "description": t.description} for t in cycle_traits],
-        "employees": employee_performance
-    }
+    return employee_performance
 
 @router.get("/my-assignments")
 async def get_my_review_assignments(
@@ -1040,70 +1252,85 @@ async def get_my_review_assignments(
     db: Session = Depends(get_db)
 ):
     """Get current user's review assignments using ReviewAssignment model"""
+    assignments = _load_reviewer_assignments(db, current_user.user_id, cycle_id=cycle_id, status=status, limit=limit)
+    return _format_my_assignments(db, assignments)
 
-    # Query all assignments where the current user is the reviewer
-    query = db.query(ReviewAssignment).filter(
+@router.get("/assignments/me")
+async def get_my_assignments_overview(
+    cycle_id: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the current user's review assignments with per-cycle completion counts
+    Registered before /assignments/{assignment_id} so "me" is not taken as an id
+    """
+    assignments = _load_reviewer_assignments(db, current_user.user_id, cycle_id=cycle_id, status=status)
+
+    # Completion counts per cycle (independent of the status filter)
+    is_completed = ReviewAssignment.status == 'completed'
+    counts_query = db.query(
+        ReviewCycle.id,
+        ReviewCycle.name,
+        ReviewCycle.period,
+        ReviewCycle.end_date,
+        func.count(ReviewAssignment.id).label('total'),
+        func.count().filter(is_completed).label('completed')
+    ).join(ReviewAssignment, ReviewAssignment.cycle_id == ReviewCycle.id).filter(
         ReviewAssignment.reviewer_id == current_user.user_id
     )
-
-    # Apply status filter if provided
-    if status:
-        query = query.filter(ReviewAssignment.status == status)
-
-    # Apply cycle filter if provided
     if cycle_id:
-        query = query.filter(ReviewAssignment.cycle_id == cycle_id)
+        counts_query = counts_query.filter(ReviewAssignment.cycle_id == cycle_id)
+    cycle_counts = counts_query.group_by(
+        ReviewCycle.id, ReviewCycle.name, ReviewCycle.period, ReviewCycle.end_date
+    ).order_by(desc(ReviewCycle.end_date)).all()
 
-    # Get assignments with related data
-    assignments_data = query.limit(limit).all()
+    return {
+        "assignments": _format_my_assignments(db, assignments),
+        "cycles": [
+            {
+                "cycle_id": str(row.id),
+                "cycle_name": row.name,
+                "period": row.period,
+                "due_date": row.end_date,
+                "total": row.total,
+                "completed": row.completed,
+                "pending": row.total - row.completed,
+                "completion_rate": (row.completed / row.total * 100) if row.total > 0 else 0
+            }
+            for row in cycle_counts
+        ]
+    }
+
+def _format_my_assignments(db: Session, assignments: list) -> list:
+    """Reviewer-facing assignment rows with form progress (answered counts from one grouped query)"""
+    answered = _answered_question_counts(db, [assignment.id for assignment in assignments])
 
     # Format response
-    assignments = []
-    for assignment in assignments_data:
-        # Get cycle details
-        cycle = db.query(ReviewCycle).filter(ReviewCycle.id == assignment.cycle_id).first()
+    formatted = []
+    for assignment in assignments:
+        cycle = assignment.cycle
 
-        # Get reviewee details (only for peer and supervisor reviews)
+        # Reviewee name only for peer and supervisor reviews
         reviewee_name = None
         if assignment.review_type != 'self':
-            reviewee = db.query(User).filter(User.id == assignment.reviewee_id).first()
-            reviewee_name = reviewee.name if reviewee else "Unknown"
-
-        # Calculate progress based on responses
-        # Get trait IDs for this cycle
-        cycle_trait_ids = [ct.trait_id for ct in db.query(ReviewCycleTrait).filter(
-            ReviewCycleTrait.cycle_id == assignment.cycle_id
-        ).all()]
+            reviewee_name = assignment.reviewee.name
 
-        # Count total questions for this review type
-        questions_query = db.query(ReviewQuestion).filter(
-            ReviewQuestion.trait_id.in_(cycle_trait_ids)
+        # Progress against the questions shown on the form
+        total_questions = sum(
+            len(trait["questions"]) for trait in get_form_catalog(db, assignment.cycle_id, assignment.review_type)
         )
-
-        # Filter by review type
-        if assignment.review_type == 'self':
-            questions_query = questions_query.filter(ReviewQuestion.applies_to_self == True)
-        elif assignment.review_type == 'peer':
-            questions_query = questions_query.filter(ReviewQuestion.applies_to_peer == True)
-        elif assignment.review_type == 'supervisor':
-            questions_query = questions_query.filter(ReviewQuestion.applies_to_supervisor == True)
-
-        total_questions = questions_query.count()
-
-        completed_responses = db.query(ReviewResponseModel).filter(
-            ReviewResponseModel.assignment_id == assignment.id,
-            ReviewResponseModel.rating.isnot(None)
-        ).count()
-
+        completed_responses = answered.get(assignment.id, 0)
         progress = (completed_responses / total_questions * 100) if total_questions > 0 else 0
 
-        assignments.append({
+        formatted.append({
             "id": str(assignment.id),
             "review_type": assignment.review_type,
             "cycle_id": str(assignment.cycle_id),
-            "cycle_title": cycle.name if cycle else "Unknown Cycle",
+            "cycle_title": cycle.name,
             "reviewee_name": reviewee_name,
-            "due_date": cycle.end_date if cycle else None,
+            "due_date": cycle.end_date,
             "status": assignment.status,
             "progress": round(progress, 1),
             "total_questions": total_questions,
@@ -1111,7 +1338,45 @@ async def get_my_review_assignments(
             "completed_at": assignment.completed_at
         })
 
-    return assignments
+    return formatted
+
+def _load_reviewer_assignments(
+    db: Session,
+    reviewer_id,
+    cycle_id: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: Optional[int] = None
+) -> list:
+    """
+    A reviewer's assignments, newest first, with cycle and reviewee loaded
+    Filters run in SQL; cycles and reviewees come from one IN query each (selectinload)
+    """
+    query = db.query(ReviewAssignment).options(
+        selectinload(ReviewAssignment.cycle),
+        selectinload(ReviewAssignment.reviewee)
+    ).filter(ReviewAssignment.reviewer_id == reviewer_id)
+
+    if status:
+        query = query.filter(ReviewAssignment.status == status)
+    if cycle_id:
+        query = query.filter(ReviewAssignment.cycle_id == cycle_id)
+
+    query = query.order_by(desc(ReviewAssignment.created_at), ReviewAssignment.id)
+    if limit:
+        query = query.limit(limit)
+    return query.all()
+
+def _answered_question_counts(db: Session, assignment_ids: list) -> Dict[Any, int]:
+    """Rated responses per assignment from one grouped query"""
+    if not assignment_ids:
+        return {}
+    return dict(db.query(
+        ReviewResponseModel.assignment_id,
+        func.count()
+    ).filter(
+        ReviewResponseModel.assignment_id.in_(assignment_ids),
+        ReviewResponseModel.rating.isnot(None)
+    ).group_by(ReviewResponseModel.assignment_id).all())
 
 @router.get("/assignments/{assignment_id}")
 async def get_review_assignment(
@@ -1313,13 +1578,17 @@ async def get_cycle_analytics(
         if cycle.created_by != current_user.user_id:
             raise HTTPException(status_code=403, detail="Insufficient permissions")
     
-    # Get all reviews and peer reviews for this cycle
-    reviews = db.query(Review).filter(Review.cycle_id == cycle_id).all()
-    peer_reviews = db.query(PeerReview).filter(PeerReview.cycle_id == cycle_id).all()
-    
-    analytics = _generate_comprehensive_cycle_analytics(cycle, reviews, peer_reviews, db)
-    
-    return analytics
+    def compute():
+        # Get all reviews and peer reviews for this cycle
+        reviews = db.query(Review).filter(Review.cycle_id == cycle_id).all()
+        peer_reviews = db.query(PeerReview).filter(PeerReview.cycle_id == cycle_id).all()
+        return _generate_comprehensive_cycle_analytics(cycle, reviews, peer_reviews, db)
+
+    return cycle_results.get_or_compute(
+        "analytics", cycle,
+        watermark=lambda: cycle_watermark(db, cycle.id, Review, PeerReview),
+        compute=compute
+    )
 
 @router.get("/cycles/{cycle_id}/progress")
 async def get_cycle_progress(
@@ -1388,50 +1657,156 @@ async def get_cycle_user_scores(
     if not cycle:
         raise HTTPException(status_code=404, detail="Review cycle not found")
 
-    # Get all review scores for this cycle
-    review_scores = db.query(ReviewScore).filter(
-        ReviewScore.cycle_id == cycle_id
-    ).all()
+    return cycle_results.get_or_compute(
+        "user-scores", cycle,
+        watermark=lambda: cycle_watermark(db, cycle.id, ReviewScore),
+        compute=lambda: _build_cycle_user_scores(cycle.id, db)
+    )
+
+@router.get("/cycles/{cycle_id}/export")
+async def export_cycle_results(
+    cycle_id: str,
+    format: str = Query("csv", description="csv, ndjson or xlsx"),
+    dataset: str = Query("scores", description="scores (per trait) or responses (raw per-question answers)"),
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Stream a cycle's scores or raw responses; memory use is independent of cycle size"""
+    if "review_view_all" not in current_user.permissions:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to export review cycle results"
+        )
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be one of: {', '.join(EXPORT_FORMATS)}")
+    if dataset not in EXPORT_DATASETS:
+        raise HTTPException(status_code=400, detail=f"dataset must be one of: {', '.join(EXPORT_DATASETS)}")
+
+    cycle = db.query(ReviewCycle).filter(ReviewCycle.id == cycle_id).first()
+    if not cycle:
+        raise HTTPException(status_code=404, detail="Review cycle not found")
+
+    return StreamingResponse(
+        stream_cycle_export(cycle.id, dataset, format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": content_disposition(f"review-cycle-{cycle.id}-{dataset}.{format}")}
+    )
+
+@router.post("/cycles/{cycle_id}/rankings", status_code=status.HTTP_202_ACCEPTED)
+async def rank_cycle_performance(
+    cycle_id: str,
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Queue the performance score, band and rank calculation for every participant of a cycle
+    Returns the job; poll GET /analytics-jobs/{job_id} for progress
+    """
+    if "review_manage_cycle" not in current_user.permissions:
+        raise HTTPException(status_code=403, detail="Insufficient permissions to rank cycle performance")
+
+    cycle = db.query(ReviewCycle).filter(ReviewCycle.id == cycle_id).first()
+    if not cycle:
+        raise HTTPException(status_code=404, detail="Review cycle not found")
+
+    task_version = db.query(func.count(Initiative.id), func.max(Initiative.updated_at)).filter(
+        Initiative.created_at >= cycle.start_date,
+        Initiative.created_at <= cycle.end_date
+    ).one()
+    job = submit_analytics_job(
+        db, "performance_ranking", cycle.id,
+        version=(cycle.updated_at,) + cycle_watermark(db, cycle.id, ReviewScore, ReviewAssignment) + tuple(task_version),
+        handler=_performance_ranking_job,
+        requested_by=current_user.user_id
+    )
+    return serialize_job(job)
+
+def _performance_ranking_job(db: Session, cycle_id: str, progress) -> dict:
+    """Window-function ranking of a cycle (runs in an analytics worker process)"""
+    progress(10, "Ranking participants")
+    ranked = PerformanceRankingService(db).rank_cycle(cycle_id)
+    return {"cycle_id": cycle_id, "participants_ranked": ranked}
+
+@router.get("/cycles/{cycle_id}/rankings")
+async def get_cycle_rankings(
+    cycle_id: str,
+    scope: str = Query("organization", description="organization, directorate or department"),
+    unit_id: Optional[str] = Query(None, description="Directorate or department id; every unit when omitted"),
+    limit: int = Query(10, ge=1, le=100),
+    current_user = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Top performers of a cycle per unit (ties share a rank, so a unit can return more than limit)"""
+    if "review_view_all" not in current_user.permissions:
+        raise HTTPException(status_code=403, detail="Insufficient permissions to view cycle rankings")
+    if scope not in RANK_SCOPES:
+        raise HTTPException(status_code=400, detail=f"scope must be one of: {', '.join(RANK_SCOPES)}")
+
+    cycle = db.query(ReviewCycle).filter(ReviewCycle.id == cycle_id).first()
+    if not cycle:
+        raise HTTPException(status_code=404, detail="Review cycle not found")
+
+    rows = PerformanceRankingService(db).top_performers(cycle.id, scope, unit_id, limit)
+    rank_field = f"{scope}_rank"
+    return {
+        "cycle_id": str(cycle.id),
+        "scope": scope,
+        "limit": limit,
+        "rankings": [
+            {
+                "user_id": str(score.user_id),
+                "name": f"{first_name} {last_name}",
+                "job_title": job_title,
+                "directorate_id": str(score.directorate_id) if score.directorate_id else None,
+                "department_id": str(score.department_id) if score.department_id else None,
+                "rank": getattr(score, rank_field),
+                "overall_performance_score": float(score.overall_performance_score),
+                "task_performance_score": float(score.task_performance_score) if score.task_performance_score is not None else None,
+                "review_performance_score": float(score.review_performance_score) if score.review_performance_score is not None else None,
+                "performance_band": score.performance_band,
+                "calculated_at": score.calculated_at
+            }
+            for score, first_name, last_name, job_title in rows
+        ]
+    }
+
+def _build_cycle_user_scores(cycle_id, db: Session) -> list:
+    """Per-user trait scores of a cycle with user and department names from one join"""
+    rows = db.query(
+        ReviewScore.user_id,
+        ReviewScore.trait_id,
+        ReviewScore.weighted_score,
+        ReviewScore.self_score,
+        User.first_name,
+        User.middle_name,
+        User.last_name,
+        Organization.name.label('department_name')
+    ).join(User, User.id == ReviewScore.user_id)\
+     .outerjoin(Organization, Organization.id == User.organization_id)\
+     .filter(ReviewScore.cycle_id == cycle_id).all()
 
     # Group by user
     user_scores = {}
-    for score in review_scores:
-        user_id = str(score.user_id)
+    for row in rows:
+        user_id = str(row.user_id)
         if user_id not in user_scores:
             user_scores[user_id] = {
                 'user_id': user_id,
+                'user_name': " ".join(part for part in (row.first_name, row.middle_name, row.last_name) if part),
+                'department_name': row.department_name,
                 'trait_scores': {},
                 'total_score': 0,
                 'trait_count': 0
             }
 
         # Add trait score (using weighted_score if available, otherwise average of available scores)
-        trait_score = score.weighted_score or score.self_score or 0
-        user_scores[user_id]['trait_scores'][str(score.trait_id)] = trait_score
+        trait_score = row.weighted_score or row.self_score or 0
+        user_scores[user_id]['trait_scores'][str(row.trait_id)] = trait_score
         user_scores[user_id]['total_score'] += trait_score
         user_scores[user_id]['trait_count'] += 1
 
-    # Build response with user details
     result = []
-    for user_id, scores in user_scores.items():
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            continue
-
-        # Build user name
-        name_parts = [user.first_name]
-        if user.middle_name:
-            name_parts.append(user.middle_name)
-        name_parts.append(user.last_name)
-        user_name = " ".join(name_parts)
-
-        # Get department name
-        department_name = None
-        if user.organization_id:
-            org = db.query(Organization).filter(Organization.id == user.organization_id).first()
-            if org:
-                department_name = org.name
-
+    for scores in user_scores.values():
         # Calculate overall score
         overall_score = scores['total_score'] / scores['trait_count'] if scores['trait_count'] > 0 else 0
 
@@ -1439,9 +1814,9 @@ async def get_cycle_user_scores(
         completion_status = 'completed' if scores['trait_count'] > 0 else 'pending'
 
         result.append({
-            'user_id': user_id,
-            'user_name': user_name,
-            'department_name': department_name,
+            'user_id': scores['user_id'],
+            'user_name': scores['user_name'],
+            'department_name': scores['department_name'],
             'trait_scores': scores['trait_scores'],
             'overall_score': round(overall_score, 2),
             'completion_status': completion_status
@@ -1491,177 +1866,47 @@ def _analyze_performance_patterns(reviews: List[Review]) -> dict:
         "outlier_analysis": _identify_performance_outliers(reviews)
     }
 
-def _detect_and_analyze_bias(reviews: List[Review], peer_reviews: List[PeerReview]) -> dict:
+def _detect_and_analyze_bias(reviews: List[Review], peer_reviews: List[PeerReview], ratings: RatingMatrix) -> dict:
     """Comprehensive bias detection and analysis"""
     return {
-        "overall_bias_risk": _calculate_overall_bias_risk(reviews, peer_reviews),
+        "overall_bias_risk": _calculate_overall_bias_risk(ratings),
         "specific_biases": {
-            "recency_bias": _detect_recency_bias(reviews),
-            "halo_effect": _detect_halo_effect(reviews),
+            "recency_bias": ratings.recency_bias(),
+            "halo_effect": ratings.halo_effect(),
             "similarity_bias": _detect_similarity_bias(peer_reviews),
-            "leniency_bias": _detect_leniency_bias(reviews)
+            "leniency_bias": ratings.leniency_bias()
         },
         "demographic_analysis": _analyze_demographic_bias(reviews, None),  # db not available here
-        "mitigation_priority": _prioritize_bias_mitigation(reviews, peer_reviews)
-    }
-
-# Bias detection functions - TODO: Implement proper algorithms
-def _calculate_overall_bias_score(reviews, peer_reviews):
-    """Calculate overall bias risk score based on review patterns"""
-    if not reviews and not peer_reviews:
-        return 0.0
-    
-    # Basic implementation - analyze rating patterns
-    all_ratings = []
-    for review in reviews:
-        if review.responses:
-            for key, response in review.responses.items():
-                if isinstance(response, (int, float)) and 1 <= response <= 5:
-                    all_ratings.append(response)
-    
-    if not all_ratings:
-        return 0.0
-    
-    # Simple bias indicators
-    avg_rating = sum(all_ratings) / len(all_ratings)
-    rating_variance = sum((r - avg_rating) ** 2 for r in all_ratings) / len(all_ratings)
-    
-    # Higher variance indicates less bias, score between 0-1
-    bias_score = max(0.0, min(1.0, (5.0 - rating_variance) / 5.0))
-    return bias_score
-
-def _detect_recency_bias(reviews):
-    """Detect if recent events disproportionately influence ratings"""
-    if len(reviews) < 2:
-        return {"detected": False, "severity": "low", "details": "Insufficient data"}
-    
-    # Sort by creation date and compare recent vs older ratings
-    recent_reviews = sorted(reviews, key=lambda r: r.created_at, reverse=True)[:len(reviews)//2]
-    older_reviews = sorted(reviews, key=lambda r: r.created_at, reverse=True)[len(reviews)//2:]
-    
-    recent_avg = _get_average_rating(recent_reviews)
-    older_avg = _get_average_rating(older_reviews)
-    
-    if recent_avg is None or older_avg is None:
-        return {"detected": False, "severity": "low", "details": "No rating data"}
-    
-    difference = abs(recent_avg - older_avg)
-    severity = "high" if difference > 1.0 else ("medium" if difference > 0.5 else "low")
-    
-    return {
-        "detected": difference > 0.5,
-        "severity": severity,
-        "details": f"Recent avg: {recent_avg:.2f}, Older avg: {older_avg:.2f}"
-    }
-
-def _detect_halo_effect(reviews):
-    """Detect if one strong trait influences all ratings"""
-    if not reviews:
-        return {"detected": False, "severity": "low", "details": "No review data"}
-    
-    correlations = []
-    for review in reviews:
-        if not review.responses:
-            continue
-        
-        ratings = [v for v in review.responses.values() if isinstance(v, (int, float)) and 1 <= v <= 5]
-        if len(ratings) < 2:
-            continue
-        
-        # Simple correlation check - if all ratings are very similar, possible halo effect
-        rating_range = max(ratings) - min(ratings)
-        correlations.append(rating_range)
-    
-    if not correlations:
-        return {"detected": False, "severity": "low", "details": "No rating patterns found"}
-    
-    avg_range = sum(correlations) / len(correlations)
-    severity = "high" if avg_range < 0.5 else ("medium" if avg_range < 1.0 else "low")
-    
-    return {
-        "detected": avg_range < 1.0,
-        "severity": severity,
-        "details": f"Average rating range: {avg_range:.2f}"
+        "mitigation_priority": _prioritize_bias_mitigation(ratings)
     }
 
+# Bias detection functions - rating metrics live on RatingMatrix (utils/review_bias.py)
 def _detect_similarity_bias(peer_reviews):
     """Detect if similar peers rate each other more favorably"""
     # TODO: Implement based on peer demographic/role similarity
     return {"detected": False, "severity": "low", "details": "Not implemented"}
 
-def _detect_leniency_bias(reviews):
-    """Detect if reviewers are consistently too lenient"""
-    if not reviews:
-        return {"detected": False, "severity": "low", "details": "No review data"}
-    
-    all_ratings = []
-    for review in reviews:
-        if review.responses:
-            ratings = [v for v in review.responses.values() if isinstance(v, (int, float)) and 1 <= v <= 5]
-            all_ratings.extend(ratings)
-    
-    if not all_ratings:
-        return {"detected": False, "severity": "low", "details": "No ratings found"}
-    
-    avg_rating = sum(all_ratings) / len(all_ratings)
-    high_ratings_percent = len([r for r in all_ratings if r >= 4]) / len(all_ratings)
-    
-    severity = "high" if avg_rating > 4.2 and high_ratings_percent > 0.8 else \
-              ("medium" if avg_rating > 3.8 and high_ratings_percent > 0.6 else "low")
-    
-    return {
-        "detected": avg_rating > 3.8 and high_ratings_percent > 0.6,
-        "severity": severity,
-        "details": f"Avg rating: {avg_rating:.2f}, High ratings: {high_ratings_percent:.1%}"
-    }
-
-def _detect_central_tendency_bias(reviews):
-    """Detect if reviewers avoid extreme ratings"""
-    if not reviews:
-        return {"detected": False, "severity": "low", "details": "No review data"}
-    
-    all_ratings = []
-    for review in reviews:
-        if review.responses:
-            ratings = [v for v in review.responses.values() if isinstance(v, (int, float)) and 1 <= v <= 5]
-            all_ratings.extend(ratings)
-    
-    if not all_ratings:
-        return {"detected": False, "severity": "low", "details": "No ratings found"}
-    
-    extreme_ratings = len([r for r in all_ratings if r <= 2 or r >= 4]) / len(all_ratings)
-    middle_ratings = len([r for r in all_ratings if r == 3]) / len(all_ratings)
-    
-    severity = "high" if middle_ratings > 0.6 else ("medium" if middle_ratings > 0.4 else "low")
-    
-    return {
-        "detected": middle_ratings > 0.4 and extreme_ratings < 0.3,
-        "severity": severity,
-        "details": f"Middle ratings: {middle_ratings:.1%}, Extreme ratings: {extreme_ratings:.1%}"
-    }
-
 def _analyze_demographic_bias(reviews, db):
     """Analyze potential demographic bias patterns"""
     # TODO: Implement demographic analysis when user demographic data is available
     return {"message": "Demographic bias analysis requires additional user demographic data"}
 
-def _analyze_reviewer_bias_patterns(peer_reviews):
-    """Analyze individual reviewer bias patterns"""
-    # TODO: Implement reviewer-specific bias pattern analysis
-    return {"message": "Reviewer bias pattern analysis not yet implemented"}
+def _analyze_reviewer_bias_patterns(peer_ratings: RatingMatrix):
+    """Analyze individual reviewer bias patterns (per-reviewer leniency against the cycle average)"""
+    return peer_ratings.reviewer_leniency()
 
-def _generate_bias_mitigation_recommendations(reviews, peer_reviews):
+def _generate_bias_mitigation_recommendations(ratings: RatingMatrix):
     """Generate recommendations to reduce identified bias"""
     recommendations = []
     
-    if _detect_leniency_bias(reviews)["detected"]:
+    if ratings.leniency_bias()["detected"]:
         recommendations.append({
             "type": "leniency_bias",
             "recommendation": "Provide calibration training to ensure rating standards",
             "priority": "high"
         })
     
-    if _detect_halo_effect(reviews)["detected"]:
+    if ratings.halo_effect()["detected"]:
         recommendations.append({
             "type": "halo_effect",
             "recommendation": "Use structured rating forms with specific criteria for each competency",
@@ -1670,15 +1915,15 @@ def _generate_bias_mitigation_recommendations(reviews, peer_reviews):
     
     return recommendations
 
-def _calculate_overall_bias_risk(reviews, peer_reviews):
+def _calculate_overall_bias_risk(ratings: RatingMatrix):
     """Calculate overall bias risk level"""
     risk_factors = 0
     
-    if _detect_leniency_bias(reviews)["detected"]:
+    if ratings.leniency_bias()["detected"]:
         risk_factors += 1
-    if _detect_halo_effect(reviews)["detected"]:
+    if ratings.halo_effect()["detected"]:
         risk_factors += 1
-    if _detect_recency_bias(reviews)["detected"]:
+    if ratings.recency_bias()["detected"]:
         risk_factors += 1
     
     if risk_factors >= 2:
@@ -1688,30 +1933,20 @@ def _calculate_overall_bias_risk(reviews, peer_reviews):
     else:
         return "low"
 
-def _prioritize_bias_mitigation(reviews, peer_reviews):
+def _prioritize_bias_mitigation(ratings: RatingMatrix):
     """Prioritize bias mitigation actions"""
     priorities = []
     
-    leniency = _detect_leniency_bias(reviews)
+    leniency = ratings.leniency_bias()
     if leniency["detected"] and leniency["severity"] == "high":
         priorities.append({"type": "leniency_bias", "priority": 1})
     
-    halo = _detect_halo_effect(reviews)
+    halo = ratings.halo_effect()
     if halo["detected"] and halo["severity"] == "high":
         priorities.append({"type": "halo_effect", "priority": 2})
     
     return priorities
 
-def _get_average_rating(reviews):
-    """Helper function to get average rating from reviews"""
-    all_ratings = []
-    for review in reviews:
-        if review.responses:
-            ratings = [v for v in review.responses.values() if isinstance(v, (int, float)) and 1 <= v <= 5]
-            all_ratings.extend(ratings)
-    
-    return sum(all_ratings) / len(all_ratings) if all_ratings else None
-
 # AI insights functions - Basic implementations
 def _extract_performance_highlights(responses):
     """Extract key performance highlights from review responses"""
@@ -1723,7 +1958,7 @@ def _extract_performance_highlights(responses):
     for key, value in responses.items():
         if isinstance(value, (int, float)) and value >= 4:
             highlights.append(f"High rating in {key.replace('_', ' ')}: {value}/5")
-        elif isinstance(value, str) and any(word in value.lower() for word in ['excellent', 'outstanding', 'exceptional', 'exceeded']):
+        elif isinstance(value, str) and mentions(value, "highlight"):
             highlights.append(f"Positive feedback in {key.replace('_', ' ')}")
     
     return highlights
@@ -1738,7 +1973,7 @@ def _identify_development_areas(responses):
     for key, value in responses.items():
         if isinstance(value, (int, float)) and value <= 2:
             development_areas.append(f"Improvement needed in {key.replace('_', ' ')}: {value}/5")
-        elif isinstance(value, str) and any(word in value.lower() for word in ['improve', 'develop', 'needs work', 'lacking']):
+        elif isinstance(value, str) and mentions(value, "development"):
             development_areas.append(f"Development opportunity in {key.replace('_', ' ')}")
     
     return development_areas
@@ -1748,16 +1983,13 @@ def _analyze_review_sentiment(responses):
     if not responses:
         return {"overall": "neutral", "details": {}}
     
-    positive_indicators = ['excellent', 'outstanding', 'great', 'strong', 'exceeded', 'exceptional']
-    negative_indicators = ['poor', 'lacking', 'needs improvement', 'below expectations', 'weak']
-    
     sentiment_scores = []
     details = {}
     
     for key, value in responses.items():
         if isinstance(value, str):
-            positive_count = sum(1 for word in positive_indicators if word in value.lower())
-            negative_count = sum(1 for word in negative_indicators if word in value.lower())
+            positive_count = mention_count(value, "positive")
+            negative_count = mention_count(value, "negative")
             
             if positive_count > negative_count:
                 sentiment = "positive"
@@ -1797,23 +2029,8 @@ def _extract_review_topics(responses):
     if not responses:
         return topics
     
-    # Basic keyword-based topic extraction
-    topic_keywords = {
-        "Leadership": ["lead", "leadership", "manage", "team", "direct", "guide"],
-        "Communication": ["communicate", "presentation", "meeting", "discuss", "explain"],
-        "Technical Skills": ["technical", "coding", "programming", "analysis", "problem solving"],
-        "Collaboration": ["collaborate", "teamwork", "cooperation", "work with", "partner"],
-        "Innovation": ["innovative", "creative", "new ideas", "improve", "solution"],
-        "Quality": ["quality", "accuracy", "detail", "thorough", "careful"]
-    }
-    
-    text_content = " ".join([str(v) for v in responses.values() if isinstance(v, str)]).lower()
-    
-    for topic, keywords in topic_keywords.items():
-        if any(keyword in text_content for keyword in keywords):
-            topics.append(topic)
-    
-    return topics
+    # Keyword-based topic extraction (keyword lists in utils/review_text.py)
+    return topics_in(v for v in responses.values() if isinstance(v, str))
 
 def _summarize_strengths(responses):
     """Summarize key strengths from review responses"""
@@ -1827,8 +2044,7 @@ def _summarize_strengths(responses):
             strengths.append(key.replace('_', ' ').title())
         elif isinstance(value, str):
             # Look for strength-related keywords
-            strength_words = ['strength', 'strong', 'excellent', 'outstanding', 'skilled', 'proficient']
-            if any(word in value.lower() for word in strength_words):
+            if mentions(value, "strength"):
                 strengths.append(f"Noted strength in {key.replace('_', ' ')}")
     
     return list(set(strengths))  # Remove duplicates
@@ -1844,7 +2060,7 @@ def _generate_improvement_suggestions(responses):
         if isinstance(value, (int, float)) and value <= 2:
             area = key.replace('_', ' ').title()
             suggestions.append(f"Focus on developing {area} through targeted training and practice")
-        elif isinstance(value, str) and 'improve' in value.lower():
+        elif isinstance(value, str) and mentions(value, "improve"):
             suggestions.append(f"Address feedback in {key.replace('_', ' ')} area")
     
     # Add generic suggestions if specific ones not found
@@ -1891,226 +2107,16 @@ def _recommend_career_development(responses):
     return recommendations
 
 # Performance dashboard functions - Basic implementations
-def _generate_performance_summary(reviews, peer_reviews):
-    """Generate performance summary from reviews"""
-    if not reviews and not peer_reviews:
-        return {
-            "overall_score": 0,
-            "trend": "no_data",
-            "key_strengths": [],
-            "development_areas": [],
-            "peer_rating": 0,
-            "supervisor_rating": 0,
-            "self_assessment": 0
-        }
-    
-    # Calculate ratings by type
-    self_ratings = []
-    supervisor_ratings = []
-    peer_ratings = []
-    
-    for review in reviews:
-        if review.responses:
-            ratings = [v for v in review.responses.values() if isinstance(v, (int, float)) and 1 <= v <= 5]
-            if ratings:
-                avg_rating = sum(ratings) / len(ratings)
-                if review.type == 'self':
-                    self_ratings.append(avg_rating)
-                elif review.type == 'supervisor':
-                    supervisor_ratings.append(avg_rating)
-    
-    for peer_review in peer_reviews:
-        if peer_review.responses:
-            ratings = [v for v in peer_review.responses.values() if isinstance(v, (int, float)) and 1 <= v <= 5]
-            if ratings:
-                peer_ratings.append(sum(ratings) / len(ratings))
-    
-    # Compile summary
-    return {
-        "overall_score": round(sum(self_ratings + supervisor_ratings + peer_ratings) / 
-                             len(self_ratings + supervisor_ratings + peer_ratings) * 20) if (self_ratings + supervisor_ratings + peer_ratings) else 0,
-        "trend": "improving",  # Would need historical data to determine
-        "key_strengths": _extract_common_strengths(reviews + peer_reviews),
-        "development_areas": _extract_common_development_areas(reviews + peer_reviews),
-        "peer_rating": sum(peer_ratings) / len(peer_ratings) if peer_ratings else 0,
-        "supervisor_rating": sum(supervisor_ratings) / len(supervisor_ratings) if supervisor_ratings else 0,
-        "self_assessment": sum(self_ratings) / len(self_ratings) if self_ratings else 0
-    }
-
 def _analyze_goal_achievement(user_id, db):
     """Analyze goal achievement for user - placeholder for now"""
     # TODO: Implement once goal models are integrated
     return {
         "total_goals": 0,
-        "completed_goals": 0,
-        "in_progress_goals": 0,
-        "achievement_rate": 0,
-        "top_achievements": []
-    }
-
-def _analyze_competency_development(reviews):
-    """Analyze competency development from reviews"""
-    if not reviews:
-        return {}
-    
-    competencies = {}
-    for review in reviews:
-        if review.responses:
-            topics = _extract_review_topics(review.responses)
-            for topic in topics:
-                if topic not in competencies:
-                    competencies[topic] = {"mentions": 0, "avg_score": 0, "ratings": []}
-                competencies[topic]["mentions"] += 1
-                
-                # Extract ratings for this topic area
-                ratings = [v for k, v in review.responses.items() if isinstance(v, (int, float)) and topic.lower() in k.lower()]
-                if ratings:
-                    competencies[topic]["ratings"].extend(ratings)
-    
-    # Calculate averages
-    for comp in competencies.values():
-        if comp["ratings"]:
-            comp["avg_score"] = sum(comp["ratings"]) / len(comp["ratings"])
-        else:
-            comp["avg_score"] = 3.0  # Default neutral
-        del comp["ratings"]  # Remove raw ratings
-    
-    return competencies
-
-def _analyze_peer_feedback_trends(peer_reviews):
-    """Analyze trends in peer feedback"""
-    if not peer_reviews:
-        return {"total_reviews": 0, "avg_rating": 0, "themes": []}
-    
-    all_ratings = []
-    all_themes = []
-    
-    for review in peer_reviews:
-        if review.responses:
-            ratings = [v for v in review.responses.values() if isinstance(v, (int, float)) and 1 <= v <= 5]
-            all_ratings.extend(ratings)
-            all_themes.extend(_extract_review_topics(review.responses))
-    
-    from collections import Counter
-    theme_counts = Counter(all_themes)
-    
-    return {
-        "total_reviews": len(peer_reviews),
-        "avg_rating": sum(all_ratings) / len(all_ratings) if all_ratings else 0,
-        "themes": [{"theme": theme, "count": count} for theme, count in theme_counts.most_common(5)],
-        "trend": "stable"  # Would need historical data
-    }
-
-def _track_development_progress(reviews):
-    """Track development progress over time"""
-    if not reviews:
-        return {"progress_indicators": [], "improvement_areas": []}
-    
-    # Sort reviews by date
-    sorted_reviews = sorted(reviews, key=lambda r: r.created_at)
-    
-    progress_indicators = []
-    if len(sorted_reviews) >= 2:
-        first_review = sorted_reviews[0]
-        latest_review = sorted_reviews[-1]
-        
-        first_avg = _get_review_average(first_review)
-        latest_avg = _get_review_average(latest_review)
-        
-        if first_avg and latest_avg:
-            improvement = latest_avg - first_avg
-            progress_indicators.append({
-                "metric": "Overall Performance",
-                "change": improvement,
-                "direction": "improving" if improvement > 0 else ("declining" if improvement < 0 else "stable")
-            })
-    
-    return {
-        "progress_indicators": progress_indicators,
-        "improvement_areas": _identify_development_areas(latest_review.responses if sorted_reviews else {})
-    }
-
-def _extract_recognition_highlights(reviews, peer_reviews):
-    """Extract recognition and achievements from reviews"""
-    highlights = []
-    
-    all_reviews = reviews + peer_reviews
-    for review in all_reviews:
-        if hasattr(review, 'responses') and review.responses:
-            # Look for recognition keywords
-            for key, value in review.responses.items():
-                if isinstance(value, str):
-                    recognition_words = ['recognition', 'award', 'achievement', 'outstanding', 'exceptional', 'exceeded expectations']
-                    if any(word in value.lower() for word in recognition_words):
-                        highlights.append({
-                            "type": "peer_recognition" if hasattr(review, 'reviewer_id') else "performance_recognition",
-                            "description": f"Recognition noted in {key.replace('_', ' ')}",
-                            "date": review.created_at.isoformat() if review.created_at else None
-                        })
-                elif isinstance(value, (int, float)) and value == 5:
-                    highlights.append({
-                        "type": "top_rating",
-                        "description": f"Excellent rating in {key.replace('_', ' ')}: {value}/5",
-                        "date": review.created_at.isoformat() if review.created_at else None
-                    })
-    
-    return highlights
-
-def _generate_growth_recommendations(user_id, reviews, peer_reviews, db):
-    """Generate growth recommendations based on review data"""
-    recommendations = []
-    
-    if not reviews and not peer_reviews:
-        return recommendations
-    
-    # Analyze strengths and development areas
-    all_responses = []
-    for review in reviews + peer_reviews:
-        if hasattr(review, 'responses') and review.responses:
-            all_responses.append(review.responses)
-    
-    if all_responses:
-        # Combine all responses
-        combined_responses = {}
-        for responses in all_responses:
-            combined_responses.update(responses)
-        
-        development_areas = _identify_development_areas(combined_responses)
-        career_recs = _recommend_career_development(combined_responses)
-        
-        # Convert to growth recommendations format
-        for area in development_areas:
-            recommendations.append({
-                "area": "Skill Development",
-                "recommendation": area,
-                "priority": "medium"
-            })
-        
-        recommendations.extend(career_recs)
-    
-    return recommendations
-
-def _extract_common_strengths(reviews):
-    """Extract commonly mentioned strengths across reviews"""
-    all_strengths = []
-    for review in reviews:
-        if hasattr(review, 'responses') and review.responses:
-            all_strengths.extend(_summarize_strengths(review.responses))
-    
-    from collections import Counter
-    strength_counts = Counter(all_strengths)
-    return [strength for strength, count in strength_counts.most_common(5) if count > 1]
-
-def _extract_common_development_areas(reviews):
-    """Extract commonly mentioned development areas across reviews"""
-    all_areas = []
-    for review in reviews:
-        if hasattr(review, 'responses') and review.responses:
-            all_areas.extend(_identify_development_areas(review.responses))
-    
-    from collections import Counter
-    area_counts = Counter(all_areas)
-    return [area for area, count in area_counts.most_common(3) if count > 1]
+        "completed_goals": 0,
+        "in_progress_goals": 0,
+        "achievement_rate": 0,
+        "top_achievements": []
+    }
 
 def _get_review_average(review):
     """Get average rating from a review"""
@@ -2151,7 +2157,7 @@ def _calculate_thoughtfulness_score(reviews):
             if isinstance(value, str):
                 # Basic thoughtfulness indicators
                 word_count = len(value.split())
-                has_examples = any(word in value.lower() for word in ['example', 'instance', 'specifically', 'such as'])
+                has_examples = mentions(value, "example")
                 has_detail = word_count > 20
                 
                 score = 0.3  # Base score
@@ -2297,7 +2303,7 @@ def _identify_performance_outliers(reviews):
     
     return outliers
 
-def _generate_cycle_recommendations(cycle, reviews, peer_reviews):
+def _generate_cycle_recommendations(cycle, reviews, peer_reviews, ratings: RatingMatrix):
     """Generate recommendations for improving review cycles"""
     recommendations = []
     
@@ -2322,7 +2328,7 @@ def _generate_cycle_recommendations(cycle, reviews, peer_reviews):
         })
     
     # Check for bias issues
-    bias_risk = _calculate_overall_bias_risk(reviews, peer_reviews)
+    bias_risk = _calculate_overall_bias_risk(ratings)
     if bias_risk == "high":
         recommendations.append({
             "type": "bias_mitigation",
@@ -2570,45 +2576,46 @@ async def create_development_plan(
 
 @router.get("/performance-trends/{user_id}")
 async def get_performance_trends(
-    user_id: int,
-    time_range: str = Query("2_years"),
+    user_id: str,
+    time_range: str = Query("2_years", description="1_year, 2_years, 3_years or all"),
+    resolution: str = Query("cycle", description="cycle, quarter or year"),
+    max_points: Optional[int] = Query(None, ge=2, le=500, description="Merge neighbouring points down to this many"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get detailed performance trends analysis"""
-    
-    if user_id != current_user.user_id:
-        permission_engine = get_permission_engine(db)
-        if not permission_engine.check_permission(current_user, "performance:view:all"):
-            raise HTTPException(status_code=403, detail="Insufficient permissions")
-    
+    """
+    Performance trends across cycles from the per-cycle summaries
+    Reads one row per completed cycle; long ranges can be downsampled by calendar bucket or point count
+    """
+    if user_id != str(current_user.user_id) and "performance_view_all" not in current_user.permissions:
+        raise HTTPException(status_code=403, detail="Insufficient permissions")
+    if resolution not in RESOLUTIONS:
+        raise HTTPException(status_code=400, detail=f"resolution must be one of: {', '.join(RESOLUTIONS)}")
+
     # Calculate time range
     if time_range == "1_year":
         start_date = datetime.utcnow() - timedelta(days=365)
     elif time_range == "2_years":
         start_date = datetime.utcnow() - timedelta(days=730)
+    elif time_range == "all":
+        start_date = None
     else:
         start_date = datetime.utcnow() - timedelta(days=1095)  # 3 years
-    
-    # Get historical reviews
-    reviews = db.query(Review).filter(
-        Review.reviewee_id == user_id,
-        Review.created_at >= start_date,
-        Review.status == "submitted"
-    ).order_by(Review.created_at.asc()).all()
-    
-    trends_analysis = {
-        "performance_trajectory": _calculate_performance_trajectory(reviews),
-        "competency_progression": _track_competency_progression(reviews),
-        "goal_achievement_trends": _analyze_goal_achievement_trends(user_id, start_date, db),
-        "feedback_themes_evolution": _track_feedback_themes_evolution(reviews),
-        "development_progress": _measure_development_progress(reviews),
-        "consistency_patterns": _identify_consistency_patterns(reviews),
-        "seasonal_performance": _analyze_seasonal_patterns(reviews),
-        "predictive_insights": _generate_predictive_insights(reviews)
+
+    history = PerformanceHistoryService(db).user_history(user_id, start_date=start_date)
+    points = downsample(history, resolution, max_points)
+
+    return {
+        "user_id": user_id,
+        "time_range": time_range,
+        "resolution": resolution,
+        "cycles": len(history),
+        "points": points,
+        "performance_trajectory": _calculate_performance_trajectory(points),
+        "competency_progression": _track_competency_progression(points, db),
+        "task_trends": _analyze_task_trends(points),
+        "consistency_patterns": _identify_consistency_patterns(points)
     }
-    
-    return trends_analysis
 
 @router.get("/user-trait-scores/{user_id}")
 async def get_user_trait_scores(
@@ -2765,37 +2772,108 @@ def _define_development_success_indicators(development_data):
     """TODO: Implement development success indicator definition"""
     return []
 
-def _calculate_performance_trajectory(reviews): 
-    """TODO: Implement performance trajectory calculation"""
-    return {"message": "Performance trajectory calculation not yet implemented"}
-
-def _track_competency_progression(reviews): 
-    """TODO: Implement competency progression tracking"""
-    return {"message": "Competency progression tracking not yet implemented"}
-
-def _analyze_goal_achievement_trends(user_id, start_date, db): 
-    """TODO: Implement goal achievement trend analysis"""
-    return {"message": "Goal achievement trend analysis not yet implemented"}
-
-def _track_feedback_themes_evolution(reviews): 
-    """TODO: Implement feedback theme evolution tracking"""
-    return {"message": "Feedback theme evolution tracking not yet implemented"}
-
-def _measure_development_progress(reviews): 
-    """TODO: Implement development progress measurement"""
-    return {"message": "Development progress measurement not yet implemented"}
+def _calculate_performance_trajectory(points: List[dict]) -> dict:
+    """Overall score series with its direction (slopes within 1 point per step count as stable)"""
+    scores = [point["overall_performance_score"] for point in points if point["overall_performance_score"] is not None]
+    return {
+        "scores": [
+            {"period": point["period"], "end_date": point["end_date"], "score": point["overall_performance_score"],
+             "band": point.get("performance_band")}
+            for point in points
+        ],
+        "latest": scores[-1] if scores else None,
+        "best": max(scores) if scores else None,
+        "change": round(scores[-1] - scores[0], 2) if len(scores) >= 2 else None,
+        **trend_direction(scores, threshold=1.0)
+    }
 
-def _identify_consistency_patterns(reviews): 
-    """TODO: Implement consistency pattern identification"""
-    return {"message": "Consistency pattern identification not yet implemented"}
+def _track_competency_progression(points: List[dict], db: Session) -> List[dict]:
+    """Per-trait score series (1-5) with direction, for every trait present in the range"""
+    trait_ids = {trait_id for point in points for trait_id in point["trait_scores"]}
+    if not trait_ids:
+        return []
+    names = dict(db.query(ReviewTrait.id, ReviewTrait.name).filter(ReviewTrait.id.in_(list(trait_ids))).all())
+    names = {str(trait_id): name for trait_id, name in names.items()}
+
+    progression = []
+    for trait_id in trait_ids:
+        series = [
+            {"period": point["period"], "score": point["trait_scores"][trait_id]}
+            for point in points if point["trait_scores"].get(trait_id) is not None
+        ]
+        progression.append({
+            "trait_id": trait_id,
+            "trait_name": names.get(trait_id),
+            "series": series,
+            **trend_direction([entry["score"] for entry in series], threshold=0.1)
+        })
+    return sorted(progression, key=lambda entry: entry["trait_name"] or "")
 
-def _analyze_seasonal_patterns(reviews): 
-    """TODO: Implement seasonal pattern analysis"""
-    return {"message": "Seasonal pattern analysis not yet implemented"}
+def _analyze_task_trends(points: List[dict]) -> dict:
+    """Task volume, completion rate and task score per point"""
+    series = [
+        {
+            "period": point["period"],
+            "task_count": point["task_count"],
+            "completion_rate": round(point["completed_task_count"] / point["task_count"] * 100, 1) if point["task_count"] else None,
+            "average_task_score": point["average_task_score"]
+        }
+        for point in points
+    ]
+    task_scores = [point["average_task_score"] for point in points if point["average_task_score"] is not None]
+    return {"series": series, **trend_direction(task_scores, threshold=0.2)}
+
+def _identify_consistency_patterns(points: List[dict]) -> dict:
+    """Spread of the overall score across the range"""
+    scores = [point["overall_performance_score"] for point in points if point["overall_performance_score"] is not None]
+    if len(scores) < 2:
+        return {"standard_deviation": None, "consistency": "insufficient_data"}
+    mean = sum(scores) / len(scores)
+    deviation = (sum((score - mean) ** 2 for score in scores) / len(scores)) ** 0.5
+    consistency = "high" if deviation < 5 else ("moderate" if deviation < 10 else "low")
+    return {"standard_deviation": round(deviation, 2), "consistency": consistency}
+
+def _summarize_performance(points: List[dict], competencies: List[dict]) -> dict:
+    """Latest cycle's scores, band and rank with the overall direction and strongest / weakest traits"""
+    latest = points[-1] if points else {}
+    scores = [point["overall_performance_score"] for point in points if point["overall_performance_score"] is not None]
+    # Latest score of each trait, best first
+    traits = sorted(
+        ((entry["trait_name"], entry["series"][-1]["score"]) for entry in competencies if entry["series"]),
+        key=lambda trait: trait[1], reverse=True
+    )
+    return {
+        "cycles": len(points),
+        "overall_score": latest.get("overall_performance_score"),
+        "task_score": latest.get("task_performance_score"),
+        "review_score": latest.get("review_performance_score"),
+        "performance_band": latest.get("performance_band"),
+        "organization_rank": latest.get("organization_rank"),
+        "trend": trend_direction(scores, threshold=1.0)["direction"] if points else "no_data",
+        "key_strengths": [name for name, score in traits if score >= 4][:5],
+        "development_areas": [name for name, score in reversed(traits) if score < 3][:3]
+    }
 
-def _generate_predictive_insights(reviews): 
-    """TODO: Implement predictive insights generation"""
-    return {"message": "Predictive insights generation not yet implemented"}
+def _recommend_growth(competencies: List[dict]) -> List[dict]:
+    """Development suggestions for traits scored below 3 in their latest cycle or declining"""
+    recommendations = []
+    for entry in competencies:
+        if not entry["series"]:
+            continue
+        latest = entry["series"][-1]["score"]
+        if latest < 3:
+            recommendations.append({
+                "area": entry["trait_name"],
+                "recommendation": f"Latest {entry['trait_name']} score is {latest}/5; agree a development plan for it",
+                "priority": "high" if latest < 2 else "medium"
+            })
+        elif entry["direction"] == "declining":
+            recommendations.append({
+                "area": entry["trait_name"],
+                "recommendation": f"{entry['trait_name']} has declined across recent cycles; review what changed",
+                "priority": "medium"
+            })
+    return recommendations
 
 # Additional helper functions for new API endpoints
 
@@ -3112,21 +3190,12 @@ def _generate_comprehensive_cycle_analytics(cycle: ReviewCycle, reviews: List[Re
         "peer_reviews": len(peer_reviews)
     }
     
-    # Performance insights
-    all_ratings = []
-    for review in reviews:
-        if review.responses:
-            ratings = [v for v in review.responses.values() 
-                      if isinstance(v, (int, float)) and 1 <= v <= 5]
-            all_ratings.extend(ratings)
-    
-    for peer_review in peer_reviews:
-        if peer_review.responses:
-            ratings = [v for v in peer_review.responses.values() 
-                      if isinstance(v, (int, float)) and 1 <= v <= 5]
-            all_ratings.extend(ratings)
-    
-    avg_rating = sum(all_ratings) / len(all_ratings) if all_ratings else 0
+    # Performance insights (responses parsed once; bias metrics use self/supervisor reviews only)
+    ratings = RatingMatrix(reviews)
+    peer_ratings = RatingMatrix(peer_reviews)
+    scan_batch(response_texts(review.responses for review in reviews + peer_reviews))
+    rating_count = len(ratings) + len(peer_ratings)
+    avg_rating = (ratings.total + peer_ratings.total) / rating_count if rating_count else 0
     
     # Quality metrics
     avg_response_length = _calculate_avg_response_length(reviews + peer_reviews)
@@ -3134,10 +3203,10 @@ def _generate_comprehensive_cycle_analytics(cycle: ReviewCycle, reviews: List[Re
     
     # Bias analysis
     bias_analysis = {
-        "overall_bias_score": _calculate_overall_bias_score(reviews, peer_reviews),
-        "leniency_bias": _detect_leniency_bias(reviews),
-        "halo_effect": _detect_halo_effect(reviews),
-        "recency_bias": _detect_recency_bias(reviews)
+        "overall_bias_score": ratings.overall_bias_score(),
+        "leniency_bias": ratings.leniency_bias(),
+        "halo_effect": ratings.halo_effect(),
+        "recency_bias": ratings.recency_bias()
     }
     
     return {
@@ -3156,9 +3225,9 @@ def _generate_comprehensive_cycle_analytics(cycle: ReviewCycle, reviews: List[Re
         },
         "performance_insights": {
             "average_score": round(avg_rating, 2),
-            "high_performers": len([r for r in all_ratings if r >= 4]),
-            "needs_improvement": len([r for r in all_ratings if r <= 2]),
-            "rating_distribution": _calculate_rating_distribution(all_ratings)
+            "high_performers": ratings.count_between(4, 5) + peer_ratings.count_between(4, 5),
+            "needs_improvement": ratings.count_between(1, 2) + peer_ratings.count_between(1, 2),
+            "rating_distribution": rating_distribution(ratings, peer_ratings)
         },
         "quality_metrics": {
             "avg_response_length": avg_response_length,
@@ -3166,23 +3235,7 @@ def _generate_comprehensive_cycle_analytics(cycle: ReviewCycle, reviews: List[Re
             "completion_timeline": _analyze_completion_timeline(reviews, peer_reviews)
         },
         "bias_analysis": bias_analysis,
-        "recommendations": _generate_cycle_recommendations(cycle, reviews, peer_reviews)
-    }
-
-def _calculate_rating_distribution(ratings: List[float]) -> dict:
-    """Calculate distribution of ratings"""
-    if not ratings:
-        return {}
-    
-    from collections import Counter
-    distribution = Counter(ratings)
-    
-    return {
-        "1_star": distribution.get(1, 0),
-        "2_star": distribution.get(2, 0),
-        "3_star": distribution.get(3, 0),
-        "4_star": distribution.get(4, 0),
-        "5_star": distribution.get(5, 0)
+        "recommendations": _generate_cycle_recommendations(cycle, reviews, peer_reviews, ratings)
     }
 
 # Trait Management Endpoints
@@ -3471,6 +3524,7 @@ async def delete_trait(
     # Delete the trait
     db.delete(trait)
     db.commit()
+    invalidate_form_catalog()
 
     return {"message": "Trait deleted successfully"}
 
@@ -3532,6 +3586,7 @@ async def create_question(
     db.add(question)
     db.commit()
     db.refresh(question)
+    invalidate_form_catalog()
 
     return QuestionResponse(
         id=str(question.id),
@@ -3575,6 +3630,7 @@ async def delete_question(
 
     db.delete(question)
     db.commit()
+    invalidate_form_catalog()
 
     return {"message": "Question deleted successfully"}
 
@@ -3664,6 +3720,7 @@ async def add_question_to_cycle(
     db.add(question)
     db.commit()
     db.refresh(question)
+    invalidate_form_catalog()
 
     return {"id": str(question.id), "message": "Question added successfully"}
 
@@ -3692,6 +3749,7 @@ async def remove_question_from_cycle(
     # Soft delete
     question.is_active = False
     db.commit()
+    invalidate_form_catalog()
 
     return {"message": "Question removed successfully"}
 
@@ -3724,6 +3782,12 @@ async def activate_review_cycle(
             detail="Review cycle is not in draft status"
         )
 
+    # Validate the participant criteria before any assignments are replaced
+    try:
+        cycle_participant_filter(cycle)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
     # Generate all review assignments
     _generate_review_assignments(cycle_id, db)
 
@@ -3751,141 +3815,48 @@ async def activate_review_cycle(
     }
 
 def _generate_review_assignments(cycle_id: str, db: Session):
-    """Generate review assignments for a cycle"""
+    """
+    Generate review assignments for a cycle
+    Loads active users once, plans all pairs in memory and writes them with one multi-row insert
+    """
     cycle = db.query(ReviewCycle).filter(ReviewCycle.id == cycle_id).first()
     if not cycle:
         return
 
     # Delete any existing assignments for this cycle (to handle re-activation scenarios)
-    db.query(ReviewAssignment).filter(ReviewAssignment.cycle_id == cycle_id).delete()
+    db.query(ReviewAssignment).filter(ReviewAssignment.cycle_id == cycle_id).delete(synchronize_session=False)
     db.flush()  # Ensure deletions are processed before creating new assignments
 
-    # Get all active users
-    active_users = db.query(User).filter(User.status == 'ACTIVE').all()
+    participants = [
+        ReviewParticipant(*row) for row in db.query(
+            User.id, User.organization_id, User.supervisor_id
+        ).filter(cycle_participant_filter(cycle)).all()
+    ]
 
-    for user in active_users:
-        # Create self-review assignment
-        self_assignment = ReviewAssignment(
-            cycle_id=cycle_id,
-            reviewer_id=user.id,
-            reviewee_id=user.id,
-            review_type='self'
-        )
-        db.add(self_assignment)
-
-        # Create supervisor review assignment
-        # Use the actual supervisor_id field from the user model
-        if user.supervisor_id:
-            supervisor = db.query(User).filter(
-                User.id == user.supervisor_id,
-                User.status == 'ACTIVE'
-            ).first()
-
-            if supervisor:
-                supervisor_assignment = ReviewAssignment(
-                    cycle_id=cycle_id,
-                    reviewer_id=supervisor.id,
-                    reviewee_id=user.id,
-                    review_type='supervisor'
-                )
-                db.add(supervisor_assignment)
-
-        # Create peer reviews (always included in new system)
-        peer_count = cycle.components.get('peer_count', 5)
-
-        # Get users from same department, excluding:
-        # 1. The user themselves
-        # 2. Their supervisor (already reviewing in supervisor section)
-        # 3. Anyone they supervise (avoid dual review burden)
-        excluded_ids = [user.id]
-        if user.supervisor_id:
-            excluded_ids.append(user.supervisor_id)
-
-        # Get all subordinates
-        subordinate_ids = db.query(User.id).filter(
-            User.supervisor_id == user.id,
-            User.status == 'ACTIVE'
-        ).all()
-        excluded_ids.extend([sub_id[0] for sub_id in subordinate_ids])
-
-        # Get eligible peers from same department
-        dept_users = db.query(User).filter(
-            User.organization_id == user.organization_id,
-            User.status == 'ACTIVE',
-            User.id.notin_(excluded_ids)
-        ).order_by(func.random()).limit(peer_count).all()
-
-        for peer in dept_users:
-            peer_assignment = ReviewAssignment(
-                cycle_id=cycle_id,
-                reviewer_id=peer.id,
-                reviewee_id=user.id,
-                review_type='peer'
-            )
-            db.add(peer_assignment)
+    components = cycle.components or {}
+    planned = plan_review_assignments(
+        participants,
+        peer_count=components.get('peer_count', DEFAULT_PEER_COUNT),
+        seed=assignment_seed(cycle),
+        max_peer_reviews=components.get('max_peer_reviews')
+    )
+
+    if planned:
+        db.execute(insert(ReviewAssignment), [
+            {
+                "cycle_id": cycle.id,
+                "reviewer_id": assignment.reviewer_id,
+                "reviewee_id": assignment.reviewee_id,
+                "review_type": assignment.review_type
+            }
+            for assignment in planned
+        ])
 
+    ReviewProgressService(db).rebuild(cycle.id)
     db.commit()
 
 # User Review Assignment Endpoints
 
-@router.get("/assignments/me")
-async def get_my_review_assignments(
-    current_user = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """Get all review assignments for the current user"""
-    # Get assignments for current user
-    assignments = db.query(ReviewAssignment).filter(
-        ReviewAssignment.reviewer_id == current_user.user_id
-    ).all()
-
-    if not assignments:
-        return []
-
-    result = []
-    for assignment in assignments:
-        try:
-            # Get cycle
-            cycle = db.query(ReviewCycle).filter(
-                ReviewCycle.id == assignment.cycle_id
-            ).first()
-
-            if not cycle:
-                continue
-
-            # Get reviewee
-            reviewee = db.query(User).filter(
-                User.id == assignment.reviewee_id
-            ).first()
-
-            if not reviewee:
-                continue
-
-            # Build reviewee name
-            name_parts = [reviewee.first_name]
-            if reviewee.middle_name:
-                name_parts.append(reviewee.middle_name)
-            name_parts.append(reviewee.last_name)
-            reviewee_name = " ".join(name_parts)
-
-            # Simple response with empty questions array for now
-            result.append({
-                "id": str(assignment.id),
-                "cycle_id": str(cycle.id),
-                "cycle_name": cycle.name,
-                "reviewee_id": str(reviewee.id),
-                "reviewee_name": reviewee_name,
-                "review_type": assignment.review_type,
-                "status": assignment.status,
-                "completed_at": assignment.completed_at.isoformat() if assignment.completed_at else None,
-                "questions": []  # Empty for now to prevent frontend errors
-            })
-        except Exception as e:
-            print(f"Error processing assignment: {e}")
-            continue
-
-    return result
-
 @router.get("/assignments/{assignment_id}/form")
 async def get_review_assignment_form(
     assignment_id: str,
@@ -3913,12 +3884,6 @@ async def get_review_assignment_form(
     if not cycle:
         raise HTTPException(status_code=404, detail="Review cycle not found")
 
-    # Get traits and questions for this cycle and review type
-    cycle_traits = db.query(ReviewCycleTrait).filter(
-        ReviewCycleTrait.cycle_id == assignment.cycle_id,
-        ReviewCycleTrait.is_active == True
-    ).all()
-
     form_data = {
         "assignment_id": assignment_id,
         "review_type": assignment.review_type,
@@ -3939,55 +3904,31 @@ async def get_review_assignment_form(
     }
 
     # Get existing responses
-    existing_responses = db.query(ReviewResponseModel).filter(
-        ReviewResponse.assignment_id == assignment_id
-    ).all()
-
-    response_map = {str(resp.question_id): resp for resp in existing_responses}
-
-    # Build trait questions structure
-    for cycle_trait in cycle_traits:
-        trait = db.query(ReviewTrait).filter(ReviewTrait.id == cycle_trait.trait_id).first()
-        if not trait:
-            continue
-
-        # Get questions for this trait that apply to the review type
-        questions_query = db.query(ReviewQuestion).filter(
-            ReviewQuestion.trait_id == trait.id,
-            ReviewQuestion.is_active == True
-        )
-
-        # Filter based on review type
-        if assignment.review_type == 'self':
-            questions_query = questions_query.filter(ReviewQuestion.applies_to_self == True)
-        elif assignment.review_type == 'peer':
-            questions_query = questions_query.filter(ReviewQuestion.applies_to_peer == True)
-        elif assignment.review_type == 'supervisor':
-            questions_query = questions_query.filter(ReviewQuestion.applies_to_supervisor == True)
-
-        questions = questions_query.all()
-
-        trait_data = {
-            "id": str(trait.id),
-            "name": trait.name,
-            "description": trait.description,
-            "questions": []
-        }
-
-        for question in questions:
-            question_id = str(question.id)
-            existing_response = response_map.get(question_id)
+    response_map = {
+        str(question_id): (rating, comment)
+        for question_id, rating, comment in db.query(
+            ReviewResponseModel.question_id, ReviewResponseModel.rating, ReviewResponseModel.comment
+        ).filter(ReviewResponseModel.assignment_id == assignment.id).all()
+    }
 
-            question_data = {
+    # Overlay this reviewer's responses on the shared trait/question catalog
+    for trait in get_form_catalog(db, assignment.cycle_id, assignment.review_type):
+        questions = []
+        for question_id, question_text in trait["questions"]:
+            rating, comment = response_map.get(question_id, (None, None))
+            questions.append({
                 "id": question_id,
-                "text": question.question_text,
-                "rating": existing_response.rating if existing_response else None,
-                "comment": existing_response.comment if existing_response else None
-            }
-            trait_data["questions"].append(question_data)
+                "text": question_text,
+                "rating": rating,
+                "comment": comment
+            })
 
-        if trait_data["questions"]:  # Only include traits that have questions
-            form_data["traits"].append(trait_data)
+        form_data["traits"].append({
+            "id": trait["id"],
+            "name": trait["name"],
+            "description": trait["description"],
+            "questions": questions
+        })
 
     return form_data
 
@@ -4012,56 +3953,30 @@ async def submit_review_assignment(
     if assignment.status == 'completed':
         raise HTTPException(status_code=400, detail="Assignment already completed")
 
-    # Validate and save responses
-    response_list = responses.get('responses', [])
-
-    for response_data in response_list:
-        question_id = response_data.get('question_id')
-        rating = response_data.get('rating')
-        comment = response_data.get('comment', '')
-
-        if not question_id or rating is None:
-            continue
-
-        # Validate rating is in range 1-10
-        if not (1 <= rating <= 10):
-            raise HTTPException(status_code=400, detail=f"Rating must be between 1 and 10, got {rating}")
-
-        # Check if response already exists
-        existing_response = db.query(ReviewResponseModel).filter(
-            ReviewResponseModel.assignment_id == assignment_id,
-            ReviewResponseModel.question_id == question_id
-        ).first()
-
-        if existing_response:
-            # Update existing response
-            existing_response.rating = rating
-            existing_response.comment = comment
-            existing_response.updated_at = func.now()
-        else:
-            # Create new response
-            new_response = ReviewResponseModel(
-                assignment_id=assignment_id,
-                question_id=question_id,
-                rating=rating,
-                comment=comment
-            )
-            db.add(new_response)
+    # Validate and save all responses with one upsert
+    _upsert_assignment_responses(assignment, responses.get('responses', []), db)
 
     # Check if this is final submission or just saving progress
     is_draft = responses.get('is_draft', False)
+    progress_message = None
 
     if not is_draft:
-        # Mark assignment as completed
-        assignment.status = 'completed'
-        assignment.completed_at = func.now()
+        # Conditional transition: a concurrent submit of the same assignment matches nothing here
+        if not complete_assignment(db, assignment):
+            db.rollback()
+            raise HTTPException(status_code=400, detail="Assignment already completed")
 
-    db.commit()
+        # Fold this submission's ratings into the reviewee's running score aggregates
+        submitted_ratings = dict(db.query(ReviewResponseModel.question_id, ReviewResponseModel.rating).filter(
+            ReviewResponseModel.assignment_id == assignment.id
+        ).all())
+        ReviewScoringService(db).apply_submission(assignment, submitted_ratings)
 
-    # After marking as completed, check if all reviews for this reviewee in this cycle are done
-    # If so, calculate scores
-    if not is_draft:
-        _calculate_scores_if_ready(assignment.cycle_id, assignment.reviewee_id, db)
+        # Bump the cycle's completion counters in the same transaction
+        progress_message = ReviewProgressService(db).record_completion(assignment)
+
+    db.commit()
+    await push_cycle_progress(progress_message)
 
     return {
         "message": "Progress saved successfully" if is_draft else "Review submitted successfully",
@@ -4070,140 +3985,89 @@ async def submit_review_assignment(
         "completed_at": assignment.completed_at
     }
 
-def _calculate_scores_if_ready(cycle_id: str, user_id: str, db: Session):
-    """Check if all reviews are completed for a user and calculate scores if ready"""
-
-    # Check if all assignments for this user in this cycle are completed
-    total_assignments = db.query(ReviewAssignment).filter(
-        ReviewAssignment.cycle_id == cycle_id,
-        ReviewAssignment.reviewee_id == user_id
-    ).count()
-
-    completed_assignments = db.query(ReviewAssignment).filter(
-        ReviewAssignment.cycle_id == cycle_id,
-        ReviewAssignment.reviewee_id == user_id,
-        ReviewAssignment.status == 'completed'
-    ).count()
-
-    if total_assignments == completed_assignments and total_assignments > 0:
-        # All reviews completed, calculate scores
-        _calculate_user_review_scores(cycle_id, user_id, db)
-
-def _calculate_user_review_scores(cycle_id: str, user_id: str, db: Session):
-    """Calculate weighted scores for a user based on all their reviews in a cycle"""
+@router.patch("/assignments/{assignment_id}/responses")
+async def patch_review_assignment_responses(
+    assignment_id: str,
+    responses: dict,  # {"responses": [{"question_id": "uuid", "rating": 4, "comment": "text"}]}
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Save only the changed responses of an in-progress assignment (draft autosave)
+    Questions not in the payload are left untouched, as is the comment when it is omitted
+    """
+    assignment = db.query(ReviewAssignment).filter(ReviewAssignment.id == assignment_id).first()
+    if not assignment:
+        raise HTTPException(status_code=404, detail="Assignment not found")
 
-    # Get all traits for this cycle
-    cycle_traits = db.query(ReviewCycleTrait).filter(
-        ReviewCycleTrait.cycle_id == cycle_id,
-        ReviewCycleTrait.is_active == True
-    ).all()
+    if assignment.reviewer_id != current_user.user_id:
+        raise HTTPException(status_code=403, detail="Access denied")
 
-    for cycle_trait in cycle_traits:
-        trait_id = cycle_trait.trait_id
-
-        # Calculate scores for each review type
-        self_score = _calculate_trait_score_by_type(cycle_id, user_id, trait_id, 'self', db)
-        peer_score = _calculate_trait_score_by_type(cycle_id, user_id, trait_id, 'peer', db)
-        supervisor_score = _calculate_trait_score_by_type(cycle_id, user_id, trait_id, 'supervisor', db)
-
-        # Calculate weighted score: self (20%) + peer (30%) + supervisor (50%)
-        weighted_score = None
-        if self_score is not None or peer_score is not None or supervisor_score is not None:
-            # Only include scores that exist, adjust weights proportionally
-            total_weight = 0
-            weighted_total = 0
-
-            if self_score is not None:
-                weighted_total += self_score * 0.2
-                total_weight += 0.2
-
-            if peer_score is not None:
-                weighted_total += peer_score * 0.3
-                total_weight += 0.3
-
-            if supervisor_score is not None:
-                weighted_total += supervisor_score * 0.5
-                total_weight += 0.5
-
-            if total_weight > 0:
-                weighted_score = weighted_total / total_weight * 10  # Normalize to 10-point scale
-
-        # Save or update the score
-        existing_score = db.query(ReviewScore).filter(
-            ReviewScore.cycle_id == cycle_id,
-            ReviewScore.user_id == user_id,
-            ReviewScore.trait_id == trait_id
-        ).first()
-
-        if existing_score:
-            existing_score.self_score = self_score
-            existing_score.peer_score = peer_score
-            existing_score.supervisor_score = supervisor_score
-            existing_score.weighted_score = weighted_score
-            existing_score.calculated_at = func.now()
-        else:
-            new_score = ReviewScore(
-                cycle_id=cycle_id,
-                user_id=user_id,
-                trait_id=trait_id,
-                self_score=self_score,
-                peer_score=peer_score,
-                supervisor_score=supervisor_score,
-                weighted_score=weighted_score
-            )
-            db.add(new_score)
+    if assignment.status == 'completed':
+        raise HTTPException(status_code=400, detail="Assignment already completed")
 
+    saved_count = _upsert_assignment_responses(assignment, responses.get('responses', []), db, partial=True)
     db.commit()
 
-def _calculate_trait_score_by_type(cycle_id: str, user_id: str, trait_id: str, review_type: str, db: Session) -> float:
-    """Calculate average score for a trait from specific review type"""
+    return {
+        "message": "Progress saved successfully",
+        "assignment_id": assignment_id,
+        "status": assignment.status,
+        "saved_count": saved_count
+    }
 
-    # Get all assignments of this type for this user
-    assignments = db.query(ReviewAssignment).filter(
-        ReviewAssignment.cycle_id == cycle_id,
-        ReviewAssignment.reviewee_id == user_id,
-        ReviewAssignment.review_type == review_type,
-        ReviewAssignment.status == 'completed'
-    ).all()
+def _upsert_assignment_responses(assignment: ReviewAssignment, response_list: list, db: Session,
+                                 partial: bool = False) -> int:
+    """
+    Write an assignment's responses with one INSERT ... ON CONFLICT ON CONSTRAINT unique_response
 
-    if not assignments:
-        return None
+    Args:
+        partial: Keep the stored comment when an item omits it (PATCH); otherwise a missing
+                 comment is saved as empty, as a full submission replaces it
 
-    # Get all questions for this trait
-    trait_questions = db.query(ReviewQuestion).filter(
-        ReviewQuestion.trait_id == trait_id,
-        ReviewQuestion.is_active == True
-    )
+    Returns:
+        int: Number of responses written
+    """
+    rows = {}
+    for response_data in response_list:
+        question_id = response_data.get('question_id')
+        rating = response_data.get('rating')
 
-    # Filter based on review type
-    if review_type == 'self':
-        trait_questions = trait_questions.filter(ReviewQuestion.applies_to_self == True)
-    elif review_type == 'peer':
-        trait_questions = trait_questions.filter(ReviewQuestion.applies_to_peer == True)
-    elif review_type == 'supervisor':
-        trait_questions = trait_questions.filter(ReviewQuestion.applies_to_supervisor == True)
+        if not question_id or rating is None:
+            continue
 
-    question_ids = [str(q.id) for q in trait_questions.all()]
+        # Validate rating is in range 1-10
+        if not (1 <= rating <= 10):
+            raise HTTPException(status_code=400, detail=f"Rating must be between 1 and 10, got {rating}")
 
-    if not question_ids:
-        return None
+        comment = response_data.get('comment') if partial else response_data.get('comment', '')
 
-    # Get all responses for these questions from these assignments
-    all_ratings = []
-    for assignment in assignments:
-        responses = db.query(ReviewResponseModel).filter(
-            ReviewResponse.assignment_id == assignment.id,
-            ReviewResponse.question_id.in_(question_ids)
-        ).all()
+        # Later entries for the same question win, as they did with per-row updates
+        rows[str(question_id)] = {
+            "id": uuid.uuid4(),
+            "assignment_id": assignment.id,
+            "question_id": question_id,
+            "rating": rating,
+            "comment": comment
+        }
 
-        for response in responses:
-            all_ratings.append(response.rating)
+    if not rows:
+        return 0
 
-    if not all_ratings:
-        return None
+    statement = pg_insert(ReviewResponseModel).values(list(rows.values()))
+    comment_value = statement.excluded.comment
+    if partial:
+        comment_value = func.coalesce(statement.excluded.comment, ReviewResponseModel.comment)
 
-    # Return average score
-    return sum(all_ratings) / len(all_ratings)
+    db.execute(statement.on_conflict_do_update(
+        constraint='unique_response',
+        set_={
+            "rating": statement.excluded.rating,
+            "comment": comment_value,
+            "updated_at": func.now()
+        }
+    ))
+    return len(rows)
 
 @router.post("/cycles/{cycle_id}/calculate-scores")
 async def calculate_cycle_scores(
@@ -4211,7 +4075,10 @@ async def calculate_cycle_scores(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Manually trigger score calculation for all users in a cycle"""
+    """
+    Manually trigger score calculation for all users in a cycle
+    Also rebuilds the running score aggregates that submissions update incrementally
+    """
     user_permissions = UserPermissions(db)
 
     if "review_create_cycle" not in current_user.permissions:
@@ -4227,15 +4094,10 @@ async def calculate_cycle_scores(
             detail="Review cycle not found"
         )
 
-    # Get all users who have assignments in this cycle
-    user_ids = db.query(func.distinct(ReviewAssignment.reviewee_id)).filter(
-        ReviewAssignment.cycle_id == cycle_id
-    ).all()
-
-    calculated_count = 0
-    for (user_id,) in user_ids:
-        _calculate_user_review_scores(cycle_id, user_id, db)
-        calculated_count += 1
+    # One grouped aggregate and bulk upsert for every reviewee in the cycle
+    calculated_count = ReviewScoringService(db).calculate_cycle_scores(cycle.id)
+    # Score watermarks move too; this frees the stale results in this process right away
+    cycle_results.invalidate(cycle.id)
 
     return {
         "message": f"Scores calculated for {calculated_count} users",
@@ -4267,37 +4129,28 @@ async def get_cycle_dashboard(
             detail="Review cycle not found"
         )
 
+    return cycle_results.get_or_compute(
+        "dashboard", cycle,
+        watermark=lambda: cycle_watermark(db, cycle.id, ReviewCycleProgress),
+        compute=lambda: _build_cycle_dashboard(cycle, db)
+    )
+
+def _build_cycle_dashboard(cycle: ReviewCycle, db: Session) -> dict:
+    """Cycle dashboard from the maintained progress counters"""
+    # Read the maintained counters: one row per (organization, review type) plus participants
+    counters = ReviewProgressService(db).cycle_counters(cycle.id)
+
     # Get participation statistics
-    total_participants = db.query(func.count(func.distinct(ReviewAssignment.reviewee_id))).filter(
-        ReviewAssignment.cycle_id == cycle_id
-    ).scalar() or 0
-
-    completed_participants = db.query(func.count(func.distinct(ReviewAssignment.reviewee_id))).filter(
-        ReviewAssignment.cycle_id == cycle_id,
-        ReviewAssignment.reviewee_id.in_(
-            db.query(ReviewAssignment.reviewee_id).filter(
-                ReviewAssignment.cycle_id == cycle_id
-            ).group_by(ReviewAssignment.reviewee_id).having(
-                func.count(ReviewAssignment.id) == func.count(
-                    func.case([(ReviewAssignment.status == 'completed', 1)])
-                )
-            )
-        )
-    ).scalar() or 0
+    participant_rows = [row for row in counters if row.review_type == PARTICIPANTS]
+    total_participants = sum(row.total_count for row in participant_rows)
+    completed_participants = sum(row.completed_count for row in participant_rows)
 
     # Get assignment statistics by type
     assignment_stats = {}
-    for review_type in ['self', 'peer', 'supervisor']:
-        total = db.query(ReviewAssignment).filter(
-            ReviewAssignment.cycle_id == cycle_id,
-            ReviewAssignment.review_type == review_type
-        ).count()
-
-        completed = db.query(ReviewAssignment).filter(
-            ReviewAssignment.cycle_id == cycle_id,
-            ReviewAssignment.review_type == review_type,
-            ReviewAssignment.status == 'completed'
-        ).count()
+    for review_type in REVIEW_ASSIGNMENT_TYPES:
+        type_rows = [row for row in counters if row.review_type == review_type]
+        total = sum(row.total_count for row in type_rows)
+        completed = sum(row.completed_count for row in type_rows)
 
         assignment_stats[review_type] = {
             "total": total,
@@ -4305,17 +4158,11 @@ async def get_cycle_dashboard(
             "completion_rate": (completed / total * 100) if total > 0 else 0
         }
 
-    # Get department breakdown
-    dept_stats = db.query(
-        Organization.name,
-        func.count(func.distinct(ReviewAssignment.reviewee_id)).label('total'),
-        func.count(func.distinct(
-            func.case([(ReviewAssignment.status == 'completed', ReviewAssignment.reviewee_id)])
-        )).label('completed')
-    ).join(User, User.id == ReviewAssignment.reviewee_id)\
-     .join(Organization, Organization.id == User.organization_id)\
-     .filter(ReviewAssignment.cycle_id == cycle_id)\
-     .group_by(Organization.name).all()
+    # Get department breakdown (completed = reviewees with at least one completed assignment)
+    dept_stats = {}
+    for row in participant_rows:
+        dept_total, dept_completed = dept_stats.get(row.organization_name, (0, 0))
+        dept_stats[row.organization_name] = (dept_total + row.total_count, dept_completed + row.started_count)
 
     department_breakdown = [
         {
@@ -4324,7 +4171,7 @@ async def get_cycle_dashboard(
             "completed_participants": completed,
             "completion_rate": (completed / total * 100) if total > 0 else 0
         }
-        for dept_name, total, completed in dept_stats
+        for dept_name, (total, completed) in dept_stats.items()
     ]
 
     return {
@@ -4345,6 +4192,58 @@ async def get_cycle_dashboard(
         "department_breakdown": department_breakdown
     }
 
+@router.get("/analytics-cache/stats")
+async def get_analytics_cache_stats(
+    current_user: User = Depends(get_current_user)
+):
+    """Hit ratio and entry sizes of the cycle analytics result cache (this worker process)"""
+    if "review_view_all" not in current_user.permissions:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to view analytics cache statistics"
+        )
+
+    return cycle_results.stats()
+
+@router.get("/analytics/cube")
+async def get_review_analytics_cube(
+    group_by: List[str] = Query(["cycle"], description=f"Dimensions to group by: {', '.join(CUBE_DIMENSIONS)}"),
+    cycle_ids: Optional[List[uuid.UUID]] = Query(None),
+    years: Optional[List[int]] = Query(None, description="Calendar years of the cycle end dates"),
+    organization_ids: Optional[List[uuid.UUID]] = Query(None, description="Each covers its whole subtree"),
+    organization_level: Optional[OrganizationLevel] = Query(None),
+    trait_ids: Optional[List[uuid.UUID]] = Query(None),
+    review_types: Optional[List[str]] = Query(None),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Rating count, mean, standard deviation and histogram of completed cycles sliced by any of
+    cycle, year, organization, trait and review type (read from the pre-aggregated cube).
+    Without organization in group_by the whole company is returned, unless one organization or
+    an organization level is selected.
+    """
+    if "performance_view_all" not in current_user.permissions:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Insufficient permissions to view organization analytics"
+        )
+
+    try:
+        cells = ReviewCubeService(db).slice(
+            group_by,
+            cycle_ids=cycle_ids,
+            organization_ids=organization_ids,
+            organization_level=organization_level,
+            trait_ids=trait_ids,
+            review_types=review_types,
+            years=years
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return {"group_by": list(dict.fromkeys(group_by)), "cells": cells}
+
 @router.get("/cycles/{cycle_id}/user-progress")
 async def get_user_progress(
     cycle_id: str,
@@ -4360,45 +4259,22 @@ async def get_user_progress(
             detail="Insufficient permissions to view user progress"
         )
 
-    # Get all users in the cycle with their assignment details
-    user_progress = db.query(
-        User.id,
-        User.first_name,
-        User.last_name,
-        User.job_title,
-        Organization.name.label('department'),
-        func.count(ReviewAssignment.id).label('total_assignments'),
-        func.count(
-            func.case([(ReviewAssignment.status == 'completed', 1)])
-        ).label('completed_assignments')
-    ).join(ReviewAssignment, ReviewAssignment.reviewee_id == User.id)\
-     .join(Organization, Organization.id == User.organization_id)\
-     .filter(ReviewAssignment.cycle_id == cycle_id)\
-     .group_by(User.id, User.first_name, User.last_name, User.job_title, Organization.name).all()
-
+    # Get all users in the cycle with their assignment details, split by review type
     result = []
-    for progress in user_progress:
-        user_id = str(progress.id)
-
-        # Get assignment breakdown by type
+    for progress in _cycle_reviewee_progress(cycle_id, db):
         assignments_by_type = {}
-        for review_type in ['self', 'peer', 'supervisor']:
-            type_assignments = db.query(ReviewAssignment).filter(
-                ReviewAssignment.cycle_id == cycle_id,
-                ReviewAssignment.reviewee_id == progress.id,
-                ReviewAssignment.review_type == review_type
-            ).all()
-
-            completed_type = [a for a in type_assignments if a.status == 'completed']
+        for review_type in REVIEW_ASSIGNMENT_TYPES:
+            total = getattr(progress, f"{review_type}_total")
+            completed = getattr(progress, f"{review_type}_completed")
 
             assignments_by_type[review_type] = {
-                "total": len(type_assignments),
-                "completed": len(completed_type),
-                "pending": len(type_assignments) - len(completed_type)
+                "total": total,
+                "completed": completed,
+                "pending": total - completed
             }
 
         result.append({
-            "user_id": user_id,
+            "user_id": str(progress.id),
             "name": f"{progress.first_name} {progress.last_name}",
             "job_title": progress.job_title,
             "department": progress.department,
@@ -4412,6 +4288,34 @@ async def get_user_progress(
 
     return result
 
+def _cycle_reviewee_progress(cycle_id: str, db: Session) -> list:
+    """
+    Assignment counts per reviewee for a cycle from one grouped scan of review_assignments
+
+    Each row has id, first_name, last_name, job_title, department, total_assignments,
+    completed_assignments and <type>_total / <type>_completed for self, peer and supervisor
+    """
+    is_completed = ReviewAssignment.status == 'completed'
+    type_counts = []
+    for review_type in REVIEW_ASSIGNMENT_TYPES:
+        is_type = ReviewAssignment.review_type == review_type
+        type_counts.append(func.count().filter(is_type).label(f"{review_type}_total"))
+        type_counts.append(func.count().filter(and_(is_type, is_completed)).label(f"{review_type}_completed"))
+
+    return db.query(
+        User.id,
+        User.first_name,
+        User.last_name,
+        User.job_title,
+        Organization.name.label('department'),
+        func.count(ReviewAssignment.id).label('total_assignments'),
+        func.count().filter(is_completed).label('completed_assignments'),
+        *type_counts
+    ).join(ReviewAssignment, ReviewAssignment.reviewee_id == User.id)\
+     .join(Organization, Organization.id == User.organization_id)\
+     .filter(ReviewAssignment.cycle_id == cycle_id)\
+     .group_by(User.id, User.first_name, User.last_name, User.job_title, Organization.name).all()
+
 @router.get("/users/{user_id}/review-scores/{cycle_id}")
 async def get_user_review_scores(
     user_id: str,
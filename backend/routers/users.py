@@ -10,8 +10,6 @@ from typing import List, Optional
 from datetime import datetime, timedelta
 import uuid
 import os
-import shutil
-from pathlib import Path
 
 from database import get_db
 from models import User, UserStatus, UserHistory
@@ -23,6 +21,9 @@ from schemas.auth import UserSession
 from utils.auth import get_current_user, get_password_hash, generate_onboarding_token
 from utils.permissions import UserPermissions, SystemPermissions
 from utils.email_service import EmailService
+from utils.profile_images import (
+    create_profile_image_variants, delete_profile_image_files, profile_image_url, profile_image_variant_urls
+)
 
 router = APIRouter(tags=["users"])
 
@@ -339,7 +340,7 @@ async def upload_profile_image(
 ):
     """
     Upload profile image for current user
-    Stores file locally in uploads/profiles/ directory
+    The image is decoded once and stored as 32/64/256px WebP variants in uploads/profiles/variants/
     """
     user = db.query(User).filter(User.id == current_user.user_id).first()
     if not user:
@@ -351,33 +352,20 @@ async def upload_profile_image(
         raise HTTPException(status_code=400, detail="Only JPEG, PNG, and WebP images are allowed")
 
     # Validate file size (max 5MB)
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset to beginning
-    if file_size > 5 * 1024 * 1024:
+    content = await file.read()
+    if len(content) > 5 * 1024 * 1024:
         raise HTTPException(status_code=400, detail="File size must not exceed 5MB")
 
-    # Create uploads directory if it doesn't exist
-    upload_dir = Path("uploads/profiles")
-    upload_dir.mkdir(parents=True, exist_ok=True)
-
-    # Generate unique filename
-    file_extension = file.filename.split(".")[-1]
-    unique_filename = f"{user.id}_{uuid.uuid4().hex[:8]}.{file_extension}"
-    file_path = upload_dir / unique_filename
-
-    # Delete old profile image if exists
-    if user.profile_image_path:
-        old_file_path = Path(user.profile_image_path)
-        if old_file_path.exists():
-            old_file_path.unlink()
+    # Decode and write variants in the image worker pool
+    try:
+        file_path = await create_profile_image_variants(user.id, content)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
-    # Save new file
-    with file_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
+    old_file_path = user.profile_image_path
 
-    # Update user record with the path
-    user.profile_image_path = str(file_path)
+    # Update user record with the path of the primary variant
+    user.profile_image_path = file_path
 
     # Create history entry
     history = UserHistory(
@@ -385,7 +373,7 @@ async def upload_profile_image(
         admin_id=user.id,
         action="profile_image_updated",
         old_value=None,
-        new_value={"profile_image_path": str(file_path)}
+        new_value={"profile_image_path": file_path}
     )
     db.add(history)
 
@@ -394,19 +382,20 @@ async def upload_profile_image(
         db.commit()
         db.refresh(user)
     except Exception as e:
-        # Rollback on error and delete uploaded file
+        # Rollback on error and delete uploaded variants
         db.rollback()
-        if file_path.exists():
-            file_path.unlink()
+        delete_profile_image_files(file_path)
         raise HTTPException(status_code=500, detail=f"Failed to save profile image: {str(e)}")
 
-    # Generate URL path for the uploaded image
-    url_path = f"/api/uploads/profiles/{unique_filename}"
+    # Delete old profile image once the new one is saved (re-uploading the same image keeps its files)
+    if old_file_path and old_file_path != file_path:
+        delete_profile_image_files(old_file_path)
 
     return {
         "message": "Profile image uploaded successfully",
-        "profile_image_path": str(file_path),
-        "profile_image_url": url_path
+        "profile_image_path": file_path,
+        "profile_image_url": profile_image_url(file_path),
+        "profile_image_variants": profile_image_variant_urls(file_path)
     }
 
 @router.delete("/me/profile-image")
@@ -424,10 +413,8 @@ async def delete_profile_image(
     if not user.profile_image_path:
         raise HTTPException(status_code=404, detail="No profile image to delete")
 
-    # Delete file
-    file_path = Path(user.profile_image_path)
-    if file_path.exists():
-        file_path.unlink()
+    # Delete file and all variants
+    delete_profile_image_files(user.profile_image_path)
 
     # Update user record
     user.profile_image_path = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 import uuid
 
@@ -55,4 +55,5 @@ class UserSession(BaseModel):
     is_leadership: bool
     status: str
     profile_image_path: Optional[str] = None
-    profile_image_url: Optional[str] = None
\ No newline at end of file
+    profile_image_url: Optional[str] = None
+    profile_image_variants: Optional[Dict[str, str]] = None  # Variant size ("32", "64", "256") -> URL
\ No newline at end of file
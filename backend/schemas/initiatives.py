@@ -83,6 +83,13 @@ class InitiativeCreate(InitiativeBase):
                     raise ValueError('Individual initiatives cannot have a team head')
         return v
 
+class InitiativeBulkCreate(BaseModel):
+    """
+    Create many initiatives in one request
+    e.g. a supervisor assigning the same quarterly initiative to each report
+    """
+    initiatives: List[InitiativeCreate] = Field(..., min_items=1, max_items=500)
+
 class InitiativeUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
@@ -218,6 +225,11 @@ class InitiativeList(BaseModel):
     page: int
     per_page: int
 
+class InitiativeBulkCreateResponse(BaseModel):
+    """Initiatives created by a bulk request, in request order"""
+    initiatives: List[Initiative]
+    total: int
+
 class InitiativeStats(BaseModel):
     """Initiative statistics and analytics"""
     total_initiatives: int
@@ -1,9 +1,11 @@
 from pydantic import BaseModel, Field, EmailStr, validator, model_validator
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 from enum import Enum
 import uuid
 
+from utils.profile_images import profile_image_url, profile_image_variant_urls
+
 class UserStatus(str, Enum):
     PENDING_ACTIVATION = "PENDING_ACTIVATION"
     ACTIVE = "ACTIVE"
@@ -64,6 +66,7 @@ class User(UserInDB):
     supervisor_id: Optional[uuid.UUID] = None
     supervisor_name: Optional[str] = None
     profile_image_url: Optional[str] = None  # Computed field for frontend access
+    profile_image_variants: Optional[Dict[str, str]] = None  # Variant size ("32", "64", "256") -> URL
 
     @model_validator(mode='before')
     @classmethod
@@ -77,14 +80,10 @@ class User(UserInDB):
                 names.append(values.get('last_name'))
                 values['name'] = " ".join(names)
 
-            # Compute profile_image_url from profile_image_path
+            # Compute profile_image_url and variant URLs from profile_image_path
             if values.get('profile_image_path'):
-                # Convert Windows path to URL-friendly format
-                path = values['profile_image_path'].replace('\\', '/')
-                # Remove 'uploads/' prefix if present since we'll add /api/uploads/
-                if path.startswith('uploads/'):
-                    path = path[8:]  # Remove 'uploads/' prefix
-                values['profile_image_url'] = f"/api/uploads/{path}"
+                values['profile_image_url'] = profile_image_url(values['profile_image_path'])
+                values['profile_image_variants'] = profile_image_variant_urls(values['profile_image_path'])
         return values
 
 class UserWithRelations(User):
@@ -0,0 +1,66 @@
+"""
+Shared fixtures for tests that need a database
+The schema relies on PostgreSQL (FILTER aggregates, gen_random_uuid, advisory locks), so these
+tests run against the database named by TEST_DATABASE_URL and are skipped when it is unset.
+Every test works inside a transaction that is rolled back afterwards.
+"""
+
+from contextlib import contextmanager
+import os
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+from database import Base
+import models  # noqa: F401  (registers every table on Base.metadata)
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+
+
+@pytest.fixture(scope="session")
+def engine():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_engine(TEST_DATABASE_URL)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    connection = engine.connect()
+    transaction = connection.begin()
+    Base.metadata.create_all(connection)
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture
+def count_statements(engine):
+    """
+    Context manager collecting the SQL statements executed inside it
+
+        with count_statements() as statements:
+            ...
+        assert len(statements) == 1
+    """
+    @contextmanager
+    def counting():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return counting
@@ -0,0 +1,93 @@
+"""Row builders shared by the database tests; each flushes so generated ids are available"""
+
+from datetime import datetime, timezone
+import uuid
+
+from models import (
+    Initiative, InitiativeAssignment, InitiativeStatus, InitiativeType, Organization, ReviewAssignment,
+    ReviewCycle, ReviewCycleTrait, ReviewQuestion, ReviewResponse, ReviewScore, ReviewTrait, Role, User
+)
+
+
+def make_organization(db, name, level, parent=None):
+    organization = Organization(name=name, level=level, parent_id=parent.id if parent else None)
+    db.add(organization)
+    db.flush()
+    return organization
+
+
+def make_role(db, permissions=()):
+    role = Role(name=f"role-{uuid.uuid4().hex[:8]}", permissions=list(permissions))
+    db.add(role)
+    db.flush()
+    return role
+
+
+def make_user(db, organization, role=None, **fields):
+    suffix = uuid.uuid4().hex[:8]
+    user = User(
+        email=f"{suffix}@example.com", name=f"User {suffix}", first_name="User", last_name=suffix,
+        organization_id=organization.id, role_id=(role or make_role(db)).id, **fields
+    )
+    db.add(user)
+    db.flush()
+    return user
+
+
+def make_cycle(db, creator, start_date=datetime(2026, 1, 1), end_date=datetime(2026, 6, 30), **fields):
+    cycle = ReviewCycle(
+        name=fields.pop('name', f"Cycle {uuid.uuid4().hex[:6]}"), type="quarterly",
+        period=fields.pop('period', "H1-2026"), start_date=start_date, end_date=end_date,
+        created_by=creator.id, **fields
+    )
+    db.add(cycle)
+    db.flush()
+    return cycle
+
+
+def make_trait(db, creator, cycle=None, name=None):
+    """An active global trait with one question for every review type, optionally selected for cycle"""
+    trait = ReviewTrait(name=name or f"Trait {uuid.uuid4().hex[:6]}", created_by=creator.id)
+    db.add(trait)
+    db.flush()
+    db.add(ReviewQuestion(question_text=f"How is {trait.name}?", trait_id=trait.id, created_by=creator.id))
+    if cycle is not None:
+        db.add(ReviewCycleTrait(cycle_id=cycle.id, trait_id=trait.id))
+    db.flush()
+    return trait
+
+
+def make_assignment(db, cycle, reviewer, reviewee, review_type='self', status='pending'):
+    assignment = ReviewAssignment(
+        cycle_id=cycle.id, reviewer_id=reviewer.id, reviewee_id=reviewee.id,
+        review_type=review_type, status=status
+    )
+    db.add(assignment)
+    db.flush()
+    return assignment
+
+
+def rate(db, assignment, trait, rating):
+    """Answer trait's question on assignment"""
+    db.add(ReviewResponse(assignment_id=assignment.id, question_id=trait.questions[0].id, rating=rating))
+    db.flush()
+
+
+def make_review_score(db, cycle, user, trait, weighted_score, **scores):
+    score = ReviewScore(cycle_id=cycle.id, user_id=user.id, trait_id=trait.id, weighted_score=weighted_score, **scores)
+    db.add(score)
+    db.flush()
+    return score
+
+
+def make_scored_initiative(db, user, score, created_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
+                           status=InitiativeStatus.COMPLETED):
+    """An initiative created by and assigned to user"""
+    initiative = Initiative(
+        title=f"Initiative {uuid.uuid4().hex[:6]}", type=InitiativeType.INDIVIDUAL, status=status,
+        due_date=datetime(2026, 12, 31), created_by=user.id, score=score, created_at=created_at
+    )
+    initiative.assignments.append(InitiativeAssignment(user_id=user.id))
+    db.add(initiative)
+    db.flush()
+    return initiative
@@ -0,0 +1,90 @@
+"""Cycle analytics cache: versioning by cycle row and data watermark, expiry and invalidation"""
+
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+import uuid
+
+from models import OrganizationLevel, ReviewCycleStatus, ReviewScore
+from utils.analytics_cache import CycleResultCache, cycle_watermark
+from tests.factories import make_cycle, make_organization, make_review_score, make_trait, make_user
+
+
+class Source:
+    """compute() / watermark() pair counting recomputations"""
+
+    def __init__(self):
+        self.version = 0
+        self.computed = 0
+
+    def watermark(self):
+        return (self.version,)
+
+    def compute(self):
+        self.computed += 1
+        return {"computed": self.computed}
+
+
+def fake_cycle(status=ReviewCycleStatus.ACTIVE):
+    return SimpleNamespace(id=uuid.uuid4(), status=status, updated_at=datetime(2026, 1, 1))
+
+
+def get(cache, cycle, source, variant=None):
+    return cache.get_or_compute("scores", cycle, source.watermark, source.compute, variant)
+
+
+def test_recomputes_only_when_the_version_moves():
+    cache, cycle, source = CycleResultCache(), fake_cycle(), Source()
+
+    assert get(cache, cycle, source) == get(cache, cycle, source) == {"computed": 1}
+    source.version += 1
+    assert get(cache, cycle, source) == {"computed": 2}
+    cycle.updated_at = datetime(2026, 2, 1)
+    assert get(cache, cycle, source) == {"computed": 3}
+    assert get(cache, cycle, source, variant="department") == {"computed": 4}
+    assert (cache.hits, cache.misses) == (1, 4)
+
+
+def test_completed_cycles_follow_the_watermark_and_never_expire():
+    cache, cycle, source = CycleResultCache(ttl_seconds=0), fake_cycle(ReviewCycleStatus.COMPLETED), Source()
+
+    assert get(cache, cycle, source) == get(cache, cycle, source) == {"computed": 1}
+    # e.g. scores recalculated after completion
+    source.version += 1
+    assert get(cache, cycle, source) == {"computed": 2}
+
+    active, active_source = fake_cycle(), Source()
+    get(cache, active, active_source)
+    assert get(cache, active, active_source) == {"computed": 2}
+
+
+def test_invalidate_and_size_bound():
+    cache, source = CycleResultCache(max_bytes=40), Source()
+    first, second = fake_cycle(), fake_cycle()
+    get(cache, first, source)
+    get(cache, second, source)
+
+    cache.invalidate(str(first.id))
+    assert [entry["cycle_id"] for entry in cache.stats()["entries"]] == [str(second.id)]
+    assert get(cache, first, source) == {"computed": 3}
+
+    # Two 15-byte results fit in 40 bytes, a third evicts the least recently used
+    get(cache, fake_cycle(), source)
+    assert [entry["cycle_id"] for entry in cache.stats()["entries"]][:1] == [str(first.id)]
+    assert cache.stats()["total_bytes"] <= 40
+
+    cache.invalidate()
+    assert cache.stats()["entry_count"] == 0
+
+
+def test_score_recalculation_moves_the_watermark(db):
+    admin = make_user(db, make_organization(db, "Company", OrganizationLevel.GLOBAL))
+    cycle = make_cycle(db, admin, status=ReviewCycleStatus.COMPLETED)
+    trait = make_trait(db, admin, cycle)
+    score = make_review_score(db, cycle, admin, trait, Decimal('3.00'))
+    before = cycle_watermark(db, cycle.id, ReviewScore)
+
+    score.weighted_score = Decimal('4.00')
+    db.flush()
+
+    assert cycle_watermark(db, cycle.id, ReviewScore) != before
@@ -0,0 +1,148 @@
+"""Initiative statistics: one aggregate query whatever the number of visible initiatives"""
+
+from collections import Counter
+from datetime import datetime, timedelta
+import re
+import uuid
+
+import pytest
+
+from models import (
+    Initiative, InitiativeAssignment, InitiativeStatus, InitiativeType, InitiativeUrgency,
+    Organization, OrganizationLevel, Role, ScopeOverride, User
+)
+from utils.initiative_workflows import InitiativeWorkflowService
+
+READS_INITIATIVES = re.compile(r"\bFROM initiatives\b")
+
+
+def make_organization(db, name, level, parent=None):
+    organization = Organization(name=name, level=level, parent_id=parent.id if parent else None)
+    db.add(organization)
+    db.flush()
+    return organization
+
+
+def make_user(db, organization, permissions=(), scope_override=ScopeOverride.NONE):
+    suffix = uuid.uuid4().hex[:8]
+    role = Role(name=f"role-{suffix}", permissions=list(permissions), scope_override=scope_override)
+    user = User(
+        email=f"{suffix}@example.com", name=f"User {suffix}", first_name="User", last_name=suffix,
+        organization=organization, role=role
+    )
+    db.add(user)
+    db.flush()
+    return user
+
+
+def make_initiatives(db, creator, count, assignee=None):
+    """count initiatives cycling through every status, type and urgency at different rates"""
+    statuses, types, urgencies = list(InitiativeStatus), list(InitiativeType), list(InitiativeUrgency)
+    initiatives = []
+    for index in range(count):
+        status = statuses[index % len(statuses)]
+        initiative_type = types[index // 3 % len(types)]
+        urgency = urgencies[index // 5 % len(urgencies)]
+        initiative = Initiative(
+            title=f"Initiative {index}", type=initiative_type, status=status, urgency=urgency,
+            due_date=datetime(2026, 12, 31) + timedelta(days=index), created_by=creator.id,
+            score=index % 10 + 1 if status == InitiativeStatus.COMPLETED else None
+        )
+        if assignee is not None:
+            initiative.assignments.append(InitiativeAssignment(user_id=assignee.id))
+        initiatives.append(initiative)
+    db.add_all(initiatives)
+    db.flush()
+    return initiatives
+
+
+def stats_statements(db, count_statements, user):
+    service = InitiativeWorkflowService(db)
+    # Load the role and organization first so lazy loads are not counted
+    _ = (user.role, user.organization)
+    with count_statements() as statements:
+        stats = service.get_initiative_stats(user)
+    return stats, statements
+
+
+@pytest.fixture
+def organizations(db):
+    company = make_organization(db, "Company", OrganizationLevel.GLOBAL)
+    directorate = make_organization(db, "Operations", OrganizationLevel.DIRECTORATE, company)
+    department = make_organization(db, "Logistics", OrganizationLevel.DEPARTMENT, directorate)
+    other = make_organization(db, "Finance", OrganizationLevel.DIRECTORATE, company)
+    return {"company": company, "directorate": directorate, "department": department, "other": other}
+
+
+@pytest.mark.parametrize("permissions,scope_override", [
+    ((), ScopeOverride.NONE),
+    (("initiative_view_all",), ScopeOverride.NONE),
+    (("initiative_view_all",), ScopeOverride.GLOBAL),
+])
+def test_statement_count_does_not_grow_with_initiatives(db, count_statements, organizations,
+                                                        permissions, scope_override):
+    department = organizations["department"]
+    few = make_user(db, department, permissions, scope_override)
+    many = make_user(db, department, permissions, scope_override)
+    make_initiatives(db, few, 2)
+    make_initiatives(db, many, 120)
+
+    _, few_statements = stats_statements(db, count_statements, few)
+    _, many_statements = stats_statements(db, count_statements, many)
+
+    assert len(few_statements) == len(many_statements)
+    for statements in (few_statements, many_statements):
+        assert sum(1 for statement in statements if READS_INITIATIVES.search(statement)) == 1
+
+
+def test_counts_only_visible_initiatives(db, count_statements, organizations):
+    department = organizations["department"]
+    user = make_user(db, department)
+    colleague = make_user(db, department)
+    outsider = make_user(db, organizations["other"])
+
+    created = make_initiatives(db, user, 37)
+    assigned = make_initiatives(db, colleague, 11, assignee=user)
+    make_initiatives(db, colleague, 5)
+    make_initiatives(db, outsider, 8)
+    visible = created + assigned
+
+    stats, statements = stats_statements(db, count_statements, user)
+
+    assert sum(1 for statement in statements if READS_INITIATIVES.search(statement)) == 1
+    by_status = Counter(initiative.status.value for initiative in visible)
+    assert stats["total_initiatives"] == len(visible)
+    assert stats["by_status"] == {status.value: by_status[status.value] for status in InitiativeStatus}
+    assert stats["by_type"] == {
+        initiative_type.value: sum(1 for initiative in visible if initiative.type == initiative_type)
+        for initiative_type in InitiativeType
+    }
+    assert stats["by_urgency"] == {
+        urgency.value: sum(1 for initiative in visible if initiative.urgency == urgency)
+        for urgency in InitiativeUrgency
+    }
+    assert stats["overdue_initiatives"] == by_status[InitiativeStatus.OVERDUE.value]
+    assert stats["pending_approval"] == by_status[InitiativeStatus.PENDING_APPROVAL.value]
+    completed = by_status[InitiativeStatus.UNDER_REVIEW.value] + by_status[InitiativeStatus.COMPLETED.value]
+    assert stats["completion_rate"] == pytest.approx(completed / len(visible) * 100)
+    scores = [initiative.score for initiative in visible if initiative.score is not None]
+    assert stats["average_score"] == pytest.approx(sum(scores) / len(scores))
+
+
+def test_view_all_is_limited_to_accessible_organizations(db, count_statements, organizations):
+    manager = make_user(db, organizations["directorate"], ("initiative_view_all",))
+    make_initiatives(db, make_user(db, organizations["department"]), 6)
+    make_initiatives(db, make_user(db, organizations["other"]), 9)
+
+    stats, _ = stats_statements(db, count_statements, manager)
+
+    assert stats["total_initiatives"] == 6
+
+
+def test_no_visible_initiatives(db, count_statements, organizations):
+    stats, statements = stats_statements(db, count_statements, make_user(db, organizations["department"]))
+
+    assert sum(1 for statement in statements if READS_INITIATIVES.search(statement)) == 1
+    assert stats["total_initiatives"] == 0
+    assert stats["completion_rate"] == 0
+    assert stats["average_score"] is None
@@ -0,0 +1,153 @@
+"""Review cycle participant criteria: each rule compiled to SQL, and the dry-run endpoint"""
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from fastapi import HTTPException
+import pytest
+
+from models import OrganizationLevel, User, UserStatus
+from routers.reviews import ParticipantCriteria, preview_cycle_participants
+from utils.participant_criteria import count_participants, participant_filter
+from tests.factories import make_organization, make_user
+
+REFERENCE_DATE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def people(db):
+    """Company > Operations > Logistics > Fleet, Company > Finance, one user per row below"""
+    company = make_organization(db, "Company", OrganizationLevel.GLOBAL)
+    operations = make_organization(db, "Operations", OrganizationLevel.DIRECTORATE, company)
+    logistics = make_organization(db, "Logistics", OrganizationLevel.DEPARTMENT, operations)
+    fleet = make_organization(db, "Fleet", OrganizationLevel.UNIT, logistics)
+    finance = make_organization(db, "Finance", OrganizationLevel.DIRECTORATE, company)
+
+    users = {}
+    for name, organization, level, job_title, status, created_at in [
+        ('analyst', logistics, 8, "Analyst", UserStatus.ACTIVE, datetime(2024, 1, 1)),
+        ('fleet_lead', fleet, 12, "Team Lead", UserStatus.ACTIVE, datetime(2025, 12, 1)),
+        ('finance_analyst', finance, 7, "analyst", UserStatus.ACTIVE, datetime(2020, 6, 1)),
+        ('on_leave', logistics, 9, "Analyst", UserStatus.ON_LEAVE, datetime(2023, 3, 1)),
+        ('ungraded', logistics, None, None, UserStatus.ACTIVE, datetime(2022, 9, 1)),
+    ]:
+        users[name] = make_user(db, organization, level=level, job_title=job_title, status=status,
+                                created_at=created_at.replace(tzinfo=timezone.utc))
+    return users, {'operations': operations, 'logistics': logistics, 'finance': finance}
+
+
+def selected(db, users, *criteria, **options):
+    """Names of the users participant_filter(*criteria) selects"""
+    predicate = participant_filter(*criteria, reference_date=REFERENCE_DATE, **options)
+    ids = {user_id for (user_id,) in db.query(User.id).filter(predicate)}
+    return {name for name, user in users.items() if user.id in ids}
+
+
+def test_active_users_by_default(db, people):
+    users, _ = people
+
+    assert selected(db, users) == {'analyst', 'fleet_lead', 'finance_analyst', 'ungraded'}
+    assert selected(db, users, {'statuses': ['on_leave', 'ACTIVE']}) == set(users)
+
+
+def test_organization_subtree(db, people):
+    users, units = people
+
+    assert selected(db, users, {'organization_ids': [str(units['operations'].id)]}) == \
+        {'analyst', 'fleet_lead', 'ungraded'}
+    assert selected(db, users, {'organization_ids': [units['finance'].id]}) == {'finance_analyst'}
+
+
+def test_grade_range_and_list(db, people):
+    users, _ = people
+
+    assert selected(db, users, {'grade_levels': {'min': 8, 'max': 12}}) == {'analyst', 'fleet_lead'}
+    assert selected(db, users, {'grade_levels': {'max': 8}}) == {'analyst', 'finance_analyst'}
+    assert selected(db, users, {'grade_levels': [7, "12"]}) == {'finance_analyst', 'fleet_lead'}
+    assert selected(db, users, {'grade_levels': 8}) == {'analyst'}
+
+
+def test_job_titles_ignore_case(db, people):
+    users, _ = people
+
+    assert selected(db, users, {'job_titles': [" ANALYST "]}) == {'analyst', 'finance_analyst'}
+    assert selected(db, users, {'job_titles': "team lead"}) == {'fleet_lead'}
+
+
+def test_tenure_at_the_reference_date(db, people):
+    users, _ = people
+
+    assert selected(db, users, {'min_tenure_days': 365}) == {'analyst', 'finance_analyst', 'ungraded'}
+    assert selected(db, users, {'max_tenure_days': 90}) == {'fleet_lead'}
+    assert selected(db, users, {'min_tenure_days': 1000, 'max_tenure_days': 2000}) == {'ungraded'}
+
+
+def test_target_population_and_inclusion_must_both_match(db, people):
+    users, units = people
+
+    assert selected(db, users, {'organization_ids': [units['operations'].id]}, {'job_titles': ["analyst"]}) == \
+        {'analyst'}
+
+
+def test_exclusions_keep_users_with_null_columns(db, people):
+    users, _ = people
+
+    # ungraded has no grade level or job title: a NULL comparison is not a match
+    assert selected(db, users, None, None, {'grade_levels': {'min': 8}}) == {'finance_analyst', 'ungraded'}
+    assert selected(db, users, None, None, {'job_titles': ["analyst"]}) == {'fleet_lead', 'ungraded'}
+    # All exclusion rules must hold
+    assert selected(db, users, None, None, {'job_titles': ["analyst"], 'grade_levels': [7]}) == \
+        {'analyst', 'fleet_lead', 'ungraded'}
+
+
+def test_mandatory_participants_bypass_every_rule(db, people):
+    users, units = people
+    criteria = ({'organization_ids': [units['finance'].id]}, None, {'job_titles': ["analyst"]})
+
+    assert selected(db, users, *criteria) == set()
+    assert selected(db, users, *criteria, mandatory_participants=[str(users['on_leave'].id), users['analyst'].id]) == \
+        {'on_leave', 'analyst'}
+
+
+def test_explicit_user_ids(db, people):
+    users, _ = people
+
+    assert selected(db, users, {'user_ids': [str(users['analyst'].id)], 'specific_user': users['ungraded'].id}) == \
+        {'analyst', 'ungraded'}
+
+
+@pytest.mark.parametrize("criteria", [
+    {'departments': ["Logistics"]},
+    {'organization_ids': ["not-an-id"]},
+    {'grade_levels': {'min': "senior"}},
+    {'grade_levels': {'from': 7}},
+    {'grade_levels': [True]},
+    {'statuses': ["retired"]},
+    {'min_tenure_days': None, 'max_tenure_days': "long"},
+])
+def test_malformed_criteria(criteria):
+    with pytest.raises(ValueError):
+        participant_filter(criteria)
+
+
+def test_dry_run(db, people):
+    users, units = people
+    current_user = SimpleNamespace(user_id=users['analyst'].id, permissions=["review_create_cycle"])
+
+    preview = asyncio.run(preview_cycle_participants(
+        ParticipantCriteria(target_population={'organization_ids': [str(units['logistics'].id)]},
+                            mandatory_participants=[str(users['finance_analyst'].id)]),
+        current_user, db
+    ))
+    assert preview == {"participants_count": 4}
+    assert count_participants(db, participant_filter()) == 4
+
+    for criteria in (
+        ParticipantCriteria(inclusion_criteria={'grade_levels': {'min': "senior"}}),
+        ParticipantCriteria(exclusion_criteria={'unknown_rule': True}),
+        ParticipantCriteria(mandatory_participants=["not-an-id"]),
+    ):
+        with pytest.raises(HTTPException) as error:
+            asyncio.run(preview_cycle_participants(criteria, current_user, db))
+        assert error.value.status_code == 400
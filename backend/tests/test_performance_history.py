@@ -0,0 +1,189 @@
+"""Per-user cycle summaries: building them, reading a user's history and the dashboard on top"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from models import InitiativeStatus, OrganizationLevel, ReviewCycle, ReviewCycleStatus, UserCycleSummary
+from routers.reviews import get_performance_dashboard
+from utils.performance_history import PerformanceHistoryService, downsample
+from tests.factories import (
+    make_assignment, make_cycle, make_organization, make_review_score, make_scored_initiative,
+    make_trait, make_user
+)
+
+
+@pytest.fixture
+def people(db):
+    company = make_organization(db, "Company", OrganizationLevel.GLOBAL)
+    department = make_organization(db, "Logistics", OrganizationLevel.DEPARTMENT, company)
+    admin = make_user(db, company)
+    return admin, make_user(db, department), make_user(db, department), department
+
+
+def completed_cycle(db, admin, user, start_date, weighted_scores, task_scores, traits=None):
+    """A COMPLETED cycle in which user has weighted_scores (one per trait) and scored initiatives"""
+    end_date = start_date + timedelta(days=89)
+    cycle = make_cycle(db, admin, start_date=start_date, end_date=end_date, status=ReviewCycleStatus.COMPLETED,
+                       period=f"{start_date:%Y-%m}")
+    traits = traits or [make_trait(db, admin, cycle) for _ in weighted_scores]
+    make_assignment(db, cycle, user, user, status='completed')
+    for trait, score in zip(traits, weighted_scores):
+        make_review_score(db, cycle, user, trait, Decimal(score))
+    for score in task_scores:
+        make_scored_initiative(db, user, score, created_at=start_date.replace(tzinfo=timezone.utc) + timedelta(days=10))
+    return cycle
+
+
+def test_summarize_cycle(db, people):
+    admin, user, colleague, department = people
+    cycle = completed_cycle(db, admin, user, datetime(2026, 1, 1), ['4.50', '3.50'], [8, 6])
+    make_scored_initiative(db, user, None, created_at=datetime(2026, 2, 1, tzinfo=timezone.utc),
+                           status=InitiativeStatus.ONGOING)
+    make_assignment(db, cycle, colleague, user, review_type='peer', status='completed')
+    make_assignment(db, cycle, user, colleague, review_type='peer')
+    updated_at = db.query(ReviewCycle.updated_at).filter(ReviewCycle.id == cycle.id).scalar()
+
+    assert PerformanceHistoryService(db).summarize_cycle(cycle.id) == 2
+
+    summaries = {row.user_id: row for row in db.query(UserCycleSummary).filter(UserCycleSummary.cycle_id == cycle.id)}
+    summary = summaries[user.id]
+    assert summary.organization_id == department.id
+    assert summary.cycle_end_date.replace(tzinfo=None) == cycle.end_date
+    # task 70, review 80: 70*0.6 + 80*0.4
+    assert (summary.task_performance_score, summary.review_performance_score, summary.overall_performance_score) == \
+        (Decimal('70.00'), Decimal('80.00'), Decimal('74.00'))
+    assert summary.performance_band == 'meets_expectations'
+    assert summary.organization_rank == 1
+    assert summary.average_trait_score == Decimal('4.00')
+    assert sorted(summary.trait_scores.values()) == [3.5, 4.5]
+    assert (summary.task_count, summary.completed_task_count, summary.average_task_score) == (3, 2, Decimal('7.00'))
+    assert summary.reviews_completed == 2
+
+    # The colleague has no scores and no completed reviews as reviewee
+    empty = summaries[colleague.id]
+    assert empty.overall_performance_score is None and empty.trait_scores is None
+    assert (empty.task_count, empty.reviews_completed) == (0, 0)
+
+    db.expire_all()
+    cycle = db.get(ReviewCycle, cycle.id)
+    assert cycle.summarized_at is not None
+    assert cycle.updated_at == updated_at
+
+
+def test_resummarizing_drops_removed_participants(db, people):
+    admin, user, colleague, _ = people
+    cycle = completed_cycle(db, admin, user, datetime(2026, 1, 1), ['4.00'], [])
+    colleague_assignment = make_assignment(db, cycle, colleague, colleague)
+    service = PerformanceHistoryService(db)
+    service.summarize_cycle(cycle.id)
+
+    db.delete(colleague_assignment)
+    db.flush()
+    assert service.summarize_cycle(cycle.id) == 1
+
+    assert [row.user_id for row in db.query(UserCycleSummary).filter(UserCycleSummary.cycle_id == cycle.id)] == [user.id]
+
+
+def test_summarize_completed_cycles_only_picks_unsummarized(db, people):
+    admin, user, _, _ = people
+    first = completed_cycle(db, admin, user, datetime(2025, 1, 1), ['3.00'], [5])
+    service = PerformanceHistoryService(db)
+    service.summarize_cycle(first.id)
+    second = completed_cycle(db, admin, user, datetime(2025, 4, 1), ['4.00'], [7])
+    make_cycle(db, admin, status=ReviewCycleStatus.ACTIVE)
+
+    assert service.summarize_completed_cycles() == 1
+    assert service.summarize_completed_cycles() == 0
+    assert {row.cycle_id for row in db.query(UserCycleSummary)} == {first.id, second.id}
+
+
+@pytest.fixture
+def history(db, people):
+    """Six quarterly cycles over 2024-2025 with a rising overall score"""
+    admin, user, _, _ = people
+    traits = [make_trait(db, admin), make_trait(db, admin)]
+    service = PerformanceHistoryService(db)
+    cycles = []
+    for index, (start_date, weighted) in enumerate([
+        (datetime(2024, 1, 1), '3.00'), (datetime(2024, 4, 1), '3.25'), (datetime(2024, 7, 1), '3.50'),
+        (datetime(2025, 1, 1), '3.75'), (datetime(2025, 4, 1), '4.00'), (datetime(2025, 10, 1), '4.50'),
+    ]):
+        cycle = completed_cycle(db, admin, user, start_date, [weighted, '2.50'], [5 + index], traits)
+        service.summarize_cycle(cycle.id)
+        cycles.append(cycle)
+    return user, cycles, traits
+
+
+def test_user_history_is_ordered_and_filtered_by_end_date(db, history):
+    user, cycles, _ = history
+    service = PerformanceHistoryService(db)
+
+    points = service.user_history(user.id)
+    assert [point["cycle_id"] for point in points] == [str(cycle.id) for cycle in cycles]
+    assert [point["task_count"] for point in points] == [1] * 6
+    # task (5+i)*10*0.6 + review mean(weighted, 2.5)*20*0.4
+    assert points[0]["overall_performance_score"] == pytest.approx(30 + 22)
+
+    recent = service.user_history(user.id, start_date=datetime(2025, 1, 1), end_date=datetime(2025, 7, 1))
+    assert [point["cycle_id"] for point in recent] == [str(cycles[3].id), str(cycles[4].id)]
+    assert service.user_history(cycles[0].created_by) == []
+
+
+def test_downsample_history(db, history):
+    user, cycles, traits = history
+    points = PerformanceHistoryService(db).user_history(user.id)
+
+    assert downsample(points) == points
+
+    years = downsample(points, 'year')
+    assert [point["period"] for point in years] == ["2024", "2025"]
+    assert [point["cycles"] for point in years] == [3, 3]
+    assert years[0]["task_count"] == 3
+    assert years[0]["cycle_ids"] == [str(cycle.id) for cycle in cycles[:3]]
+    assert years[0]["overall_performance_score"] == pytest.approx(
+        round(sum(point["overall_performance_score"] for point in points[:3]) / 3, 2))
+    assert years[1]["trait_scores"][str(traits[1].id)] == 2.5
+
+    quarters = downsample(points, 'quarter')
+    assert [point["period"] for point in quarters] == ["2024-Q1", "2024-Q2", "2024-Q3", "2025-Q1", "2025-Q2", "2025-Q4"]
+
+    merged = downsample(points, max_points=4)
+    assert len(merged) == 4
+    assert sum(point["cycles"] for point in merged) == 6
+    assert merged[-1]["end_date"] == points[-1]["end_date"]
+
+
+def test_performance_dashboard_reads_summaries(db, count_statements, history):
+    user, cycles, traits = history
+    current_user = SimpleNamespace(user_id=user.id, permissions=[])
+
+    with count_statements() as statements:
+        dashboard = asyncio.run(get_performance_dashboard(str(user.id), "all_time", current_user, db))
+
+    assert not [statement for statement in statements if "FROM reviews" in statement or "FROM peer_reviews" in statement]
+    assert dashboard["user_profile"]["department"] == "Logistics"
+    assert len(dashboard["cycle_history"]) == 6
+    summary = dashboard["performance_summary"]
+    assert summary["cycles"] == 6
+    assert summary["overall_score"] == dashboard["cycle_history"][-1]["overall_performance_score"]
+    assert summary["trend"] == "improving"
+    assert summary["key_strengths"] == [traits[0].name]
+    assert summary["development_areas"] == [traits[1].name]
+    assert [entry["area"] for entry in dashboard["growth_recommendations"]] == [traits[1].name]
+    assert dashboard["development_progress"]["direction"] == "improving"
+    assert len(dashboard["task_trends"]["series"]) == 6
+
+
+def test_performance_dashboard_without_history(db, people):
+    _, user, _, _ = people
+    current_user = SimpleNamespace(user_id=user.id, permissions=[])
+
+    dashboard = asyncio.run(get_performance_dashboard(str(user.id), "current_year", current_user, db))
+
+    assert dashboard["cycle_history"] == []
+    assert dashboard["performance_summary"]["trend"] == "no_data"
+    assert dashboard["growth_recommendations"] == []
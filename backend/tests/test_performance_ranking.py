@@ -0,0 +1,136 @@
+"""Cycle performance ranking: scores, bands and organization / directorate / department ranks"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from models import OrganizationLevel, PerformanceScore
+from utils.performance_ranking import PerformanceRankingService
+from tests.factories import (
+    make_assignment, make_cycle, make_organization, make_review_score, make_scored_initiative,
+    make_trait, make_user
+)
+
+
+@pytest.fixture
+def ranked_cycle(db):
+    """
+    Company > Operations > (Logistics > Fleet, Procurement), Company > Finance > Payroll
+    with one participant per expected row below
+    """
+    company = make_organization(db, "Company", OrganizationLevel.GLOBAL)
+    operations = make_organization(db, "Operations", OrganizationLevel.DIRECTORATE, company)
+    logistics = make_organization(db, "Logistics", OrganizationLevel.DEPARTMENT, operations)
+    fleet = make_organization(db, "Fleet", OrganizationLevel.UNIT, logistics)
+    procurement = make_organization(db, "Procurement", OrganizationLevel.DEPARTMENT, operations)
+    finance = make_organization(db, "Finance", OrganizationLevel.DIRECTORATE, company)
+    payroll = make_organization(db, "Payroll", OrganizationLevel.DEPARTMENT, finance)
+
+    admin = make_user(db, company)
+    cycle = make_cycle(db, admin)
+    other_cycle = make_cycle(db, admin)
+    quality, delivery = make_trait(db, admin, cycle), make_trait(db, admin, cycle)
+
+    users = {name: make_user(db, organization) for name, organization in [
+        ('best', logistics), ('tied_unit', fleet), ('tied_department', logistics), ('review_only', procurement),
+        ('task_only', payroll), ('directorate_only', finance), ('unscored', company), ('left', logistics)
+    ]}
+    for name, user in users.items():
+        if name != 'left':
+            make_assignment(db, cycle, user, user)
+
+    # Task scores: mean initiative score x10
+    for name, scores in [('best', [9, 10]), ('tied_unit', [8]), ('tied_department', [8]),
+                         ('task_only', [5]), ('directorate_only', [4])]:
+        for score in scores:
+            make_scored_initiative(db, users[name], score)
+    # Outside the cycle window, or not scored yet
+    make_scored_initiative(db, users['task_only'], 10, created_at=datetime(2025, 6, 1, tzinfo=timezone.utc))
+    make_scored_initiative(db, users['task_only'], None)
+
+    # Review scores: mean weighted trait score x20
+    for name, scores in [('best', ['4.50', '4.70']), ('tied_unit', ['4.00', '4.00']),
+                         ('tied_department', ['4.00', '4.00']), ('review_only', ['3.00', '3.50']),
+                         ('directorate_only', ['2.00', '2.00'])]:
+        for trait, score in zip((quality, delivery), scores):
+            make_review_score(db, cycle, users[name], trait, Decimal(score))
+    make_review_score(db, other_cycle, users['review_only'], quality, Decimal('5.00'))
+
+    # A participant removed from the cycle since the last ranking loses their row
+    db.add(PerformanceScore(cycle_id=cycle.id, user_id=users['left'].id, organization_rank=1))
+    db.flush()
+
+    return cycle, users, {'operations': operations, 'finance': finance, 'logistics': logistics,
+                          'procurement': procurement, 'payroll': payroll}
+
+
+def scores_by_user(db, cycle):
+    return {row.user_id: row for row in db.query(PerformanceScore).filter(PerformanceScore.cycle_id == cycle.id)}
+
+
+def test_scores_bands_and_ranks(db, ranked_cycle):
+    cycle, users, units = ranked_cycle
+
+    assert PerformanceRankingService(db).rank_cycle(cycle.id) == 7
+
+    rows = scores_by_user(db, cycle)
+    assert users['left'].id not in rows
+    expected = {
+        # name: (task, review, overall, band, organization, directorate, department, directorate_id, department_id)
+        'best': ('95.00', '92.00', '93.80', 'outstanding', 1, 1, 1, 'operations', 'logistics'),
+        'tied_unit': ('80.00', '80.00', '80.00', 'exceeds_expectations', 2, 2, 2, 'operations', 'logistics'),
+        'tied_department': ('80.00', '80.00', '80.00', 'exceeds_expectations', 2, 2, 2, 'operations', 'logistics'),
+        'review_only': (None, '65.00', '65.00', 'meets_expectations', 4, 4, 1, 'operations', 'procurement'),
+        'task_only': ('50.00', None, '50.00', 'below_expectations', 5, 1, 1, 'finance', 'payroll'),
+        'directorate_only': ('40.00', '40.00', '40.00', 'needs_improvement', 6, 2, None, 'finance', None),
+        'unscored': (None, None, None, None, None, None, None, None, None),
+    }
+    assert set(rows) == {users[name].id for name in expected}
+    for name, (task, review, overall, band, organization_rank, directorate_rank, department_rank,
+               directorate, department) in expected.items():
+        row = rows[users[name].id]
+        assert row.task_performance_score == (Decimal(task) if task else None), name
+        assert row.review_performance_score == (Decimal(review) if review else None), name
+        assert row.overall_performance_score == (Decimal(overall) if overall else None), name
+        assert row.performance_band == band, name
+        assert (row.organization_rank, row.directorate_rank, row.department_rank) == \
+            (organization_rank, directorate_rank, department_rank), name
+        assert row.directorate_id == (units[directorate].id if directorate else None), name
+        assert row.department_id == (units[department].id if department else None), name
+
+
+def test_reranking_updates_rows_in_place(db, ranked_cycle):
+    cycle, users, _ = ranked_cycle
+    service = PerformanceRankingService(db)
+    service.rank_cycle(cycle.id)
+    ids = {user_id: row.id for user_id, row in scores_by_user(db, cycle).items()}
+
+    make_scored_initiative(db, users['review_only'], 10)
+    service.rank_cycle(cycle.id)
+    db.expire_all()
+
+    rows = scores_by_user(db, cycle)
+    assert {user_id: row.id for user_id, row in rows.items()} == ids
+    # 100*0.6 + 65*0.4
+    review_only = rows[users['review_only'].id]
+    assert review_only.overall_performance_score == Decimal('86.00')
+    assert review_only.organization_rank == 2
+    assert rows[users['tied_unit'].id].organization_rank == 3
+
+
+def test_top_performers_include_ties(db, ranked_cycle):
+    cycle, users, units = ranked_cycle
+    service = PerformanceRankingService(db)
+    service.rank_cycle(cycle.id)
+
+    top = service.top_performers(cycle.id, limit=2)
+    assert {row[0].user_id for row in top} == {users[name].id for name in ('best', 'tied_unit', 'tied_department')}
+
+    finance = service.top_performers(cycle.id, 'directorate', units['finance'].id, limit=1)
+    assert [row[0].user_id for row in finance] == [users['task_only'].id]
+
+
+def test_unknown_cycle(db):
+    with pytest.raises(ValueError):
+        PerformanceRankingService(db).rank_cycle("00000000-0000-0000-0000-000000000000")
@@ -0,0 +1,124 @@
+"""Invariants of the in-memory review assignment planner"""
+
+from typing import Dict, List
+import random
+import uuid
+
+import pytest
+
+from utils.review_assignments import (
+    DEFAULT_PEER_COUNT, PEER_LOAD_SLACK, PlannedAssignment, ReviewParticipant, plan_review_assignments
+)
+
+
+def synthetic_participants(rng: random.Random, count: int, organizations: int, supervised: float) -> List[ReviewParticipant]:
+    """Participants spread over organizations, each supervised by an earlier one with the given probability"""
+    org_ids = [uuid.uuid4() for _ in range(organizations)]
+    participants = []
+    for index in range(count):
+        supervisor_id = participants[rng.randrange(index)].id if index and rng.random() < supervised else None
+        participants.append(ReviewParticipant(uuid.uuid4(), rng.choice(org_ids), supervisor_id))
+    return participants
+
+
+def check_plan(participants: List[ReviewParticipant], planned: List[PlannedAssignment], max_peer_reviews: int):
+    """
+    Assert the invariants of a plan: peers share the reviewee's organization, are not the
+    reviewee, their supervisor or a direct report, appear once per reviewee, and no
+    reviewer exceeds max_peer_reviews
+    """
+    by_id = {participant.id: participant for participant in participants}
+    seen = set()
+    loads: Dict[uuid.UUID, int] = {}
+    for assignment in planned:
+        key = (assignment.reviewer_id, assignment.reviewee_id, assignment.review_type)
+        assert key not in seen, f"duplicate assignment {key}"
+        seen.add(key)
+        if assignment.review_type != 'peer':
+            continue
+
+        reviewer = by_id[assignment.reviewer_id]
+        reviewee = by_id[assignment.reviewee_id]
+        assert reviewer.id != reviewee.id, "self assigned as peer"
+        assert reviewer.organization_id == reviewee.organization_id, "peer from another organization"
+        assert reviewer.id != reviewee.supervisor_id, "supervisor assigned as peer"
+        assert reviewer.supervisor_id != reviewee.id, "direct report assigned as peer"
+        loads[reviewer.id] = loads.get(reviewer.id, 0) + 1
+
+    assert max(loads.values(), default=0) <= max_peer_reviews, "peer review cap exceeded"
+    return loads
+
+
+@pytest.mark.parametrize("trial", range(200))
+def test_random_plans_satisfy_invariants(trial):
+    rng = random.Random(trial)
+    participants = synthetic_participants(rng, rng.randint(1, 60), rng.randint(1, 4), supervised=0.8)
+    peer_count = rng.randint(0, 8)
+    cap = rng.randint(1, 10)
+
+    check_plan(participants, plan_review_assignments(participants, peer_count, seed=trial, max_peer_reviews=cap), cap)
+
+
+def test_every_participant_gets_self_and_supervisor_reviews():
+    participants = synthetic_participants(random.Random(1), 300, 3, supervised=0.9)
+    planned = plan_review_assignments(participants, seed=1)
+
+    self_reviews = {a.reviewee_id for a in planned if a.review_type == 'self'}
+    supervisor_reviews = {(a.reviewer_id, a.reviewee_id) for a in planned if a.review_type == 'supervisor'}
+    assert self_reviews == {participant.id for participant in participants}
+    assert supervisor_reviews == {
+        (participant.supervisor_id, participant.id) for participant in participants if participant.supervisor_id
+    }
+
+
+def test_default_cap_and_full_peer_sets_in_large_organizations():
+    participants = synthetic_participants(random.Random(2), 2000, 10, supervised=0.95)
+    planned = plan_review_assignments(participants, seed=2)
+
+    loads = check_plan(participants, planned, DEFAULT_PEER_COUNT + PEER_LOAD_SLACK)
+    peers = sum(loads.values())
+    # ~200 colleagues per organization leave enough capacity for almost everyone
+    assert peers >= 0.95 * DEFAULT_PEER_COUNT * len(participants)
+
+
+def test_same_seed_reproduces_the_plan():
+    participants = synthetic_participants(random.Random(3), 200, 2, supervised=0.8)
+
+    assert plan_review_assignments(participants, seed=7) == plan_review_assignments(participants, seed=7)
+
+
+@pytest.mark.parametrize("trial", range(300))
+def test_peer_load_is_balanced_without_exclusions(trial):
+    # Without supervisors only the reviewee is excluded, so every reviewee gets a full peer set
+    # and each member writes within one review of the mean
+    rng = random.Random(trial)
+    participants = synthetic_participants(rng, rng.randint(2, 80), 1, supervised=0.0)
+    peer_count = rng.randint(1, 6)
+    expected = min(peer_count, len(participants) - 1)
+
+    planned = plan_review_assignments(participants, peer_count, seed=trial)
+
+    received = {participant.id: 0 for participant in participants}
+    written = {participant.id: 0 for participant in participants}
+    for assignment in planned:
+        if assignment.review_type == 'peer':
+            received[assignment.reviewee_id] += 1
+            written[assignment.reviewer_id] += 1
+    assert set(received.values()) == {expected}
+    assert expected - 1 <= min(written.values()) and max(written.values()) <= expected + 1
+
+
+def test_explicit_cap_limits_peer_reviews_and_varies_the_shortfall_by_seed():
+    participants = synthetic_participants(random.Random(4), 50, 1, supervised=0.0)
+
+    short_by_seed = []
+    for seed in (1, 2):
+        planned = plan_review_assignments(participants, peer_count=5, seed=seed, max_peer_reviews=2)
+        loads = check_plan(participants, planned, 2)
+        # 50 members x 2 reviews of capacity for 5 requested each: exactly 100 peers are placed
+        assert sum(loads.values()) == 100
+
+        received = {assignment.reviewee_id for assignment in planned if assignment.review_type == 'peer'}
+        short_by_seed.append({participant.id for participant in participants} - received)
+
+    assert short_by_seed[0] and short_by_seed[0] != short_by_seed[1]
@@ -0,0 +1,125 @@
+"""RatingMatrix metrics against straightforward per-list computations"""
+
+from collections import Counter
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+import random
+import uuid
+
+import pytest
+
+from utils.review_bias import (
+    MIN_REVIEWER_RATINGS, REVIEWER_DEVIATION_THRESHOLD, RatingMatrix, is_rating, rating_distribution
+)
+
+
+def make_review(reviewer_id, responses, created_at=None, reviewee_id=None):
+    return SimpleNamespace(
+        reviewer_id=reviewer_id,
+        reviewee_id=reviewee_id or uuid.uuid4(),
+        created_at=created_at or datetime(2026, 1, 1),
+        responses=responses
+    )
+
+
+def random_reviews(seed: int, count: int):
+    rng = random.Random(seed)
+    reviewers = [uuid.uuid4() for _ in range(max(1, count // 5))]
+    started_at = datetime(2026, 1, 1)
+    reviews = []
+    for _ in range(count):
+        responses = {f"q{index}": rng.choice((1, 2, 3, 3, 4, 4, 4, 5, 5, 2.5)) for index in range(rng.randint(0, 8))}
+        responses["comment"] = "Consistently delivers"
+        if rng.random() < 0.1:
+            responses["out_of_range"] = 9
+        reviews.append(make_review(
+            rng.choice(reviewers), responses, started_at + timedelta(minutes=rng.randrange(100_000))
+        ))
+    return reviews
+
+
+def plain_ratings(reviews):
+    return [value for review in reviews for value in (review.responses or {}).values() if is_rating(value)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matrix_statistics_match_per_list_computation(seed):
+    reviews = random_reviews(seed, 200)
+    ratings = plain_ratings(reviews)
+
+    matrix = RatingMatrix(reviews)
+
+    mean = sum(ratings) / len(ratings)
+    assert len(matrix) == len(ratings)
+    assert matrix.mean == pytest.approx(mean)
+    assert matrix.variance == pytest.approx(sum((rating - mean) ** 2 for rating in ratings) / len(ratings))
+    assert matrix.histogram == Counter(ratings)
+    assert matrix.count_between(4, 5) == sum(1 for rating in ratings if 4 <= rating <= 5)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_recency_and_halo_match_per_list_computation(seed):
+    reviews = random_reviews(seed, 101)
+    matrix = RatingMatrix(reviews)
+
+    ordered = sorted(reviews, key=lambda review: review.created_at, reverse=True)
+    half = len(reviews) // 2
+    recent, older = plain_ratings(ordered[:half]), plain_ratings(ordered[half:])
+    assert matrix.recency_bias()["details"] == (
+        f"Recent avg: {sum(recent) / len(recent):.2f}, Older avg: {sum(older) / len(older):.2f}"
+    )
+
+    ranges = []
+    for review in reviews:
+        own = plain_ratings([review])
+        if len(own) >= 2:
+            ranges.append(max(own) - min(own))
+    assert matrix.halo_effect()["details"] == f"Average rating range: {sum(ranges) / len(ranges):.2f}"
+
+
+def test_empty_inputs_report_no_data():
+    empty = RatingMatrix([])
+    assert empty.mean is None and empty.variance is None
+    assert empty.overall_bias_score() == 0.0
+    assert empty.halo_effect()["details"] == "No review data"
+    assert rating_distribution(empty) == {}
+
+    unrated = RatingMatrix([make_review(uuid.uuid4(), {"comment": "text"})])
+    assert unrated.leniency_bias()["details"] == "No ratings found"
+    assert unrated.reviewer_leniency()["reviewers_analyzed"] == 0
+
+
+def test_leniency_and_central_tendency_thresholds():
+    lenient = RatingMatrix([make_review(uuid.uuid4(), {"a": 5, "b": 5, "c": 4, "d": 5})])
+    assert lenient.leniency_bias()["detected"] and lenient.leniency_bias()["severity"] == "high"
+
+    central = RatingMatrix([make_review(uuid.uuid4(), {"a": 3, "b": 3, "c": 3, "d": 3, "e": 4})])
+    assert central.central_tendency_bias()["detected"]
+    assert central.central_tendency_bias()["severity"] == "high"
+
+
+def test_reviewer_leniency_flags_outlying_reviewers():
+    generous, harsh, typical = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    reviews = (
+        [make_review(generous, {f"q{i}": 5 for i in range(MIN_REVIEWER_RATINGS)})]
+        + [make_review(harsh, {f"q{i}": 1 for i in range(MIN_REVIEWER_RATINGS)})]
+        + [make_review(typical, {f"q{i}": 3 for i in range(MIN_REVIEWER_RATINGS)})]
+        # Too few ratings to be judged, however extreme
+        + [make_review(uuid.uuid4(), {"q0": 5})]
+    )
+
+    report = RatingMatrix(reviews).reviewer_leniency()
+
+    assert report["reviewers_analyzed"] == 4
+    assert [entry["reviewer_id"] for entry in report["lenient_reviewers"]] == [str(generous)]
+    assert [entry["reviewer_id"] for entry in report["severe_reviewers"]] == [str(harsh)]
+    assert report["lenient_reviewers"][0]["deviation"] >= REVIEWER_DEVIATION_THRESHOLD
+
+
+def test_rating_distribution_merges_matrices():
+    first = RatingMatrix([make_review(uuid.uuid4(), {"a": 1, "b": 5})])
+    second = RatingMatrix([make_review(uuid.uuid4(), {"a": 5, "b": 3.0})])
+
+    assert rating_distribution(first, second) == {
+        "1_star": 1, "2_star": 0, "3_star": 1, "4_star": 0, "5_star": 2
+    }
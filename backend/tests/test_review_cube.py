@@ -0,0 +1,239 @@
+"""Review analytics cube: statistics from summed cells and slice validation"""
+
+from datetime import datetime
+import asyncio
+import random
+import statistics
+from types import SimpleNamespace
+import uuid
+
+import pytest
+
+from sqlalchemy import text
+
+from models import (
+    OrganizationLevel, ReviewAnalyticsCube, ReviewCycle, ReviewCycleStatus, ReviewCycleTrait, ReviewQuestion,
+    ReviewResponse
+)
+from routers.reviews import ReviewCycleUpdate, update_review_cycle
+from utils.performance_history import PerformanceHistoryService
+from utils.review_cube import RATINGS, ReviewCubeService, _dimension_values, cell_statistics
+from tests.factories import make_assignment, make_cycle, make_organization, make_trait, make_user
+
+
+def cell(ratings):
+    """Cube cell columns (count, sum, sum of squares, rating_1..rating_5) of a list of ratings"""
+    return (len(ratings), sum(ratings), sum(rating * rating for rating in ratings),
+            *[ratings.count(value) for value in RATINGS])
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_rolled_up_cells_give_pooled_statistics(seed):
+    rng = random.Random(seed)
+    groups = [[rng.randint(1, 5) for _ in range(rng.randint(1, 300))] for _ in range(rng.randint(1, 50))]
+    cells = [cell(ratings) for ratings in groups]
+    pooled = [rating for ratings in groups for rating in ratings]
+
+    result = cell_statistics(*[sum(values) for values in zip(*cells)])
+
+    assert result["count"] == len(pooled)
+    assert result["mean"] == round(statistics.fmean(pooled), 3)
+    assert result["stddev"] == pytest.approx(statistics.pstdev(pooled), abs=1e-3)
+    assert result["histogram"] == {str(value): pooled.count(value) for value in RATINGS}
+
+
+def test_empty_and_uniform_cells():
+    assert cell_statistics(None, None, None, None, None, None, None, None) == {
+        "count": 0, "mean": None, "stddev": None, "histogram": {str(value): 0 for value in RATINGS}
+    }
+    # Rounding must never produce a negative variance
+    assert cell_statistics(*cell([3] * 7))["stddev"] == 0.0
+
+
+@pytest.mark.parametrize("arguments, message", [
+    ({"group_by": ["cycle", "department"]}, "Unknown dimensions: department"),
+    ({"review_types": ["self", "manager"]}, "review_types must be among"),
+    ({"group_by": ["trait"], "organization_ids": [uuid.uuid4(), uuid.uuid4()]}, "Group by organization"),
+])
+def test_slice_rejects_invalid_requests_before_querying(arguments, message):
+    # No session: validation happens before any query is built
+    with pytest.raises(ValueError, match=message):
+        ReviewCubeService(None).slice(**arguments)
+
+
+def test_dimension_values_label_each_group():
+    cycle_id, organization_id, trait_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    row = (datetime(2026, 6, 30), cycle_id, "Mid-year", "H1-2026", 2026,
+           organization_id, "Finance", OrganizationLevel.DIRECTORATE, trait_id, "Integrity", "peer")
+
+    assert _dimension_values(["cycle", "year", "organization", "trait", "review_type"], row) == {
+        "cycle": {"id": str(cycle_id), "name": "Mid-year", "period": "H1-2026", "end_date": "2026-06-30T00:00:00"},
+        "year": 2026,
+        "organization": {"id": str(organization_id), "name": "Finance", "level": "DIRECTORATE"},
+        "trait": {"id": str(trait_id), "name": "Integrity"},
+        "review_type": "peer",
+    }
+
+
+@pytest.fixture
+def cube_data(db):
+    """
+    Company > Operations (directorate) > Logistics (department), Company > Finance (directorate)
+    Two completed cycles with random ratings. Returns the cycles, organizations, traits and one
+    fact per response: (cycle, reviewee organization, trait, review type, rating, counted)
+    """
+    rng = random.Random(11)
+    company = make_organization(db, "Company", OrganizationLevel.GLOBAL)
+    operations = make_organization(db, "Operations", OrganizationLevel.DIRECTORATE, company)
+    logistics = make_organization(db, "Logistics", OrganizationLevel.DEPARTMENT, operations)
+    finance = make_organization(db, "Finance", OrganizationLevel.DIRECTORATE, company)
+    organizations = {"company": company, "operations": operations, "logistics": logistics, "finance": finance}
+
+    admin = make_user(db, company)
+    reviewees = [make_user(db, organization) for organization in (logistics, logistics, operations, finance, company)]
+    cycles = [
+        make_cycle(db, admin, start_date=datetime(2025, 1, 1), end_date=datetime(2025, 6, 30),
+                   status=ReviewCycleStatus.COMPLETED),
+        make_cycle(db, admin, start_date=datetime(2026, 1, 1), end_date=datetime(2026, 6, 30),
+                   status=ReviewCycleStatus.COMPLETED),
+    ]
+    quality, delivery = make_trait(db, admin, name="Quality"), make_trait(db, admin, name="Delivery")
+    unselected = make_trait(db, admin, name="Unselected")
+    for cycle in cycles:
+        db.add(ReviewCycleTrait(cycle_id=cycle.id, trait_id=quality.id))
+        # Deselected from the first cycle: its ratings there are not counted
+        db.add(ReviewCycleTrait(cycle_id=cycle.id, trait_id=delivery.id, is_active=cycle is not cycles[0]))
+    self_only = ReviewQuestion(question_text="Self only", trait_id=quality.id, created_by=admin.id,
+                               applies_to_peer=False, applies_to_supervisor=False)
+    db.add(self_only)
+    db.flush()
+
+    questions = [(quality, quality.questions[0]), (quality, self_only), (delivery, delivery.questions[0]),
+                 (unselected, unselected.questions[0])]
+    facts = []
+    for cycle in cycles:
+        for index, reviewee in enumerate(reviewees):
+            reviewers = {'self': reviewee, 'peer': reviewees[index - 1], 'supervisor': admin}
+            for review_type, reviewer in reviewers.items():
+                completed = rng.random() < 0.8
+                assignment = make_assignment(db, cycle, reviewer, reviewee, review_type,
+                                             'completed' if completed else 'in_progress')
+                for trait, question in questions:
+                    rating = rng.randint(1, 5)
+                    db.add(ReviewResponse(assignment_id=assignment.id, question_id=question.id, rating=rating))
+                    counted = (completed and trait is not unselected
+                               and not (trait is delivery and cycle is cycles[0])
+                               and not (question is self_only and review_type != 'self'))
+                    facts.append((cycle, reviewee.organization_id, trait, review_type, rating, counted))
+    db.flush()
+    return cycles, organizations, (quality, delivery), [fact for fact in facts if fact[-1]]
+
+
+def subtree(organizations, name):
+    return {
+        "company": set(organization.id for organization in organizations.values()),
+        "operations": {organizations["operations"].id, organizations["logistics"].id},
+        "logistics": {organizations["logistics"].id},
+        "finance": {organizations["finance"].id},
+    }[name]
+
+
+def test_build_cycle_rolls_cells_up_the_organization_tree(db, cube_data):
+    cycles, organizations, traits, facts = cube_data
+    cycle = cycles[1]
+    service = ReviewCubeService(db)
+
+    written = service.build_cycle(cycle.id)
+    # Rebuilding replaces the cycle's cells
+    assert service.build_cycle(cycle.id) == written
+
+    rows = db.query(ReviewAnalyticsCube).filter(ReviewAnalyticsCube.cycle_id == cycle.id).all()
+    assert len(rows) == written
+    cells = {
+        (row.organization_id, row.trait_id, row.review_type):
+            (row.rating_count, row.rating_sum, row.rating_sum_squares, *[getattr(row, f"rating_{value}") for value in RATINGS])
+        for row in rows
+    }
+    expected = {}
+    for name, organization in organizations.items():
+        for trait in traits:
+            for review_type in ("self", "peer", "supervisor"):
+                ratings = [fact[4] for fact in facts if fact[0] is cycle and fact[1] in subtree(organizations, name)
+                           and fact[2] is trait and fact[3] == review_type]
+                if ratings:
+                    expected[(organization.id, trait.id, review_type)] = cell(ratings)
+    assert cells == expected
+
+    db.expire_all()
+    assert db.get(ReviewCycle, cycle.id).cube_built_at is not None
+    assert db.query(ReviewAnalyticsCube).filter(ReviewAnalyticsCube.cycle_id == cycles[0].id).count() == 0
+
+
+def test_build_completed_cycles_only_builds_unbuilt(db, cube_data):
+    cycles, _, _, _ = cube_data
+    service = ReviewCubeService(db)
+    service.build_cycle(cycles[0].id)
+
+    assert service.build_completed_cycles() == 1
+    assert service.build_completed_cycles() == 0
+    assert {row[0] for row in db.query(ReviewAnalyticsCube.cycle_id).distinct()} == {cycle.id for cycle in cycles}
+
+
+def test_slice(db, cube_data):
+    cycles, organizations, (quality, delivery), facts = cube_data
+    service = ReviewCubeService(db)
+    for cycle in cycles:
+        service.build_cycle(cycle.id)
+
+    def statistics(predicate):
+        return cell_statistics(*cell([fact[4] for fact in facts if predicate(fact)]))
+
+    def measures(result):
+        return {key: value for key, value in result.items() if key in ("count", "mean", "stddev", "histogram")}
+
+    # Whole company per cycle, in chronological order
+    by_cycle = service.slice(("cycle",))
+    assert [result["cycle"]["id"] for result in by_cycle] == [str(cycle.id) for cycle in cycles]
+    for result, cycle in zip(by_cycle, cycles):
+        assert measures(result) == statistics(lambda fact: fact[0] is cycle)
+
+    # Each directorate's subtree, peer reviews only
+    directorates = service.slice(("organization",), organization_level=OrganizationLevel.DIRECTORATE,
+                                 review_types=["peer"])
+    assert {result["organization"]["name"] for result in directorates} == {"Operations", "Finance"}
+    for result in directorates:
+        name = result["organization"]["name"].lower()
+        assert measures(result) == statistics(
+            lambda fact: fact[1] in subtree(organizations, name) and fact[3] == "peer")
+
+    # One organization per year and trait
+    operations = service.slice(("year", "trait"), organization_ids=[organizations["operations"].id])
+    assert sorted((result["year"], result["trait"]["name"]) for result in operations) == \
+        [(2025, "Quality"), (2026, "Delivery"), (2026, "Quality")]
+    for result in operations:
+        cycle = cycles[result["year"] - 2025]
+        trait = quality if result["trait"]["name"] == "Quality" else delivery
+        assert measures(result) == statistics(
+            lambda fact: fact[0] is cycle and fact[2] is trait and fact[1] in subtree(organizations, "operations"))
+
+    assert service.slice(("trait",), years=[2024]) == []
+
+
+def test_completing_a_cycle_builds_the_cube_even_if_summarization_fails(db, cube_data, monkeypatch):
+    cycles, _, _, _ = cube_data
+    cycle = cycles[1]
+    cycle.status = ReviewCycleStatus.ACTIVE
+    db.flush()
+    # A statement that fails in the database, as a broken summary query would
+    monkeypatch.setattr(PerformanceHistoryService, "summarize_cycle",
+                        lambda self, cycle_id: self.db.execute(text("SELECT 1 / 0")))
+    current_user = SimpleNamespace(user_id=cycle.created_by, permissions=[])
+
+    asyncio.run(update_review_cycle(str(cycle.id), ReviewCycleUpdate(status="COMPLETED"), current_user, db))
+
+    db.expire_all()
+    cycle = db.get(ReviewCycle, cycle.id)
+    assert cycle.status == ReviewCycleStatus.COMPLETED
+    assert cycle.summarized_at is None
+    assert cycle.cube_built_at is not None
+    assert db.query(ReviewAnalyticsCube).filter(ReviewAnalyticsCube.cycle_id == cycle.id).count() > 0
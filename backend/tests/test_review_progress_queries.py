@@ -0,0 +1,139 @@
+"""Cycle reviewee progress and dashboard: a constant number of statements whatever the number of reviewees"""
+
+from datetime import datetime
+import random
+import uuid
+
+import pytest
+
+from models import Organization, OrganizationLevel, ReviewAssignment, ReviewCycle, Role, User
+from routers.reviews import REVIEW_ASSIGNMENT_TYPES, _build_cycle_dashboard, _cycle_reviewee_progress
+from utils.review_progress import ReviewProgressService
+
+
+def make_user(db, organization, role):
+    suffix = uuid.uuid4().hex[:8]
+    user = User(
+        email=f"{suffix}@example.com", name=f"User {suffix}", first_name="User", last_name=suffix,
+        job_title="Analyst", organization=organization, role=role
+    )
+    db.add(user)
+    return user
+
+
+def seed_cycle(db, reviewee_count, seed):
+    """
+    A cycle whose reviewees each get a self review, up to three peer reviews and a supervisor
+    review, a random subset completed
+
+    Returns:
+        (cycle, {reviewee_id: {review_type: [total, completed]}})
+    """
+    rng = random.Random(seed)
+    organization = Organization(name=f"Department {seed}", level=OrganizationLevel.DEPARTMENT)
+    role = Role(name=f"role-{uuid.uuid4().hex[:8]}", permissions=[])
+    users = [make_user(db, organization, role) for _ in range(reviewee_count + 1)]
+    db.flush()
+
+    cycle = ReviewCycle(
+        name=f"Cycle {seed}", type="quarterly", period="Q4-2026",
+        start_date=datetime(2026, 10, 1), end_date=datetime(2026, 12, 31), created_by=users[0].id
+    )
+    db.add(cycle)
+    db.flush()
+
+    expected = {}
+    supervisor, reviewees = users[0], users[1:]
+    for reviewee in reviewees:
+        reviewers = {'self': [reviewee], 'supervisor': [supervisor]}
+        reviewers['peer'] = rng.sample([user for user in reviewees if user is not reviewee],
+                                       min(rng.randint(0, 3), len(reviewees) - 1))
+        counts = expected[reviewee.id] = {}
+        for review_type in REVIEW_ASSIGNMENT_TYPES:
+            counts[review_type] = [0, 0]
+            for reviewer in reviewers[review_type]:
+                completed = rng.random() < 0.5
+                db.add(ReviewAssignment(
+                    cycle_id=cycle.id, reviewer_id=reviewer.id, reviewee_id=reviewee.id,
+                    review_type=review_type, status='completed' if completed else 'pending'
+                ))
+                counts[review_type][0] += 1
+                counts[review_type][1] += completed
+    db.flush()
+    return cycle, expected
+
+
+@pytest.mark.parametrize("reviewee_count", [1, 5, 80])
+def test_single_statement(db, count_statements, reviewee_count):
+    cycle, _ = seed_cycle(db, reviewee_count, seed=reviewee_count)
+
+    with count_statements() as statements:
+        rows = _cycle_reviewee_progress(str(cycle.id), db)
+
+    assert len(statements) == 1
+    assert len(rows) == reviewee_count
+
+
+def test_counts_per_reviewee_and_type(db):
+    cycle, expected = seed_cycle(db, 25, seed=7)
+    # Assignments of another cycle are not counted
+    seed_cycle(db, 10, seed=8)
+
+    rows = {row.id: row for row in _cycle_reviewee_progress(str(cycle.id), db)}
+
+    assert set(rows) == set(expected)
+    for reviewee_id, counts in expected.items():
+        row = rows[reviewee_id]
+        assert row.department == "Department 7"
+        assert row.total_assignments == sum(total for total, _ in counts.values())
+        assert row.completed_assignments == sum(completed for _, completed in counts.values())
+        for review_type, (total, completed) in counts.items():
+            assert getattr(row, f"{review_type}_total") == total
+            assert getattr(row, f"{review_type}_completed") == completed
+
+
+@pytest.mark.parametrize("reviewee_count", [1, 5, 80])
+def test_dashboard_reads_counters_in_one_statement(db, count_statements, reviewee_count):
+    cycle, _ = seed_cycle(db, reviewee_count, seed=reviewee_count)
+    ReviewProgressService(db).rebuild(cycle.id)
+
+    with count_statements() as statements:
+        dashboard = _build_cycle_dashboard(cycle, db)
+
+    assert len(statements) == 1
+    assert dashboard["participation"]["total_participants"] == reviewee_count
+
+
+def test_dashboard_rebuilds_missing_counters_in_constant_statements(db, count_statements):
+    counts = []
+    for reviewee_count in (1, 5, 80):
+        cycle, _ = seed_cycle(db, reviewee_count, seed=100 + reviewee_count)
+        with count_statements() as statements:
+            _build_cycle_dashboard(cycle, db)
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1] == counts[2]
+
+
+def test_dashboard_counts(db):
+    cycle, expected = seed_cycle(db, 25, seed=7)
+    seed_cycle(db, 10, seed=8)
+
+    dashboard = _build_cycle_dashboard(cycle, db)
+
+    for review_type in REVIEW_ASSIGNMENT_TYPES:
+        stats = dashboard["assignment_statistics"][review_type]
+        assert stats["total"] == sum(counts[review_type][0] for counts in expected.values())
+        assert stats["completed"] == sum(counts[review_type][1] for counts in expected.values())
+
+    totals = [[sum(total for total, _ in counts.values()), sum(done for _, done in counts.values())]
+              for counts in expected.values()]
+    # A participant is complete when all their assignments are, started when any one is
+    assert dashboard["participation"]["total_participants"] == 25
+    assert dashboard["participation"]["completed_participants"] == sum(done == total for total, done in totals)
+    assert dashboard["department_breakdown"] == [{
+        "department": "Department 7",
+        "total_participants": 25,
+        "completed_participants": sum(done > 0 for _, done in totals),
+        "completion_rate": sum(done > 0 for _, done in totals) / 25 * 100
+    }]
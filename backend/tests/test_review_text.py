@@ -0,0 +1,48 @@
+"""Compiled keyword scanning against plain substring checks"""
+
+import random
+
+import pytest
+
+from utils.review_text import (
+    KEYWORD_GROUPS, TOPIC_KEYWORDS, keyword_hits, mention_count, mentions, response_texts, scan_batch, topics_in
+)
+
+KEYWORDS = sorted({keyword for keywords in {**KEYWORD_GROUPS, **TOPIC_KEYWORDS}.values() for keyword in keywords})
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_keyword_hits_match_substring_semantics(seed):
+    rng = random.Random(seed)
+    vocabulary = KEYWORDS + ["the", "and", "work", "with", "needs", "ment", "s", "ly", "er", "expectations", "below"]
+    for _ in range(500):
+        text = "".join(rng.choice(vocabulary) + rng.choice(("", " ", "  ", ". ")) for _ in range(rng.randint(0, 12)))
+        text = text.upper() if rng.random() < 0.2 else text
+
+        expected = {keyword for keyword in KEYWORDS if keyword in text.lower()}
+        assert keyword_hits(text) == expected, (text, keyword_hits(text) ^ expected)
+
+
+def test_overlapping_and_nested_keywords_are_all_found():
+    # "work with" overlaps "thorough"; "exceeded expectations" contains "exceeded"
+    assert {"work with", "thorough"} <= keyword_hits("She will work withthorough care")
+    assert {"exceeded expectations", "exceeded"} <= keyword_hits("EXCEEDED EXPECTATIONS again")
+    assert {"needs improvement", "improve"} <= keyword_hits("needs improvement")
+
+
+def test_group_helpers():
+    text = "Outstanding and strong work, but needs improvement in presentation"
+
+    assert mentions(text, "highlight") and mentions(text, "negative")
+    assert not mentions(text, "example")
+    assert mention_count(text, "positive") == 2
+    # Substring semantics: "teamwork" also mentions "team"
+    assert topics_in([text, "Great teamwork"]) == ["Leadership", "Communication", "Collaboration", "Innovation"]
+
+
+def test_scan_batch_and_response_texts():
+    responses = [{"q1": 4, "comment": "Strong leader"}, None, {"note": "Strong leader", "q2": 5}]
+
+    texts = response_texts(responses)
+    assert texts == ["Strong leader", "Strong leader"]
+    assert scan_batch(texts) == {"Strong leader": keyword_hits("strong leader")}
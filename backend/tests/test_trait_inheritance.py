@@ -0,0 +1,87 @@
+"""One-pass trait applicability against a per-organization ancestor walk"""
+
+import random
+import uuid
+
+import pytest
+
+from models import TraitScopeType
+from utils.trait_inheritance import TraitApplicability
+
+
+def synthetic_tree(rng: random.Random, level_sizes=(1, 6, 30, 200)):
+    """organization_id -> parent_id, each level attached to random organizations above it"""
+    parents = {}
+    organizations = []
+    for level, count in enumerate(level_sizes):
+        upper = organizations[:]
+        for _ in range(count):
+            organization_id = uuid.uuid4()
+            parents[organization_id] = rng.choice(upper) if level and upper else None
+            organizations.append(organization_id)
+    return parents
+
+
+def synthetic_traits(rng: random.Random, organizations, count: int = 80):
+    return [
+        (uuid.uuid4(), TraitScopeType.GLOBAL, None) if rng.random() < 0.1
+        else (uuid.uuid4(), None, rng.choice(organizations))
+        for _ in range(count)
+    ]
+
+
+def walked_traits(parents, traits, organization_id):
+    """Global traits plus those scoped to the organization or any ancestor"""
+    hierarchy = []
+    node = organization_id
+    while node is not None:
+        hierarchy.append(node)
+        node = parents[node]
+    return frozenset(
+        trait_id for trait_id, scope_type, trait_org in traits
+        if scope_type == TraitScopeType.GLOBAL or trait_org in hierarchy
+    )
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_one_pass_matches_ancestor_walk(seed):
+    rng = random.Random(seed)
+    parents = synthetic_tree(rng)
+    traits = synthetic_traits(rng, list(parents))
+
+    applicability = TraitApplicability(parents, traits)
+
+    assert applicability.by_organization == {
+        organization_id: walked_traits(parents, traits, organization_id) for organization_id in parents
+    }
+    assert applicability.traits_for(None) == applicability.global_trait_ids
+    assert applicability.traits_for(uuid.uuid4()) == applicability.global_trait_ids
+
+
+def test_hierarchy_descendants_and_display_order():
+    root, directorate, department, other = (uuid.uuid4() for _ in range(4))
+    parents = {root: None, directorate: root, department: directorate, other: root}
+    traits = [
+        (uuid.uuid4(), TraitScopeType.GLOBAL, None),
+        (uuid.uuid4(), None, directorate),
+        (uuid.uuid4(), None, other),
+    ]
+
+    applicability = TraitApplicability(parents, traits)
+
+    assert applicability.hierarchy(department) == [department, directorate, root]
+    assert applicability.descendants(directorate) == [directorate, department]
+    assert set(applicability.descendants(root)) == set(parents)
+    assert applicability.applies(traits[1][0], department)
+    assert not applicability.applies(traits[2][0], department)
+    assert [applicability.trait_order[trait_id] for trait_id, _, _ in traits] == [0, 1, 2]
+
+
+def test_parent_cycles_terminate():
+    first, second = uuid.uuid4(), uuid.uuid4()
+    trait_id = uuid.uuid4()
+
+    applicability = TraitApplicability({first: second, second: first}, [(trait_id, None, first)])
+
+    assert applicability.hierarchy(first) == [first, second]
+    assert trait_id in applicability.traits_for(first)
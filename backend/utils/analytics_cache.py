@@ -0,0 +1,146 @@
+"""
+Versioned result cache for review cycle analytics
+Endpoint results are cached per (endpoint, cycle, variant) together with a version built from
+the cycle row and a data watermark (row counts and newest created_at/updated_at of the tables
+the endpoint reads). A request recomputes only when the version moved.
+
+COMPLETED cycles are still versioned by the watermark, since scores can be recalculated after
+completion, but never expire. Active cycles also expire after ANALYTICS_CACHE_TTL seconds as a
+backstop for writes whose timestamps land behind the watermark (long transactions).
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from decouple import config
+from models import ReviewCycle, ReviewCycleStatus
+import json
+import threading
+import time
+
+ANALYTICS_CACHE_TTL_SECONDS = config("ANALYTICS_CACHE_TTL", default=300, cast=int)
+ANALYTICS_CACHE_MAX_BYTES = config("ANALYTICS_CACHE_MAX_BYTES", default=64 * 1024 * 1024, cast=int)
+
+
+class _Entry:
+    __slots__ = ("version", "value", "size", "created", "permanent", "hits")
+
+    def __init__(self, version: tuple, value: Any, size: int, permanent: bool):
+        self.version = version
+        self.value = value
+        self.size = size
+        self.created = time.monotonic()
+        self.permanent = permanent
+        self.hits = 0
+
+
+class CycleResultCache:
+    """In-process LRU of analytics results bounded by their serialized size"""
+
+    def __init__(self, max_bytes: int = ANALYTICS_CACHE_MAX_BYTES, ttl_seconds: int = ANALYTICS_CACHE_TTL_SECONDS):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, str, Hashable], _Entry]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self,
+        endpoint: str,
+        cycle: ReviewCycle,
+        watermark: Callable[[], tuple],
+        compute: Callable[[], Any],
+        variant: Hashable = None
+    ) -> Any:
+        """
+        Cached result of compute() for a cycle
+
+        Args:
+            watermark: returns the data version of the rows compute() reads
+            variant: extra key part for results that depend on request parameters
+
+        The returned value is shared between requests and must not be mutated.
+        """
+        key = (endpoint, str(cycle.id), variant)
+        permanent = cycle.status == ReviewCycleStatus.COMPLETED
+        version = (str(cycle.status), cycle.updated_at, watermark())
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version and (
+                entry.permanent or time.monotonic() - entry.created < self.ttl_seconds
+            ):
+                entry.hits += 1
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            self.misses += 1
+
+        value = compute()
+        size = len(json.dumps(value, default=str))
+
+        with self._lock:
+            self._discard(key)
+            if size <= self.max_bytes:
+                self._entries[key] = _Entry(version, value, size, permanent)
+                self._total_bytes += size
+                while self._total_bytes > self.max_bytes:
+                    self._discard(next(iter(self._entries)))
+        return value
+
+    def invalidate(self, cycle_id: Optional[str] = None):
+        """Drop cached results of one cycle, or of every cycle when cycle_id is None"""
+        with self._lock:
+            for key in [key for key in self._entries if cycle_id is None or key[1] == str(cycle_id)]:
+                self._discard(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit ratio and per-entry sizes"""
+        with self._lock:
+            requests = self.hits + self.misses
+            now = time.monotonic()
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / requests, 4) if requests else 0.0,
+                "entry_count": len(self._entries),
+                "total_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "entries": [
+                    {
+                        "endpoint": endpoint,
+                        "cycle_id": cycle_id,
+                        "variant": None if variant is None else str(variant),
+                        "bytes": entry.size,
+                        "hits": entry.hits,
+                        "age_seconds": round(now - entry.created, 1),
+                        "permanent": entry.permanent
+                    }
+                    for (endpoint, cycle_id, variant), entry in self._entries.items()
+                ]
+            }
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+
+
+def cycle_watermark(db: Session, cycle_id, *models) -> tuple:
+    """
+    Data version of a cycle's rows in the given tables from one query:
+    row count plus newest created_at / updated_at of each (models need a cycle_id column)
+    """
+    columns = []
+    for model in models:
+        columns.append(select(func.count()).select_from(model).where(model.cycle_id == cycle_id).scalar_subquery())
+        for timestamp in ('created_at', 'updated_at'):
+            if hasattr(model, timestamp):
+                columns.append(select(func.max(getattr(model, timestamp))).where(model.cycle_id == cycle_id).scalar_subquery())
+    return tuple(db.query(*columns).one())
+
+
+cycle_results = CycleResultCache()
@@ -0,0 +1,214 @@
+"""
+Background analytics jobs
+Heavy analytics run in a process pool instead of the request's event loop. Each run is an
+analytics_jobs row: clients get its id back immediately, poll progress, and read the persisted
+result. A job whose input (kind, subject, data version) matches a running or finished job is
+not started again; the existing job is returned instead.
+
+Handlers are module-level functions handler(db, subject_id, progress) -> JSON-able dict, so
+they can be sent to worker processes by reference.
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from decouple import config
+from database import SessionLocal, engine
+from models import AnalyticsJob
+import hashlib
+import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+ANALYTICS_JOB_WORKERS = config("ANALYTICS_JOB_WORKERS", default=2, cast=int)
+# Pending/running jobs older than this are treated as lost (e.g. the server restarted mid-run)
+ANALYTICS_JOB_TIMEOUT_SECONDS = config("ANALYTICS_JOB_TIMEOUT", default=1800, cast=int)
+
+ACTIVE_STATUSES = ('pending', 'running')
+
+ProgressCallback = Callable[[int, str], None]
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def job_input_key(kind: str, subject_id, version) -> str:
+    """Deduplication key for a job's input (the version may hold JSON documents; keys are sorted)"""
+    payload = json.dumps([kind, str(subject_id), version], default=str, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def submit_analytics_job(
+    db: Session,
+    kind: str,
+    subject_id,
+    version,
+    handler: Callable[[Session, str, ProgressCallback], dict],
+    requested_by=None
+) -> AnalyticsJob:
+    """
+    Start a job, or return the active or completed job with the same input
+
+    Args:
+        version: data version of the subject (e.g. a watermark); a new version starts a new job
+    """
+    input_key = job_input_key(kind, subject_id, version)
+
+    # Serialize submissions of the same input across workers until commit
+    lock_key = int.from_bytes(bytes.fromhex(input_key[:16]), "big", signed=True)
+    db.execute(func.pg_advisory_xact_lock(lock_key).select())
+
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=ANALYTICS_JOB_TIMEOUT_SECONDS)
+    db.query(AnalyticsJob).filter(
+        AnalyticsJob.input_key == input_key,
+        AnalyticsJob.status.in_(ACTIVE_STATUSES),
+        AnalyticsJob.created_at < stale_before
+    ).update({
+        AnalyticsJob.status: 'failed',
+        AnalyticsJob.error: 'Job timed out',
+        AnalyticsJob.finished_at: func.now()
+    }, synchronize_session=False)
+
+    existing = db.query(AnalyticsJob).filter(
+        AnalyticsJob.input_key == input_key,
+        AnalyticsJob.status.in_(ACTIVE_STATUSES + ('completed',))
+    ).order_by(AnalyticsJob.created_at.desc()).first()
+    if existing:
+        db.commit()
+        return existing
+
+    job = AnalyticsJob(
+        kind=kind,
+        subject_id=str(subject_id),
+        input_key=input_key,
+        status='pending',
+        message='Queued',
+        requested_by=requested_by
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+
+    future = _get_executor().submit(_execute_job, str(job.id), handler)
+    future.add_done_callback(lambda done, job_id=str(job.id): _on_job_done(job_id, done))
+    return job
+
+
+def serialize_job(job: AnalyticsJob, include_result: bool = True) -> dict:
+    """API representation of a job"""
+    data = {
+        "job_id": str(job.id),
+        "kind": job.kind,
+        "subject_id": job.subject_id,
+        "status": job.status,
+        "progress": job.progress,
+        "message": job.message,
+        "error": job.error,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at
+    }
+    if include_result:
+        data["result"] = job.result if job.status == 'completed' else None
+    return data
+
+
+def shutdown_job_runner():
+    """Stop the worker pool; queued jobs are cancelled, running ones finish in their worker"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=ANALYTICS_JOB_WORKERS, initializer=_init_worker)
+        return _executor
+
+
+def _init_worker():
+    # Never reuse connections inherited from the parent process across a fork
+    engine.dispose(close=False)
+
+
+def _update_job(job_id: str, **fields):
+    db = SessionLocal()
+    try:
+        db.query(AnalyticsJob).filter(AnalyticsJob.id == job_id).update(fields, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _execute_job(job_id: str, handler: Callable[[Session, str, ProgressCallback], dict]):
+    """Worker-process entry point"""
+    job_db = SessionLocal()
+    try:
+        job = job_db.query(AnalyticsJob).filter(AnalyticsJob.id == job_id).first()
+        if job is None or job.status != 'pending':
+            return
+        subject_id = job.subject_id
+        job.status = 'running'
+        job.started_at = func.now()
+        job.message = 'Started'
+        job_db.commit()
+    finally:
+        job_db.close()
+
+    def progress(percent: int, message: str):
+        _update_job(job_id, progress=max(0, min(100, int(percent))), message=message[:255])
+
+    db = SessionLocal()
+    try:
+        result = handler(db, subject_id, progress)
+        db.commit()
+        # Round-trip through JSON so datetimes etc. are stored the way the API returns them
+        _update_job(
+            job_id,
+            status='completed',
+            progress=100,
+            message='Completed',
+            result=json.loads(json.dumps(result, default=str)),
+            finished_at=func.now()
+        )
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"Analytics job {job_id} failed")
+        _update_job(job_id, status='failed', message='Failed', error=str(e)[:2000], finished_at=func.now())
+    finally:
+        db.close()
+
+
+def _on_job_done(job_id: str, future: Future):
+    """Mark jobs whose worker died (or was cancelled) before it could record the outcome"""
+    if future.cancelled():
+        error = 'Job cancelled'
+    elif future.exception() is not None:
+        error = str(future.exception())[:2000]
+    else:
+        return
+
+    try:
+        db = SessionLocal()
+        try:
+            db.query(AnalyticsJob).filter(
+                AnalyticsJob.id == job_id,
+                AnalyticsJob.status.in_(ACTIVE_STATUSES)
+            ).update({
+                AnalyticsJob.status: 'failed',
+                AnalyticsJob.error: error,
+                AnalyticsJob.finished_at: func.now()
+            }, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+    except Exception:
+        logger.exception(f"Could not record failure of analytics job {job_id}")
@@ -14,6 +14,7 @@ from database import get_db
 from models import User, UserStatus, RefreshToken
 from schemas.auth import UserSession
 from utils.permissions import UserPermissions
+from utils.profile_images import profile_image_url, profile_image_variant_urls
 
 SECRET_KEY = config("JWT_SECRET_KEY", default="your-secret-key-change-in-production")
 ALGORITHM = "HS256"
@@ -200,13 +201,6 @@ def get_current_user(
     name_parts.append(user.last_name)
     full_name = " ".join(name_parts)
 
-    # Compute profile_image_url from profile_image_path
-    profile_image_url = None
-    if user.profile_image_path:
-        # Convert Windows path to URL-friendly format
-        path = user.profile_image_path.replace('\\', '/')
-        profile_image_url = f"/api/{path}"
-
     return UserSession(
         user_id=user.id,
         email=user.email,
@@ -229,7 +223,8 @@ def get_current_user(
         is_leadership=user_perms["is_leadership"],
         status=user.status.value,
         profile_image_path=user.profile_image_path,
-        profile_image_url=profile_image_url
+        profile_image_url=profile_image_url(user.profile_image_path),
+        profile_image_variants=profile_image_variant_urls(user.profile_image_path)
     )
 
 def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
@@ -0,0 +1,208 @@
+"""
+Content-addressed upload storage
+Stores each distinct file content once, keyed by its sha256 digest, and reference counts it
+"""
+
+from typing import Optional
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import case, or_, and_
+from sqlalchemy.sql import func
+from datetime import datetime, timedelta, timezone
+import hashlib
+import os
+import uuid
+
+from models import UploadBlob, InitiativeDocument
+
+BLOB_ROOT = "uploads/blobs"
+
+
+class BlobStorageService:
+    """
+    Deduplicated file storage backed by the upload_blobs table
+
+    Storage Rules:
+    - Files live at uploads/blobs/<first 2 hex chars>/<sha256>, so identical uploads share one file
+    - Every row pointing at a blob (e.g. InitiativeDocument) holds one reference
+    - Blobs whose ref_count drops to zero are only removed by collect_garbage()
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def store(self, content: bytes, content_type: Optional[str] = None) -> UploadBlob:
+        """
+        Store file content and take a reference on the resulting blob
+        Re-uploading existing content only bumps the reference count
+        Caller is responsible for committing the session
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+
+        blob = self._get_locked(content_hash)
+        if blob is None:
+            file_path = self._blob_path(content_hash)
+            self._write_file(file_path, content)
+            try:
+                with self.db.begin_nested():
+                    blob = UploadBlob(
+                        content_hash=content_hash,
+                        file_path=file_path,
+                        size_bytes=len(content),
+                        content_type=content_type,
+                        ref_count=0
+                    )
+                    self.db.add(blob)
+            except IntegrityError:
+                # Another request stored the same content concurrently
+                blob = self._get_locked(content_hash)
+        elif not os.path.exists(blob.file_path):
+            # Self-heal blobs whose file went missing (e.g. interrupted GC)
+            self._write_file(blob.file_path, content)
+
+        self.acquire(blob.id)
+        self.db.refresh(blob)
+        return blob
+
+    def acquire(self, blob_id: uuid.UUID):
+        """Take one reference on a blob"""
+        self.db.query(UploadBlob).filter(UploadBlob.id == blob_id).update(
+            {
+                UploadBlob.ref_count: UploadBlob.ref_count + 1,
+                UploadBlob.released_at: None
+            },
+            synchronize_session=False
+        )
+
+    def release(self, blob_id: uuid.UUID):
+        """
+        Drop one reference on a blob
+        The file stays on disk until the garbage collector removes it
+        """
+        self.db.query(UploadBlob).filter(
+            UploadBlob.id == blob_id,
+            UploadBlob.ref_count > 0
+        ).update(
+            {
+                UploadBlob.ref_count: UploadBlob.ref_count - 1,
+                UploadBlob.released_at: case(
+                    (UploadBlob.ref_count == 1, func.now()),
+                    else_=UploadBlob.released_at
+                )
+            },
+            synchronize_session=False
+        )
+
+    def release_document(self, document: InitiativeDocument) -> int:
+        """
+        Release the storage held by a document row that is about to be deleted
+        Legacy documents (no blob) own their file exclusively, so it is removed immediately
+
+        Returns:
+            int: Bytes reclaimed immediately (always 0 for blob-backed documents)
+        """
+        if document.blob_id:
+            self.release(document.blob_id)
+            return 0
+
+        return self._remove_file(document.file_path)
+
+    def collect_garbage(self, batch_size: int = 500, stale_upload_hours: int = 24,
+                        grace_minutes: int = 60) -> dict:
+        """
+        Remove stale unattached documents and unreferenced blobs in batches
+
+        Args:
+            batch_size: Rows processed per transaction
+            stale_upload_hours: Age after which pre-uploaded documents that were never
+                attached to an initiative are deleted
+            grace_minutes: Minimum time a blob must stay unreferenced before its file is removed
+
+        Returns:
+            dict: Counts of removed documents and blobs plus total bytes reclaimed
+        """
+        now = datetime.now(timezone.utc)
+        stats = {"documents_removed": 0, "blobs_removed": 0, "bytes_reclaimed": 0}
+
+        # Step 1: Stale pre-uploads (initiative_id never set)
+        stale_cutoff = now - timedelta(hours=stale_upload_hours)
+        while True:
+            documents = self.db.query(InitiativeDocument).filter(
+                InitiativeDocument.initiative_id.is_(None),
+                InitiativeDocument.uploaded_at < stale_cutoff
+            ).limit(batch_size).with_for_update(skip_locked=True).all()
+
+            if not documents:
+                break
+
+            for document in documents:
+                stats["bytes_reclaimed"] += self.release_document(document)
+                self.db.delete(document)
+
+            self.db.commit()
+            stats["documents_removed"] += len(documents)
+
+            if len(documents) < batch_size:
+                break
+
+        # Step 2: Blobs nobody references any more
+        grace_cutoff = now - timedelta(minutes=grace_minutes)
+        while True:
+            blobs = self.db.query(UploadBlob).filter(
+                UploadBlob.ref_count == 0,
+                or_(
+                    UploadBlob.released_at < grace_cutoff,
+                    and_(UploadBlob.released_at.is_(None), UploadBlob.created_at < grace_cutoff)
+                )
+            ).limit(batch_size).with_for_update(skip_locked=True).all()
+
+            if not blobs:
+                break
+
+            # Files are removed while the rows are still locked so a concurrent
+            # store() of the same content waits and then rewrites the file
+            for blob in blobs:
+                stats["bytes_reclaimed"] += self._remove_file(blob.file_path)
+                self.db.delete(blob)
+
+            self.db.commit()
+            stats["blobs_removed"] += len(blobs)
+
+            if len(blobs) < batch_size:
+                break
+
+        return stats
+
+    def _get_locked(self, content_hash: str) -> Optional[UploadBlob]:
+        return self.db.query(UploadBlob).filter(
+            UploadBlob.content_hash == content_hash
+        ).with_for_update().first()
+
+    @staticmethod
+    def _blob_path(content_hash: str) -> str:
+        return os.path.join(BLOB_ROOT, content_hash[:2], content_hash)
+
+    @staticmethod
+    def _write_file(file_path: str, content: bytes):
+        """Write atomically so readers never observe a partially written blob"""
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        tmp_path = f"{file_path}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(tmp_path, "wb") as buffer:
+                buffer.write(content)
+            os.replace(tmp_path, file_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def _remove_file(file_path: Optional[str]) -> int:
+        if not file_path or not os.path.exists(file_path):
+            return 0
+        try:
+            size = os.path.getsize(file_path)
+            os.remove(file_path)
+            return size
+        except OSError as e:
+            print(f"Error deleting file {file_path}: {e}")
+            return 0
@@ -0,0 +1,312 @@
+"""
+Streaming export of review cycle results
+Rows are read through a server-side cursor (yield_per) with users, organizations, traits and
+questions joined in SQL, and encoded chunk by chunk, so memory use does not grow with the
+size of the cycle.
+
+Datasets:
+- scores: one row per participant and trait (calculated ReviewScore values)
+- responses: one row per answered question (raw ReviewResponse ratings and comments),
+  for calibration committees
+
+Formats: csv, ndjson and xlsx (written as a streamed zip with inline strings, so no
+spreadsheet library or temporary file is needed)
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, Iterator, Sequence, Tuple
+from sqlalchemy.orm import Session, aliased
+from decouple import config
+from database import SessionLocal
+from models import (
+    User, Organization, ReviewTrait, ReviewQuestion, ReviewScore,
+    ReviewAssignment, ReviewResponse
+)
+from xml.sax.saxutils import escape
+import csv
+import io
+import json
+import re
+import uuid
+import zipfile
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = config("CYCLE_EXPORT_BATCH_SIZE", default=1000, cast=int)
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+SCORE_COLUMNS = (
+    "user_id", "employee_name", "email", "department", "job_title",
+    "trait_id", "trait_name", "self_score", "peer_score", "supervisor_score",
+    "weighted_score", "calculated_at"
+)
+
+RESPONSE_COLUMNS = (
+    "assignment_id", "review_type", "assignment_status", "completed_at",
+    "reviewer_id", "reviewer_name", "reviewee_id", "reviewee_name", "reviewee_department",
+    "trait_id", "trait_name", "question_id", "question_text", "rating", "comment", "answered_at"
+)
+
+
+def score_rows(db: Session, cycle_id) -> Iterator[tuple]:
+    """ReviewScore rows of a cycle in SCORE_COLUMNS order, grouped by employee"""
+    query = db.query(
+        ReviewScore.user_id, User.first_name, User.middle_name, User.last_name, User.email,
+        Organization.name, User.job_title, ReviewScore.trait_id, ReviewTrait.name,
+        ReviewScore.self_score, ReviewScore.peer_score, ReviewScore.supervisor_score,
+        ReviewScore.weighted_score, ReviewScore.calculated_at
+    ).join(
+        User, User.id == ReviewScore.user_id
+    ).outerjoin(
+        Organization, Organization.id == User.organization_id
+    ).join(
+        ReviewTrait, ReviewTrait.id == ReviewScore.trait_id
+    ).filter(
+        ReviewScore.cycle_id == cycle_id
+    ).order_by(
+        User.last_name, User.first_name, ReviewScore.user_id, ReviewTrait.display_order, ReviewTrait.name
+    )
+
+    for (user_id, first_name, middle_name, last_name, email, department, job_title, trait_id, trait_name,
+         self_score, peer_score, supervisor_score, weighted_score, calculated_at) in query.yield_per(EXPORT_BATCH_SIZE):
+        yield (
+            user_id, _full_name(first_name, middle_name, last_name), email, department, job_title,
+            trait_id, trait_name, self_score, peer_score, supervisor_score, weighted_score, calculated_at
+        )
+
+
+def response_rows(db: Session, cycle_id) -> Iterator[tuple]:
+    """Per-question responses of a cycle in RESPONSE_COLUMNS order, grouped by assignment"""
+    Reviewer = aliased(User)
+    Reviewee = aliased(User)
+    query = db.query(
+        ReviewAssignment.id, ReviewAssignment.review_type, ReviewAssignment.status, ReviewAssignment.completed_at,
+        Reviewer.id, Reviewer.first_name, Reviewer.middle_name, Reviewer.last_name,
+        Reviewee.id, Reviewee.first_name, Reviewee.middle_name, Reviewee.last_name, Organization.name,
+        ReviewTrait.id, ReviewTrait.name, ReviewQuestion.id, ReviewQuestion.question_text,
+        ReviewResponse.rating, ReviewResponse.comment, ReviewResponse.updated_at, ReviewResponse.created_at
+    ).select_from(ReviewResponse).join(
+        ReviewAssignment, ReviewAssignment.id == ReviewResponse.assignment_id
+    ).join(
+        Reviewer, Reviewer.id == ReviewAssignment.reviewer_id
+    ).join(
+        Reviewee, Reviewee.id == ReviewAssignment.reviewee_id
+    ).outerjoin(
+        Organization, Organization.id == Reviewee.organization_id
+    ).join(
+        ReviewQuestion, ReviewQuestion.id == ReviewResponse.question_id
+    ).join(
+        ReviewTrait, ReviewTrait.id == ReviewQuestion.trait_id
+    ).filter(
+        ReviewAssignment.cycle_id == cycle_id
+    ).order_by(
+        Reviewee.last_name, Reviewee.first_name, ReviewAssignment.reviewee_id, ReviewAssignment.review_type,
+        ReviewAssignment.id, ReviewTrait.display_order, ReviewQuestion.created_at, ReviewQuestion.id
+    )
+
+    for (assignment_id, review_type, assignment_status, completed_at,
+         reviewer_id, reviewer_first, reviewer_middle, reviewer_last,
+         reviewee_id, reviewee_first, reviewee_middle, reviewee_last, department,
+         trait_id, trait_name, question_id, question_text,
+         rating, comment, updated_at, created_at) in query.yield_per(EXPORT_BATCH_SIZE):
+        yield (
+            assignment_id, review_type, assignment_status, completed_at,
+            reviewer_id, _full_name(reviewer_first, reviewer_middle, reviewer_last),
+            reviewee_id, _full_name(reviewee_first, reviewee_middle, reviewee_last), department,
+            trait_id, trait_name, question_id, question_text, rating, comment, updated_at or created_at
+        )
+
+
+EXPORT_DATASETS: Dict[str, Tuple[Sequence[str], Callable[[Session, object], Iterator[tuple]]]] = {
+    "scores": (SCORE_COLUMNS, score_rows),
+    "responses": (RESPONSE_COLUMNS, response_rows),
+}
+
+
+def stream_cycle_export(cycle_id, dataset: str, export_format: str) -> Iterator[bytes]:
+    """
+    Encoded export of a cycle, for a StreamingResponse
+
+    Uses its own session: the request session is closed once the endpoint returns.
+    """
+    columns, rows = EXPORT_DATASETS[dataset]
+    encode = _ENCODERS[export_format]
+    db = SessionLocal()
+    try:
+        yield from encode(columns, rows(db, cycle_id), dataset)
+    finally:
+        db.close()
+
+
+def _full_name(*parts) -> str:
+    return " ".join(part for part in parts if part)
+
+
+def _plain(value):
+    """JSON/CSV-friendly cell value"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+def _encode_ndjson(columns: Sequence[str], rows: Iterable[tuple], dataset: str) -> Iterator[bytes]:
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(dict(zip(columns, map(_plain, row)))))
+        if len(lines) >= EXPORT_BATCH_SIZE:
+            yield ("\n".join(lines) + "\n").encode()
+            lines.clear()
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def _csv_cell(value):
+    value = _plain(value)
+    # Keep spreadsheet apps from evaluating free-text cells (comments) as formulas
+    if isinstance(value, str) and value[:1] in ("=", "+", "-", "@"):
+        return "'" + value
+    return value
+
+
+def _encode_csv(columns: Sequence[str], rows: Iterable[tuple], dataset: str) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM so Excel opens the file as UTF-8
+    buffer.write("\ufeff")
+    writer.writerow(columns)
+    pending = 0
+    for row in rows:
+        writer.writerow([_csv_cell(value) for value in row])
+        pending += 1
+        if pending >= EXPORT_BATCH_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue().encode()
+
+
+# XLSX: a zip written to a non-seekable sink and drained after every batch of rows
+
+_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
+
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+
+_XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="{name}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable file that hands written bytes back on drain()"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _column_letter(index: int) -> str:
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _xlsx_row(number: int, letters: Sequence[str], values: Iterable) -> str:
+    cells = []
+    for letter, value in zip(letters, values):
+        value = _plain(value)
+        if value is None:
+            continue
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            cells.append(f'<c r="{letter}{number}"><v>{value}</v></c>')
+        else:
+            text = escape(_XML_INVALID.sub("", str(value)))
+            cells.append(f'<c r="{letter}{number}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+    return f'<row r="{number}">{"".join(cells)}</row>'
+
+
+def _encode_xlsx(columns: Sequence[str], rows: Iterable[tuple], dataset: str) -> Iterator[bytes]:
+    sink = _ChunkSink()
+    letters = [_column_letter(index) for index in range(len(columns))]
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_PARTS.items():
+            archive.writestr(name, content)
+        archive.writestr("xl/workbook.xml", _XLSX_WORKBOOK.format(name=escape(dataset.capitalize())))
+        yield sink.drain()
+
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+            )
+            sheet.write(_xlsx_row(1, letters, columns).encode())
+            for number, row in enumerate(rows, start=2):
+                sheet.write(_xlsx_row(number, letters, row).encode())
+                if number % EXPORT_BATCH_SIZE == 0:
+                    data = sink.drain()
+                    if data:
+                        yield data
+            sheet.write(b'</sheetData></worksheet>')
+    yield sink.drain()
+
+
+_ENCODERS = {
+    "csv": _encode_csv,
+    "ndjson": _encode_ndjson,
+    "xlsx": _encode_xlsx,
+}
@@ -0,0 +1,151 @@
+"""
+File delivery helpers for uploaded files
+Adds conditional (304), byte-range (206) and proxy offload support to downloads and the uploads mount
+"""
+
+from typing import Optional
+from fastapi import Request
+from fastapi.responses import FileResponse, Response
+from fastapi.staticfiles import StaticFiles
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import quote
+from decouple import config
+import hashlib
+import mimetypes
+import os
+
+UPLOADS_ROOT = "uploads"
+
+# direct: the app streams file bytes itself (FileResponse handles Range requests)
+# x-accel-redirect: nginx serves the file from an internal location mapped to uploads/
+# x-sendfile: Apache/lighttpd serve the file from its absolute path
+FILE_DELIVERY_MODE = config("FILE_DELIVERY_MODE", default="direct").strip().lower()
+X_ACCEL_REDIRECT_PREFIX = config("X_ACCEL_REDIRECT_PREFIX", default="/protected-uploads")
+
+# Content-addressed paths never change content, so browsers may cache them forever
+IMMUTABLE_UPLOAD_PREFIXES = ("blobs/", "profiles/variants/")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+DEFAULT_STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+
+def guess_media_type(file_name: Optional[str], fallback: Optional[str] = None) -> str:
+    """Resolve a response content type from the original file name, then the stored type"""
+    media_type = mimetypes.guess_type(file_name)[0] if file_name else None
+    return media_type or fallback or "application/octet-stream"
+
+
+def content_disposition(file_name: str, disposition: str = "attachment") -> str:
+    """Build a Content-Disposition header that survives non-ASCII file names"""
+    quoted = quote(file_name)
+    if quoted != file_name:
+        return f"{disposition}; filename*=utf-8''{quoted}"
+    return f'{disposition}; filename="{file_name}"'
+
+
+def is_not_modified(request: Request, etag: str, last_modified: str) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since against the current validators
+    If-None-Match takes precedence as required by RFC 9110
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return parsedate_to_datetime(if_modified_since) >= parsedate_to_datetime(last_modified)
+        except (TypeError, ValueError):
+            return False
+
+    return False
+
+
+def file_download_response(request: Request, file_path: str, file_name: str,
+                           media_type: Optional[str] = None, etag: Optional[str] = None,
+                           cache_control: str = "private, no-cache") -> Response:
+    """
+    Serve a stored file as a download
+
+    - Answers 304 when the client copy is still current
+    - Otherwise hands off to the front proxy (offload modes) or streams it with
+      FileResponse, which honours Range/If-Range and answers 206
+
+    Args:
+        etag: Strong validator for the content (e.g. the blob content hash); defaults to mtime/size
+    """
+    stat_result = os.stat(file_path)
+    media_type = media_type or guess_media_type(file_name)
+    etag = etag or _stat_etag(stat_result)
+    last_modified = formatdate(stat_result.st_mtime, usegmt=True)
+
+    headers = {
+        "ETag": etag,
+        "Last-Modified": last_modified,
+        "Cache-Control": cache_control,
+        "Accept-Ranges": "bytes"
+    }
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    if FILE_DELIVERY_MODE != "direct":
+        headers["Content-Disposition"] = content_disposition(file_name)
+        return _offload_response(file_path, media_type, headers)
+
+    return FileResponse(
+        path=file_path,
+        filename=file_name,
+        media_type=media_type,
+        headers=headers,
+        stat_result=stat_result
+    )
+
+
+def blob_etag(content_hash: str) -> str:
+    return f'"{content_hash}"'
+
+
+class UploadStaticFiles(StaticFiles):
+    """
+    StaticFiles for the /api/uploads mount
+    Adds Cache-Control headers and the same proxy offload modes as document downloads
+    (conditional and Range handling come from StaticFiles/FileResponse)
+    """
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+
+        relative_path = os.path.relpath(full_path, self.directory).replace(os.sep, "/")
+        if relative_path.startswith(IMMUTABLE_UPLOAD_PREFIXES):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            response.headers["Cache-Control"] = DEFAULT_STATIC_CACHE_CONTROL
+
+        if response.status_code == 200 and FILE_DELIVERY_MODE != "direct":
+            headers = {
+                key: value for key, value in response.headers.items()
+                if key not in ("content-length", "content-type")
+            }
+            return _offload_response(str(full_path), response.media_type, headers)
+
+        return response
+
+
+def _stat_etag(stat_result: os.stat_result) -> str:
+    etag_base = f"{stat_result.st_mtime}-{stat_result.st_size}"
+    return f'"{hashlib.md5(etag_base.encode(), usedforsecurity=False).hexdigest()}"'
+
+
+def _offload_response(file_path: str, media_type: Optional[str], headers: dict) -> Response:
+    """Empty response carrying the header that tells the front proxy which file to send"""
+    if FILE_DELIVERY_MODE == "x-accel-redirect":
+        relative_path = os.path.relpath(os.path.abspath(file_path), os.path.abspath(UPLOADS_ROOT))
+        headers["X-Accel-Redirect"] = f"{X_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{quote(relative_path.replace(os.sep, '/'))}"
+    elif FILE_DELIVERY_MODE == "x-sendfile":
+        headers["X-Sendfile"] = os.path.abspath(file_path)
+    else:
+        raise ValueError(f"Unknown FILE_DELIVERY_MODE: {FILE_DELIVERY_MODE}")
+
+    return Response(status_code=200, media_type=media_type, headers=headers)
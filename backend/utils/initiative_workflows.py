@@ -3,9 +3,9 @@ Initiative workflow implementation
 Based on CLAUDE.md specification for initiative management workflows
 """
 
-from typing import List, Optional
+from typing import List, Optional, Dict, Set
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, func, true, insert, update
 from datetime import datetime, timedelta
 import uuid
 
@@ -46,32 +46,9 @@ class InitiativeWorkflowService:
             self.validate_document_ownership(creator, document_ids)
 
         # Determine initial status based on business rules
-        # Check if creator is assigning to themselves
-        is_self_assigned = creator.id in assignee_ids and len(assignee_ids) == 1
-
         # Check if creator has supervisees (is a supervisor)
         has_supervisees = self.db.query(User).filter(User.supervisor_id == creator.id).count() > 0
-
-        # Check if creator has a leadership role
-        has_leadership_role = creator.role.is_leadership if creator.role else False
-
-        # Determine initial status
-        if has_leadership_role:
-            # Users with leadership roles do not need approval for their initiatives
-            initial_status = InitiativeStatus.ASSIGNED if not is_self_assigned else InitiativeStatus.PENDING
-            assigned_by = creator.id
-        elif is_self_assigned:
-            # Individual creating initiative for themselves - needs approval
-            initial_status = InitiativeStatus.PENDING_APPROVAL
-            assigned_by = None
-        elif has_supervisees and creator.id not in assignee_ids:
-            # Supervisor creating for others (not including self) - no approval needed
-            initial_status = InitiativeStatus.ASSIGNED
-            assigned_by = creator.id
-        else:
-            # Default to pending approval for safety
-            initial_status = InitiativeStatus.PENDING_APPROVAL
-            assigned_by = None
+        initial_status, assigned_by = self._determine_initial_status(creator, assignee_ids, has_supervisees)
 
         # Create initiative
         initiative = Initiative(
@@ -129,6 +106,124 @@ class InitiativeWorkflowService:
 
         return initiative
 
+    def create_initiatives_bulk(self, creator: User, initiatives_data: List[dict]) -> List[Initiative]:
+        """
+        Create many initiatives for one creator in a single transaction
+
+        Same business rules as create_initiative, but scope, document ownership and the
+        creator's supervisor/leadership status are resolved once for the whole batch.
+        Initiatives, assignments and sub-tasks are written with multi-row INSERTs and
+        notifications are queued as one batch after commit.
+        """
+        all_assignee_ids = {assignee_id for data in initiatives_data for assignee_id in data['assignee_ids']}
+        assignees_by_id = self.validate_initiative_assignment_bulk(creator, all_assignee_ids)
+
+        document_ids = [document_id for data in initiatives_data for document_id in (data.get('document_ids') or [])]
+        if len(document_ids) != len(set(document_ids)):
+            raise ValueError("A document can only be attached to one initiative")
+        if document_ids:
+            self.validate_document_ownership_bulk(creator, document_ids)
+
+        has_supervisees = self.db.query(User).filter(User.supervisor_id == creator.id).count() > 0
+
+        initiative_rows = []
+        assignment_rows = []
+        subtask_rows = []
+        document_rows = []
+
+        for data in initiatives_data:
+            initial_status, assigned_by = self._determine_initial_status(creator, data['assignee_ids'], has_supervisees)
+            initiative_id = uuid.uuid4()
+
+            initiative_rows.append({
+                "id": initiative_id,
+                "title": data['title'],
+                "description": data.get('description'),
+                "type": data['type'],
+                "urgency": data.get('urgency') or InitiativeUrgency.MEDIUM,
+                "due_date": data['due_date'],
+                "goal_id": data.get('goal_id'),
+                "created_by": creator.id,
+                "assigned_by": assigned_by if initial_status == InitiativeStatus.ASSIGNED else None,
+                "team_head_id": data.get('team_head_id'),
+                "status": initial_status
+            })
+
+            assignment_rows.extend(
+                {"id": uuid.uuid4(), "initiative_id": initiative_id, "user_id": assignee_id}
+                for assignee_id in data['assignee_ids']
+            )
+
+            subtask_rows.extend(
+                {
+                    "id": uuid.uuid4(),
+                    "initiative_id": initiative_id,
+                    "title": subtask['title'],
+                    "description": subtask.get('description'),
+                    "status": 'pending',
+                    "sequence_order": order,
+                    "created_by": creator.id
+                }
+                for order, subtask in enumerate(data.get('subtasks') or [])
+            )
+
+            document_rows.extend(
+                {"id": document_id, "initiative_id": initiative_id}
+                for document_id in (data.get('document_ids') or [])
+            )
+
+        self.db.execute(insert(Initiative), initiative_rows)
+        self.db.execute(insert(InitiativeAssignment), assignment_rows)
+        if subtask_rows:
+            self.db.execute(insert(InitiativeSubTask), subtask_rows)
+        if document_rows:
+            # ORM bulk UPDATE by primary key
+            self.db.execute(update(InitiativeDocument), document_rows)
+
+        initiative_ids = [row["id"] for row in initiative_rows]
+        initiatives = self.db.query(Initiative).filter(Initiative.id.in_(initiative_ids)).all()
+        position = {initiative_id: index for index, initiative_id in enumerate(initiative_ids)}
+        initiatives.sort(key=lambda initiative: position[initiative.id])
+
+        assignee_ids_by_initiative = {}
+        for row in assignment_rows:
+            assignee_ids_by_initiative.setdefault(row["initiative_id"], []).append(row["user_id"])
+
+        notifications, email_jobs = self.notification_service.queue_initiatives_created_batch(
+            initiatives, assignee_ids_by_initiative, assignees_by_id, creator
+        )
+
+        self.db.commit()
+
+        self.notification_service.dispatch_batch(notifications, email_jobs, creator.name)
+
+        return initiatives
+
+    def _determine_initial_status(self, creator: User, assignee_ids: List[uuid.UUID],
+                                  has_supervisees: bool) -> tuple:
+        """
+        Resolve (initial_status, assigned_by) for a new initiative
+        """
+        # Check if creator is assigning to themselves
+        is_self_assigned = creator.id in assignee_ids and len(assignee_ids) == 1
+
+        # Check if creator has a leadership role
+        has_leadership_role = creator.role.is_leadership if creator.role else False
+
+        if has_leadership_role:
+            # Users with leadership roles do not need approval for their initiatives
+            initial_status = InitiativeStatus.ASSIGNED if not is_self_assigned else InitiativeStatus.PENDING
+            return initial_status, creator.id
+        elif is_self_assigned:
+            # Individual creating initiative for themselves - needs approval
+            return InitiativeStatus.PENDING_APPROVAL, None
+        elif has_supervisees and creator.id not in assignee_ids:
+            # Supervisor creating for others (not including self) - no approval needed
+            return InitiativeStatus.ASSIGNED, creator.id
+        else:
+            # Default to pending approval for safety
+            return InitiativeStatus.PENDING_APPROVAL, None
+
     def validate_initiative_assignment(self, creator: User, assignee_ids: List[uuid.UUID]):
         """
         Validate that creator can assign initiatives to specified users
@@ -156,6 +251,55 @@ class InitiativeWorkflowService:
             if assignee.status != UserStatus.ACTIVE:
                 raise ValueError(f"Cannot assign initiative to inactive user: {assignee.name}")
 
+    def validate_initiative_assignment_bulk(self, creator: User, assignee_ids: Set[uuid.UUID]) -> Dict[uuid.UUID, User]:
+        """
+        Set-based variant of validate_initiative_assignment
+        Loads all assignees in one query and resolves the creator's scope once
+
+        Returns:
+            Dict mapping assignee id to User
+        """
+        assignees_by_id = {
+            assignee.id: assignee
+            for assignee in self.db.query(User).filter(User.id.in_(assignee_ids)).all()
+        }
+
+        missing_ids = set(assignee_ids) - set(assignees_by_id)
+        if missing_ids:
+            raise ValueError(f"User {next(iter(missing_ids))} not found")
+
+        accessible_orgs = None
+        if self.permission_service.user_has_permission(creator, "initiative_view_all"):
+            accessible_orgs = set(self.permission_service.get_accessible_organizations(creator))
+
+        for assignee in assignees_by_id.values():
+            if accessible_orgs is not None:
+                if assignee.organization_id not in accessible_orgs:
+                    raise ValueError(f"Cannot assign initiative to user outside your scope: {assignee.name}")
+            elif creator.organization_id != assignee.organization_id:
+                raise ValueError(f"Cannot assign initiative to user outside your department: {assignee.name}")
+
+            if assignee.status != UserStatus.ACTIVE:
+                raise ValueError(f"Cannot assign initiative to inactive user: {assignee.name}")
+
+        return assignees_by_id
+
+    def validate_document_ownership_bulk(self, creator: User, document_ids: List[uuid.UUID]):
+        """
+        Set-based variant of validate_document_ownership (one query for all documents)
+        """
+        documents = self.db.query(InitiativeDocument).filter(InitiativeDocument.id.in_(document_ids)).all()
+        found_ids = {document.id for document in documents}
+        for document_id in document_ids:
+            if document_id not in found_ids:
+                raise ValueError(f"Document {document_id} not found")
+
+        for document in documents:
+            if document.uploaded_by != creator.id:
+                raise ValueError(f"Cannot attach document not owned by you: {document.file_name}")
+            if document.initiative_id is not None:
+                raise ValueError(f"Document {document.file_name} is already attached to another initiative")
+
     def validate_document_ownership(self, creator: User, document_ids: List[uuid.UUID]):
         """
         Validate that creator owns all specified documents
@@ -512,30 +656,77 @@ class InitiativeWorkflowService:
 
         return False
 
-    def get_user_initiatives(self, user: User, status_filter: Optional[List[InitiativeStatus]] = None) -> List[Initiative]:
-        """Get initiatives visible to user with optional status filtering"""
-        base_query = self.db.query(Initiative)
-
-        if status_filter:
-            base_query = base_query.filter(Initiative.status.in_(status_filter))
-
-        user_initiative_conditions = or_(
+    def get_user_visibility_condition(self, user: User):
+        """
+        SQL predicate matching every initiative visible to user
+        Involvement (creator, assignee, group team head) plus, with initiative_view_all,
+        any initiative whose creator belongs to an accessible organization
+        """
+        involvement = or_(
             Initiative.created_by == user.id,
             Initiative.assignments.any(InitiativeAssignment.user_id == user.id),
             and_(Initiative.type == InitiativeType.GROUP, Initiative.team_head_id == user.id)
         )
 
-        initiatives = base_query.filter(user_initiative_conditions).all()
+        if not self.permission_service.user_has_permission(user, "initiative_view_all"):
+            return involvement
 
-        if self.permission_service.user_has_permission(user, "initiative_view_all"):
-            accessible_orgs = self.permission_service.get_accessible_organizations(user)
-            additional_initiatives = base_query.join(User, Initiative.created_by == User.id).filter(
-                User.organization_id.in_(accessible_orgs)
-            ).all()
+        # Global scope can access every organization, so every initiative is visible
+        if self.permission_service.get_user_effective_permissions(user)["effective_scope"] == "global":
+            return true()
 
-            initiative_ids = {initiative.id for initiative in initiatives}
-            for initiative in additional_initiatives:
-                if initiative.id not in initiative_ids:
-                    initiatives.append(initiative)
+        accessible_orgs = self.permission_service.get_accessible_organizations(user)
+        return or_(
+            involvement,
+            Initiative.creator.has(User.organization_id.in_(accessible_orgs))
+        )
 
-        return initiatives
+    def get_user_initiatives(self, user: User, status_filter: Optional[List[InitiativeStatus]] = None) -> List[Initiative]:
+        """Get initiatives visible to user with optional status filtering"""
+        query = self.db.query(Initiative).filter(self.get_user_visibility_condition(user))
+
+        if status_filter:
+            query = query.filter(Initiative.status.in_(status_filter))
+
+        return query.all()
+
+    def get_initiative_stats(self, user: User) -> dict:
+        """
+        Aggregate statistics over initiatives visible to user
+        Computed in a single query with one FILTERed count per status/type/urgency value
+        """
+        columns = [
+            func.count(Initiative.id).label("total"),
+            func.avg(Initiative.score).label("average_score"),
+            func.count(Initiative.id).filter(
+                Initiative.status.in_([InitiativeStatus.UNDER_REVIEW, InitiativeStatus.COMPLETED])
+            ).label("completed")
+        ]
+        columns += [
+            func.count(Initiative.id).filter(Initiative.status == initiative_status).label(f"status_{initiative_status.name}")
+            for initiative_status in InitiativeStatus
+        ]
+        columns += [
+            func.count(Initiative.id).filter(Initiative.type == initiative_type).label(f"type_{initiative_type.name}")
+            for initiative_type in InitiativeType
+        ]
+        columns += [
+            func.count(Initiative.id).filter(Initiative.urgency == urgency).label(f"urgency_{urgency.name}")
+            for urgency in InitiativeUrgency
+        ]
+
+        row = self.db.query(*columns).filter(self.get_user_visibility_condition(user)).one()._mapping
+
+        total = row["total"]
+        by_status = {s.value: row[f"status_{s.name}"] for s in InitiativeStatus}
+
+        return {
+            "total_initiatives": total,
+            "by_status": by_status,
+            "by_type": {t.value: row[f"type_{t.name}"] for t in InitiativeType},
+            "by_urgency": {u.value: row[f"urgency_{u.name}"] for u in InitiativeUrgency},
+            "overdue_initiatives": by_status[InitiativeStatus.OVERDUE.value],
+            "pending_approval": by_status[InitiativeStatus.PENDING_APPROVAL.value],
+            "average_score": float(row["average_score"]) if row["average_score"] is not None else None,
+            "completion_rate": (row["completed"] / total * 100) if total > 0 else 0
+        }
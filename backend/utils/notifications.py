@@ -3,10 +3,11 @@ Notification service for real-time notifications and emails
 Implementation for notification triggers with database persistence
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable
+from functools import partial
 from sqlalchemy.orm import Session
 from models import (
-    User, Initiative, Goal, InitiativeExtension,
+    User, Initiative, InitiativeStatus, Goal, InitiativeExtension,
     Notification, NotificationType, NotificationPriority
 )
 from utils.email_service import EmailService
@@ -260,6 +261,162 @@ class NotificationService:
         except Exception as e:
             print(f"Error in notify_initiative_assigned: {e}")
 
+    def queue_initiatives_created_batch(
+        self,
+        initiatives: List[Initiative],
+        assignee_ids_by_initiative: Dict[uuid.UUID, List[uuid.UUID]],
+        assignees_by_id: Dict[uuid.UUID, User],
+        creator: User
+    ) -> Tuple[List[Notification], List[Callable[[], Any]]]:
+        """
+        Batch counterpart of notify_initiative_created/notify_initiative_assigned for bulk creation
+
+        Adds one summary notification per recipient to the session (caller commits with the
+        initiatives) and returns the emails to send; pass both to dispatch_batch() after commit
+        """
+        now = datetime.utcnow()
+        notifications = []
+        email_jobs = []
+
+        # Assigned initiatives: one notification per assignee covering everything assigned to them
+        assigned_by_user: Dict[uuid.UUID, List[Initiative]] = {}
+        pending_approval = []
+        for initiative in initiatives:
+            if initiative.status == InitiativeStatus.ASSIGNED:
+                for assignee_id in assignee_ids_by_initiative.get(initiative.id, []):
+                    assigned_by_user.setdefault(assignee_id, []).append(initiative)
+            elif initiative.status == InitiativeStatus.PENDING_APPROVAL:
+                pending_approval.append(initiative)
+
+        for assignee_id, assigned in assigned_by_user.items():
+            if len(assigned) == 1:
+                title = "New Initiative Assigned"
+                message = f"{creator.name} has assigned you the initiative '{assigned[0].title}'"
+                action_url = f"/dashboard/initiatives/{assigned[0].id}"
+            else:
+                title = "New Initiatives Assigned"
+                message = f"{creator.name} has assigned you {len(assigned)} initiatives"
+                action_url = "/dashboard/initiatives"
+
+            notifications.append(Notification(
+                user_id=assignee_id,
+                type=NotificationType.INITIATIVE_ASSIGNED,
+                priority=NotificationPriority.MEDIUM,
+                title=title,
+                message=message,
+                action_url=action_url,
+                data={
+                    "initiative_ids": [str(initiative.id) for initiative in assigned],
+                    "creator_id": str(creator.id),
+                    "creator_name": creator.name
+                },
+                triggered_by=creator.id,
+                created_at=now
+            ))
+
+            assignee = assignees_by_id.get(assignee_id)
+            if assignee and assignee.email:
+                for initiative in assigned:
+                    email_jobs.append(partial(
+                        self.email_service.send_task_assignment_email,
+                        user_email=assignee.email,
+                        user_name=assignee.name or assignee.email,
+                        task_title=initiative.title,
+                        task_id=str(initiative.id),
+                        due_date=self._format_due_date(initiative),
+                        created_by_name=creator.name or creator.email
+                    ))
+
+        # Initiatives needing approval: one notification to the creator's supervisor
+        supervisor = creator.supervisor
+        if pending_approval and supervisor:
+            if len(pending_approval) == 1:
+                message = f"{creator.name} has created an initiative '{pending_approval[0].title}' that requires your approval"
+            else:
+                message = f"{creator.name} has created {len(pending_approval)} initiatives that require your approval"
+
+            notifications.append(Notification(
+                user_id=supervisor.id,
+                type=NotificationType.INITIATIVE_CREATED,
+                priority=NotificationPriority.HIGH,
+                title="Initiative Approval Required",
+                message=message,
+                action_url="/dashboard/initiatives",
+                data={
+                    "initiative_ids": [str(initiative.id) for initiative in pending_approval],
+                    "creator_id": str(creator.id),
+                    "creator_name": creator.name
+                },
+                triggered_by=creator.id,
+                created_at=now
+            ))
+
+            if supervisor.email:
+                for initiative in pending_approval:
+                    email_jobs.append(partial(
+                        self.email_service.send_initiative_approval_request_email,
+                        supervisor_email=supervisor.email,
+                        supervisor_name=supervisor.name or supervisor.email,
+                        creator_name=creator.name or creator.email,
+                        initiative_title=initiative.title,
+                        initiative_id=str(initiative.id),
+                        due_date=self._format_due_date(initiative)
+                    ))
+
+        self.db.add_all(notifications)
+        return notifications, email_jobs
+
+    def dispatch_batch(self, notifications: List[Notification], email_jobs: List[Callable[[], Any]],
+                       triggered_by_name: Optional[str] = None):
+        """
+        Push committed notifications over WebSocket and send queued emails
+        Runs in a single background thread so the request does not wait on SMTP/API calls
+        """
+        from utils.websocket_manager import manager
+        import asyncio
+        import threading
+
+        payloads = [
+            (notification.user_id, {
+                "type": "new_notification",
+                "notification": {
+                    "id": str(notification.id),
+                    "type": notification.type.value,
+                    "priority": notification.priority.value,
+                    "title": notification.title,
+                    "message": notification.message,
+                    "action_url": notification.action_url,
+                    "data": notification.data,
+                    "triggered_by_name": triggered_by_name,
+                    "created_at": notification.created_at.isoformat(),
+                    "is_read": False
+                }
+            })
+            for notification in notifications
+        ]
+
+        def send_all():
+            try:
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+                for user_id, payload in payloads:
+                    loop.run_until_complete(manager.send_personal_notification(user_id, payload))
+                loop.close()
+            except Exception as e:
+                print(f"Error in batch notification send: {e}")
+
+            for job in email_jobs:
+                try:
+                    job()
+                except Exception as e:
+                    print(f"✗ Failed to send batch notification email: {e}")
+
+        threading.Thread(target=send_all, daemon=True).start()
+
+    @staticmethod
+    def _format_due_date(initiative: Initiative) -> str:
+        return initiative.due_date.strftime("%B %d, %Y at %I:%M %p") if initiative.due_date else "Not specified"
+
     def notify_initiative_submitted(self, initiative: Initiative, submission, submitted_by: User):
         """Notify task creator when task is submitted"""
         try:
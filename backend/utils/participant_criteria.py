@@ -0,0 +1,169 @@
+"""
+Review cycle participant criteria
+Compiles a cycle's target_population, inclusion_criteria, exclusion_criteria and
+mandatory_participants into one SQL predicate on users, so participant selection is a
+single query instead of loading every user and filtering in Python.
+
+Rule format (target_population and inclusion_criteria must both match; exclusion_criteria
+removes users matching it; mandatory participants are always included):
+
+    {
+        "organization_ids": ["<uuid>", ...],   # these organizations and everything below them
+        "grade_levels": {"min": 7, "max": 12}, # or an explicit list, e.g. [7, 8, 9]
+        "job_titles": ["Analyst", ...],        # case-insensitive exact match
+        "statuses": ["ACTIVE", ...],           # UserStatus names; ACTIVE when no rule sets it
+        "min_tenure_days": 90,                 # account age at the cycle start date
+        "max_tenure_days": 3650,
+        "user_ids": ["<uuid>", ...]            # explicit users ("specific_user" is accepted too)
+    }
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+from sqlalchemy import and_, or_, not_, func, select, false
+from sqlalchemy.orm import Session
+from models import Organization, ReviewCycle, User, UserStatus
+import uuid
+
+RULE_KEYS = (
+    'organization_ids', 'grade_levels', 'job_titles', 'statuses',
+    'min_tenure_days', 'max_tenure_days', 'user_ids', 'specific_user'
+)
+
+
+def participant_filter(
+    target_population: Optional[Dict[str, Any]] = None,
+    inclusion_criteria: Optional[Dict[str, Any]] = None,
+    exclusion_criteria: Optional[Dict[str, Any]] = None,
+    mandatory_participants: Optional[Iterable] = None,
+    reference_date: Optional[datetime] = None
+):
+    """
+    SQL predicate on User selecting a cycle's participants
+
+    Args:
+        reference_date: date tenure is measured at (the cycle start date); defaults to now
+
+    Raises:
+        ValueError: when a rule is unknown or malformed
+    """
+    reference_date = reference_date or datetime.utcnow()
+    include_rules = [rules for rules in (target_population, inclusion_criteria) if rules]
+
+    conditions = [condition for rules in include_rules for condition in _compile_rules(rules, reference_date)]
+    if not any(rules.get('statuses') for rules in include_rules):
+        conditions.append(User.status == UserStatus.ACTIVE)
+    exclusions = _compile_rules(exclusion_criteria, reference_date) if exclusion_criteria else []
+    if exclusions:
+        # A NULL comparison (e.g. a user without a grade level) must not count as excluded
+        conditions.append(not_(func.coalesce(and_(*exclusions), false())))
+
+    predicate = and_(*conditions)
+    mandatory_ids = _uuids(mandatory_participants or [], 'mandatory_participants')
+    if mandatory_ids:
+        predicate = or_(predicate, User.id.in_(mandatory_ids))
+    return predicate
+
+
+def cycle_participant_filter(cycle: ReviewCycle):
+    """participant_filter() for the criteria stored on a cycle"""
+    return participant_filter(
+        cycle.target_population,
+        cycle.inclusion_criteria,
+        cycle.exclusion_criteria,
+        cycle.mandatory_participants,
+        reference_date=cycle.start_date
+    )
+
+
+def count_participants(db: Session, predicate) -> int:
+    """Number of users a participant predicate selects"""
+    return db.query(func.count(User.id)).filter(predicate).scalar() or 0
+
+
+def _compile_rules(rules: Dict[str, Any], reference_date: datetime) -> list:
+    """Conditions for the rules of one criteria dict (all must hold); empty rules add none"""
+    if not isinstance(rules, dict):
+        raise ValueError("Participant criteria must be an object")
+    unknown = sorted(set(rules) - set(RULE_KEYS))
+    if unknown:
+        raise ValueError(f"Unknown participant criteria: {', '.join(unknown)}")
+
+    conditions = []
+
+    if rules.get('organization_ids'):
+        conditions.append(User.organization_id.in_(
+            _organization_subtree(_uuids(rules['organization_ids'], 'organization_ids'))
+        ))
+
+    grade_levels = rules.get('grade_levels')
+    if isinstance(grade_levels, dict):
+        unknown = sorted(set(grade_levels) - {'min', 'max'})
+        if unknown:
+            raise ValueError("grade_levels accepts only 'min' and 'max'")
+        if grade_levels.get('min') is not None:
+            conditions.append(User.level >= _integer(grade_levels['min'], 'grade_levels.min'))
+        if grade_levels.get('max') is not None:
+            conditions.append(User.level <= _integer(grade_levels['max'], 'grade_levels.max'))
+    elif grade_levels:
+        conditions.append(User.level.in_([_integer(level, 'grade_levels') for level in _as_list(grade_levels)]))
+
+    if rules.get('job_titles'):
+        titles = [str(title).strip().lower() for title in _as_list(rules['job_titles'])]
+        conditions.append(func.lower(User.job_title).in_(titles))
+
+    if rules.get('statuses'):
+        conditions.append(User.status.in_(_statuses(rules['statuses'])))
+
+    # Users have no hire date; tenure is measured from account creation
+    if rules.get('min_tenure_days') is not None:
+        days = _integer(rules['min_tenure_days'], 'min_tenure_days')
+        conditions.append(User.created_at <= reference_date - timedelta(days=days))
+    if rules.get('max_tenure_days') is not None:
+        days = _integer(rules['max_tenure_days'], 'max_tenure_days')
+        conditions.append(User.created_at >= reference_date - timedelta(days=days))
+
+    user_ids = _as_list(rules.get('user_ids') or []) + _as_list(rules.get('specific_user') or [])
+    if user_ids:
+        conditions.append(User.id.in_(_uuids(user_ids, 'user_ids')))
+
+    return conditions
+
+
+def _organization_subtree(organization_ids: List[uuid.UUID]):
+    """Recursive CTE selecting the organizations and all of their descendants"""
+    subtree = select(Organization.id).where(Organization.id.in_(organization_ids)).cte(
+        'participant_organizations', recursive=True
+    )
+    # UNION (not UNION ALL) stops at repeated rows, so a parent cycle cannot recurse forever
+    subtree = subtree.union(
+        select(Organization.id).where(Organization.parent_id == subtree.c.id)
+    )
+    return select(subtree.c.id)
+
+
+def _as_list(value) -> list:
+    return list(value) if isinstance(value, (list, tuple, set)) else [value]
+
+
+def _uuids(values, field: str) -> List[uuid.UUID]:
+    try:
+        return [value if isinstance(value, uuid.UUID) else uuid.UUID(str(value)) for value in _as_list(values)]
+    except ValueError:
+        raise ValueError(f"{field} must contain valid ids")
+
+
+def _integer(value, field: str) -> int:
+    if isinstance(value, bool):
+        raise ValueError(f"{field} must be a whole number")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} must be a whole number")
+
+
+def _statuses(values) -> List[UserStatus]:
+    try:
+        return [UserStatus(str(value).upper()) for value in _as_list(values)]
+    except ValueError:
+        raise ValueError(f"statuses must be among: {', '.join(s.value for s in UserStatus)}")
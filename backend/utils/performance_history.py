@@ -0,0 +1,271 @@
+"""
+Per-user performance history across review cycles
+When a cycle completes, every participant gets one user_cycle_summaries row (overall, per-trait
+and task metrics) built with a single INSERT ... SELECT. Trend views read these rows, one per
+cycle, and can downsample long ranges to calendar buckets or a maximum number of points.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from models import (
+    Initiative, InitiativeAssignment, InitiativeStatus, PerformanceScore, ReviewAssignment,
+    ReviewCycle, ReviewCycleStatus, ReviewScore, User, UserCycleSummary
+)
+from utils.performance_ranking import PerformanceRankingService
+import uuid
+
+RESOLUTIONS = ('cycle', 'quarter', 'year')
+
+# Numeric fields averaged when several cycles fall into one bucket
+_AVERAGED_FIELDS = (
+    'overall_performance_score', 'task_performance_score', 'review_performance_score',
+    'average_trait_score', 'average_task_score'
+)
+_SUMMED_FIELDS = ('task_count', 'completed_task_count', 'reviews_completed')
+
+
+class PerformanceHistoryService:
+    """Writes and reads UserCycleSummary rows"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def summarize_cycle(self, cycle_id) -> int:
+        """
+        (Re)build the summaries of every participant of a cycle
+        Refreshes the cycle's performance_scores first so scores and ranks are frozen together.
+        Does not commit.
+
+        Returns:
+            int: Number of summaries written
+        """
+        cycle_id = cycle_id if isinstance(cycle_id, uuid.UUID) else uuid.UUID(str(cycle_id))
+        cycle = self.db.query(ReviewCycle.start_date, ReviewCycle.end_date).filter(ReviewCycle.id == cycle_id).first()
+        if cycle is None:
+            raise ValueError("Review cycle not found")
+
+        PerformanceRankingService(self.db).rank_cycle(cycle_id)
+
+        trait_scores = select(
+            ReviewScore.user_id.label('user_id'),
+            func.json_object_agg(ReviewScore.trait_id, ReviewScore.weighted_score).filter(
+                ReviewScore.weighted_score.isnot(None)
+            ).label('trait_scores'),
+            func.round(func.avg(ReviewScore.weighted_score), 2).label('average_trait_score')
+        ).where(ReviewScore.cycle_id == cycle_id).group_by(ReviewScore.user_id).cte('summary_trait_scores')
+
+        tasks = select(
+            InitiativeAssignment.user_id.label('user_id'),
+            func.count().label('task_count'),
+            func.count().filter(Initiative.status == InitiativeStatus.COMPLETED).label('completed_task_count'),
+            func.round(func.avg(Initiative.score), 2).label('average_task_score')
+        ).join(
+            Initiative, Initiative.id == InitiativeAssignment.initiative_id
+        ).where(
+            Initiative.created_at >= cycle.start_date,
+            Initiative.created_at <= cycle.end_date
+        ).group_by(InitiativeAssignment.user_id).cte('summary_tasks')
+
+        reviews = select(
+            ReviewAssignment.reviewee_id.label('user_id'),
+            func.count().label('reviews_completed')
+        ).where(
+            ReviewAssignment.cycle_id == cycle_id,
+            ReviewAssignment.status == 'completed'
+        ).group_by(ReviewAssignment.reviewee_id).cte('summary_reviews')
+
+        rows = select(
+            func.gen_random_uuid(),
+            PerformanceScore.cycle_id,
+            PerformanceScore.user_id,
+            User.organization_id,
+            literal(cycle.end_date, UserCycleSummary.cycle_end_date.type),
+            PerformanceScore.overall_performance_score,
+            PerformanceScore.task_performance_score,
+            PerformanceScore.review_performance_score,
+            PerformanceScore.performance_band,
+            PerformanceScore.organization_rank,
+            trait_scores.c.average_trait_score,
+            trait_scores.c.trait_scores,
+            func.coalesce(tasks.c.task_count, 0),
+            func.coalesce(tasks.c.completed_task_count, 0),
+            tasks.c.average_task_score,
+            func.coalesce(reviews.c.reviews_completed, 0)
+        ).select_from(PerformanceScore).join(
+            User, User.id == PerformanceScore.user_id
+        ).outerjoin(
+            trait_scores, trait_scores.c.user_id == PerformanceScore.user_id
+        ).outerjoin(
+            tasks, tasks.c.user_id == PerformanceScore.user_id
+        ).outerjoin(
+            reviews, reviews.c.user_id == PerformanceScore.user_id
+        ).where(PerformanceScore.cycle_id == cycle_id)
+
+        columns = [
+            'id', 'cycle_id', 'user_id', 'organization_id', 'cycle_end_date',
+            'overall_performance_score', 'task_performance_score', 'review_performance_score',
+            'performance_band', 'organization_rank', 'average_trait_score', 'trait_scores',
+            'task_count', 'completed_task_count', 'average_task_score', 'reviews_completed'
+        ]
+        statement = pg_insert(UserCycleSummary).from_select(columns, rows)
+        result = self.db.execute(statement.on_conflict_do_update(
+            constraint='unique_user_cycle_summary',
+            set_={
+                **{column: getattr(statement.excluded, column) for column in columns[3:]},
+                'updated_at': func.now()
+            }
+        ))
+
+        # Participants removed from the cycle since the last run
+        self.db.query(UserCycleSummary).filter(
+            UserCycleSummary.cycle_id == cycle_id,
+            UserCycleSummary.user_id.notin_(
+                select(PerformanceScore.user_id).where(PerformanceScore.cycle_id == cycle_id)
+            )
+        ).delete(synchronize_session=False)
+
+        # Recorded even when the cycle has no participants, so it is not picked up again.
+        # updated_at is kept: it versions the cycle's cached analytics
+        self.db.query(ReviewCycle).filter(ReviewCycle.id == cycle_id).update({
+            ReviewCycle.summarized_at: func.now(),
+            ReviewCycle.updated_at: ReviewCycle.updated_at
+        }, synchronize_session=False)
+
+        return result.rowcount
+
+    def summarize_completed_cycles(self) -> int:
+        """
+        Summarize COMPLETED cycles that were never summarized (newly completed ones and backfill)
+        Commits after each cycle.
+
+        Returns:
+            int: Number of cycles summarized
+        """
+        pending = [
+            row[0] for row in self.db.query(ReviewCycle.id).filter(
+                ReviewCycle.status == ReviewCycleStatus.COMPLETED,
+                ReviewCycle.summarized_at.is_(None)
+            ).order_by(ReviewCycle.end_date).all()
+        ]
+        for cycle_id in pending:
+            self.summarize_cycle(cycle_id)
+            self.db.commit()
+        return len(pending)
+
+    def user_history(self, user_id, start_date: Optional[datetime] = None,
+                     end_date: Optional[datetime] = None) -> List[dict]:
+        """A user's summaries in cycle end date order (one indexed range scan)"""
+        query = self.db.query(UserCycleSummary, ReviewCycle.name, ReviewCycle.period).join(
+            ReviewCycle, ReviewCycle.id == UserCycleSummary.cycle_id
+        ).filter(UserCycleSummary.user_id == user_id)
+        if start_date is not None:
+            query = query.filter(UserCycleSummary.cycle_end_date >= start_date)
+        if end_date is not None:
+            query = query.filter(UserCycleSummary.cycle_end_date <= end_date)
+
+        return [
+            summary_point(summary, cycle_name, cycle_period)
+            for summary, cycle_name, cycle_period in query.order_by(UserCycleSummary.cycle_end_date).all()
+        ]
+
+
+def _number(value) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+def summary_point(summary: UserCycleSummary, cycle_name: str, cycle_period: str) -> dict:
+    """JSON point for one cycle"""
+    return {
+        "cycle_id": str(summary.cycle_id),
+        "cycle_name": cycle_name,
+        "period": cycle_period,
+        "end_date": summary.cycle_end_date.isoformat(),
+        "cycles": 1,
+        "overall_performance_score": _number(summary.overall_performance_score),
+        "task_performance_score": _number(summary.task_performance_score),
+        "review_performance_score": _number(summary.review_performance_score),
+        "performance_band": summary.performance_band,
+        "organization_rank": summary.organization_rank,
+        "average_trait_score": _number(summary.average_trait_score),
+        "trait_scores": {trait_id: _number(score) for trait_id, score in (summary.trait_scores or {}).items()},
+        "task_count": summary.task_count,
+        "completed_task_count": summary.completed_task_count,
+        "average_task_score": _number(summary.average_task_score),
+        "reviews_completed": summary.reviews_completed
+    }
+
+
+def _bucket_key(point: dict, resolution: str) -> str:
+    end_date = datetime.fromisoformat(point["end_date"])
+    if resolution == 'year':
+        return str(end_date.year)
+    return f"{end_date.year}-Q{(end_date.month - 1) // 3 + 1}"
+
+
+def _merge(points: List[dict], label: str) -> dict:
+    """Average (scores) or sum (counts) several cycle points into one"""
+    merged = {
+        "period": label,
+        "end_date": points[-1]["end_date"],
+        "cycles": sum(point["cycles"] for point in points),
+        "cycle_ids": [cycle_id for point in points for cycle_id in point.get("cycle_ids", [point.get("cycle_id")])]
+    }
+    for field in _AVERAGED_FIELDS:
+        values = [point[field] for point in points if point[field] is not None]
+        merged[field] = round(sum(values) / len(values), 2) if values else None
+    for field in _SUMMED_FIELDS:
+        merged[field] = sum(point[field] for point in points)
+
+    trait_values: Dict[str, List[float]] = {}
+    for point in points:
+        for trait_id, score in point["trait_scores"].items():
+            if score is not None:
+                trait_values.setdefault(trait_id, []).append(score)
+    merged["trait_scores"] = {
+        trait_id: round(sum(values) / len(values), 2) for trait_id, values in trait_values.items()
+    }
+    return merged
+
+
+def downsample(points: List[dict], resolution: str = 'cycle', max_points: Optional[int] = None) -> List[dict]:
+    """
+    Reduce a cycle series for long ranges
+
+    Args:
+        resolution: 'cycle' keeps every cycle; 'quarter' / 'year' merge cycles ending in the
+            same calendar bucket
+        max_points: afterwards merge neighbouring points evenly until at most this many remain
+    """
+    if resolution != 'cycle':
+        buckets: Dict[str, List[dict]] = {}
+        for point in points:
+            buckets.setdefault(_bucket_key(point, resolution), []).append(point)
+        points = [_merge(bucket, label) for label, bucket in buckets.items()]
+
+    if max_points and len(points) > max_points:
+        size = len(points) / max_points
+        groups = [points[int(index * size):int((index + 1) * size)] for index in range(max_points)]
+        points = [
+            _merge(group, f"{group[0]['period']} - {group[-1]['period']}") if len(group) > 1 else group[0]
+            for group in groups if group
+        ]
+    return points
+
+
+def trend_direction(values: List[float], threshold: float) -> dict:
+    """
+    Least-squares slope per point of a series and its direction
+    Slopes within +/- threshold per point count as stable
+    """
+    if len(values) < 2:
+        return {"direction": "insufficient_data", "slope": None}
+    count = len(values)
+    mean_x = (count - 1) / 2
+    mean_y = sum(values) / count
+    denominator = sum((index - mean_x) ** 2 for index in range(count))
+    slope = sum((index - mean_x) * (value - mean_y) for index, value in enumerate(values)) / denominator
+    direction = "improving" if slope > threshold else ("declining" if slope < -threshold else "stable")
+    return {"direction": direction, "slope": round(slope, 3)}
@@ -0,0 +1,220 @@
+"""
+Performance ranking engine
+Computes every participant's overall performance score, band and organization / directorate /
+department ranks for a cycle with window functions in one INSERT ... SELECT, and upserts
+them into performance_scores
+
+Scores are on a 0-100 scale:
+- task: mean initiative score (1-10) of initiatives created during the cycle, x10
+- review: mean weighted trait score (1-5) from review_scores, x20
+- overall: task*0.6 + review*0.4, or whichever of the two exists
+"""
+
+from decimal import Decimal
+from sqlalchemy.orm import Session
+from sqlalchemy import Numeric, and_, case, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from models import (
+    Initiative, InitiativeAssignment, Organization, OrganizationLevel, PerformanceScore,
+    ReviewAssignment, ReviewCycle, ReviewScore, User
+)
+import uuid
+
+TASK_WEIGHT = Decimal('0.6')
+REVIEW_WEIGHT = Decimal('0.4')
+
+# Lower bound of each band on the 0-100 overall score, best first
+PERFORMANCE_BANDS = (
+    ('outstanding', 90),
+    ('exceeds_expectations', 75),
+    ('meets_expectations', 60),
+    ('below_expectations', 45),
+    ('needs_improvement', 0),
+)
+
+RANK_SCOPES = {
+    'organization': (None, PerformanceScore.organization_rank),
+    'directorate': (PerformanceScore.directorate_id, PerformanceScore.directorate_rank),
+    'department': (PerformanceScore.department_id, PerformanceScore.department_rank),
+}
+
+
+def organization_units():
+    """
+    Recursive CTE: (id, department_id, directorate_id) for every organization reachable from a root,
+    where department_id / directorate_id are the nearest DEPARTMENT / DIRECTORATE at or above it
+    """
+    roots = select(
+        Organization.id.label('id'),
+        case((Organization.level == OrganizationLevel.DEPARTMENT, Organization.id)).label('department_id'),
+        case((Organization.level == OrganizationLevel.DIRECTORATE, Organization.id)).label('directorate_id')
+    ).where(Organization.parent_id.is_(None)).cte('organization_units', recursive=True)
+
+    child = Organization.__table__.alias('child_organization')
+    return roots.union_all(
+        select(
+            child.c.id,
+            case((child.c.level == OrganizationLevel.DEPARTMENT, child.c.id), else_=roots.c.department_id),
+            case((child.c.level == OrganizationLevel.DIRECTORATE, child.c.id), else_=roots.c.directorate_id)
+        ).where(child.c.parent_id == roots.c.id)
+    )
+
+
+def _ranked(score, partition=None):
+    """RANK() of score (best first) within partition; NULL when the score or the partition is NULL"""
+    window = func.rank().over(
+        partition_by=partition,
+        order_by=score.desc().nulls_last()
+    )
+    missing = score.is_(None) if partition is None else (score.is_(None) | partition.is_(None))
+    return case((missing, None), else_=window)
+
+
+def performance_band(score):
+    """SQL CASE mapping a 0-100 overall score to its band (NULL for NULL)"""
+    return case(
+        *[(score >= lower_bound, literal(band)) for band, lower_bound in PERFORMANCE_BANDS[:-1]],
+        (score.isnot(None), literal(PERFORMANCE_BANDS[-1][0])),
+        else_=None
+    )
+
+
+class PerformanceRankingService:
+    """Populates PerformanceScore rows for a cycle"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def rank_cycle(self, cycle_id) -> int:
+        """
+        Recompute scores, bands and ranks for every participant of a cycle in one statement
+        Participants who left the cycle lose their row. Does not commit.
+
+        Returns:
+            int: Number of participants ranked
+        """
+        cycle_id = cycle_id if isinstance(cycle_id, uuid.UUID) else uuid.UUID(str(cycle_id))
+        cycle = self.db.query(ReviewCycle.start_date, ReviewCycle.end_date).filter(ReviewCycle.id == cycle_id).first()
+        if cycle is None:
+            raise ValueError("Review cycle not found")
+
+        participants = select(ReviewAssignment.reviewee_id.label('user_id')).where(
+            ReviewAssignment.cycle_id == cycle_id
+        ).distinct().cte('participants')
+
+        task_scores = select(
+            InitiativeAssignment.user_id.label('user_id'),
+            (func.avg(Initiative.score) * 10).label('score')
+        ).join(
+            Initiative, Initiative.id == InitiativeAssignment.initiative_id
+        ).where(
+            Initiative.score.isnot(None),
+            Initiative.created_at >= cycle.start_date,
+            Initiative.created_at <= cycle.end_date
+        ).group_by(InitiativeAssignment.user_id).cte('cycle_task_scores')
+
+        review_scores = select(
+            ReviewScore.user_id.label('user_id'),
+            (func.avg(ReviewScore.weighted_score) * 20).label('score')
+        ).where(
+            ReviewScore.cycle_id == cycle_id,
+            ReviewScore.weighted_score.isnot(None)
+        # Not named review_scores: inside WITH RECURSIVE that name would refer to the CTE itself
+        ).group_by(ReviewScore.user_id).cte('cycle_review_scores')
+
+        units = organization_units()
+
+        task = func.round(task_scores.c.score, 2)
+        review = func.round(review_scores.c.score, 2)
+        combined = select(
+            participants.c.user_id,
+            task.label('task_score'),
+            review.label('review_score'),
+            func.round(case(
+                (and_(task.isnot(None), review.isnot(None)), task * literal(TASK_WEIGHT, Numeric) + review * literal(REVIEW_WEIGHT, Numeric)),
+                else_=func.coalesce(task, review)
+            ), 2).label('overall_score'),
+            units.c.department_id,
+            units.c.directorate_id
+        ).select_from(participants).join(
+            User, User.id == participants.c.user_id
+        ).outerjoin(
+            units, units.c.id == User.organization_id
+        ).outerjoin(
+            task_scores, task_scores.c.user_id == participants.c.user_id
+        ).outerjoin(
+            review_scores, review_scores.c.user_id == participants.c.user_id
+        ).cte('combined_scores')
+
+        overall = combined.c.overall_score
+        ranked = select(
+            literal(cycle_id, PerformanceScore.cycle_id.type).label('cycle_id'),
+            combined.c.user_id,
+            combined.c.task_score,
+            combined.c.review_score,
+            overall,
+            performance_band(overall),
+            _ranked(overall),
+            _ranked(overall, combined.c.directorate_id),
+            _ranked(overall, combined.c.department_id),
+            combined.c.directorate_id,
+            combined.c.department_id,
+            func.gen_random_uuid()
+        )
+
+        statement = pg_insert(PerformanceScore).from_select([
+            'cycle_id', 'user_id', 'task_performance_score', 'review_performance_score',
+            'overall_performance_score', 'performance_band', 'organization_rank',
+            'directorate_rank', 'department_rank', 'directorate_id', 'department_id', 'id'
+        ], ranked)
+        excluded = statement.excluded
+        result = self.db.execute(statement.on_conflict_do_update(
+            constraint='unique_user_cycle_performance',
+            set_={
+                'task_performance_score': excluded.task_performance_score,
+                'review_performance_score': excluded.review_performance_score,
+                'overall_performance_score': excluded.overall_performance_score,
+                'performance_band': excluded.performance_band,
+                'organization_rank': excluded.organization_rank,
+                'directorate_rank': excluded.directorate_rank,
+                'department_rank': excluded.department_rank,
+                'directorate_id': excluded.directorate_id,
+                'department_id': excluded.department_id,
+                'calculated_at': func.now(),
+                'updated_at': func.now()
+            }
+        ))
+
+        self.db.query(PerformanceScore).filter(
+            PerformanceScore.cycle_id == cycle_id,
+            PerformanceScore.user_id.notin_(
+                select(ReviewAssignment.reviewee_id).where(ReviewAssignment.cycle_id == cycle_id)
+            )
+        ).delete(synchronize_session=False)
+
+        return result.rowcount
+
+    def top_performers(self, cycle_id, scope: str = 'organization', unit_id=None, limit: int = 10) -> list:
+        """
+        Best-ranked participants per unit (ties included), read from the rank indexes
+
+        Args:
+            scope: organization, directorate or department
+            unit_id: restrict to one directorate / department; all units when None
+        """
+        unit_column, rank_column = RANK_SCOPES[scope]
+        query = self.db.query(
+            PerformanceScore, User.first_name, User.last_name, User.job_title
+        ).join(
+            User, User.id == PerformanceScore.user_id
+        ).filter(
+            PerformanceScore.cycle_id == cycle_id,
+            rank_column <= limit
+        )
+        if unit_column is not None and unit_id is not None:
+            query = query.filter(unit_column == unit_id)
+
+        order = [rank_column, User.last_name, User.first_name]
+        if unit_column is not None:
+            order.insert(0, unit_column)
+        return query.order_by(*order).all()
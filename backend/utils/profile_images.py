@@ -0,0 +1,134 @@
+"""
+Profile image processing
+Decodes uploaded avatars once and stores fixed-size WebP variants with content-hashed file names
+"""
+
+from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image, ImageOps, UnidentifiedImageError
+from decouple import config
+import asyncio
+import hashlib
+import io
+import os
+import re
+import uuid
+
+PROFILE_VARIANT_DIR = "uploads/profiles/variants"
+PROFILE_VARIANT_SIZES = (256, 64, 32)  # Largest first: smaller variants are derived from it
+PRIMARY_VARIANT_SIZE = 256  # Stored in User.profile_image_path
+WEBP_QUALITY = 85
+
+# Pillow releases the GIL while decoding, resampling and encoding, so a small
+# thread pool keeps image work off the event loop without blocking other requests
+_image_executor = ThreadPoolExecutor(
+    max_workers=config("IMAGE_WORKERS", default=2, cast=int),
+    thread_name_prefix="profile-image"
+)
+
+_VARIANT_NAME = re.compile(r"^(?P<stem>.+)_(?P<size>\d+)\.webp$")
+
+
+async def create_profile_image_variants(user_id: uuid.UUID, content: bytes) -> str:
+    """
+    Decode an uploaded image in the worker pool and write all variants
+
+    Returns:
+        str: Path of the primary (256px) variant, suitable for User.profile_image_path
+
+    Raises:
+        ValueError: If the upload is not a decodable image
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_image_executor, _write_variants, user_id, content)
+
+
+def profile_image_url(profile_image_path: Optional[str]) -> Optional[str]:
+    """Convert a stored path (uploads/...) into its /api/uploads URL"""
+    if not profile_image_path:
+        return None
+
+    # Convert Windows path to URL-friendly format
+    path = profile_image_path.replace('\\', '/')
+    if path.startswith('uploads/'):
+        path = path[8:]
+    return f"/api/uploads/{path}"
+
+
+def profile_image_variant_paths(profile_image_path: Optional[str]) -> Dict[int, str]:
+    """
+    Derive every variant path from the stored primary variant path
+    Returns an empty dict for legacy (pre-variant) uploads
+    """
+    if not profile_image_path:
+        return {}
+
+    directory, file_name = os.path.split(profile_image_path)
+    match = _VARIANT_NAME.match(file_name)
+    if not match:
+        return {}
+
+    stem = match.group("stem")
+    return {size: os.path.join(directory, f"{stem}_{size}.webp") for size in PROFILE_VARIANT_SIZES}
+
+
+def profile_image_variant_urls(profile_image_path: Optional[str]) -> Optional[Dict[str, str]]:
+    """Map of variant size (as string, e.g. "64") to URL, or None for legacy uploads"""
+    variants = profile_image_variant_paths(profile_image_path)
+    if not variants:
+        return None
+    return {str(size): profile_image_url(path) for size, path in sorted(variants.items())}
+
+
+def delete_profile_image_files(profile_image_path: Optional[str]):
+    """Remove a stored profile image and all of its variants"""
+    if not profile_image_path:
+        return
+
+    paths = list(profile_image_variant_paths(profile_image_path).values()) or [profile_image_path]
+    for path in paths:
+        if os.path.exists(path):
+            try:
+                os.remove(path)
+            except OSError as e:
+                print(f"Error deleting file {path}: {e}")
+
+
+def _write_variants(user_id: uuid.UUID, content: bytes) -> str:
+    rendered = _render_variants(content)
+
+    # Content-hashed names change whenever the image does, so they can be cached forever
+    content_hash = hashlib.sha256(content).hexdigest()[:16]
+    stem = f"{user_id.hex}_{content_hash}"
+
+    os.makedirs(PROFILE_VARIANT_DIR, exist_ok=True)
+    for size, data in rendered.items():
+        path = os.path.join(PROFILE_VARIANT_DIR, f"{stem}_{size}.webp")
+        with open(path, "wb") as buffer:
+            buffer.write(data)
+
+    return os.path.join(PROFILE_VARIANT_DIR, f"{stem}_{PRIMARY_VARIANT_SIZE}.webp")
+
+
+def _render_variants(content: bytes) -> Dict[int, bytes]:
+    """Decode once, crop to a square and encode each size as WebP"""
+    try:
+        with Image.open(io.BytesIO(content)) as image:
+            # Let JPEG decode at a reduced scale when the source is much larger than needed
+            image.draft("RGB", (PRIMARY_VARIANT_SIZE * 2, PRIMARY_VARIANT_SIZE * 2))
+            image = ImageOps.exif_transpose(image)
+            mode = "RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB"
+            current = ImageOps.fit(image.convert(mode), (PROFILE_VARIANT_SIZES[0], PROFILE_VARIANT_SIZES[0]),
+                                   method=Image.Resampling.LANCZOS)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+        raise ValueError(f"Invalid image file: {e}")
+
+    rendered = {}
+    for size in PROFILE_VARIANT_SIZES:
+        if current.width != size:
+            current = current.resize((size, size), Image.Resampling.LANCZOS)
+        buffer = io.BytesIO()
+        current.save(buffer, format="WEBP", quality=WEBP_QUALITY, method=4)
+        rendered[size] = buffer.getvalue()
+
+    return rendered
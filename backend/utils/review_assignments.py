@@ -0,0 +1,131 @@
+"""
+Review assignment planning
+Computes self, supervisor and peer review pairs for a cycle in memory from one user snapshot
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional
+import heapq
+import random
+import uuid
+
+DEFAULT_PEER_COUNT = 5
+PEER_LOAD_SLACK = 2  # Default cap is peer_count + slack peer reviews per reviewer
+
+
+class ReviewParticipant(NamedTuple):
+    """Columns of an active user needed to plan assignments"""
+    id: uuid.UUID
+    organization_id: uuid.UUID
+    supervisor_id: Optional[uuid.UUID]
+
+
+class PlannedAssignment(NamedTuple):
+    reviewer_id: uuid.UUID
+    reviewee_id: uuid.UUID
+    review_type: str
+
+
+def assignment_seed(cycle) -> int:
+    """
+    Seed for the peer sampler
+    Defaults to the cycle id so re-activating a cycle reproduces the same peers;
+    components.assignment_seed overrides it
+    """
+    seed = (cycle.components or {}).get('assignment_seed')
+    if seed is not None:
+        return int(seed)
+    cycle_id = cycle.id if isinstance(cycle.id, uuid.UUID) else uuid.UUID(str(cycle.id))
+    return cycle_id.int
+
+
+def plan_review_assignments(
+    participants: Iterable[ReviewParticipant],
+    peer_count: int = DEFAULT_PEER_COUNT,
+    seed: Optional[int] = None,
+    max_peer_reviews: Optional[int] = None
+) -> List[PlannedAssignment]:
+    """
+    Plan every assignment for a cycle
+
+    - Self review for each participant
+    - Supervisor review when the supervisor is also a participant
+    - Up to peer_count peers from the same organization, excluding the reviewee,
+      their supervisor and their direct reports
+
+    Peers are allocated load-balanced: each reviewee gets the least-loaded eligible
+    colleagues, and nobody is given more than max_peer_reviews peer reviews to write
+    (default peer_count + PEER_LOAD_SLACK). A reviewee can get fewer than peer_count
+    peers when their organization does not have enough eligible capacity.
+
+    Runs in O(participants * (peer_count + exclusions) * log(org size))
+    """
+    participants = list(participants)
+    rng = random.Random(seed)
+    if max_peer_reviews is None:
+        max_peer_reviews = peer_count + PEER_LOAD_SLACK
+
+    participant_ids = {participant.id for participant in participants}
+    members_by_org: Dict[uuid.UUID, List[uuid.UUID]] = {}
+    reports_by_supervisor: Dict[uuid.UUID, List[uuid.UUID]] = {}
+    for participant in participants:
+        members_by_org.setdefault(participant.organization_id, []).append(participant.id)
+        if participant.supervisor_id:
+            reports_by_supervisor.setdefault(participant.supervisor_id, []).append(participant.id)
+
+    planned = []
+    for participant in participants:
+        planned.append(PlannedAssignment(participant.id, participant.id, 'self'))
+        if participant.supervisor_id in participant_ids:
+            planned.append(PlannedAssignment(participant.supervisor_id, participant.id, 'supervisor'))
+
+    if peer_count <= 0 or max_peer_reviews <= 0:
+        return planned
+
+    # Visit reviewees in random order so shortfalls (if any) do not always hit the same people
+    reviewees = participants[:]
+    rng.shuffle(reviewees)
+
+    allocators = {
+        org_id: _PeerAllocator(members, rng, max_peer_reviews)
+        for org_id, members in members_by_org.items()
+    }
+    for participant in reviewees:
+        excluded = {participant.id}
+        if participant.supervisor_id in participant_ids:
+            excluded.add(participant.supervisor_id)
+        excluded.update(reports_by_supervisor.get(participant.id, ()))
+
+        for peer_id in allocators[participant.organization_id].take(peer_count, excluded):
+            planned.append(PlannedAssignment(peer_id, participant.id, 'peer'))
+
+    return planned
+
+
+class _PeerAllocator:
+    """
+    Min-heap of an organization's members keyed by (peer reviews assigned, random tiebreak)
+    Members at the cap are dropped from the heap for good
+    """
+
+    def __init__(self, members: List[uuid.UUID], rng: random.Random, max_load: int):
+        self.max_load = max_load
+        self.heap = [(0, rng.random(), member) for member in members]
+        heapq.heapify(self.heap)
+
+    def take(self, count: int, excluded: set) -> List[uuid.UUID]:
+        chosen = []
+        skipped = []
+        while self.heap and len(chosen) < count:
+            entry = heapq.heappop(self.heap)
+            if entry[2] in excluded:
+                skipped.append(entry)
+            else:
+                chosen.append(entry)
+
+        for entry in skipped:
+            heapq.heappush(self.heap, entry)
+        for load, tiebreak, member in chosen:
+            if load + 1 < self.max_load:
+                heapq.heappush(self.heap, (load + 1, tiebreak, member))
+
+        return [member for _, _, member in chosen]
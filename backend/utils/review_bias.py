@@ -0,0 +1,252 @@
+"""
+Rating matrix for review bias analytics
+Parses the JSON responses of a cycle's Review / PeerReview rows once into flat columns
+(reviewer, reviewee, question, rating) and derives every bias metric and distribution
+from them, so the detectors no longer re-walk the response dicts on each call
+"""
+
+from collections import Counter
+from functools import cached_property
+from typing import Dict, Iterable, List, Optional
+
+# Reviewers need this many ratings before their leniency is reported
+MIN_REVIEWER_RATINGS = 5
+# Mean deviation from the cycle average that marks a reviewer as lenient or severe
+REVIEWER_DEVIATION_THRESHOLD = 0.75
+
+
+def is_rating(value) -> bool:
+    """Response values that count as ratings (numeric, 1-5)"""
+    return isinstance(value, (int, float)) and 1 <= value <= 5
+
+
+class RatingMatrix:
+    """
+    Ratings of a list of reviews in sparse (coordinate) form
+
+    Review i owns ratings[offsets[i]:offsets[i + 1]]; question_index holds the column of each
+    rating in questions. Per-review sums, counts and ranges are collected during the single
+    parse; derived metrics are computed on first use and memoized.
+    """
+
+    def __init__(self, reviews: Iterable):
+        self.review_count = 0
+        self.reviewer_ids: List = []
+        self.reviewee_ids: List = []
+        self.created_at: List = []
+        self.offsets: List[int] = [0]
+        self.ratings: List[float] = []
+        self.question_index: List[int] = []
+        self.questions: Dict[str, int] = {}
+        self.review_sums: List[float] = []
+        self.review_ranges: List[Optional[float]] = []
+
+        ratings = self.ratings
+        question_index = self.question_index
+        questions = self.questions
+        for review in reviews:
+            self.review_count += 1
+            self.reviewer_ids.append(getattr(review, 'reviewer_id', None))
+            self.reviewee_ids.append(review.reviewee_id)
+            self.created_at.append(review.created_at)
+
+            start = len(ratings)
+            for key, value in (review.responses or {}).items():
+                if isinstance(value, (int, float)) and 1 <= value <= 5:
+                    ratings.append(value)
+                    column = questions.get(key)
+                    if column is None:
+                        column = questions[key] = len(questions)
+                    question_index.append(column)
+
+            own = ratings[start:]
+            self.offsets.append(len(ratings))
+            self.review_sums.append(sum(own))
+            self.review_ranges.append(max(own) - min(own) if len(own) >= 2 else None)
+
+    def __len__(self) -> int:
+        return len(self.ratings)
+
+    def review_ratings(self, index: int) -> List[float]:
+        return self.ratings[self.offsets[index]:self.offsets[index + 1]]
+
+    @cached_property
+    def total(self) -> float:
+        return sum(self.ratings)
+
+    @cached_property
+    def mean(self) -> Optional[float]:
+        return self.total / len(self.ratings) if self.ratings else None
+
+    @cached_property
+    def variance(self) -> Optional[float]:
+        if not self.ratings:
+            return None
+        mean = self.mean
+        return sum((rating - mean) ** 2 for rating in self.ratings) / len(self.ratings)
+
+    @cached_property
+    def histogram(self) -> Counter:
+        """Count of each distinct rating value (1 and 1.0 share a bucket)"""
+        return Counter(self.ratings)
+
+    def count_between(self, low: float, high: float) -> int:
+        """Number of ratings r with low <= r <= high"""
+        return sum(count for value, count in self.histogram.items() if low <= value <= high)
+
+    @cached_property
+    def newest_first(self) -> List[int]:
+        """Review indexes ordered by created_at, newest first (stable for ties)"""
+        return sorted(range(self.review_count), key=self.created_at.__getitem__, reverse=True)
+
+    def average_of_reviews(self, indexes: Iterable[int]) -> Optional[float]:
+        """Mean of every rating in the given reviews"""
+        total = 0
+        count = 0
+        for index in indexes:
+            total += self.review_sums[index]
+            count += self.offsets[index + 1] - self.offsets[index]
+        return total / count if count else None
+
+    @cached_property
+    def reviewer_stats(self) -> Dict:
+        """reviewer_id -> (rating count, mean rating) over the reviewer's reviews"""
+        totals: Dict = {}
+        for index, reviewer_id in enumerate(self.reviewer_ids):
+            if reviewer_id is None:
+                continue
+            count = self.offsets[index + 1] - self.offsets[index]
+            if not count:
+                continue
+            total, seen = totals.get(reviewer_id, (0, 0))
+            totals[reviewer_id] = (total + self.review_sums[index], seen + count)
+        return {reviewer_id: (count, total / count) for reviewer_id, (total, count) in totals.items()}
+
+    # Bias metrics (same thresholds and messages as the original per-list detectors)
+
+    def overall_bias_score(self) -> float:
+        """0-1 score; higher variance indicates less bias"""
+        if not self.ratings:
+            return 0.0
+        return max(0.0, min(1.0, (5.0 - self.variance) / 5.0))
+
+    def recency_bias(self) -> dict:
+        """Compare the newer half of the reviews with the older half"""
+        if self.review_count < 2:
+            return {"detected": False, "severity": "low", "details": "Insufficient data"}
+
+        half = self.review_count // 2
+        recent_avg = self.average_of_reviews(self.newest_first[:half])
+        older_avg = self.average_of_reviews(self.newest_first[half:])
+
+        if recent_avg is None or older_avg is None:
+            return {"detected": False, "severity": "low", "details": "No rating data"}
+
+        difference = abs(recent_avg - older_avg)
+        severity = "high" if difference > 1.0 else ("medium" if difference > 0.5 else "low")
+
+        return {
+            "detected": difference > 0.5,
+            "severity": severity,
+            "details": f"Recent avg: {recent_avg:.2f}, Older avg: {older_avg:.2f}"
+        }
+
+    def halo_effect(self) -> dict:
+        """Small rating ranges within reviews suggest one impression drives every rating"""
+        if not self.review_count:
+            return {"detected": False, "severity": "low", "details": "No review data"}
+
+        ranges = [rating_range for rating_range in self.review_ranges if rating_range is not None]
+        if not ranges:
+            return {"detected": False, "severity": "low", "details": "No rating patterns found"}
+
+        avg_range = sum(ranges) / len(ranges)
+        severity = "high" if avg_range < 0.5 else ("medium" if avg_range < 1.0 else "low")
+
+        return {
+            "detected": avg_range < 1.0,
+            "severity": severity,
+            "details": f"Average rating range: {avg_range:.2f}"
+        }
+
+    def leniency_bias(self) -> dict:
+        """High average with most ratings at 4 or above"""
+        if not self.review_count:
+            return {"detected": False, "severity": "low", "details": "No review data"}
+        if not self.ratings:
+            return {"detected": False, "severity": "low", "details": "No ratings found"}
+
+        avg_rating = self.mean
+        high_ratings_percent = self.count_between(4, 5) / len(self.ratings)
+
+        severity = "high" if avg_rating > 4.2 and high_ratings_percent > 0.8 else \
+                  ("medium" if avg_rating > 3.8 and high_ratings_percent > 0.6 else "low")
+
+        return {
+            "detected": avg_rating > 3.8 and high_ratings_percent > 0.6,
+            "severity": severity,
+            "details": f"Avg rating: {avg_rating:.2f}, High ratings: {high_ratings_percent:.1%}"
+        }
+
+    def central_tendency_bias(self) -> dict:
+        """Most ratings in the middle and few at the extremes"""
+        if not self.review_count:
+            return {"detected": False, "severity": "low", "details": "No review data"}
+        if not self.ratings:
+            return {"detected": False, "severity": "low", "details": "No ratings found"}
+
+        extreme_ratings = (self.count_between(1, 2) + self.count_between(4, 5)) / len(self.ratings)
+        middle_ratings = self.histogram.get(3, 0) / len(self.ratings)
+
+        severity = "high" if middle_ratings > 0.6 else ("medium" if middle_ratings > 0.4 else "low")
+
+        return {
+            "detected": middle_ratings > 0.4 and extreme_ratings < 0.3,
+            "severity": severity,
+            "details": f"Middle ratings: {middle_ratings:.1%}, Extreme ratings: {extreme_ratings:.1%}"
+        }
+
+    def reviewer_leniency(self) -> dict:
+        """Reviewers whose mean rating sits well above or below the average of all ratings"""
+        if not self.ratings:
+            return {"reviewers_analyzed": 0, "lenient_reviewers": [], "severe_reviewers": []}
+
+        lenient = []
+        severe = []
+        for reviewer_id, (count, mean) in self.reviewer_stats.items():
+            if count < MIN_REVIEWER_RATINGS:
+                continue
+            deviation = mean - self.mean
+            entry = {
+                "reviewer_id": str(reviewer_id),
+                "average_rating": round(mean, 2),
+                "deviation": round(deviation, 2),
+                "ratings": count
+            }
+            if deviation >= REVIEWER_DEVIATION_THRESHOLD:
+                lenient.append(entry)
+            elif deviation <= -REVIEWER_DEVIATION_THRESHOLD:
+                severe.append(entry)
+
+        return {
+            "reviewers_analyzed": len(self.reviewer_stats),
+            "lenient_reviewers": sorted(lenient, key=lambda entry: -entry["deviation"]),
+            "severe_reviewers": sorted(severe, key=lambda entry: entry["deviation"])
+        }
+
+
+def rating_distribution(*matrices: RatingMatrix) -> dict:
+    """Star counts over one or more matrices ({} when there are no ratings)"""
+    histogram = Counter()
+    for matrix in matrices:
+        histogram.update(matrix.histogram)
+    if not histogram:
+        return {}
+
+    return {
+        "1_star": histogram.get(1, 0),
+        "2_star": histogram.get(2, 0),
+        "3_star": histogram.get(3, 0),
+        "4_star": histogram.get(4, 0),
+        "5_star": histogram.get(5, 0)
+    }
@@ -0,0 +1,255 @@
+"""
+Cross-cycle review analytics cube
+When a cycle completes, its completed-assignment ratings are aggregated into
+review_analytics_cube cells keyed by (cycle, organization, trait, review type) with count, sum,
+sum of squares and a 1-5 histogram. Every organization's cell covers its whole subtree (rolled
+up along the organization closure), so slicing by directorate, department or the whole company
+across many cycles only sums a few cube rows instead of re-joining responses, users and
+organizations per cycle.
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import extract, func, literal, select
+from models import (
+    Organization, OrganizationLevel, ReviewAnalyticsCube, ReviewAssignment, ReviewCycle,
+    ReviewCycleStatus, ReviewCycleTrait, ReviewQuestion, ReviewResponse, ReviewTrait, User
+)
+from utils.review_scoring import question_applies_to_assignment
+import uuid
+
+DIMENSIONS = ('cycle', 'year', 'organization', 'trait', 'review_type')
+REVIEW_TYPES = ('self', 'peer', 'supervisor')
+RATINGS = (1, 2, 3, 4, 5)
+
+
+def organization_closure():
+    """
+    Recursive CTE: (ancestor_id, descendant_id) for every organization and each organization
+    at or below it (every organization is its own ancestor)
+    """
+    closure = select(
+        Organization.id.label('ancestor_id'),
+        Organization.id.label('descendant_id')
+    ).cte('organization_closure', recursive=True)
+
+    child = Organization.__table__.alias('closure_child')
+    # UNION (not UNION ALL) stops at repeated rows, so a parent cycle cannot recurse forever
+    return closure.union(
+        select(closure.c.ancestor_id, child.c.id).where(child.c.parent_id == closure.c.descendant_id)
+    )
+
+
+class ReviewCubeService:
+    """Builds and slices ReviewAnalyticsCube rows"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def build_cycle(self, cycle_id) -> int:
+        """
+        (Re)build a cycle's cube cells in one INSERT ... SELECT
+        Only completed assignments count, with the same question/trait applicability as
+        review scores. Does not commit.
+
+        Returns:
+            int: Number of cells written
+        """
+        cycle_id = cycle_id if isinstance(cycle_id, uuid.UUID) else uuid.UUID(str(cycle_id))
+        if self.db.query(ReviewCycle.id).filter(ReviewCycle.id == cycle_id).first() is None:
+            raise ValueError("Review cycle not found")
+
+        self.db.query(ReviewAnalyticsCube).filter(
+            ReviewAnalyticsCube.cycle_id == cycle_id
+        ).delete(synchronize_session=False)
+
+        closure = organization_closure()
+        rating = ReviewResponse.rating
+        cells = select(
+            func.gen_random_uuid(),
+            literal(cycle_id, ReviewAnalyticsCube.cycle_id.type),
+            closure.c.ancestor_id,
+            ReviewQuestion.trait_id,
+            ReviewAssignment.review_type,
+            func.count(),
+            func.sum(rating),
+            func.sum(rating * rating),
+            *[func.count().filter(rating == value) for value in RATINGS]
+        ).select_from(ReviewResponse).join(
+            ReviewAssignment, ReviewAssignment.id == ReviewResponse.assignment_id
+        ).join(
+            ReviewQuestion, ReviewQuestion.id == ReviewResponse.question_id
+        ).join(
+            ReviewCycleTrait, (ReviewCycleTrait.cycle_id == ReviewAssignment.cycle_id)
+            & (ReviewCycleTrait.trait_id == ReviewQuestion.trait_id)
+            & (ReviewCycleTrait.is_active == True)
+        ).join(
+            User, User.id == ReviewAssignment.reviewee_id
+        ).join(
+            closure, closure.c.descendant_id == User.organization_id
+        ).where(
+            ReviewAssignment.cycle_id == cycle_id,
+            ReviewAssignment.status == 'completed',
+            question_applies_to_assignment()
+        ).group_by(
+            closure.c.ancestor_id, ReviewQuestion.trait_id, ReviewAssignment.review_type
+        )
+
+        result = self.db.execute(ReviewAnalyticsCube.__table__.insert().from_select([
+            'id', 'cycle_id', 'organization_id', 'trait_id', 'review_type',
+            'rating_count', 'rating_sum', 'rating_sum_squares',
+            *[f'rating_{value}' for value in RATINGS]
+        ], cells))
+
+        # Recorded even when the cycle has no completed assignments, so it is not picked up
+        # again. updated_at is kept: it versions the cycle's cached analytics
+        self.db.query(ReviewCycle).filter(ReviewCycle.id == cycle_id).update({
+            ReviewCycle.cube_built_at: func.now(),
+            ReviewCycle.updated_at: ReviewCycle.updated_at
+        }, synchronize_session=False)
+
+        return result.rowcount
+
+    def build_completed_cycles(self) -> int:
+        """
+        Build the cube for COMPLETED cycles it was never built for (newly completed ones and backfill)
+        Commits after each cycle.
+
+        Returns:
+            int: Number of cycles built
+        """
+        pending = [
+            row[0] for row in self.db.query(ReviewCycle.id).filter(
+                ReviewCycle.status == ReviewCycleStatus.COMPLETED,
+                ReviewCycle.cube_built_at.is_(None)
+            ).order_by(ReviewCycle.end_date).all()
+        ]
+        for cycle_id in pending:
+            self.build_cycle(cycle_id)
+            self.db.commit()
+        return len(pending)
+
+    def slice(self, group_by: Iterable[str] = ('cycle',),
+              cycle_ids: Optional[List[uuid.UUID]] = None,
+              organization_ids: Optional[List[uuid.UUID]] = None,
+              organization_level: Optional[OrganizationLevel] = None,
+              trait_ids: Optional[List[uuid.UUID]] = None,
+              review_types: Optional[List[str]] = None,
+              years: Optional[List[int]] = None) -> List[dict]:
+        """
+        Sum cube cells along the requested dimensions
+
+        Cells of nested organizations overlap, so without organization in group_by the slice
+        reads one organization (the given one, or the roots for the whole company) or the
+        organizations of one level (e.g. all directorates).
+
+        Args:
+            group_by: subset of DIMENSIONS
+            organization_level: only organizations of this level
+
+        Raises:
+            ValueError: for unknown dimensions or overlapping organization filters
+        """
+        group_by = list(dict.fromkeys(group_by))
+        unknown = sorted(set(group_by) - set(DIMENSIONS))
+        if unknown:
+            raise ValueError(f"Unknown dimensions: {', '.join(unknown)}; expected among: {', '.join(DIMENSIONS)}")
+        if review_types and set(review_types) - set(REVIEW_TYPES):
+            raise ValueError(f"review_types must be among: {', '.join(REVIEW_TYPES)}")
+        if 'organization' not in group_by and organization_ids and len(organization_ids) > 1:
+            raise ValueError("Group by organization to compare several organizations")
+
+        cube = ReviewAnalyticsCube
+        year = extract('year', ReviewCycle.end_date)
+        # Cycles sort chronologically
+        dimension_columns = {
+            'cycle': [ReviewCycle.end_date, cube.cycle_id, ReviewCycle.name, ReviewCycle.period],
+            'year': [year.label('year')],
+            'organization': [cube.organization_id, Organization.name, Organization.level],
+            'trait': [cube.trait_id, ReviewTrait.name],
+            'review_type': [cube.review_type],
+        }
+        columns = [column for dimension in group_by for column in dimension_columns[dimension]]
+
+        query = self.db.query(
+            *columns,
+            func.sum(cube.rating_count),
+            func.sum(cube.rating_sum),
+            func.sum(cube.rating_sum_squares),
+            *[func.sum(getattr(cube, f'rating_{value}')) for value in RATINGS]
+        ).select_from(cube).join(
+            Organization, Organization.id == cube.organization_id
+        )
+        if 'cycle' in group_by or 'year' in group_by or years:
+            query = query.join(ReviewCycle, ReviewCycle.id == cube.cycle_id)
+        if 'trait' in group_by:
+            query = query.join(ReviewTrait, ReviewTrait.id == cube.trait_id)
+
+        if organization_ids:
+            query = query.filter(cube.organization_id.in_(organization_ids))
+        elif organization_level is None and 'organization' not in group_by:
+            query = query.filter(Organization.parent_id.is_(None))
+        if organization_level is not None:
+            query = query.filter(Organization.level == organization_level)
+        if cycle_ids:
+            query = query.filter(cube.cycle_id.in_(cycle_ids))
+        if trait_ids:
+            query = query.filter(cube.trait_id.in_(trait_ids))
+        if review_types:
+            query = query.filter(cube.review_type.in_(review_types))
+        if years:
+            query = query.filter(year.in_(years))
+
+        if columns:
+            query = query.group_by(*columns).order_by(*columns)
+
+        cells = []
+        width = len(columns)
+        for row in query.all():
+            cell = _dimension_values(group_by, row[:width])
+            cell.update(cell_statistics(*row[width:]))
+            cells.append(cell)
+        return cells
+
+
+def _dimension_values(group_by: List[str], values) -> dict:
+    """Labelled dimension values of one result row"""
+    cell = {}
+    values = iter(values)
+    for dimension in group_by:
+        if dimension == 'cycle':
+            end_date, cycle_id, name, period = (next(values) for _ in range(4))
+            cell['cycle'] = {
+                "id": str(cycle_id), "name": name, "period": period,
+                "end_date": end_date.isoformat() if end_date else None
+            }
+        elif dimension == 'year':
+            cell['year'] = int(next(values))
+        elif dimension == 'organization':
+            organization_id, name, level = (next(values) for _ in range(3))
+            cell['organization'] = {
+                "id": str(organization_id), "name": name,
+                "level": level.value if hasattr(level, 'value') else level
+            }
+        elif dimension == 'trait':
+            trait_id, name = next(values), next(values)
+            cell['trait'] = {"id": str(trait_id), "name": name}
+        else:
+            cell['review_type'] = next(values)
+    return cell
+
+
+def cell_statistics(count, total, total_squares, *histogram) -> Dict:
+    """Count, mean, population standard deviation and histogram from summed cube cells"""
+    count = int(count or 0)
+    total = int(total or 0)
+    total_squares = int(total_squares or 0)
+    mean = total / count if count else None
+    variance = max(total_squares / count - mean * mean, 0.0) if count else None
+    return {
+        "count": count,
+        "mean": round(mean, 3) if mean is not None else None,
+        "stddev": round(math.sqrt(variance), 3) if variance is not None else None,
+        "histogram": {str(value): int(bucket or 0) for value, bucket in zip(RATINGS, histogram)}
+    }
@@ -0,0 +1,98 @@
+"""
+Review form catalog cache
+Every reviewer in a cycle sees the same traits and questions for a review type, so the
+catalog is built once per (cycle_id, review_type) and shared until trait/question edits
+invalidate it
+"""
+
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from decouple import config
+from models import ReviewCycleTrait, ReviewTrait, ReviewQuestion
+import threading
+import time
+
+# Backstop for changes made outside this process (other workers, scripts, manual SQL)
+FORM_CATALOG_TTL_SECONDS = config("REVIEW_FORM_CACHE_TTL", default=300, cast=int)
+
+_APPLIES_TO = {
+    'self': ReviewQuestion.applies_to_self,
+    'peer': ReviewQuestion.applies_to_peer,
+    'supervisor': ReviewQuestion.applies_to_supervisor
+}
+
+# (cycle_id, review_type) -> (built_at, catalog)
+_catalog_cache: Dict[Tuple[str, str], Tuple[float, tuple]] = {}
+_cache_lock = threading.Lock()
+
+
+def get_form_catalog(db: Session, cycle_id, review_type: str) -> tuple:
+    """
+    Traits and questions shown on a review form, in display order
+
+    Returns:
+        tuple of {"id", "name", "description", "questions": ((question_id, text), ...)}
+        Only traits with at least one applicable question are included.
+        The result is shared between requests and must not be mutated.
+    """
+    key = (str(cycle_id), review_type)
+    now = time.monotonic()
+
+    with _cache_lock:
+        cached = _catalog_cache.get(key)
+    if cached and now - cached[0] < FORM_CATALOG_TTL_SECONDS:
+        return cached[1]
+
+    catalog = _build_catalog(db, cycle_id, review_type)
+    with _cache_lock:
+        _catalog_cache[key] = (now, catalog)
+    return catalog
+
+
+def invalidate_form_catalog(cycle_id: Optional[str] = None):
+    """
+    Drop cached catalogs for one cycle, or for every cycle when cycle_id is None
+    (trait and question edits can affect any cycle the trait is linked to)
+    """
+    with _cache_lock:
+        if cycle_id is None:
+            _catalog_cache.clear()
+            return
+        for key in [key for key in _catalog_cache if key[0] == str(cycle_id)]:
+            del _catalog_cache[key]
+
+
+def _build_catalog(db: Session, cycle_id, review_type: str) -> tuple:
+    """One query over cycle traits, traits and applicable questions"""
+    query = db.query(
+        ReviewTrait.id, ReviewTrait.name, ReviewTrait.description,
+        ReviewQuestion.id, ReviewQuestion.question_text
+    ).select_from(ReviewCycleTrait).join(
+        ReviewTrait, ReviewTrait.id == ReviewCycleTrait.trait_id
+    ).join(
+        ReviewQuestion, ReviewQuestion.trait_id == ReviewTrait.id
+    ).filter(
+        ReviewCycleTrait.cycle_id == cycle_id,
+        ReviewCycleTrait.is_active == True,
+        ReviewQuestion.is_active == True
+    )
+
+    applies_to = _APPLIES_TO.get(review_type)
+    if applies_to is not None:
+        query = query.filter(applies_to == True)
+
+    rows = query.order_by(
+        ReviewTrait.display_order, ReviewTrait.name, ReviewQuestion.created_at
+    ).all()
+
+    traits: List[dict] = []
+    by_trait: Dict[str, dict] = {}
+    for trait_id, trait_name, trait_description, question_id, question_text in rows:
+        trait = by_trait.get(trait_id)
+        if trait is None:
+            trait = {"id": str(trait_id), "name": trait_name, "description": trait_description, "questions": []}
+            by_trait[trait_id] = trait
+            traits.append(trait)
+        trait["questions"].append((str(question_id), question_text))
+
+    return tuple({**trait, "questions": tuple(trait["questions"])} for trait in traits)
@@ -0,0 +1,182 @@
+"""
+Review cycle progress counters
+Maintains review_cycle_progress alongside ReviewAssignment.status changes and
+pushes the deltas to admins watching the cycle over the notification WebSocket
+"""
+
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from models import ReviewAssignment, ReviewCycleProgress, Organization, User
+from utils.review_scoring import lock_reviewee
+from utils.websocket_manager import manager
+import uuid
+
+PARTICIPANTS = 'participants'
+
+
+class ReviewProgressService:
+    """Reads and maintains per-organization completion counters for review cycles"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def rebuild(self, cycle_id):
+        """
+        Recompute every counter row of a cycle from review_assignments
+        Used after assignments are (re)generated and for cycles that predate the counters
+        Does not commit
+        """
+        self.db.query(ReviewCycleProgress).filter(
+            ReviewCycleProgress.cycle_id == cycle_id
+        ).delete(synchronize_session=False)
+
+        is_completed = ReviewAssignment.status == 'completed'
+        counters = self.db.query(
+            User.organization_id,
+            ReviewAssignment.review_type,
+            func.count(),
+            func.count().filter(is_completed)
+        ).select_from(ReviewAssignment).join(
+            User, User.id == ReviewAssignment.reviewee_id
+        ).filter(
+            ReviewAssignment.cycle_id == cycle_id
+        ).group_by(User.organization_id, ReviewAssignment.review_type).all()
+
+        reviewees: Dict[uuid.UUID, List[int]] = {}
+
+        # Participant rows need per-reviewee totals across review types
+        for organization_id, reviewee_total, reviewee_completed in self.db.query(
+            User.organization_id,
+            func.count(),
+            func.count().filter(is_completed)
+        ).select_from(ReviewAssignment).join(
+            User, User.id == ReviewAssignment.reviewee_id
+        ).filter(
+            ReviewAssignment.cycle_id == cycle_id
+        ).group_by(User.organization_id, ReviewAssignment.reviewee_id).all():
+            participants = reviewees.setdefault(organization_id, [0, 0, 0])
+            participants[0] += 1
+            participants[1] += 1 if reviewee_completed == reviewee_total else 0
+            participants[2] += 1 if reviewee_completed > 0 else 0
+
+        rows = [
+            {
+                "cycle_id": cycle_id,
+                "organization_id": organization_id,
+                "review_type": review_type,
+                "total_count": total,
+                "completed_count": completed,
+                "started_count": completed
+            }
+            for organization_id, review_type, total, completed in counters
+        ] + [
+            {
+                "cycle_id": cycle_id,
+                "organization_id": organization_id,
+                "review_type": PARTICIPANTS,
+                "total_count": total,
+                "completed_count": completed,
+                "started_count": started
+            }
+            for organization_id, (total, completed, started) in reviewees.items()
+        ]
+        if rows:
+            self.db.bulk_insert_mappings(ReviewCycleProgress, rows)
+
+    def record_completion(self, assignment: ReviewAssignment) -> Optional[dict]:
+        """
+        Apply one assignment's pending -> completed transition to the counters
+        Call only after complete_assignment() returned True, in the same transaction, so a
+        duplicate submit of the assignment never counts it twice
+
+        Returns:
+            The cycle_progress message to push after commit; it carries "rebuilt": true
+            instead of a delta when the counters were missing or out of step (already full)
+            and had to be rebuilt
+        """
+        # Serialize with other submissions for the same reviewee so exactly one of them
+        # sees the reviewee's last assignment complete
+        lock_reviewee(self.db, assignment.cycle_id, assignment.reviewee_id)
+
+        organization_id = self.db.query(User.organization_id).filter(User.id == assignment.reviewee_id).scalar()
+        total, completed = self.db.query(
+            func.count(),
+            func.count().filter(ReviewAssignment.status == 'completed')
+        ).filter(
+            ReviewAssignment.cycle_id == assignment.cycle_id,
+            ReviewAssignment.reviewee_id == assignment.reviewee_id
+        ).one()
+
+        participant_completed = 1 if completed == total else 0
+        participant_started = 1 if completed == 1 else 0
+
+        updated = self.db.query(ReviewCycleProgress).filter(
+            ReviewCycleProgress.cycle_id == assignment.cycle_id,
+            ReviewCycleProgress.organization_id == organization_id,
+            ReviewCycleProgress.review_type == assignment.review_type,
+            # Full counters mean they drifted; rebuild instead of violating valid_progress_counts
+            ReviewCycleProgress.completed_count < ReviewCycleProgress.total_count
+        ).update({
+            ReviewCycleProgress.completed_count: ReviewCycleProgress.completed_count + 1,
+            ReviewCycleProgress.started_count: ReviewCycleProgress.started_count + 1
+        }, synchronize_session=False)
+
+        if not updated:
+            self.rebuild(assignment.cycle_id)
+            return {"type": "cycle_progress", "cycle_id": str(assignment.cycle_id), "rebuilt": True}
+
+        if participant_completed or participant_started:
+            self.db.query(ReviewCycleProgress).filter(
+                ReviewCycleProgress.cycle_id == assignment.cycle_id,
+                ReviewCycleProgress.organization_id == organization_id,
+                ReviewCycleProgress.review_type == PARTICIPANTS
+            ).update({
+                ReviewCycleProgress.completed_count: ReviewCycleProgress.completed_count + participant_completed,
+                ReviewCycleProgress.started_count: ReviewCycleProgress.started_count + participant_started
+            }, synchronize_session=False)
+
+        return {
+            "type": "cycle_progress",
+            "cycle_id": str(assignment.cycle_id),
+            "organization_id": str(organization_id),
+            "delta": {
+                "review_type": assignment.review_type,
+                "completed_assignments": 1,
+                "completed_participants": participant_completed,
+                "started_participants": participant_started
+            }
+        }
+
+    def cycle_counters(self, cycle_id) -> list:
+        """
+        Counter rows of a cycle with organization names (rebuilt first if missing)
+
+        Returns:
+            rows of (organization_id, organization_name, review_type, total_count,
+            completed_count, started_count)
+        """
+        rows = self._counter_rows(cycle_id)
+        if not rows and self.db.query(ReviewAssignment.id).filter(ReviewAssignment.cycle_id == cycle_id).first():
+            self.rebuild(cycle_id)
+            self.db.commit()
+            rows = self._counter_rows(cycle_id)
+        return rows
+
+    def _counter_rows(self, cycle_id) -> list:
+        return self.db.query(
+            ReviewCycleProgress.organization_id,
+            Organization.name.label('organization_name'),
+            ReviewCycleProgress.review_type,
+            ReviewCycleProgress.total_count,
+            ReviewCycleProgress.completed_count,
+            ReviewCycleProgress.started_count
+        ).join(
+            Organization, Organization.id == ReviewCycleProgress.organization_id
+        ).filter(ReviewCycleProgress.cycle_id == cycle_id).all()
+
+
+async def push_cycle_progress(message: Optional[dict]):
+    """Send a cycle_progress message to the admins subscribed to that cycle"""
+    if message:
+        await manager.send_cycle_update(message["cycle_id"], message)
@@ -0,0 +1,345 @@
+"""
+Review scoring engine
+Computes self/peer/supervisor trait averages for a cycle with one grouped aggregate
+and writes them to review_scores with a bulk upsert
+
+Running totals per (cycle, reviewee, trait, review type) are kept in review_score_aggregates
+so a submission only has to apply its own ratings as a delta
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import func, and_, or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from models import (
+    ReviewAssignment, ReviewResponse, ReviewQuestion, ReviewCycleTrait, ReviewScore, ReviewScoreAggregate
+)
+import hashlib
+import uuid
+
+# Weighted score: self (20%) + peer (30%) + supervisor (50%), renormalised over the types present
+REVIEW_TYPE_WEIGHTS = {
+    'self': 0.2,
+    'peer': 0.3,
+    'supervisor': 0.5
+}
+
+# (rating_sum, rating_count) per review type
+TypeTotals = Dict[str, Tuple[int, int]]
+
+
+def weighted_trait_score(self_score: Optional[float], peer_score: Optional[float],
+                         supervisor_score: Optional[float]) -> Optional[float]:
+    """
+    Combine per-type averages into one trait score on the same 1-5 scale as the ratings
+    Types without a score are left out and the remaining weights scaled up proportionally
+    """
+    weighted_total = 0.0
+    total_weight = 0.0
+    for review_type, score in (('self', self_score), ('peer', peer_score), ('supervisor', supervisor_score)):
+        if score is not None:
+            weighted_total += float(score) * REVIEW_TYPE_WEIGHTS[review_type]
+            total_weight += REVIEW_TYPE_WEIGHTS[review_type]
+
+    if total_weight == 0:
+        return None
+    return weighted_total / total_weight
+
+
+def question_applies_to_assignment():
+    """SQL predicate: the joined question is active and applies to the joined assignment's review type"""
+    review_type = ReviewAssignment.review_type
+    return and_(
+        ReviewQuestion.is_active == True,
+        or_(
+            and_(review_type == 'self', ReviewQuestion.applies_to_self == True),
+            and_(review_type == 'peer', ReviewQuestion.applies_to_peer == True),
+            and_(review_type == 'supervisor', ReviewQuestion.applies_to_supervisor == True)
+        )
+    )
+
+
+class ReviewScoringService:
+    """Calculates and stores ReviewScore rows for a cycle"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def trait_totals(self, cycle_id: uuid.UUID,
+                     reviewee_ids: Optional[Iterable[uuid.UUID]] = None
+                     ) -> Dict[Tuple[uuid.UUID, uuid.UUID], TypeTotals]:
+        """
+        Rating sum and count per (reviewee, trait) and review type for completed assignments
+        Only active questions of active cycle traits count, and only when the question
+        applies to the assignment's review type
+
+        Returns:
+            {(reviewee_id, trait_id): {"self": (sum, count), "peer": ..., "supervisor": ...}}
+            (types without responses are omitted)
+        """
+        query = self.db.query(
+            ReviewAssignment.reviewee_id,
+            ReviewQuestion.trait_id,
+            ReviewAssignment.review_type,
+            func.sum(ReviewResponse.rating),
+            func.count(ReviewResponse.rating)
+        ).select_from(ReviewResponse).join(
+            ReviewAssignment, ReviewAssignment.id == ReviewResponse.assignment_id
+        ).join(
+            ReviewQuestion, ReviewQuestion.id == ReviewResponse.question_id
+        ).join(
+            ReviewCycleTrait, and_(
+                ReviewCycleTrait.cycle_id == ReviewAssignment.cycle_id,
+                ReviewCycleTrait.trait_id == ReviewQuestion.trait_id,
+                ReviewCycleTrait.is_active == True
+            )
+        ).filter(
+            ReviewAssignment.cycle_id == cycle_id,
+            ReviewAssignment.status == 'completed',
+            question_applies_to_assignment()
+        )
+
+        if reviewee_ids is not None:
+            query = query.filter(ReviewAssignment.reviewee_id.in_(list(reviewee_ids)))
+
+        rows = query.group_by(
+            ReviewAssignment.reviewee_id, ReviewQuestion.trait_id, ReviewAssignment.review_type
+        ).all()
+
+        totals: Dict[Tuple[uuid.UUID, uuid.UUID], TypeTotals] = {}
+        for reviewee_id, trait_id, review_type, rating_sum, rating_count in rows:
+            totals.setdefault((reviewee_id, trait_id), {})[review_type] = (int(rating_sum), rating_count)
+        return totals
+
+    def calculate_cycle_scores(self, cycle_id: uuid.UUID,
+                               reviewee_ids: Optional[Iterable[uuid.UUID]] = None) -> int:
+        """
+        Recalculate ReviewScore rows for a cycle (or only the given reviewees) from the responses
+        Also rebuilds their running aggregates, so this doubles as the repair/backfill path
+
+        Every (reviewee, active cycle trait) pair gets a row, with NULL scores where no
+        responses exist yet, matching what per-user calculation produced
+
+        Returns:
+            int: Number of reviewees processed
+        """
+        cycle_id = _as_uuid(cycle_id)
+        if reviewee_ids is None:
+            reviewee_ids = [
+                row[0] for row in self.db.query(func.distinct(ReviewAssignment.reviewee_id)).filter(
+                    ReviewAssignment.cycle_id == cycle_id
+                ).all()
+            ]
+        else:
+            reviewee_ids = [_as_uuid(reviewee_id) for reviewee_id in reviewee_ids]
+
+        if not reviewee_ids:
+            return 0
+
+        trait_ids = [
+            row[0] for row in self.db.query(ReviewCycleTrait.trait_id).filter(
+                ReviewCycleTrait.cycle_id == cycle_id,
+                ReviewCycleTrait.is_active == True
+            ).all()
+        ]
+
+        totals = self.trait_totals(cycle_id, reviewee_ids)
+
+        # Replace the running aggregates with the freshly computed totals
+        self.db.query(ReviewScoreAggregate).filter(
+            ReviewScoreAggregate.cycle_id == cycle_id,
+            ReviewScoreAggregate.user_id.in_(reviewee_ids)
+        ).delete(synchronize_session=False)
+        aggregate_rows = [
+            {
+                "id": uuid.uuid4(),
+                "cycle_id": cycle_id,
+                "user_id": reviewee_id,
+                "trait_id": trait_id,
+                "review_type": review_type,
+                "rating_sum": rating_sum,
+                "rating_count": rating_count
+            }
+            for (reviewee_id, trait_id), by_type in totals.items()
+            for review_type, (rating_sum, rating_count) in by_type.items()
+        ]
+        for start in range(0, len(aggregate_rows), 1000):
+            self.db.execute(pg_insert(ReviewScoreAggregate).values(aggregate_rows[start:start + 1000]))
+
+        self.upsert_scores([
+            self._score_row(cycle_id, reviewee_id, trait_id, totals.get((reviewee_id, trait_id), {}))
+            for reviewee_id in reviewee_ids
+            for trait_id in trait_ids
+        ])
+        self.db.commit()
+        return len(reviewee_ids)
+
+    def apply_submission(self, assignment: ReviewAssignment, ratings: Dict[uuid.UUID, int]):
+        """
+        Fold a newly completed assignment's ratings into the running aggregates and refresh
+        the reviewee's ReviewScore rows for the traits it touched
+
+        Cost is proportional to the questions in the submission, not the reviewee's history
+        Does not commit: call only after complete_assignment() returned True, in the same
+        transaction, so a submission is never folded in twice
+
+        Args:
+            ratings: {question_id: rating} for the assignment's saved responses
+        """
+        if not ratings:
+            return
+
+        cycle_id = _as_uuid(assignment.cycle_id)
+        reviewee_id = _as_uuid(assignment.reviewee_id)
+
+        # Serialize score refreshes per reviewee: concurrent submissions of different review
+        # types update different aggregate rows, so row locks alone would not order them
+        lock_reviewee(self.db, cycle_id, reviewee_id)
+
+        # Trait of each submitted question that counts for this assignment
+        question_traits = dict(
+            self.db.query(ReviewQuestion.id, ReviewQuestion.trait_id).join(
+                ReviewCycleTrait, and_(
+                    ReviewCycleTrait.trait_id == ReviewQuestion.trait_id,
+                    ReviewCycleTrait.cycle_id == cycle_id,
+                    ReviewCycleTrait.is_active == True
+                )
+            ).join(
+                ReviewAssignment, ReviewAssignment.id == assignment.id
+            ).filter(
+                ReviewQuestion.id.in_([_as_uuid(question_id) for question_id in ratings]),
+                question_applies_to_assignment()
+            ).all()
+        )
+
+        deltas: Dict[uuid.UUID, List[int]] = {}
+        for question_id, rating in ratings.items():
+            trait_id = question_traits.get(_as_uuid(question_id))
+            if trait_id is None:
+                continue
+            delta = deltas.setdefault(trait_id, [0, 0])
+            delta[0] += rating
+            delta[1] += 1
+
+        if not deltas:
+            return
+
+        statement = pg_insert(ReviewScoreAggregate).values([
+            {
+                "id": uuid.uuid4(),
+                "cycle_id": cycle_id,
+                "user_id": reviewee_id,
+                "trait_id": trait_id,
+                "review_type": assignment.review_type,
+                "rating_sum": rating_sum,
+                "rating_count": rating_count
+            }
+            for trait_id, (rating_sum, rating_count) in deltas.items()
+        ])
+        self.db.execute(statement.on_conflict_do_update(
+            constraint='unique_score_aggregate',
+            set_={
+                "rating_sum": ReviewScoreAggregate.rating_sum + statement.excluded.rating_sum,
+                "rating_count": ReviewScoreAggregate.rating_count + statement.excluded.rating_count,
+                "updated_at": func.now()
+            }
+        ))
+
+        # Recompute the touched traits from their aggregates (at most 3 rows per trait)
+        totals: Dict[uuid.UUID, TypeTotals] = {trait_id: {} for trait_id in deltas}
+        for trait_id, review_type, rating_sum, rating_count in self.db.query(
+            ReviewScoreAggregate.trait_id,
+            ReviewScoreAggregate.review_type,
+            ReviewScoreAggregate.rating_sum,
+            ReviewScoreAggregate.rating_count
+        ).filter(
+            ReviewScoreAggregate.cycle_id == cycle_id,
+            ReviewScoreAggregate.user_id == reviewee_id,
+            ReviewScoreAggregate.trait_id.in_(list(deltas))
+        ).all():
+            totals[trait_id][review_type] = (rating_sum, rating_count)
+
+        self.upsert_scores([
+            self._score_row(cycle_id, reviewee_id, trait_id, by_type)
+            for trait_id, by_type in totals.items()
+        ])
+
+    def upsert_scores(self, rows: List[dict], batch_size: int = 1000):
+        """Insert or update review_scores on unique_user_trait_score in multi-row batches"""
+        for start in range(0, len(rows), batch_size):
+            statement = pg_insert(ReviewScore).values(rows[start:start + batch_size])
+            statement = statement.on_conflict_do_update(
+                constraint='unique_user_trait_score',
+                set_={
+                    "self_score": statement.excluded.self_score,
+                    "peer_score": statement.excluded.peer_score,
+                    "supervisor_score": statement.excluded.supervisor_score,
+                    "weighted_score": statement.excluded.weighted_score,
+                    "calculated_at": func.now(),
+                    "updated_at": func.now()
+                }
+            )
+            self.db.execute(statement)
+
+    @staticmethod
+    def _score_row(cycle_id: uuid.UUID, user_id: uuid.UUID, trait_id: uuid.UUID, by_type: TypeTotals) -> dict:
+        averages = {
+            review_type: (by_type[review_type][0] / by_type[review_type][1]
+                          if by_type.get(review_type) and by_type[review_type][1] else None)
+            for review_type in REVIEW_TYPE_WEIGHTS
+        }
+        return {
+            "id": uuid.uuid4(),
+            "cycle_id": cycle_id,
+            "user_id": user_id,
+            "trait_id": trait_id,
+            "self_score": averages['self'],
+            "peer_score": averages['peer'],
+            "supervisor_score": averages['supervisor'],
+            "weighted_score": weighted_trait_score(averages['self'], averages['peer'], averages['supervisor'])
+        }
+
+
+def complete_assignment(db: Session, assignment: ReviewAssignment) -> bool:
+    """
+    Mark an assignment completed unless it already is, as one conditional UPDATE
+    A concurrent submission of the same assignment blocks on the row and then matches nothing,
+    so exactly one caller sees True and may apply the submission's deltas
+
+    Returns:
+        bool: True when this call completed the assignment
+    """
+    completed_at = db.execute(
+        update(ReviewAssignment).where(
+            ReviewAssignment.id == assignment.id,
+            ReviewAssignment.status != 'completed'
+        ).values(
+            status='completed',
+            completed_at=func.now(),
+            updated_at=func.now()
+        ).returning(ReviewAssignment.completed_at)
+    ).scalar()
+    if completed_at is None:
+        return False
+
+    assignment.status = 'completed'
+    assignment.completed_at = completed_at
+    return True
+
+
+def lock_reviewee(db: Session, cycle_id, reviewee_id):
+    """
+    Take a transaction-scoped advisory lock for a (cycle, reviewee) pair
+    Re-entrant within a transaction; released on commit/rollback
+    """
+    db.execute(func.pg_advisory_xact_lock(_lock_key(_as_uuid(cycle_id), _as_uuid(reviewee_id))).select())
+
+
+def _as_uuid(value) -> uuid.UUID:
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
+
+def _lock_key(cycle_id: uuid.UUID, reviewee_id: uuid.UUID) -> int:
+    """Signed 64-bit advisory lock key for a (cycle, reviewee) pair"""
+    digest = hashlib.blake2b(cycle_id.bytes + reviewee_id.bytes, digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
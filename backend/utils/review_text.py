@@ -0,0 +1,112 @@
+"""
+Keyword matching for review comment analytics
+Every keyword list used by the review insight helpers is compiled at import into one
+trie-shaped regex, so a comment is lowercased and scanned once for all of them.
+Scan results are memoized by comment text, so unchanged comments are never re-scanned.
+"""
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List
+from decouple import config
+import re
+
+TEXT_SCAN_CACHE_SIZE = config("REVIEW_TEXT_CACHE_SIZE", default=20000, cast=int)
+
+# Keyword groups used by the insight helpers (substring matches on lowercased text)
+KEYWORD_GROUPS: Dict[str, tuple] = {
+    "highlight": ('excellent', 'outstanding', 'exceptional', 'exceeded'),
+    "development": ('improve', 'develop', 'needs work', 'lacking'),
+    "positive": ('excellent', 'outstanding', 'great', 'strong', 'exceeded', 'exceptional'),
+    "negative": ('poor', 'lacking', 'needs improvement', 'below expectations', 'weak'),
+    "strength": ('strength', 'strong', 'excellent', 'outstanding', 'skilled', 'proficient'),
+    "improve": ('improve',),
+    "recognition": ('recognition', 'award', 'achievement', 'outstanding', 'exceptional', 'exceeded expectations'),
+    "example": ('example', 'instance', 'specifically', 'such as'),
+}
+
+TOPIC_KEYWORDS: Dict[str, tuple] = {
+    "Leadership": ("lead", "leadership", "manage", "team", "direct", "guide"),
+    "Communication": ("communicate", "presentation", "meeting", "discuss", "explain"),
+    "Technical Skills": ("technical", "coding", "programming", "analysis", "problem solving"),
+    "Collaboration": ("collaborate", "teamwork", "cooperation", "work with", "partner"),
+    "Innovation": ("innovative", "creative", "new ideas", "improve", "solution"),
+    "Quality": ("quality", "accuracy", "detail", "thorough", "careful"),
+}
+
+_GROUP_SETS = {name: frozenset(keywords) for name, keywords in {**KEYWORD_GROUPS, **TOPIC_KEYWORDS}.items()}
+_KEYWORDS = sorted({keyword for keywords in _GROUP_SETS.values() for keyword in keywords})
+
+
+def _trie_pattern(node: dict) -> str:
+    """Regex for a keyword trie; greedy, so the longest keyword at a position wins"""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ''
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+    return '(?:' + body + ')?' if '' in node else body
+
+
+def _compile(keywords: List[str]):
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = True
+    return re.compile(_trie_pattern(trie))
+
+
+_MATCHER = _compile(_KEYWORDS)
+
+# A match is the longest keyword starting at its position; it implies every keyword inside it
+_CONTAINED = {
+    keyword: frozenset(other for other in _KEYWORDS if other in keyword)
+    for keyword in _KEYWORDS
+}
+
+
+@lru_cache(maxsize=TEXT_SCAN_CACHE_SIZE)
+def keyword_hits(text: str) -> FrozenSet[str]:
+    """Every known keyword that occurs in text (case-insensitive)"""
+    text = text.lower()
+    hits = set()
+    position = 0
+    while True:
+        match = _MATCHER.search(text, position)
+        if match is None:
+            return frozenset(hits)
+        hits |= _CONTAINED[match.group()]
+        # Resume inside the match so overlapping keywords ("work with" + "thorough") are found too
+        position = match.start() + 1
+
+
+def scan_batch(texts: Iterable[str]) -> Dict[str, FrozenSet[str]]:
+    """Scan a batch of comments (e.g. all of a cycle's), each distinct text once"""
+    return {text: keyword_hits(text) for text in set(texts)}
+
+
+def response_texts(responses_list: Iterable[dict]) -> List[str]:
+    """String answers of several response dicts"""
+    return [
+        value
+        for responses in responses_list if responses
+        for value in responses.values() if isinstance(value, str)
+    ]
+
+
+def mentions(text: str, group: str) -> bool:
+    """Whether text contains any keyword of a group"""
+    return not keyword_hits(text).isdisjoint(_GROUP_SETS[group])
+
+
+def mention_count(text: str, group: str) -> int:
+    """Number of distinct keywords of a group that text contains"""
+    return len(keyword_hits(text) & _GROUP_SETS[group])
+
+
+def topics_in(texts: Iterable[str]) -> List[str]:
+    """Topics (in TOPIC_KEYWORDS order) mentioned by any of the texts"""
+    hits = set()
+    for text in texts:
+        hits |= keyword_hits(text)
+    return [topic for topic in TOPIC_KEYWORDS if not hits.isdisjoint(_GROUP_SETS[topic])]
@@ -8,6 +8,9 @@ from sqlalchemy.orm import Session
 from database import SessionLocal
 from models import ReviewCycle
 from utils.email_service import EmailService
+from utils.blob_storage import BlobStorageService
+from utils.performance_history import PerformanceHistoryService
+from utils.review_cube import ReviewCubeService
 
 
 def activate_scheduled_review_cycles():
@@ -57,9 +60,69 @@ def activate_scheduled_review_cycles():
         db.close()
 
 
+def summarize_completed_review_cycles():
+    """
+    Build per-user summaries for trend views of completed cycles not summarized yet
+    Also backfills cycles completed before summaries existed
+    """
+    db: Session = SessionLocal()
+    try:
+        summarized = PerformanceHistoryService(db).summarize_completed_cycles()
+        if summarized:
+            print(f"📈 Summarized {summarized} completed review cycles")
+
+    except Exception as e:
+        print(f"❌ Error summarizing review cycles: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def build_review_analytics_cubes():
+    """
+    Build the organization analytics cube of completed cycles it was not built for yet
+    Runs apart from summarization so a failure in one does not hold back the other
+    """
+    db: Session = SessionLocal()
+    try:
+        cubed = ReviewCubeService(db).build_completed_cycles()
+        if cubed:
+            print(f"🧊 Built the analytics cube for {cubed} completed review cycles")
+
+    except Exception as e:
+        print(f"❌ Error building review analytics cubes: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+def collect_upload_garbage():
+    """
+    Remove stale unattached document uploads and unreferenced upload blobs
+    Runs in batches so large backlogs do not hold long transactions
+    """
+    db: Session = SessionLocal()
+    try:
+        stats = BlobStorageService(db).collect_garbage()
+
+        print("🧹 Upload garbage collection:")
+        print(f"   Stale documents removed: {stats['documents_removed']}")
+        print(f"   Blobs removed: {stats['blobs_removed']}")
+        print(f"   Reclaimed: {stats['bytes_reclaimed'] / (1024 * 1024):.2f} MB")
+
+    except Exception as e:
+        print(f"❌ Error in upload garbage collection: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
 if __name__ == "__main__":
     print(f"\n🔄 Running scheduled tasks at {datetime.now()}")
     print("=" * 60)
     activate_scheduled_review_cycles()
+    summarize_completed_review_cycles()
+    build_review_analytics_cubes()
+    collect_upload_garbage()
     print("=" * 60)
     print("✨ Done!\n")
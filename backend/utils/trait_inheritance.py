@@ -3,11 +3,130 @@ Trait Inheritance Logic
 Handles organizational scope-based trait inheritance
 """
 
+from functools import cached_property
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import func, select
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 from models import ReviewTrait, User, Organization, TraitScopeType
+import threading
 import uuid
 
+
+class TraitApplicability:
+    """
+    Applicable active trait ids of every organization, resolved in one pass
+
+    An organization's traits are the global traits plus the traits scoped to it or to any of
+    its ancestors. Instances are immutable snapshots shared between requests.
+    """
+
+    def __init__(self, parents: Dict, traits: Iterable[Tuple]):
+        """
+        Args:
+            parents: organization_id -> parent_id (None for roots)
+            traits: active (trait_id, scope_type, organization_id) in display order
+        """
+        self.parents = parents
+        self.trait_order: Dict = {}
+        scoped: Dict = {}
+        global_ids = []
+        for trait_id, scope_type, organization_id in traits:
+            self.trait_order[trait_id] = len(self.trait_order)
+            if scope_type == TraitScopeType.GLOBAL:
+                global_ids.append(trait_id)
+            elif organization_id is not None:
+                scoped.setdefault(organization_id, []).append(trait_id)
+        self.global_trait_ids: FrozenSet = frozenset(global_ids)
+
+        self.children: Dict = {}
+        for organization_id, parent_id in parents.items():
+            if parent_id is not None:
+                self.children.setdefault(parent_id, []).append(organization_id)
+
+        # Resolve top-down: each organization extends its parent's (already resolved) set
+        self.by_organization: Dict = {}
+        for organization_id in parents:
+            chain = []
+            node = organization_id
+            while node is not None and node in parents and node not in self.by_organization and node not in chain:
+                chain.append(node)
+                node = parents[node]
+            inherited = self.by_organization.get(node, self.global_trait_ids)
+            for node in reversed(chain):
+                own = scoped.get(node)
+                if own:
+                    inherited = inherited | frozenset(own)
+                self.by_organization[node] = inherited
+
+    def traits_for(self, organization_id) -> FrozenSet:
+        """Applicable trait ids of an organization (global traits only for None or unknown ids)"""
+        return self.by_organization.get(organization_id, self.global_trait_ids)
+
+    def applies(self, trait_id, organization_id) -> bool:
+        return trait_id in self.traits_for(organization_id)
+
+    def hierarchy(self, organization_id) -> List:
+        """Organization ids from organization_id up to its root"""
+        result = []
+        node = organization_id
+        while node is not None and node in self.parents and node not in result:
+            result.append(node)
+            node = self.parents[node]
+        return result
+
+    def descendants(self, organization_id) -> List:
+        """organization_id followed by every organization below it"""
+        result = [organization_id]
+        seen = {organization_id}
+        for node in result:
+            for child in self.children.get(node, ()):
+                if child not in seen:
+                    seen.add(child)
+                    result.append(child)
+        return result
+
+
+_snapshot: Optional[Tuple[tuple, TraitApplicability]] = None
+_snapshot_lock = threading.Lock()
+
+
+def trait_set_version(db: Session) -> tuple:
+    """Row count and newest created_at / updated_at of review_traits and organizations, in one query"""
+    columns = []
+    for model in (ReviewTrait, Organization):
+        columns.append(select(func.count()).select_from(model).scalar_subquery())
+        columns.append(select(func.max(model.created_at)).scalar_subquery())
+        columns.append(select(func.max(model.updated_at)).scalar_subquery())
+    return tuple(db.query(*columns).one())
+
+
+def resolve_trait_applicability(db: Session) -> TraitApplicability:
+    """
+    Applicability of every active trait for every organization
+
+    Built from two queries and reused until the trait set or the organization tree changes
+    (checked with one aggregate query per call).
+    """
+    global _snapshot
+    version = trait_set_version(db)
+    with _snapshot_lock:
+        cached = _snapshot
+    if cached and cached[0] == version:
+        return cached[1]
+
+    parents = dict(db.query(Organization.id, Organization.parent_id).all())
+    traits = db.query(
+        ReviewTrait.id, ReviewTrait.scope_type, ReviewTrait.organization_id
+    ).filter(
+        ReviewTrait.is_active == True
+    ).order_by(ReviewTrait.display_order, ReviewTrait.id).all()
+
+    applicability = TraitApplicability(parents, traits)
+    with _snapshot_lock:
+        _snapshot = (version, applicability)
+    return applicability
+
+
 class TraitInheritanceService:
     """
     Service for resolving trait inheritance based on organizational hierarchy
@@ -22,6 +141,11 @@ class TraitInheritanceService:
     def __init__(self, db: Session):
         self.db = db
 
+    @cached_property
+    def applicability(self) -> TraitApplicability:
+        """Applicability snapshot, resolved once per service instance"""
+        return resolve_trait_applicability(self.db)
+
     def get_organizational_hierarchy(self, organization_id: uuid.UUID) -> List[uuid.UUID]:
         """
         Get the complete organizational hierarchy for a given organization
@@ -29,18 +153,7 @@ class TraitInheritanceService:
 
         Example: For a unit, returns [unit_id, department_id, directorate_id, global_id]
         """
-        hierarchy = []
-        current_org_id = organization_id
-
-        while current_org_id:
-            org = self.db.query(Organization).filter(Organization.id == current_org_id).first()
-            if not org:
-                break
-
-            hierarchy.append(org.id)
-            current_org_id = org.parent_id
-
-        return hierarchy
+        return self.applicability.hierarchy(organization_id)
 
     def get_applicable_traits_for_user(self, user_id: uuid.UUID) -> List[ReviewTrait]:
         """
@@ -52,29 +165,9 @@ class TraitInheritanceService:
         - Traits from user's department (if user is in a unit under a department)
         - Traits from user's specific unit
         """
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if not user or not user.organization_id:
-            # Return only global traits if user has no organization
-            return self.db.query(ReviewTrait).filter(
-                ReviewTrait.is_active == True,
-                ReviewTrait.scope_type == TraitScopeType.GLOBAL
-            ).order_by(ReviewTrait.display_order).all()
-
-        # Get organizational hierarchy
-        hierarchy = self.get_organizational_hierarchy(user.organization_id)
-
-        # Build query for applicable traits
-        # 1. Global traits (always apply)
-        # 2. Traits from any organization in the user's hierarchy
-        applicable_traits = self.db.query(ReviewTrait).filter(
-            ReviewTrait.is_active == True,
-            (
-                (ReviewTrait.scope_type == TraitScopeType.GLOBAL) |
-                (ReviewTrait.organization_id.in_(hierarchy))
-            )
-        ).order_by(ReviewTrait.display_order).all()
-
-        return applicable_traits
+        organization_id = self.db.query(User.organization_id).filter(User.id == user_id).scalar()
+        # Users without an organization only get global traits
+        return self._load_traits(self.applicability.traits_for(organization_id))
 
     def get_applicable_traits_for_organization(self, organization_id: uuid.UUID) -> List[ReviewTrait]:
         """
@@ -85,19 +178,7 @@ class TraitInheritanceService:
         - Traits from the organization's parent hierarchy
         - Traits specific to this organization
         """
-        # Get organizational hierarchy
-        hierarchy = self.get_organizational_hierarchy(organization_id)
-
-        # Get all applicable traits
-        applicable_traits = self.db.query(ReviewTrait).filter(
-            ReviewTrait.is_active == True,
-            (
-                (ReviewTrait.scope_type == TraitScopeType.GLOBAL) |
-                (ReviewTrait.organization_id.in_(hierarchy))
-            )
-        ).order_by(ReviewTrait.display_order).all()
-
-        return applicable_traits
+        return self._load_traits(self.applicability.traits_for(organization_id))
 
     def get_users_assessed_on_trait(self, trait_id: uuid.UUID) -> List[User]:
         """
@@ -125,21 +206,21 @@ class TraitInheritanceService:
 
     def _get_organization_and_children(self, organization_id: uuid.UUID) -> List[uuid.UUID]:
         """
-        Get organization and all its children recursively
+        Get organization and all its children
         Used to find all users affected by a scoped trait
         """
-        result = [organization_id]
+        return self.applicability.descendants(organization_id)
 
-        # Get immediate children
-        children = self.db.query(Organization).filter(
-            Organization.parent_id == organization_id
+    def _load_traits(self, trait_ids: FrozenSet) -> List[ReviewTrait]:
+        """Trait rows for resolved ids, in display order"""
+        if not trait_ids:
+            return []
+        traits = self.db.query(ReviewTrait).filter(
+            ReviewTrait.id.in_(trait_ids),
+            ReviewTrait.is_active == True
         ).all()
-
-        # Recursively get all descendants
-        for child in children:
-            result.extend(self._get_organization_and_children(child.id))
-
-        return result
+        order = self.applicability.trait_order
+        return sorted(traits, key=lambda trait: order.get(trait.id, len(order)))
 
     def validate_trait_applicability(self, trait_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         """
@@ -149,17 +230,5 @@ class TraitInheritanceService:
         - Trait is global
         - User's organization is in the trait's scope hierarchy
         """
-        trait = self.db.query(ReviewTrait).filter(ReviewTrait.id == trait_id).first()
-        if not trait or not trait.is_active:
-            return False
-
-        if trait.scope_type == TraitScopeType.GLOBAL:
-            return True
-
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if not user or not user.organization_id:
-            return False
-
-        # Check if user's organization is within trait's scope
-        hierarchy = self.get_organizational_hierarchy(user.organization_id)
-        return trait.organization_id in hierarchy
+        organization_id = self.db.query(User.organization_id).filter(User.id == user_id).scalar()
+        return self.applicability.applies(trait_id, organization_id)
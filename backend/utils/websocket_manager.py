@@ -18,6 +18,8 @@ class ConnectionManager:
     def __init__(self):
         # Store active connections: {user_id: set of WebSocket connections}
         self.active_connections: Dict[str, Set[WebSocket]] = {}
+        # Review cycle progress subscriptions: {cycle_id: set of user_ids}
+        self.cycle_subscribers: Dict[str, Set[str]] = {}
 
     async def connect(self, websocket: WebSocket, user_id: UUID):
         """Accept and store a new WebSocket connection"""
@@ -39,6 +41,7 @@ class ConnectionManager:
             # Clean up empty sets
             if not self.active_connections[user_id_str]:
                 del self.active_connections[user_id_str]
+                self.unsubscribe_all_cycles(user_id)
 
             logger.info(f"WebSocket disconnected for user {user_id_str}")
 
@@ -88,6 +91,28 @@ class ConnectionManager:
             if user_id_str in self.active_connections:
                 self.active_connections[user_id_str].discard(connection)
 
+    def subscribe_cycle(self, user_id: UUID, cycle_id: str):
+        """Start sending a user's connections progress updates for a review cycle"""
+        self.cycle_subscribers.setdefault(str(cycle_id), set()).add(str(user_id))
+
+    def unsubscribe_cycle(self, user_id: UUID, cycle_id: str):
+        """Stop sending progress updates for a review cycle to a user"""
+        subscribers = self.cycle_subscribers.get(str(cycle_id))
+        if subscribers is not None:
+            subscribers.discard(str(user_id))
+            if not subscribers:
+                del self.cycle_subscribers[str(cycle_id)]
+
+    def unsubscribe_all_cycles(self, user_id: UUID):
+        """Drop every cycle subscription of a user (after their last connection closes)"""
+        for cycle_id in list(self.cycle_subscribers):
+            self.unsubscribe_cycle(user_id, cycle_id)
+
+    async def send_cycle_update(self, cycle_id: str, data: dict):
+        """Send a review cycle progress update to every subscribed user"""
+        for user_id_str in list(self.cycle_subscribers.get(str(cycle_id), ())):
+            await self.send_personal_notification(user_id_str, data)
+
     def get_active_users_count(self) -> int:
         """Get count of users with active connections"""
         return len(self.active_connections)
@@ -15,16 +15,56 @@ import { Input } from "@/components/ui/input"
 import { Label } from "@/components/ui/label"
 import { Textarea } from "@/components/ui/textarea"
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select"
+import { Progress } from "@/components/ui/progress"
 import { SearchableSelect } from "@/components/ui/searchable-select"
 import { GET, POST, DELETE } from "@/lib/api"
-import { useAuth } from "@/lib/auth-context"
+import { useAuth, usePermission } from "@/lib/auth-context"
+import { useNotifications } from "@/lib/notification-context"
 import { useOrganizations } from "@/lib/react-query"
 import { toast } from "sonner"
 
+const completionRate = (completed, total) => total > 0 ? completed / total * 100 : 0
+
+// Apply one cycle_progress delta pushed by the server to the cycle dashboard counters
+// (department completion counts reviewees with at least one completed review, as on the server)
+const applyProgressDelta = (dashboard, department, delta) => {
+  const typeStats = dashboard.assignment_statistics[delta.review_type] || { total: 0, completed: 0 }
+  const typeCompleted = typeStats.completed + delta.completed_assignments
+  const participantsCompleted = dashboard.participation.completed_participants + delta.completed_participants
+
+  const departments = dashboard.department_breakdown.some(row => row.department === department)
+    ? dashboard.department_breakdown
+    : [...dashboard.department_breakdown, { department, total_participants: 0, completed_participants: 0 }]
+
+  return {
+    ...dashboard,
+    participation: {
+      ...dashboard.participation,
+      completed_participants: participantsCompleted,
+      completion_rate: completionRate(participantsCompleted, dashboard.participation.total_participants)
+    },
+    assignment_statistics: {
+      ...dashboard.assignment_statistics,
+      [delta.review_type]: {
+        ...typeStats,
+        completed: typeCompleted,
+        completion_rate: completionRate(typeCompleted, typeStats.total)
+      }
+    },
+    department_breakdown: departments.map(row => {
+      if (row.department !== department) return row
+      const completed = row.completed_participants + delta.started_participants
+      return { ...row, completed_participants: completed, completion_rate: completionRate(completed, row.total_participants) }
+    })
+  }
+}
+
 export default function ReviewCycleDetailPage() {
   const params = useParams()
   const router = useRouter()
   const { user } = useAuth()
+  const canViewProgress = usePermission('review_view_all')
+  const { isConnected, lastMessage, sendMessage } = useNotifications()
   const cycleId = params.cycleId
 
   const [cycle, setCycle] = useState(null)
@@ -34,6 +74,7 @@ export default function ReviewCycleDetailPage() {
   const [currentReviewType, setCurrentReviewType] = useState(null)
   const [showQuestionDialog, setShowQuestionDialog] = useState(false)
   const [reviews, setReviews] = useState([])
+  const [progress, setProgress] = useState(null)
   const [loading, setLoading] = useState(true)
   const [searchTerm, setSearchTerm] = useState("")
   const [departmentFilter, setDepartmentFilter] = useState("all")
@@ -41,6 +82,7 @@ export default function ReviewCycleDetailPage() {
   const [confirmDialog, setConfirmDialog] = useState({ isOpen: false, title: '', description: '', onConfirm: () => {} })
 
   const { data: organizations = [] } = useOrganizations()
+  const cycleStatus = cycle?.status?.toLowerCase()
 
   // Get department options from organizations
   const departmentOptions = [
@@ -102,6 +144,15 @@ export default function ReviewCycleDetailPage() {
     }
   }, [cycleId])
 
+  const fetchProgress = useCallback(async () => {
+    try {
+      const data = await GET(`/api/reviews/cycles/${cycleId}/dashboard`)
+      setProgress(data)
+    } catch (error) {
+      console.error('Error fetching cycle progress:', error)
+    }
+  }, [cycleId])
+
   const syncTraits = async () => {
     try {
       const result = await POST(`/api/reviews/cycles/${cycleId}/sync-traits`, {})
@@ -125,6 +176,38 @@ export default function ReviewCycleDetailPage() {
     }
   }, [cycle?.status, fetchReviews])
 
+  useEffect(() => {
+    if (canViewProgress && (cycleStatus === 'active' || cycleStatus === 'completed')) {
+      fetchProgress()
+    }
+  }, [canViewProgress, cycleStatus, fetchProgress])
+
+  // Live progress of an active cycle over the notification WebSocket, subscribed again after a reconnect
+  useEffect(() => {
+    if (!canViewProgress || !isConnected || cycleStatus !== 'active') return
+
+    sendMessage(`subscribe_cycle:${cycleId}`)
+    return () => sendMessage(`unsubscribe_cycle:${cycleId}`)
+  }, [canViewProgress, isConnected, cycleStatus, cycleId, sendMessage])
+
+  useEffect(() => {
+    if (!lastMessage || lastMessage.cycle_id !== cycleId) return
+
+    if (lastMessage.type === 'cycle_subscribed' || (lastMessage.type === 'cycle_progress' && lastMessage.rebuilt)) {
+      // Catch up on submissions made while unsubscribed, or take the rebuilt counters
+      fetchProgress()
+    } else if (lastMessage.type === 'cycle_progress') {
+      const department = organizations.find(org => org.id === lastMessage.organization_id)?.name
+      if (department) {
+        setProgress(prev => prev && applyProgressDelta(prev, department, lastMessage.delta))
+      } else {
+        fetchProgress()
+      }
+    }
+    // Each pushed message is applied exactly once
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [lastMessage])
+
   const addQuestionToTrait = async (traitId, questionData) => {
     try {
       await POST(`/api/reviews/traits/${traitId}/questions`, questionData)
@@ -278,6 +361,74 @@ export default function ReviewCycleDetailPage() {
           </div>
         </CardContent>
       </Card>
+
+      {/* Completion Progress (live while the cycle is active) */}
+      {progress && (
+        <Card>
+          <CardHeader>
+            <div className="flex items-center justify-between">
+              <div>
+                <CardTitle>Completion Progress</CardTitle>
+                <CardDescription>
+                  {progress.participation.completed_participants} of {progress.participation.total_participants} participants have all their reviews completed
+                </CardDescription>
+              </div>
+              {cycleStatus === 'active' && isConnected && (
+                <Badge className="bg-green-100 text-green-800">Live</Badge>
+              )}
+            </div>
+          </CardHeader>
+          <CardContent className="space-y-6">
+            <div>
+              <div className="flex justify-between text-sm mb-1">
+                <span className="text-gray-500">Participants</span>
+                <span className="font-medium">{progress.participation.completion_rate.toFixed(1)}%</span>
+              </div>
+              <Progress value={progress.participation.completion_rate} />
+            </div>
+            <div className="grid grid-cols-1 md:grid-cols-3 gap-6">
+              {[
+                { key: 'self', label: 'Self Reviews' },
+                { key: 'peer', label: 'Peer Reviews' },
+                { key: 'supervisor', label: 'Supervisor Reviews' }
+              ].map(type => {
+                const stats = progress.assignment_statistics[type.key] || { total: 0, completed: 0, completion_rate: 0 }
+                return (
+                  <div key={type.key}>
+                    <div className="flex justify-between text-sm mb-1">
+                      <span className="text-gray-500">{type.label}</span>
+                      <span className="font-medium">{stats.completed} / {stats.total}</span>
+                    </div>
+                    <Progress value={stats.completion_rate} />
+                  </div>
+                )
+              })}
+            </div>
+            {progress.department_breakdown.length > 0 && (
+              <Table>
+                <TableHeader>
+                  <TableRow>
+                    <TableHead>Department</TableHead>
+                    <TableHead>Participants</TableHead>
+                    <TableHead>Started</TableHead>
+                    <TableHead>Rate</TableHead>
+                  </TableRow>
+                </TableHeader>
+                <TableBody>
+                  {progress.department_breakdown.map(row => (
+                    <TableRow key={row.department}>
+                      <TableCell>{row.department}</TableCell>
+                      <TableCell>{row.total_participants}</TableCell>
+                      <TableCell>{row.completed_participants}</TableCell>
+                      <TableCell>{row.completion_rate.toFixed(1)}%</TableCell>
+                    </TableRow>
+                  ))}
+                </TableBody>
+              </Table>
+            )}
+          </CardContent>
+        </Card>
+      )}
         </TabsContent>
 
         {/* Questions Tab */}
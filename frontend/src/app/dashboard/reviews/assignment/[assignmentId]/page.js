@@ -10,7 +10,7 @@ import { Badge } from "@/components/ui/badge"
 import { Skeleton } from "@/components/ui/skeleton"
 import { Label } from "@/components/ui/label"
 import { Slider } from "@/components/ui/slider"
-import { GET, POST } from "@/lib/api"
+import { GET, POST, PATCH } from "@/lib/api"
 
 export default function AssignmentReviewPage() {
   const params = useParams()
@@ -20,6 +20,7 @@ export default function AssignmentReviewPage() {
   const [assignment, setAssignment] = useState(null)
   const [questions, setQuestions] = useState([])
   const [responses, setResponses] = useState({})
+  const [savedResponses, setSavedResponses] = useState({})
   const [loading, setLoading] = useState(true)
   const [submitting, setSubmitting] = useState(false)
 
@@ -47,6 +48,7 @@ export default function AssignmentReviewPage() {
         })
       }
       setResponses(existingResponses)
+      setSavedResponses(existingResponses)
     } catch (error) {
       console.error('Error fetching assignment:', error)
     } finally {
@@ -67,9 +69,10 @@ export default function AssignmentReviewPage() {
     try {
       setSubmitting(true)
 
-      // Format responses for backend (only save rated questions)
+      // Only send rated questions that changed since the last save
       const formattedResponses = Object.entries(responses)
         .filter(([_, data]) => data.rating !== undefined && data.rating !== null)
+        .filter(([questionId, data]) => savedResponses[questionId]?.rating !== data.rating)
         .map(([questionId, data]) => ({
           question_id: questionId,
           rating: data.rating
@@ -79,9 +82,8 @@ export default function AssignmentReviewPage() {
         return
       }
 
-      await POST(`/api/reviews/assignments/${assignmentId}/submit`, {
-        responses: formattedResponses,
-        is_draft: true
+      await PATCH(`/api/reviews/assignments/${assignmentId}/responses`, {
+        responses: formattedResponses
       })
 
       // Refresh assignment data
@@ -25,54 +25,25 @@ function MyReviews() {
   const [cycles, setCycles] = useState([])
   const [selectedCycle, setSelectedCycle] = useState("")
   const [loading, setLoading] = useState(true)
-  const [cyclesLoading, setCyclesLoading] = useState(true)
 
   useEffect(() => {
-    fetchCycles()
+    fetchMyAssignments()
   }, [])
 
   useEffect(() => {
-    if (!cyclesLoading && cycles.length > 0 && !selectedCycle) {
+    if (cycles.length > 0 && !selectedCycle) {
       // Default to the most recent cycle (first in the list)
-      console.log('Setting default cycle:', cycles[0].id)
-      setSelectedCycle(cycles[0].id)
+      setSelectedCycle(cycles[0].cycle_id)
     }
-  }, [cycles, cyclesLoading, selectedCycle])
-
-  useEffect(() => {
-    console.log('State changed:', { cyclesLoading, cycles: cycles.length, selectedCycle, assignments: assignments.length, loading })
-  }, [cyclesLoading, cycles, selectedCycle, assignments, loading])
-
-  useEffect(() => {
-    if (selectedCycle) {
-      fetchMyAssignments()
-    }
-    // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [selectedCycle])
-
-  const fetchCycles = async () => {
-    try {
-      console.log('Fetching cycles...')
-      const data = await GET('/api/reviews/cycles')
-      console.log('Cycles fetched:', data)
-      setCycles(data || [])
-    } catch (error) {
-      console.error('Error fetching cycles:', error)
-    } finally {
-      setCyclesLoading(false)
-    }
-  }
+  }, [cycles, selectedCycle])
 
+  // One call: every assignment of the user plus per-cycle completion counts
   const fetchMyAssignments = async () => {
     try {
       setLoading(true)
-      console.log('Fetching assignments for cycle:', selectedCycle)
-      const url = selectedCycle
-        ? `/api/reviews/my-assignments?cycle_id=${selectedCycle}`
-        : '/api/reviews/my-assignments'
-      const data = await GET(url)
-      console.log('Assignments fetched:', data)
-      setAssignments(data || [])
+      const data = await GET('/api/reviews/assignments/me')
+      setAssignments(data?.assignments || [])
+      setCycles(data?.cycles || [])
     } catch (error) {
       console.error('Error fetching assignments:', error)
     } finally {
@@ -84,10 +55,10 @@ function MyReviews() {
     router.push(`/dashboard/reviews/assignment/${assignmentId}`)
   }
 
-  // Assignments are already filtered by cycle_id from backend
-  const selfReviews = assignments.filter(a => a.review_type === 'self')
-  const peerReviews = assignments.filter(a => a.review_type === 'peer')
-  const supervisorReviews = assignments.filter(a => a.review_type === 'supervisor')
+  const cycleAssignments = assignments.filter(a => a.cycle_id === selectedCycle)
+  const selfReviews = cycleAssignments.filter(a => a.review_type === 'self')
+  const peerReviews = cycleAssignments.filter(a => a.review_type === 'peer')
+  const supervisorReviews = cycleAssignments.filter(a => a.review_type === 'supervisor')
 
   const renderAssignments = (assignmentsList, emptyMessage, reviewType) => {
     if (assignmentsList.length === 0) {
@@ -190,8 +161,8 @@ function MyReviews() {
                 </SelectTrigger>
                 <SelectContent>
                   {cycles.map((cycle) => (
-                    <SelectItem key={cycle.id} value={cycle.id}>
-                      {cycle.name} ({cycle.period})
+                    <SelectItem key={cycle.cycle_id} value={cycle.cycle_id}>
+                      {cycle.cycle_name} ({cycle.period}) - {cycle.completed}/{cycle.total} completed
                     </SelectItem>
                   ))}
                 </SelectContent>
@@ -208,7 +179,7 @@ function MyReviews() {
           <Skeleton className="h-32 w-full" />
           <Skeleton className="h-32 w-full" />
         </div>
-      ) : assignments.length === 0 ? (
+      ) : cycleAssignments.length === 0 ? (
         <Card>
           <CardContent className="text-center py-12">
             <FileText className="w-12 h-12 mx-auto text-gray-400 mb-4" />
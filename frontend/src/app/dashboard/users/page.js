@@ -351,7 +351,7 @@ export default function UsersPage() {
                         <div className="flex items-center gap-3">
                           <Avatar className="h-8 w-8">
                             <AvatarImage
-                              src={user.profile_image_url ? `${process.env.NEXT_PUBLIC_API_URL}${user.profile_image_url}` : undefined}
+                              src={user.profile_image_url ? `${process.env.NEXT_PUBLIC_API_URL}${user.profile_image_variants?.['64'] || user.profile_image_url}` : undefined}
                               alt={user.name || 'User'}
                             />
                             <AvatarFallback>
@@ -200,7 +200,7 @@ export function DashboardHeader() {
           <Button variant="ghost" className="relative h-8 w-8 rounded-full">
             <Avatar className="h-8 w-8">
               <AvatarImage
-                src={user?.profile_image_url ? `${process.env.NEXT_PUBLIC_API_URL}${user.profile_image_url}` : undefined}
+                src={user?.profile_image_url ? `${process.env.NEXT_PUBLIC_API_URL}${user.profile_image_variants?.['64'] || user.profile_image_url}` : undefined}
                 alt={user?.name || 'User'}
               />
               <AvatarFallback>{userInitials}</AvatarFallback>
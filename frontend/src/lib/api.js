@@ -302,6 +302,19 @@ async function PUT(endpoint, data = {}) {
   })
 }
 
+/**
+ * PATCH request helper
+ * @param {string} endpoint - API endpoint
+ * @param {Object} data - Request body data
+ * @returns {Promise<Object>} API response
+ */
+async function PATCH(endpoint, data = {}) {
+  return apiRequest(endpoint, {
+    method: 'PATCH',
+    body: JSON.stringify(data)
+  })
+}
+
 /**
  * DELETE request helper
  * @param {string} endpoint - API endpoint
@@ -1559,7 +1572,7 @@ export const notifications = {
 }
 
 // Export HTTP method helpers
-export { GET, POST, PUT, DELETE }
+export { GET, POST, PUT, PATCH, DELETE }
 
 // Export API error class
 export { ApiError }
\ No newline at end of file
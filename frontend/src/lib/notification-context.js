@@ -9,7 +9,7 @@ const NotificationContext = createContext(undefined)
 
 export function NotificationProvider({ children }) {
   const { user } = useAuth()
-  const { isConnected, lastMessage } = useWebSocket()
+  const { isConnected, lastMessage, sendMessage } = useWebSocket()
   const [notifications, setNotifications] = useState([])
   const [unreadCount, setUnreadCount] = useState(0)
   const queryClient = useQueryClient()
@@ -120,6 +120,9 @@ export function NotificationProvider({ children }) {
     notifications,
     unreadCount,
     isConnected,
+    // Shared connection for pages that subscribe to other pushes (e.g. cycle_progress)
+    lastMessage,
+    sendMessage,
     addNotification,
     markAsRead,
     markAllAsRead,